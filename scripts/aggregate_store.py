@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Хранилище инкрементальных агрегатов боев рядом с графом
+
+Для каждого представления (танк, нация, карта и сторона, танк и карта,
+танк и неделя) хранятся аддитивные частичные агрегаты: число результатов,
+победы, сумма и сумма квадратов урона. Импортер дополняет их по мере выдачи
+строк боев, части складываются (merge), а дашбордные запросы движка
+считаются по группам представления, без обхода боев графа
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from graph_formats import split_graph_path
+from graph_partitions import MANIFEST_FILE, parse_time
+
+
+STORE_FORMAT = 1
+
+# Представления и их ключи (колонки строк боев); week - понедельник недели боя
+VIEWS = {
+    'tank': ('tank',),
+    'nation': ('nation',),
+    'map_side': ('map', 'spawn'),
+    'tank_map': ('tank', 'map'),
+    'tank_week': ('tank', 'week'),
+}
+
+# Значения группы: результаты, победы, сумма урона, сумма квадратов урона
+VALUES = ('count', 'wins', 'damage_sum', 'damage_sumsq')
+
+
+def sidecar_path(graph_path, suffix):
+    """Файл рядом с графом: <output><suffix> (для любого формата и директории партиций)"""
+    graph_path = Path(graph_path)
+    if graph_path.name == MANIFEST_FILE:
+        graph_path = graph_path.parent
+    base = split_graph_path(graph_path)[0]
+    return base.with_name(base.name + suffix)
+
+
+def store_path(graph_path):
+    """Файл агрегатов рядом с графом: <output>.aggregates.json"""
+    return sidecar_path(graph_path, '.aggregates.json')
+
+
+def week_start(values):
+    """Понедельник недели для колонки времени боя (ISO дата, None для пропусков)"""
+    parsed = pd.to_datetime(values, errors='coerce')
+    weeks = parsed.dt.normalize() - pd.to_timedelta(parsed.dt.weekday, unit='D')
+    return weeks.dt.strftime('%Y-%m-%d').where(parsed.notna(), None)
+
+
+def week_aligned(value):
+    """Граница окна совпадает с началом недели (окно можно собрать из недельных групп)"""
+    value = parse_time(value)
+    return value is None or (value.weekday() == 0 and value == datetime(value.year, value.month, value.day))
+
+
+def damage_std(values):
+    """Стандартное отклонение урона группы по сумме и сумме квадратов"""
+    count, _, damage_sum, damage_sumsq = values
+    if count < 2:
+        return None
+    variance = (damage_sumsq - damage_sum * damage_sum / count) / (count - 1)
+    return max(variance, 0.0) ** 0.5
+
+
+class AggregateStore:
+    """Аддитивные агрегаты боев по представлениям VIEWS"""
+
+    def __init__(self):
+        self.views = {view: {} for view in VIEWS}
+        # Имена ключей: танк -> [tankName, shortName], код нации -> nationName, ключ карты -> написание
+        self.names = {'tank': {}, 'nation': {}, 'map': {}}
+        self.battles = 0
+        self.output = None
+
+    def groups(self, view):
+        """Группы представления: ключ -> [результаты, победы, сумма урона, сумма квадратов]"""
+        return self.views[view]
+
+    def add_rows(self, rows):
+        """Дополняет агрегаты строками боев
+
+        rows - DataFrame с колонками tank, nation, map, spawn, won, damage, battle_time
+        """
+        if rows.empty:
+            return self
+        frame = pd.DataFrame({
+            'tank': rows['tank'].astype(str),
+            'nation': rows['nation'],
+            'map': rows['map'].astype(str).str.lower(),
+            'spawn': rows['spawn'],
+            'week': week_start(rows['battle_time']),
+            'won': rows['won'].astype(bool).astype(int),
+            'damage': rows['damage'].astype(float),
+        })
+        frame['damage_sq'] = frame['damage'] * frame['damage']
+
+        # Первое встреченное написание карты (ключ - без учета регистра, как в запросах)
+        map_names = self.names['map']
+        for map_key, map_name in zip(frame['map'], rows['map'].astype(str)):
+            if map_key not in map_names:
+                map_names[map_key] = map_name
+
+        for view, keys in VIEWS.items():
+            # Группы с пропуском в ключе (нет нации, времени боя) в представление не входят
+            grouped = frame.groupby(list(keys), sort=False).agg(
+                count=('won', 'size'), wins=('won', 'sum'),
+                damage_sum=('damage', 'sum'), damage_sumsq=('damage_sq', 'sum'))
+            table = self.views[view]
+            for key, count, wins, damage_sum, damage_sumsq in zip(
+                    grouped.index, grouped['count'].tolist(), grouped['wins'].tolist(),
+                    grouped['damage_sum'].tolist(), grouped['damage_sumsq'].tolist()):
+                key = tuple(part.item() if hasattr(part, 'item') else part
+                            for part in (key if isinstance(key, tuple) else (key,)))
+                self.add_group(table, key, (count, wins, damage_sum, damage_sumsq))
+        self.battles += len(frame)
+        return self
+
+    @staticmethod
+    def add_group(table, key, values):
+        """Прибавляет значения к группе таблицы"""
+        total = table.get(key)
+        if total is None:
+            table[key] = [int(values[0]), int(values[1]), float(values[2]), float(values[3])]
+        else:
+            for i, value in enumerate(values):
+                total[i] += value
+
+    def merge(self, other):
+        """Складывает агрегаты другого хранилища (части импорта, дозагруженные бои)"""
+        for view, table in other.views.items():
+            for key, values in table.items():
+                self.add_group(self.views[view], key, values)
+        for kind, names in other.names.items():
+            for key, name in names.items():
+                self.names[kind].setdefault(key, name)
+        self.battles += other.battles
+        return self
+
+    def resolve_names(self, tank_names, nation_name):
+        """Заполняет имена танков (URI -> (tankName, shortName)) и наций (код -> nationName)"""
+        for (tank,) in self.views['tank']:
+            if tank in tank_names:
+                self.names['tank'][tank] = list(tank_names[tank])
+        for (nation,) in self.views['nation']:
+            name = nation_name(nation)
+            if name is not None:
+                self.names['nation'][nation] = name
+        return self
+
+    def to_dict(self):
+        """Представление для JSON: группы - списки [ключ..., значения...]"""
+        return {
+            'format': STORE_FORMAT,
+            'output': self.output,
+            'battles': self.battles,
+            'views': {view: [list(key) + values for key, values in table.items()]
+                      for view, table in self.views.items()},
+            'names': self.names,
+        }
+
+    def save(self, path):
+        """Сохраняет агрегаты в JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Читает агрегаты из JSON"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != STORE_FORMAT:
+            raise ValueError(f"Unsupported aggregate store format: {data.get('format')}")
+        store = cls()
+        store.output = data.get('output')
+        store.battles = data['battles']
+        for view, keys in VIEWS.items():
+            width = len(keys)
+            store.views[view] = {tuple(row[:width]): row[width:] for row in data['views'].get(view, [])}
+        for kind, names in data['names'].items():
+            store.names[kind] = names
+        return store
+
+    @property
+    def size(self):
+        """Число групп во всех представлениях"""
+        return sum(len(table) for table in self.views.values())
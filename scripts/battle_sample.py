@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Стратифицированная выборка результатов боев для приближенных агрегатов
+
+Страта - танк: из результатов каждого танка берется доля fraction (но не меньше
+min_per_stratum), размер страты в графе известен точно. Win rate и средний урон
+групп (танк, нация, карта танка) оцениваются стратифицированными оценками
+с доверительными интервалами; группы с малой выборкой помечаются
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from aggregate_store import sidecar_path
+
+
+# Минимальный размер выборки группы, при котором интервал считается надежным
+MIN_GROUP_SAMPLE = 30
+
+# z-квантиль для 95% доверительного интервала
+Z_95 = 1.959964
+
+
+class Stratum:
+    """Выборка одной страты (танка): победы, урон и карты выбранных результатов"""
+
+    __slots__ = ('population', 'damage_population', 'won', 'damage', 'maps')
+
+    def __init__(self, population, won, damage, maps, damage_population=None):
+        self.population = population
+        # Результатов танка с уроном (точный размер домена для запросов, где урон обязателен)
+        self.damage_population = population if damage_population is None else damage_population
+        self.won = won
+        self.damage = damage
+        self.maps = maps
+
+    @property
+    def size(self):
+        return len(self.won)
+
+
+class Estimate:
+    """Оценка среднего группы с доверительным интервалом"""
+
+    __slots__ = ('value', 'low', 'high', 'sample_size')
+
+    def __init__(self, value, half_width, sample_size, bounds=(None, None)):
+        self.value = value
+        self.low = value - half_width
+        self.high = value + half_width
+        if bounds[0] is not None:
+            self.low = max(self.low, bounds[0])
+        if bounds[1] is not None:
+            self.high = min(self.high, bounds[1])
+        self.sample_size = sample_size
+
+
+def stratified_mean(parts, bounds=(None, None)):
+    """Стратифицированная оценка среднего по частям (N_h, значения выборки страты)
+
+    Дисперсия учитывает поправку на конечную совокупность (1 - n_h / N_h)
+    """
+    parts = [(population, values[~np.isnan(values)]) for population, values in parts]
+    parts = [(population, values) for population, values in parts if population > 0 and len(values) > 0]
+    total = sum(population for population, _ in parts)
+    if total == 0:
+        return None
+
+    value = 0.0
+    variance = 0.0
+    for population, values in parts:
+        n = len(values)
+        weight = population / total
+        value += weight * values.mean()
+        if n > 1:
+            variance += weight ** 2 * (1 - min(n / population, 1.0)) * values.var(ddof=1) / n
+    sample_size = sum(len(values) for _, values in parts)
+    return Estimate(value, Z_95 * variance ** 0.5, sample_size, bounds)
+
+
+class BattleSample:
+    """Стратифицированная (по танкам) выборка результатов боев графа
+
+    Строится либо обходом графа (build), либо при импорте по тем же строкам боев,
+    что и хранилище агрегатов (add_rows/merge, затем draw), и сохраняется рядом с графом
+    """
+
+    def __init__(self, fraction=0.1, min_per_stratum=100, seed=42):
+        self.fraction = fraction
+        self.min_per_stratum = min_per_stratum
+        self.seed = seed
+        self.strata = {}
+        self.map_names = {}
+        self.population = 0
+        self.build_time = 0.0
+        # Строки импорта до выборки: танк -> [(победы, урон, коды карт)], коды - индексы map_keys
+        self.pending = {}
+        self.map_keys = []
+        self.map_codes = {}
+
+    @property
+    def size(self):
+        return sum(stratum.size for stratum in self.strata.values())
+
+    def build(self, graph, namespace):
+        """Строит выборку прямым обходом триплетов результатов и боев"""
+        start_time = time.time()
+
+        battle_won = {battle: won.toPython() for battle, won in graph.subject_objects(namespace.won)}
+        # В графе с консолидированными боями победа - факт результата игрока
+        perf_won = {perf: won.toPython() for perf, won in graph.subject_objects(namespace.playerWon)}
+        battle_map = {battle: str(map_name) for battle, map_name in graph.subject_objects(namespace.onMap)}
+        # Ключ карты без учета регистра (как в точном запросе) и первое встреченное написание
+        self.map_names = {}
+        for map_name in battle_map.values():
+            self.map_names.setdefault(map_name.lower(), map_name)
+        perf_damage = {perf: damage.toPython() for perf, damage in graph.subject_objects(namespace.damage)}
+
+        perf_tank = dict(graph.subject_objects(namespace.withTank))
+
+        # Результаты по страте; без won (или с won не xsd:boolean) результат не участвует в win rate,
+        # как и в точных запросах
+        by_tank = {}
+        for perf, battle in graph.subject_objects(namespace.inBattle):
+            result_won = perf_won[perf] if perf in perf_won else battle_won.get(battle)
+            if isinstance(result_won, bool) and perf in perf_tank:
+                value = perf_damage.get(perf)
+                by_tank.setdefault(str(perf_tank[perf]), []).append((
+                    1.0 if result_won else 0.0,
+                    float(value) if isinstance(value, (int, float)) else np.nan,
+                    battle_map.get(battle, '').lower()))
+
+        self.stratify({tank: tuple(np.array(column) for column in zip(*rows)) for tank, rows in by_tank.items()})
+        self.build_time = time.time() - start_time
+        return self
+
+    def map_code(self, map_key):
+        """Код карты в строках импорта"""
+        code = self.map_codes.get(map_key)
+        if code is None:
+            code = self.map_codes[map_key] = len(self.map_keys)
+            self.map_keys.append(map_key)
+        return code
+
+    def add_rows(self, rows):
+        """Добавляет строки боев в совокупность выборки
+
+        rows - DataFrame с колонками tank, map, won, damage (как у хранилища агрегатов)
+        """
+        if rows.empty:
+            return self
+        maps = rows['map'].astype(str)
+        for map_key, map_name in zip(maps.str.lower(), maps):
+            self.map_names.setdefault(map_key, map_name)
+        codes = np.array([self.map_code(map_key) for map_key in maps.str.lower()], dtype=np.int32)
+        won = rows['won'].astype(bool).to_numpy(dtype=float)
+        damage = pd.to_numeric(rows['damage'], errors='coerce').to_numpy(dtype=float)
+        for tank, positions in rows.groupby(rows['tank'].astype(str), sort=False).indices.items():
+            self.pending.setdefault(tank, []).append((won[positions], damage[positions], codes[positions]))
+        return self
+
+    def merge(self, other):
+        """Добавляет строки импорта другой выборки (части пайплайна)"""
+        remap = np.array([self.map_code(map_key) for map_key in other.map_keys], dtype=np.int32)
+        for map_key, map_name in other.map_names.items():
+            self.map_names.setdefault(map_key, map_name)
+        for tank, parts in other.pending.items():
+            self.pending.setdefault(tank, []).extend(
+                (won, damage, remap[codes]) for won, damage, codes in parts)
+        return self
+
+    def draw(self):
+        """Выбирает строки из накопленных при импорте (add_rows/merge)"""
+        start_time = time.time()
+        map_keys = np.array(self.map_keys, dtype=str)
+        self.stratify({tank: (np.concatenate([won for won, _, _ in parts]),
+                              np.concatenate([damage for _, damage, _ in parts]),
+                              map_keys[np.concatenate([codes for _, _, codes in parts])])
+                       for tank, parts in self.pending.items()})
+        self.pending = {}
+        self.build_time = time.time() - start_time
+        return self
+
+    def stratify(self, by_tank):
+        """Выбирает долю fraction результатов каждого танка: {танк: (победы, урон, карты)}"""
+        rng = np.random.default_rng(self.seed)
+        self.strata = {}
+        self.population = 0
+        for tank, (won, damage, maps) in by_tank.items():
+            population = len(won)
+            size = min(population, max(self.min_per_stratum, int(round(population * self.fraction))))
+            chosen = rng.choice(population, size=size, replace=False) if size < population else np.arange(population)
+            self.strata[tank] = Stratum(population, won[chosen], damage[chosen], maps[chosen],
+                                        int((~np.isnan(damage)).sum()))
+            self.population += population
+        return self
+
+    def save(self, path):
+        """Сохраняет выборку (страты подряд в общих массивах) в .npz"""
+        tanks = list(self.strata)
+        strata = [self.strata[tank] for tank in tanks]
+        np.savez_compressed(
+            path,
+            params=np.array([self.fraction, self.min_per_stratum, self.seed], dtype=float),
+            tanks=np.array(tanks, dtype=str),
+            populations=np.array([s.population for s in strata], dtype=np.int64),
+            damage_populations=np.array([s.damage_population for s in strata], dtype=np.int64),
+            sizes=np.array([s.size for s in strata], dtype=np.int64),
+            won=np.concatenate([s.won for s in strata]) if strata else np.empty(0),
+            damage=np.concatenate([s.damage for s in strata]) if strata else np.empty(0),
+            maps=np.concatenate([s.maps for s in strata]).astype(str) if strata else np.empty(0, dtype=str),
+            map_keys=np.array(list(self.map_names), dtype=str),
+            map_names=np.array(list(self.map_names.values()), dtype=str),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path):
+        """Читает выборку, сохраненную save"""
+        with np.load(path, allow_pickle=False) as data:
+            fraction, min_per_stratum, seed = data['params'].tolist()
+            sample = cls(fraction=fraction, min_per_stratum=int(min_per_stratum), seed=int(seed))
+            offsets = np.concatenate([[0], np.cumsum(data['sizes'])])
+            won, damage, maps = data['won'], data['damage'], data['maps']
+            for i, tank in enumerate(data['tanks'].tolist()):
+                rows = slice(offsets[i], offsets[i + 1])
+                sample.strata[tank] = Stratum(int(data['populations'][i]), won[rows], damage[rows], maps[rows],
+                                              int(data['damage_populations'][i]))
+            sample.population = int(data['populations'].sum())
+            sample.map_names = dict(zip(data['map_keys'].tolist(), data['map_names'].tolist()))
+        return sample
+
+    def group_estimates(self, groups, require_damage=False):
+        """Оценки по группам страт: {группа: [танки]} -> {группа: (бои, win rate, урон)}
+
+        require_damage=True - совокупность только результатов с уроном (как в точном запросе,
+        где wot:damage обязателен): домен страты - выбранные результаты с уроном
+        """
+        estimates = {}
+        for group, tanks in groups.items():
+            strata = [self.strata[tank] for tank in tanks if tank in self.strata]
+            if not strata:
+                continue
+            if require_damage:
+                parts = [(s.damage_population, ~np.isnan(s.damage), s) for s in strata]
+            else:
+                parts = [(s.population, np.ones(s.size, dtype=bool), s) for s in strata]
+            battles = sum(population for population, _, _ in parts)
+            win_rate = stratified_mean([(population, s.won[mask] * 100.0) for population, mask, s in parts],
+                                       bounds=(0.0, 100.0))
+            damage = stratified_mean([(population, s.damage[mask]) for population, mask, s in parts],
+                                     bounds=(0.0, None))
+            estimates[group] = (battles, win_rate, damage)
+        return estimates
+
+    def map_estimates(self, tanks):
+        """Оценки по картам для результатов танков (домены внутри страт)
+
+        Число боев на карте оценивается как N_h * n_hm / n_h
+        """
+        strata = [self.strata[tank] for tank in tanks if tank in self.strata]
+        estimates = {}
+        # Результаты без карты (пустой ключ) в оценки по картам не входят
+        map_keys = {map_key for stratum in strata for map_key in stratum.maps.tolist() if map_key}
+        for map_key in sorted(map_keys):
+            parts_won = []
+            parts_damage = []
+            battles = 0.0
+            for stratum in strata:
+                mask = stratum.maps == map_key
+                if not mask.any():
+                    continue
+                domain_population = stratum.population * mask.sum() / stratum.size
+                battles += domain_population
+                parts_won.append((domain_population, stratum.won[mask] * 100.0))
+                parts_damage.append((domain_population, stratum.damage[mask]))
+            win_rate = stratified_mean(parts_won, bounds=(0.0, 100.0))
+            damage = stratified_mean(parts_damage, bounds=(0.0, None))
+            estimates[map_key] = (battles, win_rate, damage)
+        return estimates
+
+
+def sample_path(graph_path):
+    """Файл выборки рядом с графом: <output>.sample.npz"""
+    return sidecar_path(graph_path, '.sample.npz')
+
+
+def estimate_columns(prefix, estimate, digits=2):
+    """Колонки результата для оценки: значение, границы интервала"""
+    if estimate is None:
+        return {prefix: None, f"{prefix}Low": None, f"{prefix}High": None}
+    return {
+        prefix: round(estimate.value, digits),
+        f"{prefix}Low": round(estimate.low, digits),
+        f"{prefix}High": round(estimate.high, digits),
+    }
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Индекс времени боев для оконных запросов и трендов
+
+Строки индекса - результаты боев, отсортированные по времени боя (epoch, int64).
+Окно [since, until) находится бинарным поиском, агрегаты по корзинам (день,
+неделя, месяц) считаются векторно, без разбора xsd:dateTime в FILTER
+"""
+
+import time
+from datetime import timezone
+
+import numpy as np
+
+from graph_partitions import parse_time
+
+
+BUCKETS = ('day', 'week', 'month')
+
+
+def to_epoch(value):
+    """datetime -> секунды от 1970-01-01 (время без зоны считается UTC)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return int(np.datetime64(value, 's').astype(np.int64))
+
+
+def bucket_days(epochs, bucket):
+    """Начало корзины для каждого времени в днях от 1970-01-01 (недели - с понедельника)"""
+    days = epochs // 86400
+    if bucket == 'day':
+        return days
+    if bucket == 'week':
+        # 1970-01-01 - четверг, понедельник той недели - день -3
+        return (days + 3) // 7 * 7 - 3
+    if bucket == 'month':
+        return epochs.astype('datetime64[s]').astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+    raise ValueError(f"bucket must be one of: {', '.join(BUCKETS)}")
+
+
+class BattleTimeIndex:
+    """Отсортированный по времени индекс результатов боев: время, бой, танк, победа, урон"""
+
+    def __init__(self):
+        self.epochs = np.empty(0, dtype=np.int64)
+        self.battles = np.empty(0, dtype=object)
+        self.tank_codes = np.empty(0, dtype=np.int32)
+        self.won = np.empty(0, dtype=np.float64)
+        self.damage = np.empty(0, dtype=np.float64)
+        self.tanks = []
+        self.tank_index = {}
+        self.build_time = 0.0
+
+    def __len__(self):
+        return len(self.epochs)
+
+    def build(self, graph, namespace):
+        """Строит индекс прямым обходом триплетов боев и результатов"""
+        start_time = time.time()
+        battle_epochs = {}
+        for battle, battle_time in graph.subject_objects(namespace.battleTime):
+            value = battle_time.toPython()
+            if hasattr(value, 'tzinfo'):
+                battle_epochs[battle] = to_epoch(value)
+        battle_won = {battle: won.toPython() for battle, won in graph.subject_objects(namespace.won)}
+        # В графе с консолидированными боями победа - факт результата игрока
+        perf_won = {perf: won.toPython() for perf, won in graph.subject_objects(namespace.playerWon)}
+        perf_damage = {perf: damage.toPython() for perf, damage in graph.subject_objects(namespace.damage)}
+        perf_tank = dict(graph.subject_objects(namespace.withTank))
+
+        tank_codes = {}
+        epochs, battles, tanks, won, damage = [], [], [], [], []
+        for perf, battle in graph.subject_objects(namespace.inBattle):
+            result_won = perf_won[perf] if perf in perf_won else battle_won.get(battle)
+            if battle not in battle_epochs or result_won is None or perf not in perf_tank:
+                continue
+            epochs.append(battle_epochs[battle])
+            battles.append(str(battle))
+            tanks.append(tank_codes.setdefault(str(perf_tank[perf]), len(tank_codes)))
+            won.append(1.0 if result_won in (True, 'true', 'True', 1) else 0.0)
+            value = perf_damage.get(perf)
+            damage.append(float(value) if isinstance(value, (int, float)) else np.nan)
+
+        order = np.argsort(np.array(epochs, dtype=np.int64), kind='stable')
+        self.epochs = np.array(epochs, dtype=np.int64)[order]
+        self.battles = np.array(battles, dtype=object)[order]
+        self.tank_codes = np.array(tanks, dtype=np.int32)[order]
+        self.won = np.array(won, dtype=np.float64)[order]
+        self.damage = np.array(damage, dtype=np.float64)[order]
+        self.tanks = list(tank_codes)
+        self.tank_index = tank_codes
+        self.build_time = time.time() - start_time
+        return self
+
+    def window(self, since=None, until=None):
+        """Срез строк индекса для окна [since, until) бинарным поиском"""
+        since, until = parse_time(since), parse_time(until)
+        start = np.searchsorted(self.epochs, to_epoch(since), side='left') if since is not None else 0
+        stop = np.searchsorted(self.epochs, to_epoch(until), side='left') if until is not None else len(self.epochs)
+        return slice(int(start), int(stop))
+
+    def battles_between(self, since=None, until=None):
+        """Идентификаторы боев в окне, по возрастанию времени"""
+        return self.battles[self.window(since, until)]
+
+    def trend(self, tanks=None, bucket='week', since=None, until=None):
+        """Бои, победы и урон по (танк, корзина) в окне; tanks - URI танков (None - все)
+
+        Возвращает словарь массивов: tank, bucket (datetime64[D]), battles, wins,
+        damage_count, damage_sum, отсортированный по танку и началу корзины
+        """
+        rows = self.window(since, until)
+        tank_codes = self.tank_codes[rows]
+        mask = None
+        if tanks is not None:
+            codes = [self.tank_index[tank] for tank in tanks if tank in self.tank_index]
+            mask = np.isin(tank_codes, codes)
+            tank_codes = tank_codes[mask]
+
+        def select(values):
+            values = values[rows]
+            return values[mask] if mask is not None else values
+
+        days = bucket_days(select(self.epochs), bucket)
+        damage = select(self.damage)
+        has_damage = ~np.isnan(damage)
+
+        # Группы (танк, корзина) одним np.unique по составному ключу
+        keys = np.stack([tank_codes.astype(np.int64), days])
+        groups, inverse = np.unique(keys, axis=1, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        size = groups.shape[1]
+        return {
+            'tank': [self.tanks[code] for code in groups[0]],
+            'bucket': groups[1].astype('datetime64[D]'),
+            'battles': np.bincount(inverse, minlength=size),
+            'wins': np.bincount(inverse, weights=select(self.won), minlength=size),
+            'damage_count': np.bincount(inverse, weights=has_damage, minlength=size),
+            'damage_sum': np.bincount(inverse, weights=np.where(has_damage, damage, 0.0), minlength=size),
+        }
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк пайплайна World of Tanks на синтетических данных
+
+Генерирует данные, замеряет create_ontology.py, import_data_to_rdf.py на
+нескольких объемах, загрузку графа и все query_* методы движка запросов.
+Результаты пишутся в JSON и сравниваются с сохраненным baseline
+"""
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+# Аргументы для query_* методов, у которых есть обязательные параметры
+QUERY_ARGS = {
+    'query_tanks_by_nation': {'nation': 'Germany'},
+    'query_worst_maps_for_tank': {'tank_name': 'B-C 25 t', 'min_battles': 1},
+    'query_similar_tanks': {'tank_name': 'B-C 25 t', 'other_nation': True},
+}
+
+# Разница ниже порога считается шумом и не дает регрессии
+NOISE_FLOOR = {'s': 0.05, 'MB': 5.0}
+
+
+class BenchmarkRunner:
+    def __init__(self, workdir, sizes, repeat=3, seed=42, import_args=None):
+        """Инициализация бенчмарка в рабочей директории"""
+        self.workdir = Path(workdir)
+        self.sizes = sorted(sizes)
+        self.repeat = repeat
+        self.seed = seed
+        self.import_args = import_args or []
+        self.scripts_dir = self.workdir / "scripts"
+        self.logs_dir = self.workdir / "logs"
+        self.metrics = {}
+
+    def add_metric(self, name, value, unit='s'):
+        """Добавляет метрику результата"""
+        self.metrics[name] = {'value': round(value, 6), 'unit': unit}
+
+    def prepare(self):
+        """Копирует скрипты в рабочую директорию (data/ и ontology/ создаются рядом)"""
+        source_dir = Path(__file__).parent
+        shutil.copytree(source_dir, self.scripts_dir, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns('__pycache__'))
+        (self.workdir / "ontology").mkdir(exist_ok=True)
+        self.logs_dir.mkdir(exist_ok=True)
+
+    def run_script(self, name, script, *args):
+        """Запускает скрипт из рабочей директории, возвращает время выполнения"""
+        log_file = self.logs_dir / f"{name}.log"
+        command = [sys.executable, str(self.scripts_dir / script), *[str(arg) for arg in args]]
+        print(f"  ▶ {name}: {' '.join(command[1:])}")
+        start_time = time.perf_counter()
+        with open(log_file, 'w', encoding='utf-8') as log:
+            result = subprocess.run(command, cwd=self.workdir, stdout=log, stderr=subprocess.STDOUT)
+        elapsed = time.perf_counter() - start_time
+        if result.returncode != 0:
+            raise RuntimeError(f"{script} failed with code {result.returncode}, see {log_file}")
+        print(f"    {elapsed:.2f} s")
+        return elapsed
+
+    def bench_generate(self):
+        """Генерация синтетических данных (на максимальный объем)"""
+        elapsed = self.run_script('generate', 'generate_synthetic_data.py',
+                                  '--battles', max(self.sizes), '--seed', self.seed,
+                                  '--output-dir', self.workdir / "data")
+        self.add_metric('generate.seconds', elapsed)
+
+    def bench_create_ontology(self):
+        """Создание онтологии"""
+        elapsed = self.run_script('create_ontology', 'create_ontology.py')
+        self.add_metric('create_ontology.seconds', elapsed)
+
+    def bench_import(self, size):
+        """Импорт size боев; стадии берутся из метрик импортера"""
+        output = f"bench_{size}"
+        elapsed = self.run_script(f'import_{size}', 'import_data_to_rdf.py',
+                                  '--battles', size, '--no-random', '--output', output, *self.import_args)
+        self.add_metric(f'import.{size}.seconds', elapsed)
+
+        metrics_file = self.workdir / "ontology" / f"{output}.metrics.json"
+        if metrics_file.exists():
+            with open(metrics_file, encoding='utf-8') as f:
+                import_metrics = json.load(f)
+            self.add_metric(f'import.{size}.peak_rss_mb', import_metrics['peak_rss_bytes'] / 1024 ** 2, 'MB')
+            self.add_metric(f'import.{size}.triples_per_second', import_metrics['triples_per_second'], 'triples/s')
+            for stage, values in import_metrics['stages'].items():
+                self.add_metric(f'import.{size}.stage.{stage}.seconds', values['wall_seconds'])
+
+        outputs = sorted((self.workdir / "ontology").glob(f"{output}.*"))
+        return next((path for path in outputs if path.suffix in ('.owl', '.nt')), None)
+
+    def bench_queries(self, ontology_file, size):
+        """Загрузка графа и все query_* методы движка"""
+        sys.path.insert(0, str(self.scripts_dir))
+        query_module = importlib.import_module('query_ontology')
+
+        print(f"  ▶ load {ontology_file.name}")
+        start_time = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = query_module.OntologyQueryEngine(ontology_file)
+        elapsed = time.perf_counter() - start_time
+        self.add_metric(f'load.{size}.seconds', elapsed)
+        print(f"    {elapsed:.2f} s")
+
+        for name, method in inspect.getmembers(engine, inspect.ismethod):
+            if not name.startswith('query_'):
+                continue
+            kwargs = QUERY_ARGS.get(name, {})
+            required = [param.name for param in inspect.signature(method).parameters.values()
+                        if param.default is inspect.Parameter.empty and param.name not in kwargs]
+            if required:
+                print(f"  ⚠️  {name}: skipped, no benchmark arguments for {', '.join(required)}")
+                continue
+
+            timings = []
+            for _ in range(self.repeat):
+                start_time = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    method(**kwargs)
+                timings.append(time.perf_counter() - start_time)
+            median = statistics.median(timings)
+            self.add_metric(f'query.{name[len("query_"):]}.seconds', median)
+            print(f"  ▶ {name}: {median:.3f} s (median of {self.repeat})")
+
+    def run(self, query_size=None, skip_queries=False):
+        """Запускает все замеры"""
+        self.prepare()
+        print("\n📦 Data")
+        self.bench_generate()
+        print("\n🏗️  Ontology")
+        self.bench_create_ontology()
+
+        print("\n📥 Import")
+        outputs = {size: self.bench_import(size) for size in self.sizes}
+
+        if not skip_queries:
+            query_size = query_size or self.sizes[0]
+            ontology_file = outputs.get(query_size)
+            print(f"\n🔍 Queries ({query_size:,} battles)")
+            if ontology_file is None or ontology_file.suffix != '.owl':
+                print("  ⚠️  No RDF/XML output for this size, queries skipped")
+            else:
+                self.bench_queries(ontology_file, query_size)
+
+        return {
+            'meta': self.environment(),
+            'metrics': self.metrics,
+        }
+
+    def environment(self):
+        """Описание окружения, в котором снимались результаты"""
+        versions = {}
+        for package in ('rdflib', 'pandas', 'numpy'):
+            try:
+                versions[package] = importlib.import_module(package).__version__
+            except ImportError:
+                versions[package] = None
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'sizes': self.sizes,
+            'seed': self.seed,
+            'repeat': self.repeat,
+            'import_args': self.import_args,
+            'packages': versions,
+        }
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """Сравнивает метрики с baseline, возвращает список регрессий"""
+    print("\n" + "=" * 60)
+    print(f"📊 COMPARISON WITH BASELINE ({baseline['meta'].get('timestamp', 'unknown')})")
+    print("=" * 60)
+
+    regressions = []
+    for name, current in results['metrics'].items():
+        previous = baseline['metrics'].get(name)
+        unit = current['unit']
+        if previous is None or unit not in NOISE_FLOOR or previous['value'] <= 0:
+            continue
+        change = (current['value'] - previous['value']) / previous['value']
+        regressed = (change > tolerance
+                     and current['value'] - previous['value'] > NOISE_FLOOR[unit])
+        marker = '❌' if regressed else ('✅' if change < -tolerance else '  ')
+        print(f" {marker} {name:<50} {previous['value']:>10.3f} → {current['value']:>10.3f} {unit:<2} "
+              f"({change * 100:+.1f}%)")
+        if regressed:
+            regressions.append(name)
+
+    missing = sorted(set(baseline['metrics']) - set(results['metrics']))
+    if missing:
+        print(f"\n⚠️  {len(missing)} baseline metric(s) not measured in this run (different --sizes?)")
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) above {tolerance * 100:.0f}%")
+    else:
+        print(f"\n✅ No regressions above {tolerance * 100:.0f}%")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the WoT ontology pipeline on synthetic data')
+    parser.add_argument('--sizes', type=str, default='10000,100000,1000000',
+                        help='Comma-separated battle counts to import (default: 10000,100000,1000000)')
+    parser.add_argument('--query-size', type=int, default=None,
+                        help='Import size whose graph is used for load/query benchmarks (default: smallest)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per query, the median is reported (default: 3)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Seed for synthetic data (default: 42)')
+    parser.add_argument('--skip-queries', action='store_true',
+                        help='Skip graph load and query benchmarks')
+    parser.add_argument('--import-args', type=str, default='',
+                        help='Extra arguments for import_data_to_rdf.py, e.g. "--batch-size 50000"')
+    parser.add_argument('--workdir', type=str, default=None,
+                        help='Working directory (default: temporary, removed afterwards)')
+    parser.add_argument('--output', type=str, default='benchmark_results.json',
+                        help='Results file (default: benchmark_results.json)')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='Baseline results to compare against; exit code 1 on regressions')
+    parser.add_argument('--save-baseline', type=str, default=None,
+                        help='Also save these results as a new baseline file')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative slowdown before a regression is reported (default: 0.25)')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    if args.query_size and args.query_size not in sizes:
+        parser.error('--query-size must be one of --sizes')
+
+    print("=" * 60)
+    print("WORLD OF TANKS KNOWLEDGE GRAPH - BENCHMARK")
+    print("=" * 60)
+    print(f"  Sizes: {', '.join(f'{size:,}' for size in sizes)}")
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix='wot_bench_'))
+    workdir.mkdir(parents=True, exist_ok=True)
+    print(f"  Workdir: {workdir}")
+
+    runner = BenchmarkRunner(workdir, sizes, repeat=args.repeat, seed=args.seed,
+                             import_args=args.import_args.split())
+    try:
+        results = runner.run(query_size=args.query_size, skip_queries=args.skip_queries)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results saved: {args.output}")
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Baseline saved: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare_with_baseline(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
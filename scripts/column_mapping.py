@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Слой маппинга колонок CSV на свойства онтологии World of Tanks
+
+Маппинг строится один раз по DatatypeProperty из онтологии или из сгенерированной
+схемы wot_schema (domain/range), после чего компилируется в блочный эмиттер
+триплетов для конкретного DataFrame
+"""
+
+from collections import namedtuple
+
+import pandas as pd
+from rdflib import RDF, RDFS, OWL, Literal
+from rdflib.namespace import XSD
+
+
+# Колонка CSV -> предикат, XSD тип и конвертер значения
+ColumnMapping = namedtuple('ColumnMapping', ['column', 'predicate', 'datatype', 'converter'])
+
+# Имена колонок, которые не выводятся из имени свойства автоматически
+COLUMN_OVERRIDES = {
+    'baseXP': 'base_xp',
+    'onMap': 'display_name',  # В tomato.csv карта хранится в поле display_name
+}
+
+# Конвертеры значений по XSD типу (dateTime конвертируется векторно)
+XSD_CONVERTERS = {
+    XSD.integer: int,
+    XSD.float: float,
+    XSD.boolean: bool,
+    XSD.string: str,
+    XSD.dateTime: None,
+}
+
+
+def camel_to_snake(name):
+    """Переводит camelCase имя свойства в snake_case имя колонки"""
+    return ''.join(['_' + c.lower() if c.isupper() else c for c in name]).lstrip('_')
+
+
+def graph_datatype_properties(graph, namespace):
+    """DatatypeProperty онтологии в виде {имя: (классы domain, range)}, как в wot_schema"""
+    properties = {}
+    for prop_uri in graph.subjects(RDF.type, OWL.DatatypeProperty):
+        if not str(prop_uri).startswith(str(namespace)):
+            continue
+        properties[prop_uri[len(str(namespace)):]] = (
+            tuple(sorted(d[len(str(namespace)):] for d in graph.objects(prop_uri, RDFS.domain))),
+            tuple(sorted(graph.objects(prop_uri, RDFS.range))))
+    return properties
+
+
+def build_column_mappings(graph, namespace, domains, overrides=None):
+    """Строит маппинг колонок для DatatypeProperty заданных классов онтологии"""
+    return schema_column_mappings(graph_datatype_properties(graph, namespace), namespace, domains, overrides)
+
+
+def schema_column_mappings(properties, namespace, domains, overrides=None):
+    """Строит маппинг колонок по описанию свойств {имя: (классы domain, range)} (wot_schema)"""
+    overrides = {**COLUMN_OVERRIDES, **(overrides or {})}
+    mappings = {}
+
+    for domain in domains:
+        domain_mappings = []
+        for prop_name in sorted(properties):
+            prop_domains, ranges = properties[prop_name]
+            if domain not in prop_domains or not ranges:
+                continue
+            datatype = ranges[0]
+            if datatype not in XSD_CONVERTERS:
+                continue
+
+            column = overrides.get(prop_name, camel_to_snake(prop_name))
+            domain_mappings.append(ColumnMapping(column, namespace[prop_name], datatype, XSD_CONVERTERS[datatype]))
+
+        mappings[domain] = domain_mappings
+
+    return mappings
+
+
+def convert_column(values, mapping):
+    """Конвертирует колонку в список литералов (None для пропусков)"""
+    if mapping.datatype == XSD.dateTime:
+        parsed = pd.to_datetime(values, errors='coerce')
+        return [Literal(v.to_pydatetime(), datatype=XSD.dateTime) if pd.notna(v) else None
+                for v in parsed]
+
+    if mapping.datatype in (XSD.integer, XSD.float, XSD.boolean) and not pd.api.types.is_numeric_dtype(values):
+        # Нечисловые значения не пишутся (их учитывает проверка схемы)
+        values = pd.to_numeric(values, errors='coerce')
+
+    converter = mapping.converter
+    datatype = mapping.datatype
+    mask = values.notna().tolist()
+    return [Literal(converter(v), datatype=datatype) if present else None
+            for v, present in zip(values.tolist(), mask)]
+
+
+def compile_block_emitter(mappings, columns):
+    """Компилирует маппинг в эмиттер триплетов для блока строк DataFrame"""
+    active = [m for m in mappings if m.column in columns]
+
+    def emit(subjects, block):
+        for mapping in active:
+            predicate = mapping.predicate
+            for subject, literal in zip(subjects, convert_column(block[mapping.column], mapping)):
+                if literal is not None:
+                    yield (subject, predicate, literal)
+
+    emit.mappings = active
+    return emit
@@ -6,6 +6,13 @@
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, Literal, URIRef
 from rdflib.namespace import XSD
 from pathlib import Path
+import argparse
+
+from graph_formats import check_compression, parse_formats, write_formats
+from graph_partitions import nt_term
+
+# Сгенерированный модуль схемы: константы классов и свойств и триплеты схемы в N-Triples
+SCHEMA_MODULE = Path(__file__).parent / "wot_schema.py"
 
 class WoTOntologyCreator:
     def __init__(self):
@@ -40,6 +47,11 @@ class WoTOntologyCreator:
             "Онтология для игры Мир Танков, представляющая танки, бои, игроков и их взаимосвязи", 
             lang="ru"
         )))
+        
+        # Отметка профиля графа с данными (full/lean), ставится импортером
+        self.g.add((self.WOT.graphProfile, RDF.type, OWL.AnnotationProperty))
+        self.g.add((self.WOT.graphProfile, RDFS.label, Literal("graph profile", lang="en")))
+        self.g.add((self.WOT.graphProfile, RDFS.label, Literal("профиль графа", lang="ru")))
     
     def create_classes(self):
         """Создает классы онтологии"""
@@ -255,6 +267,7 @@ class WoTOntologyCreator:
             'spawn': (XSD.integer, 'spawn', 'сторона'),
             'platoon': (XSD.integer, 'platoon', 'взвод'),
             'onMap': (XSD.string, 'on map', 'на карте'),
+            'winnerSpawn': (XSD.integer, 'winner spawn', 'сторона победителя'),
         }
         
         for prop_name, (datatype, label_en, label_ru) in battle_properties.items():
@@ -293,6 +306,10 @@ class WoTOntologyCreator:
             'lifeTime': (XSD.integer, 'life time', 'время жизни'),
             'distanceTraveled': (XSD.integer, 'distance traveled', 'пройденное расстояние'),
             'baseXP': (XSD.integer, 'base XP', 'базовый опыт'),
+            # Факты игрока в консолидированном бою (иначе won/spawn/platoon лежат на Battle)
+            'playerWon': (XSD.boolean, 'player won', 'победа игрока'),
+            'playerSpawn': (XSD.integer, 'player spawn', 'сторона игрока'),
+            'playerPlatoon': (XSD.integer, 'player platoon', 'взвод игрока'),
         }
         
         for prop_name, (datatype, label_en, label_ru) in performance_properties.items():
@@ -343,16 +360,16 @@ class WoTOntologyCreator:
             self.g.add((nation_uri, self.WOT.nationName, Literal(nation_en)))
             self.g.add((nation_uri, self.WOT.nationCode, Literal(nation_code)))
     
-    def save_ontology(self):
-        """Сохраняет онтологию в файл"""
+    def save_ontology(self, formats=('owl',), compression=None):
+        """Сохраняет онтологию в файлы выбранных форматов"""
         print("\nSaving ontology...")
         
-        # Сохраняем только в OWL формат (RDF/XML для Protégé)
-        filename = 'wot_ontology.owl'
-        filepath = self.ontology_dir / filename
-        self.g.serialize(destination=str(filepath), format='xml')
-        file_size = filepath.stat().st_size / 1024  # KB
-        print(f"  Saved: {filepath} ({file_size:.1f} KB)")
+        # OWL (RDF/XML) - для Protégé, остальные форматы быстрее загружаются импортером
+        reports, _ = write_formats(self.g, self.ontology_dir / 'wot_ontology', formats, compression)
+        for report in reports:
+            print(f"  Saved: {report['file']} ({report['bytes'] / 1024:.1f} KB, {report['seconds']:.2f} s)")
+        
+        self.save_schema_module()
         
         # Выводим статистику
         print("\n" + "=" * 60)
@@ -364,7 +381,61 @@ class WoTOntologyCreator:
         print(f"Datatype Properties: {len(list(self.g.subjects(RDF.type, OWL.DatatypeProperty)))}")
         print(f"Individuals: {len(list(self.g.subjects(RDF.type, self.WOT.Nation)))}")
     
-    def create_full_ontology(self):
+    def local_name(self, uri):
+        """Имя термина без namespace (XSD типы - как XSD.<тип>)"""
+        if str(uri).startswith(str(XSD)):
+            return f"XSD.{uri[len(str(XSD)):]}"
+        return uri[len(str(self.WOT)):]
+    
+    def save_schema_module(self, path=SCHEMA_MODULE):
+        """Генерирует wot_schema.py: импортер добавляет схему без разбора OWL"""
+        terms = sorted({self.local_name(uri) for uri in self.g.all_nodes()
+                        if isinstance(uri, URIRef) and str(uri).startswith(str(self.WOT))})
+        classes = sorted(self.local_name(uri) for uri in self.g.subjects(RDF.type, OWL.Class))
+        
+        def properties(kind):
+            # Свойство может быть объявлено для нескольких классов (avgDamage у Gun и Player)
+            return {self.local_name(prop): (tuple(sorted(self.local_name(d) for d in self.g.objects(prop, RDFS.domain))),
+                                            tuple(sorted(self.local_name(r) for r in self.g.objects(prop, RDFS.range))))
+                    for prop in sorted(self.g.subjects(RDF.type, kind))}
+        
+        lines = [
+            '#!/usr/bin/env python3',
+            '"""',
+            'Схема онтологии World of Tanks (сгенерировано create_ontology.py, не редактировать)',
+            '',
+            'Константы классов и свойств (WOT - закрытый namespace: опечатка в имени термина',
+            'дает AttributeError), domain/range свойств и триплеты схемы в N-Triples,',
+            'которые импортер добавляет в граф без разбора wot_ontology.owl',
+            '"""',
+            '',
+            'from rdflib import Namespace, URIRef',
+            'from rdflib.namespace import XSD, DefinedNamespace',
+            '',
+            '',
+            'class WOT(DefinedNamespace):',
+            '    _NS = Namespace("http://www.semanticweb.org/ontology/wot#")',
+            '    _fail = True',
+            '',
+        ]
+        lines += [f'    {term}: URIRef' for term in terms]
+        lines += ['', '', f'CLASSES = {classes!r}', '', '# Свойство -> (классы domain, range)']
+        for name, kind in (('OBJECT_PROPERTIES', OWL.ObjectProperty), ('DATATYPE_PROPERTIES', OWL.DatatypeProperty)):
+            lines.append(f'{name} = {{')
+            for prop, (domains, ranges) in properties(kind).items():
+                ranges = ', '.join(value if value.startswith('XSD.') else repr(value) for value in ranges)
+                lines.append(f'    {prop!r}: ({domains!r}, ({ranges},)),')
+            lines += ['}', '']
+        namespaces = {prefix: str(uri) for prefix, uri in self.g.namespaces()
+                      if prefix in ('wot', 'owl', 'rdf', 'rdfs', 'xsd')}
+        lines += [f'NAMESPACES = {namespaces!r}', '', '# Триплеты схемы (строки N-Triples)', 'SCHEMA_TRIPLES = (']
+        lines += [f'    {line!r},' for line in sorted(f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n"
+                                                     for s, p, o in self.g)]
+        lines.append(')')
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        print(f"  Saved: {path} ({len(self.g)} schema triples, {len(terms)} terms)")
+    
+    def create_full_ontology(self, formats=('owl',), compression=None):
         """Создает полную онтологию"""
         print("=" * 60)
         print("CREATING WORLD OF TANKS ONTOLOGY")
@@ -375,7 +446,7 @@ class WoTOntologyCreator:
         self.create_object_properties()
         self.create_datatype_properties()
         self.create_nation_individuals()
-        self.save_ontology()
+        self.save_ontology(formats, compression)
         
         print("\n" + "=" * 60)
         print("ONTOLOGY CREATION COMPLETED!")
@@ -388,8 +459,20 @@ class WoTOntologyCreator:
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Create World of Tanks OWL ontology')
+    parser.add_argument('--formats', type=str, default='owl',
+                       help='Comma-separated output formats: owl, nt, ttl, nq (default: owl)')
+    parser.add_argument('--compress', choices=['gzip', 'zstd'], default=None,
+                       help='Compress output files (zstd requires the zstandard package)')
+    args = parser.parse_args()
+    try:
+        formats = parse_formats(args.formats)
+        check_compression(args.compress)
+    except ValueError as e:
+        parser.error(str(e))
+    
     creator = WoTOntologyCreator()
-    creator.create_full_ontology()
+    creator.create_full_ontology(formats, args.compress)
 
 
 if __name__ == "__main__":
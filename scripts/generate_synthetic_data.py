@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Генератор синтетических данных World of Tanks для тестов и бенчмарков
+
+Пишет tomato.csv и wot_data.csv с теми же колонками, что и исходные датасеты
+(Kaggle / GitHub), любого размера и детерминированно по seed
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import argparse
+import time
+
+
+# Колонки tomato.csv в порядке исходного датасета
+TOMATO_COLUMNS = [
+    'battle_time', 'tank_id', 'name', 'display_name', 'nation', 'class', 'tier', 'max_health',
+    'duration', 'won', 'spawn', 'platoon', 'damage', 'sniper_damage', 'damage_received',
+    'damage_received_from_invisible', 'potential_damage_received', 'damage_blocked',
+    'shots_fired', 'direct_hits', 'penetrations', 'hits_received', 'penetrations_received',
+    'splash_hits_received', 'spots', 'frags', 'tracking_assist', 'spotting_assist',
+    'base_defense_points', 'base_capture_points', 'life_time', 'distance_traveled', 'base_xp',
+]
+
+# Колонки wot_data.csv (разделитель ';')
+WOT_DATA_COLUMNS = [
+    'tank_id', 'name', 'short_name', 'nation', 'type', 'tier', 'is_premium', 'is_gift',
+    'is_wheeled', 'price_credit', 'price_gold', 'hp', 'hull_hp', 'hull_weight', 'weight',
+    'speed_forward', 'speed_backward', 'engine', 'engine.power', 'gun', 'gun.name',
+    'gun.fire_rate', 'gun.aim_time', 'ammo.avg_damage', 'ammo.avg_penetration', 'dpm',
+    'turret', 'suspension', 'radio',
+]
+
+# Нация: код в wot_data.csv, название в tomato.csv, доля танков
+NATIONS = [
+    ('ussr', 'USSR', 0.17), ('germany', 'Germany', 0.16), ('usa', 'USA', 0.14),
+    ('france', 'France', 0.10), ('uk', 'UK', 0.10), ('china', 'China', 0.07),
+    ('japan', 'Japan', 0.06), ('czech', 'Czech', 0.04), ('sweden', 'Sweden', 0.05),
+    ('poland', 'Poland', 0.04), ('italy', 'Italy', 0.07),
+]
+
+# Тип в wot_data.csv, класс в tomato.csv, доля танков, множители HP/урона/скорости
+TANK_TYPES = [
+    ('lightTank', 'LT', 0.15, 0.75, 0.70, 1.35),
+    ('mediumTank', 'MT', 0.35, 1.00, 1.00, 1.10),
+    ('heavyTank', 'HT', 0.25, 1.35, 1.25, 0.80),
+    ('AT-SPG', 'TD', 0.18, 0.95, 1.40, 0.90),
+    ('SPG', 'SPG', 0.07, 0.60, 1.60, 0.75),
+]
+
+# Известные танки, чтобы примеры запросов (например, 'B-C 25 t') находили данные
+KNOWN_TANKS = [
+    ('B-C 25 t', 'france', 'mediumTank', 10), ('IS-7', 'ussr', 'heavyTank', 10),
+    ('T-34', 'ussr', 'mediumTank', 5), ('Tiger I', 'germany', 'heavyTank', 7),
+    ('Leopard 1', 'germany', 'mediumTank', 10), ('Maus', 'germany', 'heavyTank', 10),
+    ('T110E5', 'usa', 'heavyTank', 10), ('M48A5 Patton', 'usa', 'mediumTank', 10),
+    ('FV215b', 'uk', 'heavyTank', 10), ('WZ-111 model 5A', 'china', 'heavyTank', 10),
+    ('STB-1', 'japan', 'mediumTank', 10), ('TVP T 50/51', 'czech', 'mediumTank', 10),
+    ('Kranvagn', 'sweden', 'heavyTank', 10), ('60TP Lewandowskiego', 'poland', 'heavyTank', 10),
+    ('Progetto M40 mod. 65', 'italy', 'mediumTank', 10), ('Object 140', 'ussr', 'mediumTank', 10),
+    ('AMX 13 105', 'france', 'lightTank', 10), ('Grille 15', 'germany', 'AT-SPG', 10),
+    ('Conqueror Gun Carriage', 'uk', 'SPG', 10), ('KV-1', 'ussr', 'heavyTank', 5),
+]
+
+# Карты и их популярность
+MAPS = [
+    ('Himmelsdorf', 6), ('Prokhorovka', 6), ('Ensk', 5), ('Murovanka', 4), ('Lakeville', 5),
+    ('Mines', 5), ('Cliff', 4), ('Malinovka', 5), ('Karelia', 3), ('Robin', 3),
+    ('Westfield', 4), ('Steppes', 3), ('Fisherman\'s Bay', 4), ('Sand River', 3), ('El Halluf', 3),
+    ('Airfield', 3), ('Overlord', 4), ('Redshire', 3), ('Siegfried Line', 3), ('Ruinberg', 4),
+    ('Live Oaks', 3), ('Mountain Pass', 2), ('Abbey', 3), ('Tundra', 3), ('Paris', 3),
+    ('Studzianki', 3), ('Pilsen', 3), ('Glacier', 2), ('Empire\'s Border', 2), ('Serene Coast', 2),
+]
+
+# Отслеживаемых игроков в матче и доли матчей: строки одного матча (время, карта, длительность)
+# сливает --consolidate-battles импортера
+MATCH_SIZES = [(1, 0.6), (2, 0.2), (3, 0.12), (4, 0.08)]
+
+BATTLE_PERIOD_START = pd.Timestamp('2023-01-01')
+BATTLE_PERIOD_DAYS = 180
+
+
+class SyntheticDataGenerator:
+    def __init__(self, seed=42, tanks=700, configs_per_tank=20):
+        """Инициализация генератора"""
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.tanks = self.generate_tank_catalog(tanks)
+        self.configs_per_tank = configs_per_tank
+
+    def generate_tank_catalog(self, count):
+        """Каталог танков: нация, тип, уровень, базовые характеристики"""
+        rng = self.rng
+        count = max(count, len(KNOWN_TANKS))
+        nation_weights = np.array([w for _, _, w in NATIONS])
+        type_weights = np.array([t[2] for t in TANK_TYPES])
+
+        nations = rng.choice(len(NATIONS), size=count, p=nation_weights / nation_weights.sum())
+        types = rng.choice(len(TANK_TYPES), size=count, p=type_weights / type_weights.sum())
+        tiers = rng.integers(1, 11, size=count)
+        names = []
+        for idx in range(count):
+            if idx < len(KNOWN_TANKS):
+                name, nation, tank_type, tier = KNOWN_TANKS[idx]
+                nations[idx] = [code for code, _, _ in NATIONS].index(nation)
+                types[idx] = [t[0] for t in TANK_TYPES].index(tank_type)
+                tiers[idx] = tier
+                names.append(name)
+            else:
+                names.append(f"{NATIONS[nations[idx]][1]} {TANK_TYPES[types[idx]][1]}-{idx}")
+
+        hp_factor = np.array([t[3] for t in TANK_TYPES])[types]
+        damage_factor = np.array([t[4] for t in TANK_TYPES])[types]
+        speed_factor = np.array([t[5] for t in TANK_TYPES])[types]
+        premium = rng.random(count) < 0.15
+
+        catalog = pd.DataFrame({
+            'tank_id': np.arange(count) * 16 + 1,
+            'name': names,
+            'nation_idx': nations,
+            'type_idx': types,
+            'tier': tiers,
+            'is_premium': premium,
+            'is_gift': premium & (rng.random(count) < 0.1),
+            'is_wheeled': (types == 0) & (rng.random(count) < 0.15),
+            'hp': np.round((120 * tiers + 80) * hp_factor * rng.normal(1.0, 0.08, count)).astype(int),
+            'alpha': np.round((25 * tiers + 30) * damage_factor * rng.normal(1.0, 0.1, count)).astype(int),
+            'speed': np.round(45 * speed_factor * rng.normal(1.0, 0.1, count)).astype(int),
+        })
+        catalog['short_name'] = [name if len(name) <= 12 else name[:12] for name in catalog['name']]
+        # Популярность в боях: чаще играют на высоких уровнях, плюс "любимые" машины
+        popularity = (catalog['tier'] ** 1.5) * rng.pareto(2.0, count).clip(0, 20) + 0.1
+        catalog['popularity'] = popularity / popularity.sum()
+        return catalog
+
+    def generate_wot_data(self):
+        """Конфигурации танков (модули) в формате wot_data.csv"""
+        rng = self.rng
+        catalog = self.tanks
+        configs = rng.poisson(self.configs_per_tank, size=len(catalog)).clip(1, None)
+        tank_rows = np.repeat(np.arange(len(catalog)), configs)
+        tanks = catalog.iloc[tank_rows].reset_index(drop=True)
+        n = len(tanks)
+
+        tiers = tanks['tier'].to_numpy()
+        nation_idx = tanks['nation_idx'].to_numpy()
+        alpha = tanks['alpha'].to_numpy()
+        tank_types = [TANK_TYPES[t][0] for t in tanks['type_idx']]
+
+        # Модули общие для танков одной нации и соседних уровней (как в игре)
+        module_tier = np.clip(tiers + rng.integers(-1, 1, size=n), 1, 10)
+        gun_ids = nation_idx * 10000 + module_tier * 100 + rng.integers(0, 20, size=n)
+        engine_ids = nation_idx * 10000 + module_tier * 100 + rng.integers(20, 35, size=n)
+        turret_ids = tanks['tank_id'].to_numpy() * 10 + rng.integers(0, 3, size=n)
+        suspension_ids = tanks['tank_id'].to_numpy() * 10 + 5 + rng.integers(0, 2, size=n)
+        radio_ids = nation_idx * 10000 + module_tier * 100 + rng.integers(50, 55, size=n)
+
+        gun_alpha = np.round(alpha * rng.normal(1.0, 0.08, n)).astype(int)
+        fire_rate = np.clip(rng.normal(60.0 / np.sqrt(tiers + 1), 1.2, n), 1.0, 30.0)
+        price_credit = np.where(tanks['is_premium'], 0, (tiers ** 3) * 1000 + rng.integers(0, 50, n) * 100)
+        price_gold = np.where(tanks['is_premium'] & ~tanks['is_gift'], tiers * 1250, 0)
+        weight = np.round(tiers * 4500 * rng.normal(1.0, 0.1, n)).astype(int)
+
+        df = pd.DataFrame({
+            'tank_id': tanks['tank_id'],
+            'name': tanks['name'],
+            'short_name': tanks['short_name'],
+            'nation': [NATIONS[i][0] for i in nation_idx],
+            'type': tank_types,
+            'tier': tiers,
+            'is_premium': tanks['is_premium'],
+            'is_gift': tanks['is_gift'],
+            'is_wheeled': tanks['is_wheeled'],
+            'price_credit': price_credit,
+            'price_gold': price_gold,
+            'hp': tanks['hp'],
+            'hull_hp': np.round(tanks['hp'] * 0.8).astype(int),
+            'hull_weight': np.round(weight * 0.45).astype(int),
+            'weight': weight,
+            'speed_forward': tanks['speed'],
+            'speed_backward': np.maximum(np.round(tanks['speed'] * 0.35).astype(int), 4),
+            'engine': engine_ids,
+            'engine.power': np.round(weight * rng.normal(0.02, 0.003, n)).astype(int),
+            'gun': gun_ids,
+            'gun.name': [f"{NATIONS[i][1]} Gun {g % 10000}" for i, g in zip(nation_idx, gun_ids)],
+            'gun.fire_rate': fire_rate,
+            'gun.aim_time': np.clip(rng.normal(2.2, 0.35, n), 1.2, 4.5),
+            'ammo.avg_damage': gun_alpha,
+            'ammo.avg_penetration': np.round(tiers * 24 + rng.normal(40, 15, n)).astype(int),
+            'dpm': np.round(gun_alpha * fire_rate).astype(int),
+            'turret': turret_ids.astype(float),
+            'suspension': suspension_ids,
+            'radio': radio_ids,
+        })
+        # Пропуски, как в исходном датасете: у части машин нет башни или имени орудия
+        df.loc[rng.random(n) < 0.08, 'turret'] = np.nan
+        df.loc[rng.random(n) < 0.01, 'gun.name'] = None
+        return df[WOT_DATA_COLUMNS]
+
+    def generate_battles(self, count):
+        """Блок боев в формате tomato.csv"""
+        rng = self.rng
+        catalog = self.tanks
+        tank_idx = rng.choice(len(catalog), size=count, p=catalog['popularity'].to_numpy())
+        tanks = catalog.iloc[tank_idx]
+
+        tiers = tanks['tier'].to_numpy()
+        hp = tanks['hp'].to_numpy()
+        alpha = tanks['alpha'].to_numpy()
+        type_idx = tanks['type_idx'].to_numpy()
+        # Строки группируются в матчи: у строк матча общие время, карта и длительность
+        sizes = rng.choice([size for size, _ in MATCH_SIZES], size=count, p=[share for _, share in MATCH_SIZES])
+        match_idx = np.repeat(np.arange(count), sizes)[:count]
+        matches = match_idx[-1] + 1 if count else 0
+
+        map_names = [name for name, _ in MAPS]
+        map_weights = np.array([w for _, w in MAPS], dtype=float)
+        match_map = rng.choice(len(MAPS), size=matches, p=map_weights / map_weights.sum())
+        map_idx = match_map[match_idx]
+
+        # Исход матча - сторона победителя; стороны немного неравны на части карт,
+        # чтобы запросы дисбаланса что-то находили
+        winner = np.where(rng.random(matches) < 0.5 + np.where(match_map % 5 == 0, 0.06, 0.0), 1, 2)
+        spawn = rng.integers(1, 3, size=count)
+        won = spawn == winner[match_idx]
+        skill = rng.normal(0.0, 0.12, size=count)
+
+        duration = np.clip(rng.normal(420, 110, matches), 90, 900).astype(int)[match_idx]
+        life_time = np.minimum((duration * rng.beta(3, 1.5, count)).astype(int), duration)
+        shots_fired = rng.poisson(np.where(type_idx == 4, 12, 9) * (1 + skill))
+        direct_hits = rng.binomial(shots_fired, np.clip(0.75 + skill * 0.3, 0.3, 0.98))
+        penetrations = rng.binomial(direct_hits, 0.8)
+        damage = np.round(penetrations * alpha * rng.normal(1.0, 0.25, count).clip(0.5, 1.5)).astype(int)
+        hits_received = rng.poisson(6, count)
+        penetrations_received = rng.binomial(hits_received, 0.7)
+        damage_received = np.minimum(np.round(penetrations_received * alpha * 0.9).astype(int), hp)
+        spots = rng.poisson(np.where(type_idx == 0, 3.0, 0.9))
+        frags = rng.poisson(0.8 * (1 + skill).clip(0.2, None))
+
+        df = pd.DataFrame({
+            'battle_time': (BATTLE_PERIOD_START + pd.to_timedelta(
+                rng.integers(0, BATTLE_PERIOD_DAYS * 86400, size=matches)[match_idx],
+                unit='s')).strftime('%Y-%m-%d %H:%M:%S'),
+            'tank_id': tanks['tank_id'].to_numpy(),
+            'name': tanks['name'].to_numpy(),
+            'display_name': np.array(map_names, dtype=object)[map_idx],
+            'nation': [NATIONS[i][1] for i in tanks['nation_idx']],
+            'class': [TANK_TYPES[t][1] for t in type_idx],
+            'tier': tiers,
+            'max_health': hp,
+            'duration': duration,
+            'won': won,
+            'spawn': spawn,
+            'platoon': np.where(rng.random(count) < 0.8, 0, rng.integers(1, 3, size=count)),
+            'damage': damage,
+            'sniper_damage': np.round(damage * rng.beta(1.5, 3, count)).astype(int),
+            'damage_received': damage_received,
+            'damage_received_from_invisible': np.round(damage_received * rng.beta(1, 4, count)).astype(int),
+            'potential_damage_received': np.round(damage_received * rng.uniform(1.5, 4.0, count)).astype(int),
+            'damage_blocked': np.round((hits_received - penetrations_received) * alpha * 0.8).astype(int),
+            'shots_fired': shots_fired,
+            'direct_hits': direct_hits,
+            'penetrations': penetrations,
+            'hits_received': hits_received,
+            'penetrations_received': penetrations_received,
+            'splash_hits_received': rng.poisson(0.3, count),
+            'spots': spots,
+            'frags': frags,
+            'tracking_assist': np.round(rng.exponential(150, count)).astype(int),
+            'spotting_assist': np.round(spots * rng.exponential(250, count)).astype(int),
+            'base_defense_points': np.where(rng.random(count) < 0.15, rng.integers(1, 100, count), 0),
+            'base_capture_points': np.where(rng.random(count) < 0.1, rng.integers(1, 100, count), 0),
+            'life_time': life_time,
+            'distance_traveled': np.round(life_time * tanks['speed'].to_numpy() * rng.uniform(0.05, 0.2, count)).astype(int),
+            'base_xp': np.round((damage / np.maximum(hp, 1)) * 400 + frags * 60 + won * 200 + rng.normal(150, 40, count).clip(0, None)).astype(int),
+        })
+        # Немного мусора, который отсекает clean_data
+        bad = rng.random(count)
+        df.loc[bad < 0.004, 'damage'] = -1
+        df.loc[(bad >= 0.004) & (bad < 0.007), 'duration'] = 0
+        return df[TOMATO_COLUMNS]
+
+    def write_wot_data(self, path):
+        """Пишет wot_data.csv"""
+        df = self.generate_wot_data()
+        df.to_csv(path, sep=';', index=False)
+        return len(df)
+
+    def write_battles(self, path, count, chunk_size=200000):
+        """Пишет tomato.csv блоками, чтобы не держать все бои в памяти"""
+        written = 0
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            while written < count:
+                block = self.generate_battles(min(chunk_size, count - written))
+                block.to_csv(f, index=False, header=written == 0)
+                written += len(block)
+                print(f"  Generated {written:,}/{count:,} battles")
+        return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic tomato.csv and wot_data.csv')
+    parser.add_argument('--battles', type=int, default=100000,
+                        help='Number of battles in tomato.csv (default: 100000)')
+    parser.add_argument('--tanks', type=int, default=700,
+                        help='Number of distinct tanks (default: 700)')
+    parser.add_argument('--configs-per-tank', type=int, default=20,
+                        help='Average module configurations per tank in wot_data.csv (default: 20)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Random seed (default: 42)')
+    parser.add_argument('--output-dir', type=str, default=None,
+                        help='Directory for the CSV files (default: data/)')
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir) if args.output_dir else Path(__file__).parent.parent / "data"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 60)
+    print("WORLD OF TANKS - SYNTHETIC DATA GENERATOR")
+    print("=" * 60)
+    print(f"  Battles: {args.battles:,}")
+    print(f"  Tanks: {args.tanks:,}")
+    print(f"  Seed: {args.seed}")
+    print(f"  Output: {output_dir}")
+
+    start_time = time.time()
+    generator = SyntheticDataGenerator(seed=args.seed, tanks=args.tanks,
+                                       configs_per_tank=args.configs_per_tank)
+    configs = generator.write_wot_data(output_dir / "wot_data.csv")
+    print(f"\n✅ wot_data.csv: {configs:,} configurations of {len(generator.tanks):,} tanks")
+    battles = generator.write_battles(output_dir / "tomato.csv", args.battles)
+    print(f"✅ tomato.csv: {battles:,} battles")
+    print(f"⏱️  Generated in {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
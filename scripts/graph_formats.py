@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Форматы сериализации графа знаний World of Tanks
+
+Граф пишется в несколько форматов (owl - RDF/XML для Protégé, nt, ttl, nq),
+по желанию со сжатием gzip или zstd. N-Triples и N-Quads пишутся потоком строк,
+форматы - параллельно в процессах (fork) из одного графа в памяти; файлы одной записи
+получают общее время изменения. При загрузке из файлов одного графа рядом выбирается
+самый быстрый для разбора формат, но не старше запрошенного файла
+"""
+
+import gc
+import gzip
+import io
+import multiprocessing
+import os
+import time
+from pathlib import Path
+
+from rdflib import URIRef
+from rdflib.plugins.stores.memory import Memory, SimpleMemory
+
+from graph_partitions import load_nt_lines, nt_term
+
+try:
+    import zstandard
+except ImportError:  # zstd - необязательная зависимость
+    zstandard = None
+
+
+# Формат -> (формат rdflib, расширение файла)
+FORMATS = {
+    'owl': ('xml', '.owl'),
+    'nt': ('nt', '.nt'),
+    'ttl': ('turtle', '.ttl'),
+    'nq': ('nquads', '.nq'),
+}
+
+# Сжатие -> расширение файла
+COMPRESSIONS = {
+    None: '',
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+# Порядок выбора при загрузке: от самого быстрого для разбора формата к самому медленному
+LOAD_PREFERENCE = ['nt', 'nq', 'ttl', 'owl']
+
+# Именованный граф строк N-Quads
+NQ_GRAPH = URIRef("http://www.semanticweb.org/ontology/wot")
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Строк N-Triples в одной записи в поток
+WRITE_BATCH_SIZE = 50000
+
+
+def parse_formats(text):
+    """Список форматов из строки вида owl,nt,ttl"""
+    formats = [name.strip() for name in text.split(',') if name.strip()]
+    unknown = [name for name in formats if name not in FORMATS]
+    if unknown or not formats:
+        raise ValueError(f"formats must be a comma-separated subset of: {', '.join(FORMATS)}")
+    return list(dict.fromkeys(formats))
+
+
+def check_compression(compression):
+    """Проверяет, что сжатие поддерживается в этом окружении"""
+    if compression not in COMPRESSIONS:
+        raise ValueError("compression must be one of: gzip, zstd")
+    if compression == 'zstd' and zstandard is None:
+        raise ValueError("zstd compression requires the zstandard package (pip install zstandard)")
+
+
+def graph_path(base, format_name, compression=None):
+    """Файл графа для формата и сжатия: <base>.<формат>[.gz|.zst]"""
+    base = Path(base)
+    return base.with_name(base.name + FORMATS[format_name][1] + COMPRESSIONS[compression])
+
+
+def split_graph_path(path):
+    """(база, формат, сжатие) для файла графа; формат None, если расширение неизвестно"""
+    path = Path(path)
+    compression = next((name for name, suffix in COMPRESSIONS.items() if suffix and path.name.endswith(suffix)), None)
+    name = path.name[:len(path.name) - len(COMPRESSIONS[compression])]
+    for format_name, (_, suffix) in FORMATS.items():
+        if name.endswith(suffix):
+            return path.with_name(name[:-len(suffix)]), format_name, compression
+    return path.with_name(name), None, compression
+
+
+def available_graph_files(path, stale=None):
+    """Файлы того же графа рядом с path в порядке скорости загрузки
+
+    Файл старше самого path (граф пересобран без этого формата) не берется и добавляется в stale
+    """
+    path = Path(path)
+    base, _, _ = split_graph_path(path)
+    requested_mtime = path.stat().st_mtime if path.is_file() else None
+    candidates = []
+    for format_name in LOAD_PREFERENCE:
+        for compression in COMPRESSIONS:
+            if compression == 'zstd' and zstandard is None:
+                continue
+            candidate = graph_path(base, format_name, compression)
+            if not candidate.exists():
+                continue
+            if requested_mtime is not None and candidate != path and candidate.stat().st_mtime < requested_mtime:
+                if stale is not None:
+                    stale.append(candidate)
+                continue
+            candidates.append(candidate)
+    return candidates
+
+
+def fastest_graph_file(path):
+    """Самый быстрый для загрузки файл графа из лежащих рядом (или сам path)"""
+    path = Path(path)
+    if path.is_dir():
+        return path
+    stale = []
+    candidates = available_graph_files(path, stale)
+    for candidate in stale:
+        print(f"⚠️  Skipping {candidate.name}: older than {path.name} (stale copy of the graph)")
+    return candidates[0] if candidates else path
+
+
+def open_output(path, compression=None):
+    """Бинарный поток записи с нужным сжатием"""
+    if compression == 'gzip':
+        return gzip.open(path, 'wb', compresslevel=GZIP_LEVEL)
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, 'wb'), closefd=True)
+    return open(path, 'wb')
+
+
+def open_input(path, compression=None):
+    """Бинарный поток чтения с распаковкой"""
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'zstd':
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return open(path, 'rb')
+
+
+def write_nt_lines(triples, stream, graph_name=None):
+    """Пишет тройки потоком строк N-Triples (graph_name - строки N-Quads)"""
+    ending = f" {nt_term(graph_name)} .\n" if graph_name is not None else " .\n"
+    lines = []
+    for s, p, o in triples:
+        lines.append(f"{nt_term(s)} {nt_term(p)} {nt_term(o)}{ending}")
+        if len(lines) >= WRITE_BATCH_SIZE:
+            stream.write(''.join(lines).encode('utf-8'))
+            lines = []
+    stream.write(''.join(lines).encode('utf-8'))
+
+
+def write_graph(graph, path, format_name, compression=None):
+    """Записывает граф в один формат"""
+    with open_output(path, compression) as stream:
+        if format_name == 'nt':
+            write_nt_lines(graph, stream)
+        elif format_name == 'nq':
+            write_nt_lines(graph, stream, graph_name=NQ_GRAPH)
+        else:
+            graph.serialize(destination=stream, format=FORMATS[format_name][0], encoding='utf-8')
+    return path
+
+
+def load_graph(graph, path):
+    """Загружает файл графа в граф по расширению (N-Triples/N-Quads - быстрым загрузчиком)"""
+    _, format_name, compression = split_graph_path(path)
+    format_name = format_name or 'owl'
+    with open_input(path, compression) as stream:
+        if format_name in ('nt', 'nq'):
+            load_nt_lines(graph, io.TextIOWrapper(stream, encoding='utf-8'), quads=format_name == 'nq')
+        else:
+            graph.parse(source=stream, format=FORMATS[format_name][0])
+    return graph
+
+
+# Граф, который процессы записи получают через fork
+_write_graph = None
+
+
+def write_task(task):
+    """Записывает один формат (выполняется в процессе пула или последовательно)"""
+    format_name, path, compression = task
+    start_time = time.perf_counter()
+    write_graph(_write_graph, path, format_name, compression)
+    return {
+        'format': format_name,
+        'file': str(path),
+        'compression': compression,
+        'seconds': time.perf_counter() - start_time,
+        'bytes': Path(path).stat().st_size,
+        'pid': os.getpid(),
+    }
+
+
+def write_formats(graph, base, formats, compression=None, workers=None):
+    """Пишет граф во все форматы, по процессу на формат; возвращает (отчеты, процессы)"""
+    global _write_graph
+    check_compression(compression)
+    tasks = [(format_name, graph_path(base, format_name, compression), compression) for format_name in formats]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks)))
+    # Дисковые store не переживают fork, поэтому параллельно пишем только граф в памяти
+    parallel = (workers > 1 and isinstance(graph.store, (Memory, SimpleMemory))
+                and 'fork' in multiprocessing.get_all_start_methods())
+
+    _write_graph = graph
+    try:
+        if not parallel:
+            reports, workers = [write_task(task) for task in tasks], 1
+        else:
+            # Объекты графа не трогаются сборщиком мусора, страницы остаются общими после fork
+            gc.freeze()
+            try:
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    reports = pool.map(write_task, tasks, chunksize=1)
+            finally:
+                gc.unfreeze()
+    finally:
+        _write_graph = None
+    stamp_files([report['file'] for report in reports])
+    return reports, workers
+
+
+def stamp_files(paths):
+    """Общее время изменения файлов одной записи: форматы пишутся разное время, но граф один"""
+    stamp = max(Path(path).stat().st_mtime_ns for path in paths)
+    for path in paths:
+        os.utime(path, ns=(stamp, stamp))
+
+
+def print_write_report(reports, wall_time, workers):
+    """Печатает время записи и размер каждого формата"""
+    print(f"\n💾 Output formats (wall {wall_time:.2f} s, {workers} process(es)):")
+    for report in reports:
+        print(f"   {report['format']:<4} {report['seconds']:8.2f} s  {report['bytes'] / (1024 * 1024):9.2f} MB  "
+              f"{Path(report['file']).name}")
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Партиционированное хранение графа знаний World of Tanks
+
+Граф сохраняется в директорию набором N-Triples файлов: схема онтологии,
+каталог (танки, модули, нации) и бои с результатами по месяцам. В manifest.json
+для каждой партиции записаны предикаты и классы ее субъектов, по которым
+движок запросов загружает только нужные запросу партиции
+"""
+
+import json
+import re
+from datetime import date, datetime
+from pathlib import Path
+
+from rdflib import BNode, Literal, RDF, URIRef, Variable
+from rdflib.namespace import OWL
+from rdflib.paths import AlternativePath, InvPath, MulPath, NegatedPath, SequencePath
+from rdflib.plugins.sparql.parserutils import CompValue
+
+
+MANIFEST_FILE = 'manifest.json'
+
+# Литерал в записи nt_term: "лексема" с необязательным ^^<тип> или @язык
+LITERAL_PATTERN = re.compile(r'^"(.*)"(?:\^\^<([^>]*)>|@([A-Za-z0-9-]+))?$', re.DOTALL)
+ESCAPE_PATTERN = re.compile(r'\\(.)')
+UNESCAPES = {'n': '\n', 'r': '\r'}
+
+# Триплетов в одной пачке addN при загрузке партиции
+LOAD_BATCH_SIZE = 50000
+
+# Классы субъектов, относящихся к схеме онтологии
+SCHEMA_TYPES = {OWL.Ontology, OWL.Class, OWL.ObjectProperty, OWL.DatatypeProperty,
+                OWL.AnnotationProperty, OWL.Restriction}
+
+
+def nt_term(term):
+    """Кодирует терм в синтаксис N-Triples"""
+    if isinstance(term, Literal):
+        lexical = (str(term).replace('\\', '\\\\').replace('"', '\\"')
+                   .replace('\n', '\\n').replace('\r', '\\r'))
+        if term.language:
+            return f'"{lexical}"@{term.language}'
+        if term.datatype:
+            return f'"{lexical}"^^<{term.datatype}>'
+        return f'"{lexical}"'
+    if isinstance(term, BNode):
+        return f"_:{term}"
+    return f"<{term}>"
+
+
+def parse_nt_term(text, terms):
+    """Разбирает терм, записанный nt_term; URI и blank node кешируются в terms"""
+    if text[0] == '"':
+        match = LITERAL_PATTERN.match(text)
+        lexical = match.group(1)
+        if '\\' in lexical:
+            lexical = ESCAPE_PATTERN.sub(lambda m: UNESCAPES.get(m.group(1), m.group(1)), lexical)
+        return Literal(lexical, lang=match.group(3), datatype=match.group(2))
+    term = terms.get(text)
+    if term is None:
+        term = BNode(text[2:]) if text.startswith('_:') else URIRef(text[1:-1])
+        terms[text] = term
+    return term
+
+
+def load_nt_lines(graph, lines, quads=False):
+    """Загружает в граф строки, записанные nt_term (быстрее общего N-Triples парсера rdflib)
+
+    quads=True - строки N-Quads с именем графа в конце, оно отбрасывается
+    """
+    terms = {}
+    batch = []
+    for line in lines:
+        line = line.rstrip('\n')
+        if not line or line.startswith('#'):
+            continue
+        line = line[:-2]
+        if quads:
+            line = line.rsplit(' ', 1)[0]
+        s, p, o = line.split(' ', 2)
+        batch.append((parse_nt_term(s, terms), parse_nt_term(p, terms), parse_nt_term(o, terms), graph))
+        if len(batch) >= LOAD_BATCH_SIZE:
+            graph.addN(batch)
+            batch = []
+    graph.addN(batch)
+
+
+def load_partition(graph, path):
+    """Загружает файл партиции в граф"""
+    with open(path, encoding='utf-8') as f:
+        load_nt_lines(graph, f)
+
+
+def battle_months(graph, namespace):
+    """Месяц (YYYY-MM) для каждого боя и результата боя"""
+    months = {}
+    for battle, battle_time in graph.subject_objects(namespace.battleTime):
+        value = battle_time.toPython() if isinstance(battle_time, Literal) else battle_time
+        months[battle] = value.strftime('%Y-%m') if hasattr(value, 'strftime') else str(value)[:7]
+    for performance, battle in graph.subject_objects(namespace.inBattle):
+        if battle in months:
+            months[performance] = months[battle]
+    return months
+
+
+def partition_of(subject, types, months, namespace):
+    """Имя партиции для субъекта по его классам и времени боя"""
+    if isinstance(subject, BNode) or types & SCHEMA_TYPES:
+        return 'schema'
+    if namespace.Battle in types or namespace.BattlePerformance in types or subject in months:
+        month = months.get(subject)
+        return f"battles-{month}" if month else 'battles-undated'
+    return 'catalog'
+
+
+def write_partitions(graph, namespace, directory):
+    """Записывает граф партициями в директорию, возвращает манифест"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    months = battle_months(graph, namespace)
+
+    subject_types = {}
+    for subject, subject_type in graph.subject_objects(RDF.type):
+        subject_types.setdefault(subject, set()).add(subject_type)
+
+    files = {}
+    partitions = {}
+    subject_partitions = {}
+    try:
+        for s, p, o in graph:
+            name = subject_partitions.get(s)
+            if name is None:
+                name = partition_of(s, subject_types.get(s, set()), months, namespace)
+                subject_partitions[s] = name
+            if name not in files:
+                files[name] = open(directory / f"{name}.nt", 'w', encoding='utf-8')
+                partitions[name] = {'triples': 0, 'predicates': set(), 'classes': set(),
+                                    'time_min': None, 'time_max': None}
+            files[name].write(f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n")
+
+            partition = partitions[name]
+            partition['triples'] += 1
+            partition['predicates'].add(str(p))
+            if p == RDF.type:
+                partition['classes'].add(str(o))
+            elif p == namespace.battleTime:
+                # Индекс времени шарда: минимальное и максимальное время боя
+                value = o.toPython()
+                if hasattr(value, 'isoformat'):
+                    if partition['time_min'] is None or value < partition['time_min']:
+                        partition['time_min'] = value
+                    if partition['time_max'] is None or value > partition['time_max']:
+                        partition['time_max'] = value
+    finally:
+        for f in files.values():
+            f.close()
+
+    manifest = {
+        'format': 'nt',
+        'namespaces': {prefix: str(uri) for prefix, uri in graph.namespaces()},
+        'partitions': [],
+    }
+    for name in sorted(partitions, key=lambda name: (not name == 'schema', name)):
+        partition = partitions[name]
+        manifest['partitions'].append({
+            'name': name,
+            'file': f"{name}.nt",
+            'kind': name.split('-', 1)[0],
+            'triples': partition['triples'],
+            'predicates': sorted(partition['predicates']),
+            'classes': sorted(partition['classes']),
+        })
+        if partition['time_min'] is not None:
+            manifest['partitions'][-1]['time_min'] = partition['time_min'].isoformat()
+            manifest['partitions'][-1]['time_max'] = partition['time_max'].isoformat()
+    with open(directory / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def is_partitioned(path):
+    """Путь указывает на партиционированный граф (директорию или ее манифест)"""
+    path = Path(path)
+    return (path / MANIFEST_FILE).exists() or path.name == MANIFEST_FILE
+
+
+def load_manifest(path):
+    """Читает манифест, возвращает (директория, манифест)"""
+    path = Path(path)
+    directory = path.parent if path.name == MANIFEST_FILE else path
+    with open(directory / MANIFEST_FILE, encoding='utf-8') as f:
+        return directory, json.load(f)
+
+
+def parse_time(value):
+    """Граница временного окна: datetime, date или строка ISO 8601"""
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value))
+
+
+def select_shards(manifest, since=None, until=None):
+    """Шарды боев, пересекающиеся с окном [since, until)
+
+    Возвращает пары (партиция, покрыта ли она окном целиком); для целиком
+    покрытых шардов фильтр по времени не нужен. Шарды без индекса времени
+    не отсекаются, кроме battles-undated при заданном окне
+    """
+    since, until = parse_time(since), parse_time(until)
+    shards = []
+    for partition in manifest['partitions']:
+        if partition['kind'] != 'battles':
+            continue
+        if 'time_min' not in partition:
+            # Шард без времени (battles-undated) в окно не попадает
+            if since is None and until is None:
+                shards.append((partition, True))
+            elif partition['name'] != 'battles-undated':
+                shards.append((partition, False))
+            continue
+        time_min = datetime.fromisoformat(partition['time_min'])
+        time_max = datetime.fromisoformat(partition['time_max'])
+        if (since is not None and time_max < since) or (until is not None and time_min >= until):
+            continue
+        covered = (since is None or time_min >= since) and (until is None or time_max < until)
+        shards.append((partition, covered))
+    return shards
+
+
+def path_predicates(path):
+    """Предикаты property path; None, если путь может задеть любой предикат"""
+    if isinstance(path, URIRef):
+        return {path}
+    if isinstance(path, (SequencePath, AlternativePath)):
+        predicates = set()
+        for arg in path.args:
+            arg_predicates = path_predicates(arg)
+            if arg_predicates is None:
+                return None
+            predicates |= arg_predicates
+        return predicates
+    if isinstance(path, InvPath):
+        return path_predicates(path.arg)
+    if isinstance(path, MulPath):
+        return path_predicates(path.path)
+    if isinstance(path, NegatedPath):
+        return None
+    return None
+
+
+def iter_bgps(algebra):
+    """Все BGP алгебры запроса, включая EXISTS и подзапросы"""
+    stack = [algebra]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, CompValue):
+            if node.name == 'BGP':
+                yield node
+                continue
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+
+
+def triple_condition(triple):
+    """Условие на партицию для шаблона: ('predicate', uri), ('class', uri) или None (любой предикат)"""
+    _, p, o = triple
+    if p == RDF.type:
+        return ('class', str(o)) if isinstance(o, URIRef) else ('predicate', str(RDF.type))
+    if isinstance(p, URIRef):
+        return 'predicate', str(p)
+    return None
+
+
+def select_partitions(manifest, algebra):
+    """Партиции, нужные запросу
+
+    Все триплеты субъекта лежат в одной партиции, поэтому шаблоны BGP с общим
+    субъектом могут совпасть только в партиции, где есть все их предикаты и классы
+    """
+    partitions = manifest['partitions']
+    predicate_sets = [set(partition['predicates']) for partition in partitions]
+    class_sets = [set(partition['classes']) for partition in partitions]
+
+    def matches(index, condition):
+        kind, uri = condition
+        return uri in (predicate_sets[index] if kind == 'predicate' else class_sets[index])
+
+    selected = set()
+    for bgp in iter_bgps(algebra):
+        stars = {}
+        for triple in bgp.triples:
+            p = triple[1]
+            if isinstance(p, (URIRef, Variable)):
+                condition = triple_condition(triple)
+                if condition is None:
+                    return list(partitions)
+                stars.setdefault(triple[0], []).append(condition)
+                continue
+            # Property path: звенья пути могут лежать в разных партициях
+            predicates = path_predicates(p)
+            if predicates is None:
+                return list(partitions)
+            selected.update(index for index in range(len(partitions))
+                            if predicate_sets[index] & {str(predicate) for predicate in predicates})
+
+        for conditions in stars.values():
+            selected.update(index for index in range(len(partitions))
+                            if all(matches(index, condition) for condition in conditions))
+    return [partitions[index] for index in sorted(selected)]
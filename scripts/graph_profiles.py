@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Профили графа знаний World of Tanks: full и lean, консолидация боев
+
+full пишет часть фактов дважды: связь с модулем (hasGun и equipsWith),
+maxHP/speedForward/speedBackward танка и его TankCharacteristics, связь
+результата с боем в обе стороны (inBattle и hasPerformance). lean пишет
+каждый факт один раз и помечает граф триплетом wot:graphProfile, а движок
+переписывает шаблоны запроса с избыточными предикатами в пути по оставшимся
+
+При консолидации строки одного матча (время, карта, длительность) сливаются
+в один Battle, а won/spawn/platoon игрока переезжают на его результат
+(playerWon/playerSpawn/playerPlatoon); шаблоны ?battle wot:won ?won движок
+переписывает на результат, связанный с боем через inBattle
+"""
+
+from rdflib import Literal, URIRef, Variable
+from rdflib.paths import AlternativePath, InvPath, SequencePath
+from rdflib.plugins.sparql.parserutils import CompValue
+
+
+PROFILES = ('full', 'lean')
+
+# Отметка графа с консолидированными боями
+CONSOLIDATED = 'consolidated-battles'
+
+# Заголовок онтологии: на нем лежит отметка профиля графа
+ONTOLOGY_URI = URIRef("http://www.semanticweb.org/ontology/wot")
+
+# Конкретные связи с модулями; equipsWith - их объединение
+MODULE_LINKS = ('hasGun', 'hasEngine', 'hasTurret', 'hasSuspension', 'hasRadio')
+
+# Свойство танка -> свойство TankCharacteristics с тем же значением (в lean только оно)
+CHARACTERISTIC_PROPERTIES = {
+    'maxHP': 'hp',
+    'speedForward': 'speedForward',
+    'speedBackward': 'speedBackward',
+}
+
+# Свойство Battle -> свойство BattlePerformance игрока в графе с консолидированными боями
+PERFORMANCE_FACTS = {
+    'won': 'playerWon',
+    'spawn': 'playerSpawn',
+    'platoon': 'playerPlatoon',
+}
+
+
+def profile_marker(namespace, profile):
+    """Триплет-отметка профиля графа"""
+    return (ONTOLOGY_URI, namespace.graphProfile, Literal(profile))
+
+
+def profile_markers(graph, namespace):
+    """Отметки графа: профиль (lean) и консолидация боев; у full графа отметок нет"""
+    return {str(value) for value in graph.objects(ONTOLOGY_URI, namespace.graphProfile)}
+
+
+def lean_rewrites(namespace):
+    """Избыточный предикат -> путь по фактам, которые есть в lean графе"""
+    rewrites = {
+        namespace.equipsWith: AlternativePath(*[namespace[name] for name in MODULE_LINKS]),
+        namespace.hasPerformance: InvPath(namespace.inBattle),
+    }
+    # Для танков из боев (без TankCharacteristics) свойство остается на самом танке
+    for tank_property, characteristic in CHARACTERISTIC_PROPERTIES.items():
+        rewrites[namespace[tank_property]] = AlternativePath(
+            namespace[tank_property], SequencePath(namespace.hasCharacteristics, namespace[characteristic]))
+    return rewrites
+
+
+class PredicateRewriter:
+    """Заменяет в BGP запроса избыточные предикаты путями (запросы к lean графу)"""
+
+    def __init__(self, rewrites):
+        self.rewrites = rewrites
+
+    def rewrite(self, node):
+        """Переписывает дерево алгебры на месте, возвращает число замененных шаблонов"""
+        if isinstance(node, CompValue):
+            if node.name == 'BGP':
+                count = sum(1 for triple in node.triples if triple[1] in self.rewrites)
+                if count:
+                    node['triples'] = [(s, self.rewrites.get(p, p), o) for s, p, o in node.triples]
+                return count
+            if node.name == 'values':
+                return 0
+            return sum(self.rewrite(value) for key, value in node.items() if not key.startswith('_'))
+        if isinstance(node, (list, tuple)):
+            return sum(self.rewrite(value) for value in node)
+        return 0
+
+    def optimize(self, prepared):
+        """Переписывает подготовленный запрос (prepareQuery) на месте"""
+        self.rewrite(prepared.algebra)
+        return prepared
+
+
+class BattleFactRewriter:
+    """Переносит шаблоны won/spawn/platoon боя на результат игрока (граф с консолидированными боями)"""
+
+    def __init__(self, namespace):
+        self.in_battle = namespace.inBattle
+        self.has_performance = namespace.hasPerformance
+        self.rewrites = {namespace[battle_property]: namespace[performance_property]
+                         for battle_property, performance_property in PERFORMANCE_FACTS.items()}
+
+    def battle_performances(self, node, links):
+        """Собирает пары (бой, результат) из шаблонов inBattle/hasPerformance запроса"""
+        if isinstance(node, CompValue):
+            if node.name == 'BGP':
+                for s, p, o in node.triples:
+                    if p == self.in_battle:
+                        links.setdefault(o, set()).add(s)
+                    elif p == self.has_performance:
+                        links.setdefault(s, set()).add(o)
+                return links
+            for key, value in node.items():
+                if not key.startswith('_'):
+                    self.battle_performances(value, links)
+        elif isinstance(node, (list, tuple)):
+            for value in node:
+                self.battle_performances(value, links)
+        return links
+
+    def rewrite(self, node, performances=None):
+        """Переписывает дерево алгебры на месте, возвращает число замененных шаблонов"""
+        if performances is None:
+            links = self.battle_performances(node, {})
+            performances = {battle: next(iter(perfs)) for battle, perfs in links.items()
+                            if isinstance(battle, Variable) and len(perfs) == 1}
+        if isinstance(node, CompValue):
+            if node.name == 'BGP':
+                triples = []
+                count = 0
+                for s, p, o in node.triples:
+                    if p in self.rewrites:
+                        count += 1
+                        if s in performances:
+                            # Результат игрока в этом бою уже есть в запросе
+                            s, p = performances[s], self.rewrites[p]
+                        else:
+                            p = SequencePath(InvPath(self.in_battle), self.rewrites[p])
+                    triples.append((s, p, o))
+                if count:
+                    node['triples'] = triples
+                return count
+            if node.name == 'values':
+                return 0
+            return sum(self.rewrite(value, performances) for key, value in node.items() if not key.startswith('_'))
+        if isinstance(node, (list, tuple)):
+            return sum(self.rewrite(value, performances) for value in node)
+        return 0
+
+    def optimize(self, prepared):
+        """Переписывает подготовленный запрос (prepareQuery) на месте"""
+        self.rewrite(prepared.algebra)
+        return prepared
@@ -4,26 +4,414 @@
 Поддерживает ограничение количества записей для оптимизации
 """
 
+import numpy as np
 import pandas as pd
 from rdflib import Graph, Namespace, RDF, RDFS, Literal, URIRef
 from rdflib.namespace import XSD
+from rdflib.plugins.stores.memory import Memory, SimpleMemory
 from pathlib import Path
 from datetime import datetime
 import argparse
+import io
+import re
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from aggregate_store import AggregateStore, store_path
+from battle_sample import BattleSample, sample_path
+from graph_formats import (check_compression, fastest_graph_file, graph_path, load_graph, open_output, parse_formats,
+                           print_write_report, split_graph_path, write_formats, write_nt_lines)
+from column_mapping import (ColumnMapping, camel_to_snake, compile_block_emitter, graph_datatype_properties,
+                            schema_column_mappings)
+from graph_partitions import load_nt_lines, nt_term, write_partitions
+from graph_profiles import CHARACTERISTIC_PROPERTIES, CONSOLIDATED, PERFORMANCE_FACTS, PROFILES, profile_marker
+from import_metrics import ImportMetrics, current_rss, peak_rss
+from schema_validation import SchemaValidationError, SchemaValidator
+from wot_schema import DATATYPE_PROPERTIES, NAMESPACES, SCHEMA_TRIPLES, WOT
+
+
+class GraphBatchWriter:
+    """Буферизует триплеты и записывает их в store пачками"""
+
+    def __init__(self, graph, batch_size=10000, mode='addN'):
+        self.g = graph
+        self.batch_size = batch_size
+        self.mode = mode
+        self.buffer = []
+        self.triples_written = 0
+        self.write_time = 0.0
+        # Скорость второго пути записи, замеренная на копии первой пачки
+        self.reference_path = None
+        self.reference_rate = None
+        self.reference_sample = []
+
+        # Store без контекстов (SimpleMemory и т.п.) принимает пачку напрямую,
+        # минуя фильтрацию квадов в Graph.addN
+        store = graph.store
+        self.direct = not store.context_aware
+        self.transactional = getattr(store, 'transaction_aware', False)
+
+    @property
+    def path_name(self):
+        """Название используемого пути записи"""
+        if self.mode == 'add':
+            return 'add'
+        return 'store.addN' if self.direct else 'Graph.addN'
+
+    def add(self, triple):
+        """Добавляет триплет в буфер"""
+        if self.mode == 'add':
+            if self.reference_rate is None:
+                self.reference_sample.append(triple)
+                if len(self.reference_sample) >= self.batch_size:
+                    self.measure_reference(self.reference_sample)
+            start_time = time.perf_counter()
+            self.g.add(triple)
+            self.write_time += time.perf_counter() - start_time
+            self.triples_written += 1
+            return
+        self.buffer.append(triple)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def extend(self, triples):
+        """Добавляет несколько триплетов в буфер"""
+        for triple in triples:
+            self.add(triple)
+
+    def write_batch(self, graph, triples):
+        """Записывает пачку через addN (store.addN для store без контекстов)"""
+        quads = [(s, p, o, graph) for s, p, o in triples]
+        if self.direct:
+            graph.store.addN(quads)
+        else:
+            graph.addN(quads)
+
+    def flush(self):
+        """Записывает накопленную пачку в store"""
+        if not self.buffer:
+            return
+        if self.reference_rate is None:
+            self.measure_reference(self.buffer)
+        start_time = time.perf_counter()
+        self.write_batch(self.g, self.buffer)
+        if self.transactional:
+            self.g.commit()
+        self.write_time += time.perf_counter() - start_time
+        self.triples_written += len(self.buffer)
+        self.buffer = []
+
+    def reference(self):
+        """(путь, триплетов/с) второго пути записи; None, если замерить его нельзя"""
+        if self.reference_rate is None and self.reference_sample:
+            self.measure_reference(self.reference_sample)
+        return (self.reference_path, self.reference_rate) if self.reference_path else None
+
+    def measure_reference(self, triples):
+        """Замеряет другой путь (add или addN) на копии триплетов в пустом графе того же store"""
+        self.reference_rate = 0.0
+        self.reference_sample = []
+        store_class = type(self.g.store)
+        if store_class not in (Memory, SimpleMemory):
+            # Дисковый store нельзя создать рядом без пути: второй путь не замеряется
+            return
+        sample = list(triples)
+        scratch = Graph(store=store_class())
+        start_time = time.perf_counter()
+        if self.mode == 'add':
+            reference = GraphBatchWriter(scratch, batch_size=len(sample))
+            self.reference_path = reference.path_name
+            reference.write_batch(scratch, sample)
+        else:
+            self.reference_path = 'add'
+            for triple in sample:
+                scratch.add(triple)
+        elapsed = time.perf_counter() - start_time
+        self.reference_rate = len(sample) / elapsed if elapsed > 0 else 0.0
+
+    def triples_per_second(self):
+        """Скорость записи в store"""
+        return self.triples_written / self.write_time if self.write_time > 0 else 0.0
+
+
+def battle_key(battle_time, map_name, duration):
+    """Часть URI матча: время боя, карта и длительность"""
+    time_part = re.sub(r'\D', '', str(battle_time))
+    map_part = re.sub(r'\W+', '_', str(map_name)).strip('_')
+    return f"{time_part}_{map_part}_{duration}"
+
+
+class BattleBlockBuilder:
+    """Строит триплеты Battle и BattlePerformance для блока строк tomato.csv
+    
+    consolidate=True - строки одного матча (время, карта, длительность) сливаются
+    в один Battle, а won/spawn/platoon пишутся на результат игрока
+    """
+
+    def __init__(self, namespace, column_mappings, columns, profile='full', consolidate=False, validator=None):
+        # Namespace для URI инстансов; термины схемы берутся из wot_schema.WOT
+        self.WOT = Namespace(str(namespace))
+        self.profile = profile
+        self.consolidate = consolidate
+        self.validator = validator
+        battle_columns = list(columns)
+        performance_columns = list(columns)
+        if consolidate:
+            # Факты игрока уходят с Battle на BattlePerformance, у матча - сторона победителя
+            battle_columns = [column for column in columns if column not in PERFORMANCE_FACTS] + ['winner_spawn']
+            performance_columns += [camel_to_snake(name) for name in PERFORMANCE_FACTS.values()]
+        self.battle_emitter = compile_block_emitter(column_mappings['Battle'], battle_columns)
+        self.performance_emitter = compile_block_emitter(column_mappings['BattlePerformance'], performance_columns)
+        
+        # Уже созданные матчи и триплеты, которые не пришлось писать повторно
+        self.battles = set()
+        self.rows = 0
+        self.saved_triples = 0
+
+    def triples(self, block, tank_uris):
+        """Возвращает триплеты боев и результатов (танки создаются отдельно)"""
+        indices = block.index.tolist()
+        perf_uris = [self.WOT[f"Performance_{idx}"] for idx in indices]
+        self.rows += len(block)
+        
+        if self.consolidate:
+            battle_uris = [self.WOT[f"Battle_{battle_key(*key)}"] for key in zip(
+                block['battle_time'].tolist(), block['display_name'].tolist(), block['duration'].tolist())]
+            for battle_property, performance_property in PERFORMANCE_FACTS.items():
+                if battle_property in block.columns:
+                    block = block.assign(**{camel_to_snake(performance_property): block[battle_property]})
+            # Матч создается по первой строке; у остальных строк матча только результат
+            first = []
+            for position, battle_uri in enumerate(battle_uris):
+                if battle_uri not in self.battles:
+                    self.battles.add(battle_uri)
+                    first.append(position)
+            battle_block = block.iloc[first]
+            if 'won' in block.columns and 'spawn' in block.columns:
+                spawn = battle_block['spawn']
+                winner = spawn.where(battle_block['won'].astype(bool), 3 - spawn)
+                battle_block = battle_block.assign(winner_spawn=winner.where(spawn.isin([1, 2])))
+            # Экономия: тип и факты матча у повторных строк минус добавленная сторона победителя
+            repeated = block.drop(block.index[first])
+            self.saved_triples += len(repeated) + sum(
+                int(repeated[mapping.column].notna().sum())
+                for mapping in self.battle_emitter.mappings if mapping.column in repeated.columns)
+            if 'winner_spawn' in battle_block.columns:
+                self.saved_triples -= int(battle_block['winner_spawn'].notna().sum())
+            new_battle_uris = [battle_uris[position] for position in first]
+        else:
+            battle_uris = [self.WOT[f"Battle_{idx}"] for idx in indices]
+            battle_block = block
+            new_battle_uris = battle_uris
+
+        # Значения колонок сверяются со схемой до конвертации в литералы
+        if self.validator is not None:
+            self.validator.check('Battle', self.battle_emitter.mappings, battle_block)
+            self.validator.check('BattlePerformance', self.performance_emitter.mappings, block)
+
+        # === Battle ===
+        for battle_uri in new_battle_uris:
+            yield (battle_uri, RDF.type, WOT.Battle)
+        yield from self.battle_emitter(new_battle_uris, battle_block)
+
+        # === BattlePerformance ===
+        for perf_uri, battle_uri, tank_uri in zip(perf_uris, battle_uris, tank_uris):
+            yield (perf_uri, RDF.type, WOT.BattlePerformance)
+            # Связи (без achievedBy):
+            yield (perf_uri, WOT.inBattle, battle_uri)
+            yield (perf_uri, WOT.withTank, tank_uri)
+            # В lean обратная связь не пишется: движок выводит ее из inBattle
+            if self.profile != 'lean':
+                yield (battle_uri, WOT.hasPerformance, perf_uri)
+        yield from self.performance_emitter(perf_uris, block)
+
+
+def battle_aggregate_rows(df, namespace):
+    """Колонки строк tomato.csv для хранилища агрегатов (танк - URI, карта - display_name)"""
+    return pd.DataFrame({
+        'tank': [f"{namespace}Tank_{tank_id}" for tank_id in df['tank_id'].tolist()],
+        'nation': df['nation'],
+        'map': df['display_name'],
+        'spawn': df['spawn'],
+        'won': df['won'],
+        'damage': df['damage'],
+        'battle_time': df['battle_time'],
+    }, index=df.index)
+
+
+# Состояние процесса-трансформера пайплайна (задается initializer'ом пула)
+_pipeline_worker = {}
+
+
+def init_pipeline_worker(namespace, column_mappings, profile='full', schema_properties=None):
+    """Инициализирует процесс-трансформер пайплайна"""
+    _pipeline_worker['namespace'] = Namespace(namespace)
+    _pipeline_worker['column_mappings'] = column_mappings
+    _pipeline_worker['profile'] = profile
+    _pipeline_worker['schema_properties'] = schema_properties
+
+
+def transform_battle_chunk(task):
+    """Превращает сырой чанк tomato.csv в блок N-Triples (выполняется в процессе пула)"""
+    start_time = time.perf_counter()
+    start_index, header, lines = task
+    namespace = _pipeline_worker['namespace']
+
+    df = pd.read_csv(io.StringIO(header + ''.join(lines)))
+    df.index = range(start_index, start_index + len(df))
+    loaded = len(df)
+    df = DataImporter.clean_data(df, verbose=False)
+
+    tank_uris = [namespace[f"Tank_{tank_id}"] for tank_id in df['tank_id'].tolist()]
+    validator = SchemaValidator(_pipeline_worker['schema_properties'] or DATATYPE_PROPERTIES)
+    builder = BattleBlockBuilder(namespace, _pipeline_worker['column_mappings'], df.columns, _pipeline_worker['profile'],
+                                 validator=validator)
+    nt_lines = [f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n" for s, p, o in builder.triples(df, tank_uris)]
+
+    # Первые строки по каждому танку - для создания танков в процессе-писателе
+    tank_rows = df.drop_duplicates(subset='tank_id').to_dict('records')
+    rows = battle_aggregate_rows(df, namespace)
+    return {
+        'nt': ''.join(nt_lines),
+        'triples': len(nt_lines),
+        'loaded': loaded,
+        'rows': len(df),
+        'tank_ids': df['tank_id'].value_counts(sort=False).to_dict(),
+        'tank_rows': tank_rows,
+        'maps': df['display_name'].value_counts(sort=False).to_dict(),
+        'aggregates': AggregateStore().add_rows(rows),
+        'sample': BattleSample().add_rows(rows),
+        'validation': validator.to_dict(),
+        'busy': time.perf_counter() - start_time,
+    }
+
+
+def parse_memory_size(text):
+    """Переводит размер вида 512M / 4G в байты"""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+    text = str(text).strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+class MemoryBudget:
+    """Бюджет памяти импорта: размеры чанков и пачек, момент сброса графа на диск"""
+
+    probe_rows = 2000
+    min_chunk_rows = 500
+    max_chunk_rows = 200000
+    bytes_per_buffered_triple = 250
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.bytes_per_row = None
+        self.base_rss = 0
+        self.resident_rows = 0
+        self.observed_rows = 0
+        self.observed_growth = 0
+
+    def start(self, rss):
+        """Фиксирует RSS до загрузки боев"""
+        self.base_rss = rss
+
+    def observe(self, rows, rss_before, rss_after):
+        """Уточняет стоимость строки по приросту RSS (среднее по всем чанкам)"""
+        self.resident_rows += rows
+        self.observed_rows += rows
+        self.observed_growth += max(rss_after - rss_before, 0)
+        if self.observed_rows > 0:
+            self.bytes_per_row = max(self.observed_growth / self.observed_rows, 1.0)
+
+    def estimated_rss(self):
+        """Оценка RSS по числу строк, которые сейчас лежат в графе"""
+        return self.base_rss + self.resident_rows * (self.bytes_per_row or 0)
+
+    def headroom(self):
+        """Оставшийся запас памяти"""
+        return self.limit - max(self.estimated_rss(), self.base_rss)
+
+    def should_spill(self, next_rows):
+        """Нужно ли сбросить граф на диск перед следующим чанком"""
+        if self.bytes_per_row is None or self.resident_rows == 0:
+            return False
+        return self.estimated_rss() + next_rows * self.bytes_per_row > self.limit * 0.9
+
+    def spilled(self, rows):
+        """Учитывает строки, вынесенные из графа на диск"""
+        self.resident_rows = max(self.resident_rows - rows, 0)
+
+    def next_chunk_size(self):
+        """Размер следующего чанка: четверть оставшегося запаса"""
+        if not self.bytes_per_row:
+            return self.probe_rows
+        rows = int(self.headroom() * 0.25 / self.bytes_per_row)
+        return max(self.min_chunk_rows, min(rows, self.max_chunk_rows))
+
+    def next_batch_size(self):
+        """Размер пачки addN: не больше 2% оставшегося запаса"""
+        batch = int(self.headroom() * 0.02 / self.bytes_per_buffered_triple)
+        return max(1000, min(batch, 100000))
+
 
 class DataImporter:
-    def __init__(self, ontology_file):
-        """Инициализация импортера"""
+    def __init__(self, ontology_file=None, store='Memory', store_path=None, batch_size=10000, write_mode='addN',
+                 metrics=None, profile='full', consolidate_battles=False, strict=False):
+        """Инициализация импортера (ontology_file=None - схема из wot_schema без разбора OWL,
+        profile='lean' - каждый факт пишется один раз, consolidate_battles - один Battle на матч,
+        strict - нарушения схемы в данных боев завершают импорт ошибкой)"""
+        # Метрики стадий импорта (время, память, скорость)
+        self.metrics = metrics or ImportMetrics()
+        
         # Загружаем существующую онтологию
-        self.g = Graph()
-        print(f"Loading ontology from {ontology_file}...")
-        self.g.parse(ontology_file, format='xml')
+        self.g = Graph(store=store)
+        if store_path:
+            # Дисковый store (BerkeleyDB и т.п.) нужно открыть перед записью
+            self.g.open(str(store_path), create=True)
+        print(f"Loading ontology from {ontology_file or 'precompiled schema (wot_schema.py)'}...")
+        with self.metrics.stage('load_ontology') as stage:
+            if ontology_file:
+                load_graph(self.g, ontology_file)
+            else:
+                # Триплеты схемы добавляются пачкой, без разбора RDF/XML
+                load_nt_lines(self.g, SCHEMA_TRIPLES)
+                for prefix, uri in NAMESPACES.items():
+                    self.g.bind(prefix, uri)
+            stage.triples = len(self.g)
         print(f"  Loaded {len(self.g)} triples from ontology")
         
-        # Namespace
+        # Namespace инстансов (Tank_1, Battle_2); классы и свойства схемы - константы wot_schema.WOT
         self.WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
         self.g.bind("wot", self.WOT)
         
+        # Пакетная запись триплетов в граф
+        self.writer = GraphBatchWriter(self.g, batch_size=batch_size, mode=write_mode)
+        
+        # Профиль графа: lean помечается триплетом, по нему движок переписывает запросы
+        self.profile = profile
+        if profile == 'lean':
+            self.writer.add(profile_marker(WOT, profile))
+        
+        # Консолидация строк одного матча в один Battle (тоже отмечается в графе)
+        self.consolidate_battles = consolidate_battles
+        self.consolidation = None
+        if consolidate_battles:
+            self.writer.add(profile_marker(WOT, CONSOLIDATED))
+        
+        # Маппинг колонок tomato.csv на свойства онтологии (строится один раз)
+        self.schema_properties = graph_datatype_properties(self.g, self.WOT) if ontology_file else DATATYPE_PROPERTIES
+        self.column_mappings = schema_column_mappings(self.schema_properties, self.WOT, ['Battle', 'BattlePerformance'])
+        
+        # Проверка значений колонок по domain/range схемы
+        self.validator = SchemaValidator(self.schema_properties)
+        self.strict = strict
+        
         # Счетчики
         self.tank_counter = {}
         self.map_counter = {}
@@ -34,6 +422,26 @@ class DataImporter:
         self.suspension_counter = {}
         self.radio_counter = {}
         
+        # HP из TankCharacteristics танка: в lean такое же maxHP из строки боя не пишется
+        self.characteristic_hp = {}
+        
+        # Коды наций, которых нет в схеме (предупреждение печатается один раз на код)
+        self.unknown_nations = set()
+        
+        # Агрегаты боев для дашбордных запросов и строки для выборки приближенных запросов
+        # (дополняются по мере импорта)
+        self.aggregates = AggregateStore()
+        self.sample = BattleSample()
+        
+        # Части графа, сброшенные на диск в режиме бюджета памяти
+        self.spill_dir = None
+        self.spill_files = []
+        self.spilled_triples = 0
+        self.total_triples = 0
+        
+        # Отчеты о записанных форматах (время, размер)
+        self.outputs = []
+        
         # Пути к данным
         self.data_dir = Path(__file__).parent.parent / "data"
         self.ontology_dir = Path(__file__).parent.parent / "ontology"
@@ -59,67 +467,85 @@ class DataImporter:
             'TD': 'TankDestroyer',
             'SPG': 'SelfPropelledGun',
         }
-        return self.WOT[mapping.get(tank_class, 'Tank')]
+        return WOT[mapping.get(tank_class, 'Tank')]
     
     def map_nation_to_uri(self, nation_code):
-        """Маппинг кода нации в URI"""
+        """Маппинг кода нации в URI (без учета регистра: ussr в wot_data.csv, USSR в tomato.csv)"""
         mapping = {
-            'USSR': 'USSR',
-            'Germany': 'Germany',
-            'USA': 'USA',
-            'France': 'France',
-            'UK': 'UK',
-            'China': 'China',
-            'Japan': 'Japan',
-            'Czech': 'Czech',
-            'Sweden': 'Sweden',
-            'Poland': 'Poland',
-            'Italy': 'Italy',
+            'ussr': WOT.USSR,
+            'germany': WOT.Germany,
+            'usa': WOT.USA,
+            'france': WOT.France,
+            'uk': WOT.UK,
+            'china': WOT.China,
+            'japan': WOT.Japan,
+            'czech': WOT.Czech,
+            'sweden': WOT.Sweden,
+            'poland': WOT.Poland,
+            'italy': WOT.Italy,
         }
-        return self.WOT[mapping.get(nation_code, nation_code)]
+        if nation_code.lower() in mapping:
+            return mapping[nation_code.lower()]
+        # Новая нация в данных не останавливает импорт: URI строится из кода, как раньше
+        if nation_code not in self.unknown_nations:
+            self.unknown_nations.add(nation_code)
+            print(f"⚠️  Nation '{nation_code}' is not in the schema, using {self.WOT[nation_code].n3()}")
+        return self.WOT[nation_code]
     
-    def create_module_instance(self, module_id, module_type, module_name=None, **properties):
-        """Создает инстанс модуля"""
-        if not module_id or pd.isna(module_id):
-            return None
-        
-        module_uri = self.WOT[f"{module_type}_{module_id}"]
-        
-        # Проверяем, не создавали ли уже этот модуль
-        counter_map = {
+    def module_literal(self, value):
+        """Создает литерал свойства модуля по Python-типу значения"""
+        if isinstance(value, float):
+            return Literal(float(value), datatype=XSD.float)
+        if isinstance(value, int):
+            return Literal(int(value), datatype=XSD.integer)
+        return Literal(str(value), datatype=XSD.string)
+    
+    def create_module_instances(self, df, module_type, id_column, name_column=None,
+                                required_columns=(), **properties):
+        """Создает инстансы модулей из колонки ID (дедупликация через drop_duplicates)"""
+        counter = {
             'Gun': self.gun_counter,
             'Engine': self.engine_counter,
             'Turret': self.turret_counter,
             'Suspension': self.suspension_counter,
             'Radio': self.radio_counter
-        }
+        }[module_type]
         
-        counter = counter_map.get(module_type, {})
+        if id_column not in df.columns or any(col not in df.columns for col in required_columns):
+            return
         
-        if module_uri not in counter:
-            # Создаем новый инстанс модуля
-            self.g.add((module_uri, RDF.type, self.WOT[module_type]))
-            
-            # Добавляем название если есть
-            if module_name and pd.notna(module_name):
-                prop_name = f"{module_type.lower()}Name"
-                self.g.add((module_uri, self.WOT[prop_name], Literal(str(module_name), datatype=XSD.string)))
-            
-            # Добавляем дополнительные свойства
-            for prop, value in properties.items():
-                if pd.notna(value):
-                    if isinstance(value, (int, float)):
-                        if isinstance(value, float):
-                            self.g.add((module_uri, self.WOT[prop], Literal(float(value), datatype=XSD.float)))
-                        else:
-                            self.g.add((module_uri, self.WOT[prop], Literal(int(value), datatype=XSD.integer)))
-                    else:
-                        self.g.add((module_uri, self.WOT[prop], Literal(str(value), datatype=XSD.string)))
-            
-            counter[module_uri] = 0
+        # Конфигурации, в которых модуль задан (пустые и нулевые ID пропускаем)
+        present = df[id_column].notna() & df[id_column].astype(bool)
+        for col in required_columns:
+            present &= df[col].notna()
+        configs = df.loc[present]
+        
+        # Количество использований каждого модуля
+        for module_id, count in configs[id_column].value_counts(sort=False).items():
+            module_uri = self.WOT[f"{module_type}_{module_id}"]
+            counter[module_uri] = counter.get(module_uri, 0) + count
+        
+        # Свойства модуля берем из первой конфигурации, где он встречается
+        modules = configs.drop_duplicates(subset=id_column, keep='first')
+        module_uris = [self.WOT[f"{module_type}_{module_id}"] for module_id in modules[id_column].tolist()]
         
-        counter[module_uri] += 1
-        return module_uri
+        for module_uri in module_uris:
+            self.writer.add((module_uri, RDF.type, WOT[module_type]))
+        
+        # Название модуля
+        if name_column and name_column in modules.columns:
+            name_prop = WOT[f"{module_type.lower()}Name"]
+            for module_uri, module_name in zip(module_uris, modules[name_column].tolist()):
+                if module_name and pd.notna(module_name):
+                    self.writer.add((module_uri, name_prop, Literal(str(module_name), datatype=XSD.string)))
+        
+        # Дополнительные свойства
+        for prop, column in properties.items():
+            if column not in modules.columns:
+                continue
+            for module_uri, value in zip(module_uris, modules[column].tolist()):
+                if pd.notna(value):
+                    self.writer.add((module_uri, WOT[prop], self.module_literal(value)))
     
     def get_role_name_from_type(self, tank_type):
         """Определяет роль танка на основе его типа"""
@@ -157,58 +583,30 @@ class DataImporter:
             return
         
         # Читаем данные
-        df = pd.read_csv(wot_data_file, sep=';', nrows=limit)
+        with self.metrics.stage('read_wot_data') as stage:
+            df = pd.read_csv(wot_data_file, sep=';', nrows=limit)
+            stage.rows = len(df)
         print(f"Loaded {len(df)} tank configurations")
+        timer = self.metrics.start('build_tanks')
+        triples_before = self.written_triples()
         
         # НЕ группируем - используем все конфигурации для создания модулей
         print(f"Processing all {len(df)} configurations to extract modules...")
         
         # Сначала создаем все модули из всех конфигураций
-        for idx, row in df.iterrows():
-            # Создаем Gun
-            if pd.notna(row.get('gun')) and pd.notna(row.get('gun.name')):
-                gun_uri = self.create_module_instance(
-                    module_id=row['gun'],
-                    module_type='Gun',
-                    module_name=row.get('gun.name'),
-                    avgPenetration=row.get('ammo.avg_penetration'),
-                    avgDamage=row.get('ammo.avg_damage'),
-                    fireRate=row.get('gun.fire_rate'),
-                    aimTime=row.get('gun.aim_time'),
-                    dpm=row.get('dpm')
-                )
-            
-            # Создаем Engine
-            if pd.notna(row.get('engine')) and pd.notna(row.get('engine.power')):
-                engine_uri = self.create_module_instance(
-                    module_id=row['engine'],
-                    module_type='Engine',
-                    power=row.get('engine.power')
-                )
-            
-            # Создаем Turret
-            if pd.notna(row.get('turret')):
-                turret_uri = self.create_module_instance(
-                    module_id=row['turret'],
-                    module_type='Turret'
-                )
-            
-            # Создаем Suspension
-            if pd.notna(row.get('suspension')):
-                suspension_uri = self.create_module_instance(
-                    module_id=row['suspension'],
-                    module_type='Suspension'
-                )
-            
-            # Создаем Radio
-            if pd.notna(row.get('radio')):
-                radio_uri = self.create_module_instance(
-                    module_id=row['radio'],
-                    module_type='Radio'
-                )
-            
-            if (idx + 1) % 1000 == 0:
-                print(f"  Processed {idx + 1}/{len(df)} configurations for modules")
+        self.create_module_instances(
+            df, 'Gun', 'gun', name_column='gun.name', required_columns=['gun.name'],
+            avgPenetration='ammo.avg_penetration',
+            avgDamage='ammo.avg_damage',
+            fireRate='gun.fire_rate',
+            aimTime='gun.aim_time',
+            dpm='dpm'
+        )
+        self.create_module_instances(df, 'Engine', 'engine', required_columns=['engine.power'],
+                                     power='engine.power')
+        self.create_module_instances(df, 'Turret', 'turret')
+        self.create_module_instances(df, 'Suspension', 'suspension')
+        self.create_module_instances(df, 'Radio', 'radio')
         
         print(f"\n📦 Created module instances:")
         print(f"   Guns: {len(self.gun_counter)}")
@@ -222,152 +620,138 @@ class DataImporter:
         tanks_unique = df.groupby('name').first().reset_index()
         print(f"Unique tanks: {len(tanks_unique)}")
         
-        # Счетчики для характеристик и ролей
+        # Танки и их характеристики пишем блоками по колонкам
+        tank_names = [name.strip() for name in tanks_unique['name'].tolist()]
+        if 'tank_id' in tanks_unique.columns:
+            tank_ids = tanks_unique['tank_id'].tolist()
+        else:
+            tank_ids = [f"wot_{idx}" for idx in range(len(tanks_unique))]
+        tank_uris = [self.normalize_tank_id(tank_id) for tank_id in tank_ids]
+        char_uris = [self.WOT[f"Characteristics_{self.normalize_uri_part(name)}"] for name in tank_names]
+        tank_types = tanks_unique['type'].tolist() if 'type' in tanks_unique.columns else ['Tank'] * len(tanks_unique)
+        
+        # Тип и базовые свойства
+        for tank_uri, tank_type, tank_name in zip(tank_uris, tank_types, tank_names):
+            self.writer.add((tank_uri, RDF.type, self.map_class_to_type(tank_type)))
+            self.writer.add((tank_uri, WOT.tankName, Literal(tank_name, datatype=XSD.string)))
+        
+        # Нация
+        if 'nation' in tanks_unique.columns:
+            for tank_uri, nation in zip(tank_uris, tanks_unique['nation'].tolist()):
+                if pd.notna(nation):
+                    self.writer.add((tank_uri, WOT.belongsToNation, self.map_nation_to_uri(nation)))
+        
+        tank_mappings = [
+            ColumnMapping('short_name', WOT.shortName, XSD.string, str),
+            ColumnMapping('tier', WOT.tier, XSD.integer, int),
+            ColumnMapping('hp', WOT.maxHP, XSD.integer, int),
+            ColumnMapping('weight', WOT.weight, XSD.integer, int),
+            ColumnMapping('speed_forward', WOT.speedForward, XSD.integer, int),
+            ColumnMapping('speed_backward', WOT.speedBackward, XSD.integer, int),
+            ColumnMapping('is_premium', WOT.isPremium, XSD.boolean, bool),
+            ColumnMapping('is_wheeled', WOT.isWheeled, XSD.boolean, bool),
+            ColumnMapping('is_gift', WOT.isGift, XSD.boolean, bool),
+        ]
+        if self.profile == 'lean':
+            # Те же колонки пишутся в TankCharacteristics танка, в lean - только туда
+            duplicated = {WOT[name] for name in CHARACTERISTIC_PROPERTIES}
+            tank_mappings = [mapping for mapping in tank_mappings if mapping.predicate not in duplicated]
+        tank_emitter = compile_block_emitter(tank_mappings, tanks_unique.columns)
+        self.writer.extend(tank_emitter(tank_uris, tanks_unique))
+        
+        # Цены (нулевые не пишем)
+        price_emitter = compile_block_emitter([
+            ColumnMapping('price_credit', WOT.priceCredit, XSD.integer, int),
+            ColumnMapping('price_gold', WOT.priceGold, XSD.integer, int),
+        ], tanks_unique.columns)
+        for mapping in price_emitter.mappings:
+            priced = tanks_unique[mapping.column] != 0
+            priced_uris = [uri for uri, keep in zip(tank_uris, priced.tolist()) if keep]
+            emit_price = compile_block_emitter([mapping], tanks_unique.columns)
+            self.writer.extend(emit_price(priced_uris, tanks_unique.loc[priced]))
+        
+        # TankCharacteristics для танка
+        char_emitter = compile_block_emitter([
+            ColumnMapping('hp', WOT.hp, XSD.integer, int),
+            ColumnMapping('hull_hp', WOT.hullHP, XSD.integer, int),
+            ColumnMapping('hull_weight', WOT.hullWeight, XSD.integer, int),
+            ColumnMapping('speed_forward', WOT.speedForward, XSD.integer, int),
+            ColumnMapping('speed_backward', WOT.speedBackward, XSD.integer, int),
+        ], tanks_unique.columns)
+        self.writer.extend(char_emitter(char_uris, tanks_unique))
+        
+        # Если есть характеристики, создаем инстанс и связываем с танком
+        char_columns = [m.column for m in char_emitter.mappings]
+        if char_columns:
+            has_characteristics = tanks_unique[char_columns].notna().any(axis=1).tolist()
+        else:
+            has_characteristics = [False] * len(tanks_unique)
         characteristics_counter = {}
+        for tank_uri, char_uri, present in zip(tank_uris, char_uris, has_characteristics):
+            if present:
+                self.writer.add((char_uri, RDF.type, WOT.TankCharacteristics))
+                self.writer.add((tank_uri, WOT.hasCharacteristics, char_uri))
+                characteristics_counter[char_uri] = characteristics_counter.get(char_uri, 0) + 1
+        if 'hp' in tanks_unique.columns:
+            for tank_uri, hp, present in zip(tank_uris, tanks_unique['hp'].tolist(), has_characteristics):
+                if present and pd.notna(hp):
+                    self.characteristic_hp[tank_uri] = int(hp)
+        
+        # Создаем TankRole на основе типа танка
+        role_descriptions = {
+            'HeavyAssault': 'Breakthrough and frontline assault tank',
+            'Support': 'Medium range support and flanking',
+            'Scout': 'Reconnaissance and spotting',
+            'Sniper': 'Long range fire support',
+            'Artillery': 'Indirect fire support'
+        }
         roles_counter = {}
+        for tank_uri, tank_type in zip(tank_uris, tank_types):
+            role_name = self.get_role_name_from_type(tank_type)
+            if not role_name:
+                continue
+            role_uri = self.WOT[f"Role_{role_name}"]
+            if role_uri not in roles_counter:
+                self.writer.add((role_uri, RDF.type, WOT.TankRole))
+                self.writer.add((role_uri, WOT.roleName, Literal(role_name, datatype=XSD.string)))
+                if role_name in role_descriptions:
+                    self.writer.add((role_uri, WOT.roleDescription,
+                                     Literal(role_descriptions[role_name], datatype=XSD.string)))
+            self.writer.add((tank_uri, WOT.hasRole, role_uri))
+            roles_counter[role_uri] = roles_counter.get(role_uri, 0) + 1
         
-        for idx, row in tanks_unique.iterrows():
-            tank_name = row['name'].strip()
-            
-            # Используем tank_id если есть, иначе генерируем
-            tank_id = row.get('tank_id', f"wot_{idx}")
-            tank_uri = self.normalize_tank_id(tank_id)
-            
-            # Определяем тип танка
-            tank_type = self.map_class_to_type(row.get('type', 'Tank'))
-            self.g.add((tank_uri, RDF.type, tank_type))
-            
-            # Базовые свойства
-            self.g.add((tank_uri, self.WOT.tankName, Literal(tank_name, datatype=XSD.string)))
-            
-            if pd.notna(row.get('short_name')):
-                self.g.add((tank_uri, self.WOT.shortName, Literal(row['short_name'], datatype=XSD.string)))
-            
-            if pd.notna(row.get('tier')):
-                self.g.add((tank_uri, self.WOT.tier, Literal(int(row['tier']), datatype=XSD.integer)))
-            
-            # Нация
-            if pd.notna(row.get('nation')):
-                nation_uri = self.map_nation_to_uri(row['nation'].capitalize())
-                self.g.add((tank_uri, self.WOT.belongsToNation, nation_uri))
-            
-            # Создаем TankCharacteristics для танка
-            has_characteristics = False
-            char_uri = self.WOT[f"Characteristics_{self.normalize_uri_part(tank_name)}"]
-            
-            if pd.notna(row.get('hp')):
-                self.g.add((tank_uri, self.WOT.maxHP, Literal(int(row['hp']), datatype=XSD.integer)))
-                self.g.add((char_uri, self.WOT.hp, Literal(int(row['hp']), datatype=XSD.integer)))
-                has_characteristics = True
-            
-            if pd.notna(row.get('hull_hp')):
-                self.g.add((char_uri, self.WOT.hullHP, Literal(int(row['hull_hp']), datatype=XSD.integer)))
-                has_characteristics = True
-            
-            if pd.notna(row.get('hull_weight')):
-                self.g.add((char_uri, self.WOT.hullWeight, Literal(int(row['hull_weight']), datatype=XSD.integer)))
-                has_characteristics = True
-            
-            if pd.notna(row.get('weight')):
-                self.g.add((tank_uri, self.WOT.weight, Literal(int(row['weight']), datatype=XSD.integer)))
-            
-            if pd.notna(row.get('speed_forward')):
-                self.g.add((tank_uri, self.WOT.speedForward, Literal(int(row['speed_forward']), datatype=XSD.integer)))
-                self.g.add((char_uri, self.WOT.speedForward, Literal(int(row['speed_forward']), datatype=XSD.integer)))
-                has_characteristics = True
-            
-            if pd.notna(row.get('speed_backward')):
-                self.g.add((tank_uri, self.WOT.speedBackward, Literal(int(row['speed_backward']), datatype=XSD.integer)))
-                self.g.add((char_uri, self.WOT.speedBackward, Literal(int(row['speed_backward']), datatype=XSD.integer)))
-                has_characteristics = True
-            
-            # Если есть характеристики, создаем инстанс и связываем с танком
-            if has_characteristics:
-                self.g.add((char_uri, RDF.type, self.WOT.TankCharacteristics))
-                self.g.add((tank_uri, self.WOT.hasCharacteristics, char_uri))
-                characteristics_counter[char_uri] = characteristics_counter.get(char_uri, 0) + 1
-            
-            # Создаем TankRole на основе типа танка
-            role_name = self.get_role_name_from_type(row.get('type', 'Tank'))
-            if role_name:
-                role_uri = self.WOT[f"Role_{role_name}"]
-                if role_uri not in roles_counter:
-                    self.g.add((role_uri, RDF.type, self.WOT.TankRole))
-                    self.g.add((role_uri, self.WOT.roleName, Literal(role_name, datatype=XSD.string)))
-                    
-                    # Описание роли
-                    role_descriptions = {
-                        'HeavyAssault': 'Breakthrough and frontline assault tank',
-                        'Support': 'Medium range support and flanking',
-                        'Scout': 'Reconnaissance and spotting',
-                        'Sniper': 'Long range fire support',
-                        'Artillery': 'Indirect fire support'
-                    }
-                    if role_name in role_descriptions:
-                        self.g.add((role_uri, self.WOT.roleDescription, 
-                                   Literal(role_descriptions[role_name], datatype=XSD.string)))
-                
-                self.g.add((tank_uri, self.WOT.hasRole, role_uri))
-                roles_counter[role_uri] = roles_counter.get(role_uri, 0) + 1
-            
-            # Премиум статус
-            if pd.notna(row.get('is_premium')):
-                self.g.add((tank_uri, self.WOT.isPremium, Literal(bool(row['is_premium']), datatype=XSD.boolean)))
-            
-            if pd.notna(row.get('is_wheeled')):
-                self.g.add((tank_uri, self.WOT.isWheeled, Literal(bool(row['is_wheeled']), datatype=XSD.boolean)))
-            
-            if pd.notna(row.get('is_gift')):
-                self.g.add((tank_uri, self.WOT.isGift, Literal(bool(row['is_gift']), datatype=XSD.boolean)))
-            
-            # Цены
-            if pd.notna(row.get('price_credit')) and row['price_credit'] != 0:
-                self.g.add((tank_uri, self.WOT.priceCredit, Literal(int(row['price_credit']), datatype=XSD.integer)))
-            
-            if pd.notna(row.get('price_gold')) and row['price_gold'] != 0:
-                self.g.add((tank_uri, self.WOT.priceGold, Literal(int(row['price_gold']), datatype=XSD.integer)))
-            
-            # Связи с модулями
-            if pd.notna(row.get('gun')):
-                gun_uri = self.WOT[f"Gun_{row['gun']}"]
-                if gun_uri in self.gun_counter:
-                    self.g.add((tank_uri, self.WOT.hasGun, gun_uri))
-                    self.g.add((tank_uri, self.WOT.equipsWith, gun_uri))
-            
-            if pd.notna(row.get('engine')):
-                engine_uri = self.WOT[f"Engine_{row['engine']}"]
-                if engine_uri in self.engine_counter:
-                    self.g.add((tank_uri, self.WOT.hasEngine, engine_uri))
-                    self.g.add((tank_uri, self.WOT.equipsWith, engine_uri))
-            
-            if pd.notna(row.get('turret')):
-                turret_uri = self.WOT[f"Turret_{row['turret']}"]
-                if turret_uri in self.turret_counter:
-                    self.g.add((tank_uri, self.WOT.hasTurret, turret_uri))
-                    self.g.add((tank_uri, self.WOT.equipsWith, turret_uri))
-            
-            if pd.notna(row.get('suspension')):
-                suspension_uri = self.WOT[f"Suspension_{row['suspension']}"]
-                if suspension_uri in self.suspension_counter:
-                    self.g.add((tank_uri, self.WOT.hasSuspension, suspension_uri))
-                    self.g.add((tank_uri, self.WOT.equipsWith, suspension_uri))
-            
-            if pd.notna(row.get('radio')):
-                radio_uri = self.WOT[f"Radio_{row['radio']}"]
-                if radio_uri in self.radio_counter:
-                    self.g.add((tank_uri, self.WOT.hasRadio, radio_uri))
-                    self.g.add((tank_uri, self.WOT.equipsWith, radio_uri))
-            
-            if (idx + 1) % 100 == 0:
-                print(f"  Processed {idx + 1}/{len(tanks_unique)} tanks")
+        # Связи с модулями
+        module_links = [
+            ('gun', 'Gun', WOT.hasGun, self.gun_counter),
+            ('engine', 'Engine', WOT.hasEngine, self.engine_counter),
+            ('turret', 'Turret', WOT.hasTurret, self.turret_counter),
+            ('suspension', 'Suspension', WOT.hasSuspension, self.suspension_counter),
+            ('radio', 'Radio', WOT.hasRadio, self.radio_counter),
+        ]
+        for column, module_type, link_prop, counter in module_links:
+            if column not in tanks_unique.columns:
+                continue
+            for tank_uri, module_id in zip(tank_uris, tanks_unique[column].tolist()):
+                if pd.isna(module_id):
+                    continue
+                module_uri = self.WOT[f"{module_type}_{module_id}"]
+                if module_uri in counter:
+                    self.writer.add((tank_uri, link_prop, module_uri))
+                    # equipsWith - объединение конкретных связей, в lean не пишется
+                    if self.profile != 'lean':
+                        self.writer.add((tank_uri, WOT.equipsWith, module_uri))
         
+        self.writer.flush()
+        self.metrics.stop(timer, rows=len(df), triples=self.written_triples() - triples_before)
         print(f"✅ Imported {len(tanks_unique)} tanks with module connections")
         print(f"   Tank Characteristics: {len(characteristics_counter)}")
         print(f"   Tank Roles: {len(roles_counter)}")
     
-    def clean_data(self, df):
+    @staticmethod
+    def clean_data(df, verbose=True):
         """Очистка данных от некорректных значений"""
-        print("\n🧹 Cleaning data...")
+        if verbose:
+            print("\n🧹 Cleaning data...")
         initial_count = len(df)
         
         # Удаляем записи с пустыми критическими полями
@@ -394,13 +778,88 @@ class DataImporter:
         cleaned_count = len(df)
         removed = initial_count - cleaned_count
         
+        if not verbose:
+            return df
+        
         print(f"  ✅ Cleaned: {initial_count} → {cleaned_count} records")
         if removed > 0:
             print(f"  🗑️  Removed {removed} invalid records ({removed/initial_count*100:.1f}%)")
         
         return df
     
-    def import_battles_from_tomato(self, limit=10000, random_sample=True):
+    def add_tank_from_battle_row(self, tank_uri, row):
+        """Создает танк по данным строки tomato.csv"""
+        tank_type = self.map_class_to_type(row.get('class', 'Tank'))
+        self.writer.add((tank_uri, RDF.type, tank_type))
+        self.writer.add((tank_uri, WOT.tankName,
+                    Literal(row['name'], datatype=XSD.string)))
+        if pd.notna(row.get('tier')):
+            self.writer.add((tank_uri, WOT.tier,
+                        Literal(int(row['tier']), datatype=XSD.integer)))
+        if pd.notna(row.get('nation')):
+            nation_uri = self.map_nation_to_uri(row['nation'])
+            self.writer.add((tank_uri, WOT.belongsToNation, nation_uri))
+        if pd.notna(row.get('max_health')):
+            max_hp = int(row['max_health'])
+            if self.profile != 'lean' or self.characteristic_hp.get(tank_uri) != max_hp:
+                self.writer.add((tank_uri, WOT.maxHP, Literal(max_hp, datatype=XSD.integer)))
+
+    def select_skipped_battles(self, tomato_file, limit, random_sample):
+        """Выбирает номера строк tomato.csv, которые пропускаются при случайной выборке"""
+        if not random_sample:
+            # Берем первые N записей
+            print(f"Loading first {limit:,} battles...")
+            return None
+        
+        # Сначала узнаем общее количество строк
+        print("Counting total battles...")
+        total_lines = sum(1 for _ in open(tomato_file)) - 1  # -1 для заголовка
+        print(f"  Total battles in file: {total_lines:,}")
+        
+        if limit >= total_lines:
+            print(f"  Loading all {total_lines:,} battles...")
+            return None
+        
+        # Генерируем случайные индексы
+        print(f"  Selecting {limit:,} random battles...")
+        np.random.seed(42)  # Для воспроизводимости
+        return np.random.choice(range(1, total_lines + 1),
+                                size=total_lines - limit,
+                                replace=False)
+    
+    def add_battle_rows(self, df, builder, done=0, total=None):
+        """Добавляет в граф бои, результаты и недостающие танки для строк tomato.csv"""
+        total = total or len(df)
+        
+        # Карты (onMap) считаем сразу по всей колонке
+        if 'display_name' in df.columns:
+            for map_name, count in df['display_name'].value_counts().items():
+                self.map_counter[map_name] = self.map_counter.get(map_name, 0) + count
+        
+        # Агрегаты и строки выборки боев дополняются сразу по всему чанку
+        rows = battle_aggregate_rows(df, self.WOT)
+        self.aggregates.add_rows(rows)
+        self.sample.add_rows(rows)
+        
+        block_size = 1000
+        for start in range(0, len(df), block_size):
+            block = df.iloc[start:start + block_size]
+            tank_uris = [self.normalize_tank_id(tank_id) for tank_id in block['tank_id'].tolist()]
+            
+            # === Tank === (если еще не был создан)
+            for pos, tank_uri in enumerate(tank_uris):
+                if tank_uri not in self.tank_counter:
+                    self.add_tank_from_battle_row(tank_uri, block.iloc[pos])
+                    self.tank_counter[tank_uri] = 0
+                self.tank_counter[tank_uri] += 1
+            
+            # === Battle и BattlePerformance ===
+            self.writer.extend(builder.triples(block, tank_uris))
+            
+            # Прогресс
+            print(f"  Processed {done + start + len(block)}/{total} battles")
+    
+    def import_battles_from_tomato(self, limit=10000, random_sample=True, memory_budget=None):
         """Импортирует данные о боях из tomato.csv"""
         print("\n" + "=" * 60)
         print(f"IMPORTING BATTLE DATA FROM tomato.csv")
@@ -413,34 +872,28 @@ class DataImporter:
             print(f"⚠️  File not found: {tomato_file}")
             return
         
+        if memory_budget is not None:
+            self.import_battles_budgeted(tomato_file, limit, random_sample, memory_budget)
+            return
+        
         # Читаем данные
-        if random_sample:
-            # Сначала узнаем общее количество строк
-            print("Counting total battles...")
-            total_lines = sum(1 for _ in open(tomato_file)) - 1  # -1 для заголовка
-            print(f"  Total battles in file: {total_lines:,}")
-            
-            if limit >= total_lines:
-                print(f"  Loading all {total_lines:,} battles...")
+        with self.metrics.stage('select_sample'):
+            skip_idx = self.select_skipped_battles(tomato_file, limit, random_sample)
+        with self.metrics.stage('read_csv') as stage:
+            if skip_idx is not None:
+                df = pd.read_csv(tomato_file, skiprows=skip_idx)
+            elif random_sample:
                 df = pd.read_csv(tomato_file)
             else:
-                # Генерируем случайные индексы
-                print(f"  Selecting {limit:,} random battles...")
-                import numpy as np
-                np.random.seed(42)  # Для воспроизводимости
-                skip_idx = np.random.choice(range(1, total_lines + 1), 
-                                           size=total_lines - limit, 
-                                           replace=False)
-                df = pd.read_csv(tomato_file, skiprows=skip_idx)
-        else:
-            # Берем первые N записей
-            print(f"Loading first {limit:,} battles...")
-            df = pd.read_csv(tomato_file, nrows=limit)
+                df = pd.read_csv(tomato_file, nrows=limit)
+            stage.rows = len(df)
         
         print(f"  Loaded {len(df):,} battle records")
         
         # Очищаем данные
-        df = self.clean_data(df)
+        with self.metrics.stage('clean_data') as stage:
+            df = self.clean_data(df)
+            stage.rows = len(df)
         
         # Показываем статистику по игрокам и танкам
         print(f"\n📊 Data statistics:")
@@ -451,145 +904,482 @@ class DataImporter:
         print(f"  Avg damage: {df['damage'].mean():.0f}")
         print(f"  Win rate: {df['won'].mean()*100:.1f}%")
         
-        for idx, row in df.iterrows():
-            # Создаем объекты
-            battle_uri = self.normalize_battle_id(idx)
-            perf_uri = self.normalize_performance_id(idx)
-            tank_uri = self.normalize_tank_id(row['tank_id'])
-            map_name = row.get('display_name')  # В этом поле реально хранится карта
-
-            # === Battle ===
-            self.g.add((battle_uri, RDF.type, self.WOT.Battle))
-
-            # Время боя, длительность, победа, сторона, взвод — как раньше...
-            if pd.notna(row.get('battle_time')):
-                try:
-                    battle_time = pd.to_datetime(row['battle_time'])
-                    self.g.add((battle_uri, self.WOT.battleTime,
-                                Literal(battle_time, datatype=XSD.dateTime)))
-                except:
-                    pass
-
-            if pd.notna(row.get('duration')):
-                self.g.add((battle_uri, self.WOT.duration,
-                            Literal(int(row['duration']), datatype=XSD.integer)))
-
-            if pd.notna(row.get('won')):
-                self.g.add((battle_uri, self.WOT.won,
-                            Literal(bool(row['won']), datatype=XSD.boolean)))
-
-            if pd.notna(row.get('spawn')):
-                self.g.add((battle_uri, self.WOT.spawn,
-                            Literal(int(row['spawn']), datatype=XSD.integer)))
-
-            if pd.notna(row.get('platoon')):
-                self.g.add((battle_uri, self.WOT.platoon,
-                            Literal(int(row['platoon']), datatype=XSD.integer)))
-
-            # Новое: сохраняем карту как Battle.onMap (datatype string)
-            if pd.notna(map_name):
-                self.g.add((battle_uri, self.WOT.onMap,
-                            Literal(str(map_name), datatype=XSD.string)))
-                self.map_counter[map_name] = self.map_counter.get(map_name, 0) + 1
-
-            # === Tank === (как раньше, если не был создан)
-            if tank_uri not in self.tank_counter:
-                tank_type = self.map_class_to_type(row.get('class', 'Tank'))
-                self.g.add((tank_uri, RDF.type, tank_type))
-                self.g.add((tank_uri, self.WOT.tankName,
-                            Literal(row['name'], datatype=XSD.string)))
-                if pd.notna(row.get('tier')):
-                    self.g.add((tank_uri, self.WOT.tier,
-                                Literal(int(row['tier']), datatype=XSD.integer)))
-                if pd.notna(row.get('nation')):
-                    nation_uri = self.map_nation_to_uri(row['nation'])
-                    self.g.add((tank_uri, self.WOT.belongsToNation, nation_uri))
-                if pd.notna(row.get('max_health')):
-                    self.g.add((tank_uri, self.WOT.maxHP,
-                                Literal(int(row['max_health']), datatype=XSD.integer)))
-                self.tank_counter[tank_uri] = 0
-
-            self.tank_counter[tank_uri] += 1
-
-            # === BattlePerformance ===
-            self.g.add((perf_uri, RDF.type, self.WOT.BattlePerformance))
-
-            # Связи (без achievedBy):
-            self.g.add((perf_uri, self.WOT.inBattle, battle_uri))
-            self.g.add((perf_uri, self.WOT.withTank, tank_uri))
-            self.g.add((battle_uri, self.WOT.hasPerformance, perf_uri))
-            
-            # Урон
-            for field in ['damage', 'sniperDamage', 'damageReceived', 
-                         'damageReceivedFromInvisible', 'potentialDamageReceived', 
-                         'damageBlocked']:
-                snake_field = ''.join(['_'+c.lower() if c.isupper() else c for c in field]).lstrip('_')
-                if pd.notna(row.get(snake_field)):
-                    self.g.add((perf_uri, self.WOT[field], 
-                              Literal(int(row[snake_field]), datatype=XSD.integer)))
+        # Эмиттеры триплетов, скомпилированные из маппинга онтологии
+        timer = self.metrics.start('build_triples')
+        triples_before = self.written_triples()
+        builder = BattleBlockBuilder(self.WOT, self.column_mappings, df.columns, self.profile,
+                                     consolidate=self.consolidate_battles, validator=self.validator)
+        self.add_battle_rows(df, builder)
+        
+        self.writer.flush()
+        self.metrics.stop(timer, rows=len(df), triples=self.written_triples() - triples_before)
+        self.battle_counter = len(df)
+        self.finish_validation()
+        
+        print(f"✅ Imported {len(df)} battles")
+        print(f"   Unique tanks: {len(self.tank_counter)}")
+        if self.consolidate_battles:
+            merged = builder.rows - len(builder.battles)
+            self.consolidation = {
+                'rows': builder.rows,
+                'battles': len(builder.battles),
+                'merged_rows': merged,
+                'saved_triples': builder.saved_triples,
+            }
+            if merged == 0:
+                print(f"   🔗 Consolidated matches: no rows share a match, {builder.rows:,} battles kept as is "
+                      f"(winner side adds {-builder.saved_triples:,} triples)")
+            elif builder.saved_triples >= 0:
+                print(f"   🔗 Consolidated matches: {builder.rows:,} rows → {len(builder.battles):,} battles "
+                      f"({builder.saved_triples:,} triples saved)")
+            else:
+                print(f"   🔗 Consolidated matches: {builder.rows:,} rows → {len(builder.battles):,} battles "
+                      f"({-builder.saved_triples:,} more triples: winner side outweighs {merged:,} merged rows)")
+    
+    def import_battles_budgeted(self, tomato_file, limit, random_sample, memory_budget):
+        """Импортирует бои чанками, подбирая размеры под бюджет памяти
+        
+        Первый чанк служит пробой: по приросту RSS оценивается стоимость строки
+        (чтение + граф). Дальше размер чанка и пачки addN выбирается из оставшегося
+        запаса, а когда граф перестает помещаться - бои сбрасываются на диск.
+        Очистка данных выполняется в пределах чанка.
+        """
+        print(f"  Memory budget: {memory_budget.limit / 1024 ** 2:,.0f} MB")
+        with self.metrics.stage('select_sample'):
+            skip_idx = self.select_skipped_battles(tomato_file, limit, random_sample)
+        reader = pd.read_csv(tomato_file, skiprows=skip_idx, iterator=True)
+        max_rows = limit if skip_idx is None and not random_sample else None
+        
+        builder = None
+        loaded = 0
+        chunk_size = memory_budget.probe_rows
+        battle_subjects = []
+        memory_budget.start(current_rss())
+        
+        while max_rows is None or loaded < max_rows:
+            if max_rows is not None:
+                chunk_size = min(chunk_size, max_rows - loaded)
+            try:
+                with self.metrics.stage('read_csv') as stage:
+                    chunk = reader.get_chunk(chunk_size)
+                    stage.rows += len(chunk)
+            except StopIteration:
+                break
+            loaded += len(chunk)
             
-            # Стрельба
-            for field in ['shotsFired', 'directHits', 'penetrations', 'hitsReceived', 
-                         'penetrationsReceived', 'splashHitsReceived']:
-                snake_field = ''.join(['_'+c.lower() if c.isupper() else c for c in field]).lstrip('_')
-                if pd.notna(row.get(snake_field)):
-                    self.g.add((perf_uri, self.WOT[field], 
-                              Literal(int(row[snake_field]), datatype=XSD.integer)))
+            # Сбрасываем бои на диск, если следующий чанк не помещается в бюджет
+            if memory_budget.should_spill(len(chunk)):
+                self.writer.flush()
+                with self.metrics.stage('spill') as stage:
+                    stage.triples += self.spill_battles(battle_subjects)
+                    stage.rows += len(battle_subjects) // 2
+                memory_budget.spilled(len(battle_subjects) // 2)
+                battle_subjects = []
             
-            # Действия
-            for field in ['spots', 'frags', 'trackingAssist', 'spottingAssist']:
-                snake_field = ''.join(['_'+c.lower() if c.isupper() else c for c in field]).lstrip('_')
-                if pd.notna(row.get(snake_field)):
-                    self.g.add((perf_uri, self.WOT[field], 
-                              Literal(int(row[snake_field]), datatype=XSD.integer)))
+            rss_before = current_rss()
+            with self.metrics.stage('clean_data') as stage:
+                df = self.clean_data(chunk, verbose=False)
+                stage.rows += len(df)
+            timer = self.metrics.start('build_triples')
+            triples_before = self.written_triples()
+            if builder is None:
+                builder = BattleBlockBuilder(self.WOT, self.column_mappings, df.columns, self.profile,
+                                             validator=self.validator)
+            self.add_battle_rows(df, builder, done=self.battle_counter, total=limit)
+            self.writer.flush()
+            self.metrics.stop(timer, rows=len(df), triples=self.written_triples() - triples_before)
+            memory_budget.observe(len(df), rss_before, current_rss())
             
-            # База
-            for field in ['baseDefensePoints', 'baseCapturePoints']:
-                snake_field = ''.join(['_'+c.lower() if c.isupper() else c for c in field]).lstrip('_')
-                if pd.notna(row.get(snake_field)):
-                    self.g.add((perf_uri, self.WOT[field], 
-                              Literal(int(row[snake_field]), datatype=XSD.integer)))
+            for idx in df.index.tolist():
+                battle_subjects.append(self.normalize_battle_id(idx))
+                battle_subjects.append(self.normalize_performance_id(idx))
+            self.battle_counter += len(df)
             
-            # Прочее
-            if pd.notna(row.get('life_time')):
-                self.g.add((perf_uri, self.WOT.lifeTime, 
-                          Literal(int(row['life_time']), datatype=XSD.integer)))
+            # Размеры следующего чанка и пачки addN - по оставшемуся запасу памяти
+            chunk_size = memory_budget.next_chunk_size()
+            self.writer.batch_size = memory_budget.next_batch_size()
+        
+        self.finish_validation()
+        print(f"✅ Imported {self.battle_counter} battles ({loaded:,} loaded)")
+        print(f"   Unique tanks: {len(self.tank_counter)}")
+        print(f"   Estimated cost: {memory_budget.bytes_per_row:,.0f} bytes/row, "
+              f"last chunk {chunk_size:,} rows, batch {self.writer.batch_size:,}")
+        if self.spill_files:
+            print(f"   Spilled to disk: {len(self.spill_files)} parts")
+    
+    def spill_battles(self, subjects):
+        """Переносит триплеты боев и результатов из графа в N-Triples файл на диске"""
+        if not subjects:
+            return 0
+        if self.spill_dir is None:
+            self.spill_dir = Path(tempfile.mkdtemp(prefix='spill_', dir=self.ontology_dir))
+        
+        spill_file = self.spill_dir / f"part_{len(self.spill_files):04d}.nt"
+        triples = 0
+        with open(spill_file, 'w', encoding='utf-8') as out:
+            for subject in subjects:
+                for s, p, o in self.g.triples((subject, None, None)):
+                    out.write(f"{nt_term(s)} {nt_term(p)} {nt_term(o)} .\n")
+                    triples += 1
+                self.g.remove((subject, None, None))
+        self.spill_files.append(spill_file)
+        self.spilled_triples += triples
+        print(f"  💾 Spilled {triples:,} triples to {spill_file.name} (RSS {current_rss() / 1024 ** 2:,.0f} MB)")
+        return triples
+    
+    def iter_raw_battle_chunks(self, tomato_file, limit, random_sample, chunk_size):
+        """Читает tomato.csv сырыми чанками строк с той же выборкой, что и import_battles_from_tomato"""
+        skip_idx = self.select_skipped_battles(tomato_file, limit, random_sample)
+        keep = None
+        if skip_idx is not None:
+            keep = np.ones(len(skip_idx) + limit + 1, dtype=bool)
+            keep[skip_idx] = False
+        max_rows = None if random_sample else limit
+        
+        with open(tomato_file) as f:
+            header = f.readline()
+            lines = []
+            start_index = 0
+            taken = 0
+            for line_no, line in enumerate(f, start=1):
+                if keep is not None and not keep[line_no]:
+                    continue
+                lines.append(line)
+                taken += 1
+                if len(lines) >= chunk_size:
+                    yield start_index, header, lines
+                    start_index += len(lines)
+                    lines = []
+                if max_rows is not None and taken >= max_rows:
+                    break
+            if lines:
+                yield start_index, header, lines
+    
+    def import_battles_pipeline(self, output_name="wot_with_data", limit=10000, random_sample=True,
+                                workers=None, chunk_size=5000, queue_size=None):
+        """Импортирует бои параллельным пайплайном и пишет граф в N-Triples
+        
+        Читатель (поток) -> пул процессов-трансформеров -> писатель (поток),
+        между стадиями - ограниченные очереди. Очистка данных (в т.ч. удаление
+        дубликатов) выполняется в пределах чанка.
+        """
+        workers = workers or os.cpu_count() or 1
+        queue_size = queue_size or workers * 2
+        print("\n" + "=" * 60)
+        print(f"IMPORTING BATTLE DATA FROM tomato.csv (PIPELINE)")
+        print(f"  Limit: {limit}")
+        print(f"  Random sampling: {random_sample}")
+        print(f"  Workers: {workers}, chunk size: {chunk_size:,}, queue size: {queue_size}")
+        print("=" * 60)
+        
+        tomato_file = self.data_dir / "tomato.csv"
+        if not tomato_file.exists():
+            print(f"⚠️  File not found: {tomato_file}")
+            return
+        
+        filepath = self.ontology_dir / f'{output_name}.nt'
+        raw_chunks = queue.Queue(maxsize=queue_size)
+        pending = queue.Queue(maxsize=queue_size)
+        stats = {
+            'reader_busy': 0.0, 'reader_blocked': 0.0,
+            'transform_busy': 0.0,
+            'writer_busy': 0.0, 'writer_waiting': 0.0,
+            'loaded': 0, 'rows': 0, 'triples': 0,
+        }
+        errors = []
+        # Ошибка любой стадии останавливает чтение; писатель дочитывает и отменяет очередь
+        failed = threading.Event()
+        
+        def reader():
+            try:
+                chunks = self.iter_raw_battle_chunks(tomato_file, limit, random_sample, chunk_size)
+                while not failed.is_set():
+                    start_time = time.perf_counter()
+                    chunk = next(chunks, None)
+                    stats['reader_busy'] += time.perf_counter() - start_time
+                    start_time = time.perf_counter()
+                    raw_chunks.put(chunk)
+                    stats['reader_blocked'] += time.perf_counter() - start_time
+                    if chunk is None:
+                        return
+                raw_chunks.put(None)
+            except Exception as e:
+                errors.append(e)
+                failed.set()
+                raw_chunks.put(None)
+        
+        def writer(out):
+            try:
+                write_results(out)
+            except Exception as e:
+                errors.append(e)
+                failed.set()
+                # Дочитываем очередь, чтобы раздающий поток не заблокировался на pending.put
+                future = pending.get()
+                while future is not None:
+                    future.cancel()
+                    future = pending.get()
+        
+        def write_results(out):
+            while True:
+                start_time = time.perf_counter()
+                future = pending.get()
+                if future is None:
+                    break
+                result = future.result()
+                stats['writer_waiting'] += time.perf_counter() - start_time
+                
+                start_time = time.perf_counter()
+                out.write(result['nt'])
+                stats['transform_busy'] += result['busy']
+                stats['loaded'] += result['loaded']
+                stats['rows'] += result['rows']
+                stats['triples'] += result['triples']
+                for map_name, count in result['maps'].items():
+                    self.map_counter[map_name] = self.map_counter.get(map_name, 0) + count
+                self.aggregates.merge(result['aggregates'])
+                self.sample.merge(result['sample'])
+                self.validator.merge(result['validation'])
+                
+                # === Tank === (если еще не был создан)
+                for row in result['tank_rows']:
+                    tank_uri = self.normalize_tank_id(row['tank_id'])
+                    if tank_uri not in self.tank_counter:
+                        self.add_tank_from_battle_row(tank_uri, row)
+                        self.tank_counter[tank_uri] = 0
+                for tank_id, count in result['tank_ids'].items():
+                    self.tank_counter[self.normalize_tank_id(tank_id)] += count
+                
+                stats['writer_busy'] += time.perf_counter() - start_time
+                print(f"  Written {stats['rows']:,} battles ({stats['triples']:,} triples)")
+        
+        wall_start = time.perf_counter()
+        with open(filepath, 'w', encoding='utf-8') as out, \
+                ProcessPoolExecutor(max_workers=workers, initializer=init_pipeline_worker,
+                                    initargs=(str(self.WOT), self.column_mappings, self.profile,
+                                              self.schema_properties)) as pool:
+            reader_thread = threading.Thread(target=reader, name='pipeline-reader')
+            writer_thread = threading.Thread(target=writer, args=(out,), name='pipeline-writer')
+            reader_thread.start()
+            writer_thread.start()
             
-            if pd.notna(row.get('distance_traveled')):
-                self.g.add((perf_uri, self.WOT.distanceTraveled, 
-                          Literal(int(row['distance_traveled']), datatype=XSD.integer)))
+            # Раздаем сырые чанки пулу; очередь pending ограничивает число чанков в работе
+            while True:
+                chunk = raw_chunks.get()
+                if chunk is None:
+                    break
+                if not failed.is_set():
+                    pending.put(pool.submit(transform_battle_chunk, chunk))
+            pending.put(None)
+            reader_thread.join()
+            writer_thread.join()
             
-            if pd.notna(row.get('base_xp')):
-                self.g.add((perf_uri, self.WOT.baseXP, 
-                          Literal(int(row['base_xp']), datatype=XSD.integer)))
+            if errors:
+                out.close()
+                filepath.unlink(missing_ok=True)
+                raise errors[0]
             
-            # Прогресс
-            if (idx + 1) % 1000 == 0:
-                print(f"  Processed {idx + 1}/{len(df)} battles")
+            # Схема и танки из рабочего графа дописываются в конец файла
+            self.writer.flush()
+            with self.metrics.stage('serialize') as stage:
+                out.write(self.g.serialize(format='nt'))
+                stage.triples = len(self.g)
+        wall_time = time.perf_counter() - wall_start
         
-        self.battle_counter = len(df)
+        # Стадии пайплайна замерены в потоках; CPU трансформеров - в дочерних процессах
+        self.metrics.record('pipeline_read', stats['reader_busy'], rows=stats['loaded'])
+        self.metrics.record('pipeline_transform', stats['transform_busy'],
+                            rows=stats['rows'], triples=stats['triples'])
+        self.metrics.record('pipeline_write', stats['writer_busy'],
+                            rows=stats['rows'], triples=stats['triples'])
         
-        print(f"✅ Imported {len(df)} battles")
+        self.battle_counter = stats['rows']
+        total_triples = stats['triples'] + len(self.g)
+        try:
+            self.finish_validation()
+        except SchemaValidationError:
+            # Файл пайплайна уже записан: в строгом режиме он не должен остаться
+            filepath.unlink()
+            raise
+        print(f"✅ Imported {stats['rows']} battles ({stats['loaded']:,} loaded)")
         print(f"   Unique tanks: {len(self.tank_counter)}")
+        print(f"  ✅ Saved: {filepath}")
+        print(f"  📦 File size: {filepath.stat().st_size / (1024 * 1024):.2f} MB")
+        
+        # Загрузка стадий: доля времени, занятая полезной работой
+        stages = [
+            ('reader', stats['reader_busy'], wall_time),
+            ('transform', stats['transform_busy'], wall_time * workers),
+            ('writer', stats['writer_busy'], wall_time),
+        ]
+        print(f"\n⚙️  Pipeline stage utilization (wall {wall_time:.2f} s, "
+              f"{stats['rows'] / wall_time if wall_time > 0 else 0:,.0f} rows/s):")
+        for name, busy, capacity in stages:
+            utilization = busy / capacity * 100 if capacity > 0 else 0
+            print(f"   {name:<10} busy {busy:7.2f} s  utilization {utilization:5.1f}%")
+        print(f"   reader blocked on full queue: {stats['reader_blocked']:.2f} s, "
+              f"writer waiting for chunks: {stats['writer_waiting']:.2f} s")
+        bottleneck = max(stages, key=lambda stage: stage[1] / stage[2] if stage[2] > 0 else 0)
+        print(f"   Bottleneck: {bottleneck[0]}")
+        
+        self.print_statistics(total_triples)
+        return filepath
     
-    def save_graph(self, output_name="wot_with_data"):
-        """Сохраняет граф в OWL файл"""
+    def save_graph(self, output_name="wot_with_data", formats=('owl',), compression=None):
+        """Сохраняет граф в выбранные форматы (owl, nt, ttl, nq), возвращает файл первого формата"""
         print("\n" + "=" * 60)
         print("SAVING KNOWLEDGE GRAPH")
         print("=" * 60)
         
-        # Сохраняем только в OWL формат (RDF/XML)
-        filename = f'{output_name}.owl'
-        filepath = self.ontology_dir / filename
+        self.writer.flush()
+        base = self.ontology_dir / output_name
         
-        print(f"Saving {filename}...")
-        self.g.serialize(destination=str(filepath), format='xml')
+        if self.spill_files:
+            # Часть боев уже на диске: остальные форматы требуют весь граф в памяти,
+            # поэтому склеиваем граф и сброшенные части в N-Triples
+            filepath = graph_path(base, 'nt', compression)
+            print(f"Saving {filepath.name} (graph was spilled to disk, writing N-Triples only)...")
+            start_time = time.perf_counter()
+            with self.metrics.stage('serialize') as stage, open_output(filepath, compression) as out:
+                write_nt_lines(self.g, out)
+                for spill_file in self.spill_files:
+                    with open(spill_file, 'rb') as part:
+                        shutil.copyfileobj(part, out)
+                stage.triples = len(self.g) + self.spilled_triples
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+            self.outputs = [{'format': 'nt', 'file': str(filepath), 'compression': compression,
+                             'seconds': time.perf_counter() - start_time, 'bytes': filepath.stat().st_size}]
+        else:
+            print(f"Saving {', '.join(graph_path(base, name, compression).name for name in formats)}...")
+            start_time = time.perf_counter()
+            with self.metrics.stage('serialize') as stage:
+                self.outputs, workers = write_formats(self.g, base, formats, compression)
+                stage.triples = len(self.g)
+            # Время каждого формата замерено в процессе записи
+            for report in self.outputs:
+                self.metrics.record(f"serialize_{report['format']}", report['seconds'], triples=len(self.g))
+            print_write_report(self.outputs, time.perf_counter() - start_time, workers)
+            filepath = Path(self.outputs[0]['file'])
         file_size = filepath.stat().st_size / (1024 * 1024)  # MB
         print(f"  ✅ Saved: {filepath}")
         print(f"  📦 File size: {file_size:.2f} MB")
         
+        self.print_statistics(len(self.g) + self.spilled_triples)
+        return filepath
+    
+    def save_partitioned(self, output_name="wot_with_data"):
+        """Сохраняет граф партициями (схема, каталог, бои по месяцам) в директорию"""
+        print("\n" + "=" * 60)
+        print("SAVING KNOWLEDGE GRAPH (PARTITIONED)")
+        print("=" * 60)
+        
+        self.writer.flush()
+        
+        directory = self.ontology_dir / output_name
+        print(f"Saving partitions to {directory}/...")
+        with self.metrics.stage('serialize') as stage:
+            manifest = write_partitions(self.g, self.WOT, directory)
+            stage.triples = len(self.g)
+        
+        total_size = 0
+        for partition in manifest['partitions']:
+            size = (directory / partition['file']).stat().st_size
+            total_size += size
+            print(f"  {partition['name']:<20} {partition['triples']:>10,} triples  {size / (1024 * 1024):8.2f} MB")
+        print(f"  ✅ Saved: {directory} ({len(manifest['partitions'])} partitions)")
+        print(f"  📦 Total size: {total_size / (1024 * 1024):.2f} MB")
+        
+        self.print_statistics(len(self.g))
+        return directory
+    
+    def save_aggregates(self, output_file):
+        """Сохраняет агрегаты боев (<output>.aggregates.json) и выборку боев (<output>.sample.npz) рядом с графом"""
+        tank_names = {}
+        for tank, name in self.g.subject_objects(WOT.tankName):
+            short = self.g.value(tank, WOT.shortName)
+            tank_names[str(tank)] = (str(name), str(short) if short is not None else None)
+        
+        def nation_name(nation):
+            name = self.g.value(self.map_nation_to_uri(nation), WOT.nationName)
+            return str(name) if name is not None else None
+        
+        self.aggregates.resolve_names(tank_names, nation_name)
+        self.aggregates.output = output_file.name
+        aggregates_file = self.aggregates.save(store_path(output_file))
+        print(f"  📊 Aggregates: {aggregates_file} ({self.aggregates.size:,} groups, "
+              f"{self.aggregates.battles:,} battles)")
+        
+        # Выборка для approx запросов строится здесь, а не в каждом процессе движка при первом запросе
+        sample_file = self.sample.draw().save(sample_path(output_file))
+        print(f"  🎲 Stratified sample: {sample_file} ({self.sample.size:,} of {self.sample.population:,} "
+              f"performances, {len(self.sample.strata)} strata)")
+        return aggregates_file
+    
+    def finish_validation(self):
+        """Печатает отчет проверки схемы; в строгом режиме нарушения завершают импорт"""
+        self.metrics.record('validate', self.validator.seconds, rows=self.battle_counter)
+        self.validator.print_report()
+        if self.strict and self.validator.violations():
+            raise SchemaValidationError(f"{self.validator.violations():,} schema violations in battle data")
+    
+    def save_validation(self, output_file):
+        """Сохраняет отчет проверки схемы рядом с графом (<output>.validation.json)"""
+        base = split_graph_path(output_file)[0]
+        validation_file = base.with_name(base.name + '.validation.json')
+        self.validator.write_json(validation_file)
+        print(f"  🔎 Validation report: {validation_file}")
+        return validation_file
+    
+    def written_triples(self):
+        """Триплеты, переданные писателю (записанные и ожидающие в буфере)"""
+        return self.writer.triples_written + len(self.writer.buffer)
+    
+    def counters(self):
+        """Счетчики импортированных сущностей"""
+        return {
+            'tanks': len(self.tank_counter),
+            'maps': len(self.map_counter),
+            'battles': self.battle_counter,
+            'guns': len(self.gun_counter),
+            'engines': len(self.engine_counter),
+            'turrets': len(self.turret_counter),
+            'suspensions': len(self.suspension_counter),
+            'radios': len(self.radio_counter),
+        }
+    
+    def write_metrics(self, output_file, prometheus=False):
+        """Сохраняет метрики импорта рядом с выходным файлом (JSON и, по желанию, Prometheus)"""
+        metrics = self.metrics.to_dict(rows=self.battle_counter, triples=self.total_triples,
+                                       counters=self.counters(), writer=self.writer)
+        metrics['output'] = output_file.name
+        metrics['profile'] = self.profile
+        if self.consolidation:
+            metrics['consolidation'] = self.consolidation
+        if self.outputs:
+            metrics['outputs'] = self.outputs
+        metrics['validation'] = self.validator.summary()
+        
+        base = split_graph_path(output_file)[0]
+        metrics_file = base.with_name(base.name + '.metrics.json')
+        ImportMetrics.write_json(metrics, metrics_file)
+        print(f"  📈 Metrics: {metrics_file}")
+        if prometheus:
+            prom_file = base.with_name(base.name + '.prom')
+            ImportMetrics.write_prometheus(metrics, prom_file)
+            print(f"  📈 Prometheus metrics: {prom_file}")
+        
+        if metrics.get('top_allocators'):
+            print(f"\n🧠 Top allocators (tracemalloc):")
+        for allocation in metrics.get('top_allocators', []):
+            print(f"   {allocation['size_bytes'] / 1024 ** 2:8.1f} MB  {allocation['count']:>9,}  "
+                  f"{allocation['location']}")
+        return metrics_file
+    
+    def print_statistics(self, total_triples):
+        """Печатает итоговую статистику импорта"""
+        self.total_triples = total_triples
         print(f"\n📊 Final statistics:")
-        print(f"   Total triples: {len(self.g):,}")
+        print(f"   Total triples: {total_triples:,}")
         print(f"   Tanks: {len(self.tank_counter)}")
         print(f"   Maps: {len(self.map_counter)}")
         print(f"   Battles: {self.battle_counter if hasattr(self, 'battle_counter') else 'N/A'}")
@@ -598,7 +1388,15 @@ class DataImporter:
         print(f"   Turrets: {len(self.turret_counter)}")
         print(f"   Suspensions: {len(self.suspension_counter)}")
         print(f"   Radios: {len(self.radio_counter)}")
-
+        print(f"   Peak RSS: {peak_rss() / 1024 ** 2:,.0f} MB")
+        print(f"\n⚡ Graph writes ({self.writer.path_name}, store {type(self.g.store).__name__}, "
+              f"batch {self.writer.batch_size:,}):")
+        print(f"   {self.writer.triples_written:,} triples in {self.writer.write_time:.2f} s "
+              f"({self.writer.triples_per_second():,.0f} triples/s)")
+        reference = self.writer.reference()
+        if reference:
+            print(f"   {reference[0]} on the first batch: {reference[1]:,.0f} triples/s (scratch graph)")
+        self.metrics.print_summary()
 
 def main():
     parser = argparse.ArgumentParser(description='Import WoT data to RDF Knowledge Graph')
@@ -610,8 +1408,57 @@ def main():
                        help='Output filename prefix (default: wot_with_data)')
     parser.add_argument('--no-random', action='store_true',
                        help='Disable random sampling (take first N battles)')
+    parser.add_argument('--store', type=str, default='Memory',
+                       help='rdflib store plugin for the working graph, e.g. Memory, SimpleMemory, BerkeleyDB (default: Memory)')
+    parser.add_argument('--store-path', type=str, default=None,
+                       help='Directory for a disk-backed store (default: in-memory)')
+    parser.add_argument('--batch-size', type=int, default=10000,
+                       help='Triples per addN batch (default: 10000)')
+    parser.add_argument('--pipeline', action='store_true',
+                       help='Import battles with a parallel reader/transformer/writer pipeline into <output>.nt')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Transformer processes for --pipeline (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=5000,
+                       help='Rows per pipeline chunk (default: 5000)')
+    parser.add_argument('--max-memory', type=str, default=None,
+                       help='Memory budget, e.g. 4G: chunk/batch sizes and spilling to disk follow measured RSS')
+    parser.add_argument('--write-mode', choices=['addN', 'add'], default='addN',
+                       help='Batched addN writes or legacy per-triple add (default: addN)')
+    parser.add_argument('--profile', choices=PROFILES, default='full',
+                       help='Graph profile: full (redundant links for Protégé) or lean (each fact written once)')
+    parser.add_argument('--consolidate-battles', action='store_true',
+                       help='Merge rows of one match (time + map + duration) into a single Battle')
+    parser.add_argument('--formats', type=str, default='owl',
+                       help='Comma-separated output formats written in parallel: owl, nt, ttl, nq (default: owl)')
+    parser.add_argument('--compress', choices=['gzip', 'zstd'], default=None,
+                       help='Compress output files (zstd requires the zstandard package)')
+    parser.add_argument('--partitioned', action='store_true',
+                       help='Save the graph as N-Triples partitions (schema, catalog, battles per month) into ontology/<output>/')
+    parser.add_argument('--ontology', type=str, default=None,
+                       help='Parse this ontology file (relative to the project root) instead of the precompiled schema '
+                            '(scripts/wot_schema.py)')
+    parser.add_argument('--strict', action='store_true',
+                       help='Fail the import if battle values violate the declared datatypes (see <output>.validation.json)')
+    parser.add_argument('--metrics-prometheus', action='store_true',
+                       help='Also write metrics in Prometheus text format to <output>.prom')
+    parser.add_argument('--trace-memory', type=int, default=0, metavar='N',
+                       help='Trace allocations with tracemalloc and report top N allocators (slow)')
     
     args = parser.parse_args()
+    try:
+        formats = parse_formats(args.formats)
+        check_compression(args.compress)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.max_memory and args.pipeline:
+        parser.error('--max-memory is not supported together with --pipeline')
+    if args.partitioned and (args.pipeline or args.max_memory):
+        parser.error('--partitioned is not supported together with --pipeline or --max-memory')
+    if args.consolidate_battles and (args.pipeline or args.max_memory):
+        parser.error('--consolidate-battles is not supported together with --pipeline or --max-memory')
+    if (args.pipeline or args.partitioned) and (formats != ['owl'] or args.compress):
+        parser.error('--formats/--compress are not supported together with --pipeline or --partitioned')
+    memory_budget = MemoryBudget(parse_memory_size(args.max_memory)) if args.max_memory else None
     
     print("=" * 60)
     print("WORLD OF TANKS KNOWLEDGE GRAPH - DATA IMPORTER")
@@ -620,33 +1467,64 @@ def main():
     print(f"  Battles to import: {args.battles:,}")
     print(f"  Tanks to import: {args.tanks if args.tanks else 'all'}")
     print(f"  Random sampling: {not args.no_random}")
-    print(f"  Output filename: {args.output}")
-    
-    # Находим онтологию
-    ontology_file = Path(__file__).parent.parent / "ontology" / "wot_ontology.owl"
+    print(f"  Output filename: {args.output}{' (partitioned)' if args.partitioned else ''}")
+    print(f"  Memory budget: {args.max_memory or 'unlimited'}")
+    print(f"  Store: {args.store} ({args.write_mode}, batch {args.batch_size:,})")
+    print(f"  Profile: {args.profile}{' (consolidated battles)' if args.consolidate_battles else ''}")
+    print(f"  Formats: {', '.join(formats)}{f' ({args.compress})' if args.compress else ''}")
     
-    if not ontology_file.exists():
-        print(f"\n❌ Ontology not found: {ontology_file}")
-        print("Please run create_ontology.py first!")
-        return
+    # По умолчанию схема берется из wot_schema.py; файл онтологии разбирается только по --ontology
+    ontology_file = None
+    if args.ontology:
+        # Путь считается от корня проекта (как у query_ontology.py), а не от текущей директории
+        ontology_file = fastest_graph_file(Path(__file__).parent.parent / args.ontology)
+        if not ontology_file.exists():
+            print(f"\n❌ Ontology not found: {ontology_file}")
+            print("Please run create_ontology.py first!")
+            return
     
     # Создаем импортер
-    importer = DataImporter(ontology_file)
+    metrics = ImportMetrics(trace_allocations=args.trace_memory)
+    importer = DataImporter(ontology_file, store=args.store, store_path=args.store_path,
+                            batch_size=args.batch_size, write_mode=args.write_mode, metrics=metrics,
+                            profile=args.profile, consolidate_battles=args.consolidate_battles,
+                            strict=args.strict)
     
     # Импортируем данные о танках
     importer.import_tanks_from_wot_data(limit=args.tanks)
     
-    # Импортируем данные о боях
-    importer.import_battles_from_tomato(limit=args.battles, random_sample=not args.no_random)
+    try:
+        if args.pipeline:
+            # Импортируем бои пайплайном (сразу в N-Triples)
+            output_file = importer.import_battles_pipeline(output_name=args.output, limit=args.battles,
+                                             random_sample=not args.no_random,
+                                             workers=args.workers, chunk_size=args.chunk_size)
+        else:
+            # Импортируем данные о боях
+            importer.import_battles_from_tomato(limit=args.battles, random_sample=not args.no_random,
+                                                memory_budget=memory_budget)
+    except SchemaValidationError as e:
+        print(f"\n❌ Import failed (--strict): {e}")
+        sys.exit(1)
     
-    # Сохраняем
-    importer.save_graph(output_name=args.output)
+    if not args.pipeline:
+        # Сохраняем
+        if args.partitioned:
+            output_file = importer.save_partitioned(output_name=args.output)
+        else:
+            output_file = importer.save_graph(output_name=args.output, formats=formats, compression=args.compress)
+    if output_file:
+        importer.save_aggregates(output_file)
+        importer.save_validation(output_file)
+        importer.write_metrics(output_file, prometheus=args.metrics_prometheus)
+    if args.store_path:
+        importer.g.close()
     
     print("\n" + "=" * 60)
     print("✅ DATA IMPORT COMPLETED!")
     print("=" * 60)
     print(f"\nYou can now:")
-    print(f"  1. Open {args.output}.owl in Protégé")
+    print(f"  1. Open {output_file.name if output_file else args.output} in Protégé")
     print(f"  2. Run SPARQL queries")
     print(f"  3. Analyze the knowledge graph")
 
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Метрики импорта данных в граф знаний World of Tanks
+
+Для каждой стадии импорта собираются wall/CPU время, число строк и триплетов,
+RSS после стадии. Итог сохраняется в JSON рядом с выходным файлом
+и, по желанию, в текстовом формате Prometheus
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def current_rss():
+    """Текущий RSS процесса в байтах"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return peak_rss()
+
+
+def peak_rss():
+    """Пиковый RSS процесса в байтах"""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux отдает килобайты, macOS - байты
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class StageMetrics:
+    """Накопленные показатели одной стадии импорта"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.rows = 0
+        self.triples = 0
+        self.rss_after = 0
+
+    def rows_per_second(self):
+        return self.rows / self.wall_time if self.wall_time > 0 else 0.0
+
+    def triples_per_second(self):
+        return self.triples / self.wall_time if self.wall_time > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'wall_seconds': round(self.wall_time, 6),
+            'cpu_seconds': round(self.cpu_time, 6) if self.cpu_time is not None else None,
+            'rows': self.rows,
+            'triples': self.triples,
+            'rows_per_second': round(self.rows_per_second(), 2),
+            'triples_per_second': round(self.triples_per_second(), 2),
+            'rss_after_bytes': self.rss_after,
+        }
+
+
+class ImportMetrics:
+    """Сборщик метрик импорта: стадии, память и (опционально) tracemalloc"""
+
+    def __init__(self, trace_allocations=0):
+        # trace_allocations - сколько мест аллокаций показывать (0 - tracemalloc выключен)
+        self.trace_allocations = trace_allocations
+        self.stages = {}
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        if trace_allocations:
+            tracemalloc.start()
+
+    def get(self, name):
+        """Возвращает (или создает) метрики стадии"""
+        if name not in self.stages:
+            self.stages[name] = StageMetrics(name)
+        return self.stages[name]
+
+    def start(self, name):
+        """Начинает замер стадии, возвращает таймер для stop()"""
+        return name, time.perf_counter(), time.process_time()
+
+    def stop(self, timer, rows=0, triples=0):
+        """Завершает замер стадии"""
+        name, wall_start, cpu_start = timer
+        stage = self.get(name)
+        stage.calls += 1
+        stage.wall_time += time.perf_counter() - wall_start
+        if stage.cpu_time is not None:
+            stage.cpu_time += time.process_time() - cpu_start
+        stage.rows += rows
+        stage.triples += triples
+        stage.rss_after = max(stage.rss_after, current_rss())
+        return stage
+
+    @contextmanager
+    def stage(self, name):
+        """Замеряет стадию; строки и триплеты добавляются через stage.rows / stage.triples"""
+        timer = self.start(name)
+        stage = self.get(name)
+        try:
+            yield stage
+        finally:
+            self.stop(timer)
+
+    def record(self, name, wall_time, cpu_time=None, rows=0, triples=0):
+        """Добавляет стадию, замеренную снаружи (например, в потоках пайплайна)"""
+        stage = self.get(name)
+        stage.calls += 1
+        stage.wall_time += wall_time
+        if cpu_time is None:
+            stage.cpu_time = None
+        elif stage.cpu_time is not None:
+            stage.cpu_time += cpu_time
+        stage.rows += rows
+        stage.triples += triples
+        stage.rss_after = max(stage.rss_after, current_rss())
+
+    def top_allocators(self):
+        """Места с наибольшим объемом живых аллокаций (по данным tracemalloc)"""
+        if not self.trace_allocations or not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.statistics('lineno')[:self.trace_allocations]
+        return [{
+            'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            'size_bytes': stat.size,
+            'count': stat.count,
+        } for stat in stats]
+
+    def to_dict(self, rows=0, triples=0, counters=None, writer=None):
+        """Собирает все метрики в словарь для JSON"""
+        wall_time = time.perf_counter() - self.wall_start
+        metrics = {
+            'started_at': self.started_at,
+            'wall_seconds': round(wall_time, 6),
+            'cpu_seconds': round(time.process_time() - self.cpu_start, 6),
+            'rows': rows,
+            'triples': triples,
+            'rows_per_second': round(rows / wall_time, 2) if wall_time > 0 else 0.0,
+            'triples_per_second': round(triples / wall_time, 2) if wall_time > 0 else 0.0,
+            'peak_rss_bytes': peak_rss(),
+            'rss_bytes': current_rss(),
+            'stages': {name: stage.to_dict() for name, stage in self.stages.items()},
+            'counters': counters or {},
+        }
+        if writer is not None:
+            metrics['graph_writes'] = {
+                'path': writer.path_name,
+                'batch_size': writer.batch_size,
+                'triples': writer.triples_written,
+                'seconds': round(writer.write_time, 6),
+                'triples_per_second': round(writer.triples_per_second(), 2),
+            }
+            reference = writer.reference()
+            if reference:
+                metrics['graph_writes']['reference_path'] = reference[0]
+                metrics['graph_writes']['reference_triples_per_second'] = round(reference[1], 2)
+        if self.trace_allocations:
+            metrics['top_allocators'] = self.top_allocators()
+        return metrics
+
+    def print_summary(self):
+        """Печатает таблицу стадий"""
+        print(f"\n⏱️  Stage timings:")
+        for name, stage in self.stages.items():
+            cpu = f"{stage.cpu_time:7.2f}" if stage.cpu_time is not None else "      -"
+            print(f"   {name:<18} wall {stage.wall_time:7.2f} s  cpu {cpu} s  "
+                  f"{stage.rows:>10,} rows  {stage.triples:>11,} triples")
+
+    @staticmethod
+    def write_json(metrics, path):
+        """Сохраняет метрики в JSON файл"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(metrics, f, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    def write_prometheus(metrics, path, prefix='wot_import'):
+        """Сохраняет метрики в текстовом формате Prometheus (node_exporter textfile)"""
+        lines = []
+
+        def gauge(name, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            for labels, value in samples:
+                if value is None:
+                    continue
+                label_text = ','.join(f'{key}="{val}"' for key, val in labels.items())
+                lines.append(f"{prefix}_{name}{{{label_text}}} {value}" if label_text
+                             else f"{prefix}_{name} {value}")
+
+        gauge('wall_seconds', 'Total import wall time', [({}, metrics['wall_seconds'])])
+        gauge('cpu_seconds', 'Total import CPU time', [({}, metrics['cpu_seconds'])])
+        gauge('rows', 'Imported battle rows', [({}, metrics['rows'])])
+        gauge('triples', 'Triples in the output graph', [({}, metrics['triples'])])
+        gauge('rows_per_second', 'Imported rows per second', [({}, metrics['rows_per_second'])])
+        gauge('triples_per_second', 'Output triples per second', [({}, metrics['triples_per_second'])])
+        gauge('peak_rss_bytes', 'Peak resident set size', [({}, metrics['peak_rss_bytes'])])
+
+        stages = metrics['stages'].items()
+        gauge('stage_wall_seconds', 'Wall time per import stage',
+              [({'stage': name}, stage['wall_seconds']) for name, stage in stages])
+        gauge('stage_cpu_seconds', 'CPU time per import stage',
+              [({'stage': name}, stage['cpu_seconds']) for name, stage in stages])
+        gauge('stage_rows', 'Rows processed per import stage',
+              [({'stage': name}, stage['rows']) for name, stage in stages])
+        gauge('stage_triples', 'Triples produced per import stage',
+              [({'stage': name}, stage['triples']) for name, stage in stages])
+        gauge('stage_rss_bytes', 'Resident set size after import stage',
+              [({'stage': name}, stage['rss_after_bytes']) for name, stage in stages])
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
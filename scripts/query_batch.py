@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Пакетное выполнение предопределенных запросов World of Tanks
+
+Набор запросов (короткое имя или имя метода query_* и параметры) читается
+из JSON файла и распределяется по пулу процессов. Процессы создаются через
+fork после загрузки графа, поэтому граф разбирается один раз и разделяется
+copy-on-write. Результаты всех запросов собираются в один отчет
+"""
+
+import contextlib
+import gc
+import io
+import json
+import multiprocessing
+import os
+import time
+from datetime import datetime
+
+from query_results import ResultTable
+
+
+# Движок запросов, унаследованный рабочими процессами при fork
+_ENGINE = None
+
+
+def load_batch(path):
+    """Читает файл пакета: список запросов или {"queries": [...]}"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    entries = data['queries'] if isinstance(data, dict) else data
+
+    jobs = []
+    for index, entry in enumerate(entries):
+        if isinstance(entry, str):
+            entry = {'query': entry}
+        query = entry['query']
+        jobs.append({
+            'index': index,
+            'name': entry.get('name', query),
+            'query': query,
+            'params': entry.get('params', {}),
+        })
+    return jobs
+
+
+def result_rows(results):
+    """Строки результата rdflib в виде словарей с Python значениями (пропуски - None)"""
+    return ResultTable.from_result(results).records() if results else []
+
+
+def run_job(job):
+    """Выполняет один запрос пакета в рабочем процессе"""
+    output = io.StringIO()
+    profiles_before = len(_ENGINE.profiles)
+    error = None
+    rows = []
+
+    start_time = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            rows = result_rows(_ENGINE.run_named_query(job['query'], job['params']))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - start_time
+
+    return dict(job, **{
+        'seconds': round(elapsed, 6),
+        'pid': os.getpid(),
+        'error': error,
+        'row_count': len(rows),
+        'rows': rows,
+        'output': output.getvalue(),
+        'profiles': _ENGINE.profiles[profiles_before:],
+    })
+
+
+def run_batch(engine, batch_file, workers=None, output_file='query_batch_report.json'):
+    """Выполняет пакет запросов в пуле процессов и сохраняет общий отчет"""
+    global _ENGINE
+
+    jobs = load_batch(batch_file)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    use_fork = workers > 1 and 'fork' in multiprocessing.get_all_start_methods()
+
+    print("\n" + "=" * 60)
+    print(f"📦 BATCH: {len(jobs)} queries from {batch_file}")
+    print("=" * 60)
+    if workers > 1 and not use_fork:
+        print("⚠️  fork is not available on this platform, running sequentially")
+    print(f"  Workers: {workers if use_fork else 1}")
+
+    _ENGINE = engine
+    # Ошибки запросов попадают в поле error отчета, а не превращаются в пустой результат
+    raise_errors, engine.raise_errors = engine.raise_errors, True
+    start_time = time.perf_counter()
+    results = []
+    try:
+        run_jobs(jobs, workers, use_fork, results)
+    finally:
+        engine.raise_errors = raise_errors
+    wall_time = time.perf_counter() - start_time
+    results.sort(key=lambda result: result['index'])
+
+    # Вывод запросов печатается в порядке пакета, профили переносятся в движок
+    for result in results:
+        print(result.pop('output'), end='')
+        engine.profiles.extend(result.pop('profiles'))
+
+    query_time = sum(result['seconds'] for result in results)
+    report = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'batch_file': str(batch_file),
+        'workers': workers if use_fork else 1,
+        'wall_seconds': round(wall_time, 6),
+        'query_seconds': round(query_time, 6),
+        'speedup': round(query_time / wall_time, 2) if wall_time > 0 else 0.0,
+        'errors': sum(1 for result in results if result['error']),
+        'queries': results,
+    }
+    print_summary(report)
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    print(f"\n💾 Batch report saved: {output_file}")
+    return report
+
+
+def run_jobs(jobs, workers, use_fork, results):
+    """Выполняет запросы пакета в пуле процессов (fork) или последовательно"""
+    if use_fork:
+        # Объекты графа больше не трогаются сборщиком мусора: страницы остаются общими
+        gc.freeze()
+        try:
+            with multiprocessing.get_context('fork').Pool(workers) as pool:
+                for result in pool.imap_unordered(run_job, jobs):
+                    print_progress(result, len(results) + 1, len(jobs))
+                    results.append(result)
+        finally:
+            gc.unfreeze()
+    else:
+        for job in jobs:
+            result = run_job(job)
+            print_progress(result, len(results) + 1, len(jobs))
+            results.append(result)
+
+
+def print_progress(result, done, total):
+    """Строка прогресса по завершенному запросу"""
+    status = '❌' if result['error'] else '✅'
+    print(f"  {status} [{done}/{total}] {result['name']:<30} {result['seconds']:7.2f} s  "
+          f"{result['row_count']:>6,} rows  (pid {result['pid']})")
+
+
+def print_summary(report):
+    """Итоговая таблица пакета"""
+    print("\n" + "=" * 60)
+    print("📊 BATCH SUMMARY")
+    print("=" * 60)
+    for result in report['queries']:
+        status = f"error: {result['error']}" if result['error'] else f"{result['row_count']:,} rows"
+        print(f"  {result['name']:<30} {result['seconds']:7.2f} s  {status}")
+    print(f"\n  Wall time:   {report['wall_seconds']:.2f} s ({report['workers']} workers)")
+    print(f"  Query time:  {report['query_seconds']:.2f} s (sum over queries)")
+    print(f"  Speedup:     {report['speedup']:.2f}x")
+    if report['errors']:
+        print(f"  ❌ Errors:    {report['errors']}")
@@ -3,17 +3,116 @@
 Скрипт для работы с онтологией World of Tanks и выполнения SPARQL запросов
 """
 
-from rdflib import Graph, Namespace
+from rdflib import Graph, Literal, Namespace, URIRef, Variable
+from rdflib.namespace import XSD
+from rdflib.plugins.sparql import prepareQuery
+from rdflib.query import ResultRow
+from rdflib.term import Node
+from datetime import date
+from decimal import Decimal
 from pathlib import Path
 import argparse
+import contextlib
+import inspect
+import io
+import json
 import time
 
+from query_optimizer import GraphStatistics, QueryOptimizer
+from aggregate_store import AggregateStore, store_path, week_aligned
+from graph_partitions import (is_partitioned, load_manifest, load_partition, parse_time, select_partitions,
+                              select_shards)
+from query_batch import run_batch
+from query_profiler import QueryProfiler, build_plan, format_plan, profile_report
+from battle_sample import MIN_GROUP_SAMPLE, BattleSample, estimate_columns, sample_path
+from battle_time_index import BattleTimeIndex
+from shard_aggregation import aggregate_graph, merge_partials, rollup, scatter_gather
+from triple_index import TripleIndexStore, is_triple_index
+from graph_profiles import CONSOLIDATED, BattleFactRewriter, PredicateRewriter, lean_rewrites, profile_markers
+from graph_formats import available_graph_files, fastest_graph_file, load_graph, split_graph_path
+from tank_names import TankNameResolver
+from tank_similarity import TankFeatureIndex
+from query_results import ResultTable, format_cell, term_value
+from query_session import QuerySession
+
+# Короткие имена предопределенных запросов (--query, пакетный режим)
+QUERY_REGISTRY = {
+    'top-winrate': 'query_top_tanks_by_winrate',
+    'damage-by-class': 'query_average_damage_by_class',
+    'best-players': 'query_best_players',
+    'tanks-by-nation': 'query_tanks_by_nation',
+    'spotting-masters': 'query_spotting_masters',
+    'guns-dpm': 'query_guns_with_highest_dpm',
+    'engines-power': 'query_engines_by_power',
+    'nation-stats': 'query_nation_statistics',
+    'best-tanks': 'query_best_tanks_by_composite',
+    'best-nation': 'query_best_nation_by_weighted_tanks',
+    'highest-avg-damage': 'query_tank_with_highest_avg_damage',
+    'worst-maps': 'query_worst_maps_for_tank',
+    'side-imbalance': 'query_maps_with_side_imbalance',
+    'win-rates': 'query_win_rates',
+    'tank-trend': 'query_tank_trend',
+    'similar-tanks': 'query_similar_tanks',
+}
+
+# Группировки query_win_rates и имена колонок результата
+WIN_RATE_GROUPS = {
+    'tank': 'tankName',
+    'map': 'mapName',
+    'nation': 'nationName',
+    'tier': 'tier',
+    'class': 'tankClass',
+}
+
+
+class UnknownQueryError(KeyError):
+    """Имени нет среди предопределенных запросов"""
+
+
+class QueryParameterError(ValueError):
+    """Параметры не подходят к сигнатуре предопределенного запроса"""
+
+
+def query_usage(name, method):
+    """Строка использования запроса: имя и параметры метода"""
+    params = ', '.join(str(parameter) for parameter in inspect.signature(method).parameters.values())
+    return f"{name}({params})"
+
+
+def make_result_rows(columns, records):
+    """Строки результата rdflib (ResultRow) из словарей колонка -> значение (термы rdflib берутся как есть)"""
+    labels = [Variable(column) for column in columns]
+    return [ResultRow({label: record[column] if isinstance(record[column], Node) else Literal(record[column])
+                       for label, column in zip(labels, columns) if record.get(column) is not None}, labels)
+            for record in records]
+
+
+def decimal_ratio(numerator, denominator):
+    """numerator / denominator как xsd:decimal: так же, как деление в SPARQL вариантах запросов"""
+    return Decimal(str(numerator)) / Decimal(denominator)
+
+
+def name_literal(name):
+    """Имя танка или карты с тем же datatype, что в графе (xsd:string)"""
+    return Literal(name, datatype=XSD.string)
+
 
 class OntologyQueryEngine:
-    def __init__(self, ontology_file):
+    def __init__(self, ontology_file, profile=None, optimize=True, sample_fraction=0.1, aggregates=True):
         """Инициализация движка запросов"""
-        self.g = Graph()
-        self.ontology_file = Path(ontology_file)
+        # Из файлов одного графа в разных форматах берем самый быстрый для разбора
+        self.requested_file = Path(ontology_file)
+        self.ontology_file = fastest_graph_file(self.requested_file)
+
+        # Индекс троек (директория с index.json) открывается через mmap без разбора графа
+        self.index_store = TripleIndexStore(self.ontology_file) if is_triple_index(self.ontology_file) else None
+        self.g = Graph(store=self.index_store) if self.index_store is not None else Graph()
+
+        # Профилирование запросов: None, 'text' или 'json'
+        self.profile = profile
+        self.profiles = []
+        # Пакетный режим: ошибка запроса поднимается, а не печатается с пустым результатом
+        self.raise_errors = False
 
         # Namespace
         self.WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
@@ -23,12 +122,40 @@ class OntologyQueryEngine:
         print("WORLD OF TANKS ONTOLOGY QUERY ENGINE")
         print("=" * 60)
 
+        # Партиционированный граф (директория с manifest.json): партиции грузятся по запросу
+        self.partition_dir = None
+        self.manifest = None
+        self.loaded_partitions = set()
+        self.shard_partials = {}
+
+        # Каталог танков, выборка боев и индекс времени боев (строятся по требованию)
+        self.tanks = None
+        self.tank_resolver = None
+        self.features = None
+        self.sample = None
+        self.time_index = None
+        self.sample_fraction = sample_fraction
+
         # Загружаем онтологию
         print(f"\n📂 Loading ontology: {self.ontology_file.name}")
+        if self.ontology_file != self.requested_file:
+            print(f"⚡ Fastest available format instead of {self.requested_file.name}")
         start_time = time.time()
 
         try:
-            self.g.parse(str(self.ontology_file), format='xml')
+            if self.index_store is not None:
+                print(f"🗂️  Triple index: {self.index_store.index['terms']:,} terms, "
+                      f"SPO/POS/OSP arrays memory-mapped")
+            elif is_partitioned(self.ontology_file):
+                self.partition_dir, self.manifest = load_manifest(self.ontology_file)
+                for prefix, uri in self.manifest['namespaces'].items():
+                    self.g.bind(prefix, uri, override=False)
+                self.load_partitions([partition for partition in self.manifest['partitions']
+                                      if partition['kind'] == 'schema'])
+                print(f"🧩 Partitioned graph: {len(self.manifest['partitions'])} partitions, "
+                      f"loaded on demand")
+            else:
+                load_graph(self.g, self.ontology_file)
             load_time = time.time() - start_time
 
             print(f"✅ Loaded successfully in {load_time:.2f} seconds")
@@ -38,93 +165,225 @@ class OntologyQueryEngine:
             print(f"❌ Error loading ontology: {e}")
             raise
 
-    def execute_query(self, query, description=None):
-        """Выполняет SPARQL запрос"""
+        # Отметки графа: шаблоны с предикатами, которых в графе нет, переписываются по оставшимся фактам
+        markers = profile_markers(self.g, self.WOT)
+        self.consolidated = CONSOLIDATED in markers
+        self.rewriters = []
+        if self.consolidated:
+            self.rewriters.append(BattleFactRewriter(self.WOT))
+            print("🔗 Consolidated battles: won/spawn/platoon are read from player performances")
+        if 'lean' in markers:
+            self.rewriters.append(PredicateRewriter(lean_rewrites(self.WOT)))
+            print("🪶 Lean graph: equipsWith, hasPerformance and tank characteristics are resolved at query time")
+
+        # Агрегаты боев рядом с графом: дашбордные запросы считаются по ним, без обхода боев
+        self.aggregates = None
+        aggregates_file = store_path(self.ontology_file)
+        if aggregates and aggregates_file.exists():
+            self.aggregates = AggregateStore.load(aggregates_file)
+            print(f"📊 Aggregate store: {self.aggregates.size:,} groups over "
+                  f"{self.aggregates.battles:,} battles ({aggregates_file.name})")
+
+        # Выборка боев, построенная импортером (с другой долей строится заново при первом approx запросе)
+        sample_file = sample_path(self.ontology_file)
+        if sample_file.exists():
+            sample = BattleSample.load(sample_file)
+            if sample.fraction == self.sample_fraction:
+                self.sample = sample
+                print(f"🎲 Stratified sample: {sample.size:,} of {sample.population:,} performances, "
+                      f"{len(sample.strata)} strata ({sample_file.name})")
+
+        # Статистика кардинальностей для оптимизатора запросов
+        self.optimize = optimize
+        self.optimizer = None
+        self.refresh_statistics()
+
+        # Индекс имен танков; партиционированный граф без агрегатов строит его при первом обращении,
+        # чтобы не догружать каталог при старте
+        if self.manifest is None or self.aggregates is not None:
+            self.tank_name_resolver()
+
+    def refresh_statistics(self):
+        """Собирает статистику кардинальностей графа для оптимизатора"""
+        if not self.optimize:
+            return
+        start_time = time.time()
+        if self.index_store is not None:
+            statistics = self.index_store.statistics()
+        else:
+            statistics = GraphStatistics.from_graph(self.g)
+        self.optimizer = QueryOptimizer(statistics)
+        print(f"📈 Cardinality statistics: {len(statistics.predicates)} predicates "
+              f"in {time.time() - start_time:.2f} seconds")
+
+    def load_partitions(self, partitions):
+        """Загружает в граф партиции, которых в нем еще нет"""
+        missing = [partition for partition in partitions if partition['name'] not in self.loaded_partitions]
+        if not missing:
+            return False
+
+        start_time = time.time()
+        for partition in missing:
+            load_partition(self.g, self.partition_dir / partition['file'])
+            self.loaded_partitions.add(partition['name'])
+        names = ', '.join(partition['name'] for partition in missing)
+        if len(names) > 60:
+            names = names[:57] + '...'
+        print(f"🧩 Loaded {len(missing)} partition(s) [{names}] in {time.time() - start_time:.2f} seconds "
+              f"({len(self.g):,} triples in graph)")
+        return True
+
+    def ensure_partitions(self, algebra):
+        """Догружает партиции с предикатами и классами запроса"""
+        if self.manifest is None:
+            return
+        if self.load_partitions(select_partitions(self.manifest, algebra)):
+            self.refresh_statistics()
+
+    def execute_query(self, query, description=None, profile=None):
+        """Выполняет SPARQL запрос (profile='text'/'json' - с профилем узлов алгебры)"""
         if description:
             print(f"\n{'=' * 60}")
             print(f"🔍 {description}")
             print(f"{'=' * 60}")
 
+        profile = profile or self.profile
+        if profile:
+            return self.profile_query(query, description, profile)
+
         try:
             start_time = time.time()
-            results = self.g.query(query)
+            prepared = self.prepare_query(query)
+            # Результаты вычисляются лениво, поэтому собираем их при активном оптимизаторе
+            with self.optimization():
+                result_list = list(self.g.query(prepared))
             query_time = time.time() - start_time
 
-            result_list = list(results)
             print(f"\n⏱️  Query executed in {query_time:.3f} seconds")
             print(f"📋 Results: {len(result_list)} rows\n")
 
             return result_list
 
         except Exception as e:
+            if self.raise_errors:
+                raise
+            print(f"❌ Query error: {e}")
+            return []
+
+    def prepare_query(self, query):
+        """Разбирает запрос в алгебру rdflib с префиксами графа, догружает партиции и оптимизирует ее"""
+        prepared = prepareQuery(query, initNs=dict(self.g.namespaces()))
+        for rewriter in self.rewriters:
+            rewriter.optimize(prepared)
+        self.ensure_partitions(prepared.algebra)
+        if self.optimizer:
+            self.optimizer.optimize(prepared)
+        return prepared
+
+    def optimization(self):
+        """Контекст выполнения запроса с порядком BGP по статистике"""
+        return self.optimizer.active(self.g) if self.optimizer else contextlib.nullcontext()
+
+    def explain(self, query, output='text'):
+        """Печатает план (алгебру rdflib) запроса без выполнения"""
+        try:
+            prepared = self.prepare_query(query)
+        except Exception as e:
+            if self.raise_errors:
+                raise
+            print(f"❌ Query error: {e}")
+            return None
+
+        return self.print_plan(prepared, output)
+
+    def print_plan(self, prepared, output='text'):
+        """Печатает план подготовленного запроса"""
+        plan = build_plan(prepared.algebra, namespace_manager=self.g.namespace_manager)
+        print("\n🧭 Query plan:")
+        if output == 'json':
+            print(json.dumps(plan, indent=2, ensure_ascii=False))
+        else:
+            print(format_plan(plan))
+        return plan
+
+    def profile_query(self, query, description=None, output='text'):
+        """Выполняет запрос, замеряя строки и время каждого узла алгебры"""
+        try:
+            prepared = self.prepare_query(query)
+            # Результаты вычисляются лениво, поэтому собираем их внутри профилировщика
+            with self.optimization(), QueryProfiler() as profiler:
+                start_time = time.perf_counter()
+                result_list = list(self.g.query(prepared))
+                query_time = time.perf_counter() - start_time
+        except Exception as e:
+            if self.raise_errors:
+                raise
             print(f"❌ Query error: {e}")
             return []
 
+        plan = profiler.build_plan(prepared.algebra, self.g.namespace_manager)
+        report = profile_report(plan, query_time, len(result_list), query=description or query.strip())
+        self.profiles.append(report)
+
+        print(f"\n⏱️  Query executed in {query_time:.3f} seconds (profiled)")
+        print(f"📋 Results: {len(result_list)} rows\n")
+        if output == 'json':
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+        else:
+            print("🧭 Query profile:")
+            print(format_plan(plan, total_time=query_time))
+            if report['dominant']:
+                print(f"\n🔥 Dominant node: {report['dominant']['label'][:80]} "
+                      f"({report['dominant']['share'] * 100:.1f}% of query time)")
+        print()
+        return result_list
+
+    def save_profiles(self, path):
+        """Сохраняет собранные профили запросов в JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.profiles, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Query profiles saved: {path}")
+
     def print_results(self, results, limit=None):
         """Печатает результаты запроса"""
-        if not results:
+        table = ResultTable.from_result(results)
+        if not len(table):
             print("No results found.")
             return
 
-        # Определяем ширину колонок
-        if results:
-            headers = list(results[0].labels)
-            col_widths = {h: len(str(h)) for h in headers}
-
-            # Вычисляем максимальную ширину для каждой колонки
-            for row in results[:100]:  # Проверяем первые 100 строк
-                for header in headers:
-                    value = row[header]
-                    if value:
-                        value_str = self.format_value(value)
-                        col_widths[header] = max(col_widths[header], len(value_str))
-
-            # Ограничиваем ширину колонок
-            for header in headers:
-                col_widths[header] = min(col_widths[header], 50)
+        # Значения колонок форматируются один раз; ширина - по первым 100 строкам, не больше 50
+        display_limit = limit or len(table)
+        cells = {header: table.formatted(header, limit=max(display_limit, 100)) for header in table.columns}
+        col_widths = {header: min(max([len(header)] + [len(value) for value in cells[header][:100]]), 50)
+                      for header in table.columns}
 
         # Печатаем заголовки
-        header_line = " | ".join([h.ljust(col_widths[h]) for h in headers])
+        header_line = " | ".join([h.ljust(col_widths[h]) for h in table.columns])
         print(header_line)
         print("-" * len(header_line))
 
         # Печатаем строки
-        display_results = results[:limit] if limit else results
-        for row in display_results:
-            row_values = []
-            for header in headers:
-                value = row[header]
-                value_str = self.format_value(value) if value else ""
-                row_values.append(value_str.ljust(col_widths[header]))
-            print(" | ".join(row_values))
-
-        if limit and len(results) > limit:
-            print(f"\n... and {len(results) - limit} more rows")
+        for row in zip(*(cells[header][:display_limit] for header in table.columns)):
+            print(" | ".join(value.ljust(col_widths[header]) for header, value in zip(table.columns, row)))
+
+        if limit and len(table) > limit:
+            print(f"\n... and {len(table) - limit} more rows")
 
     def format_value(self, value):
         """Форматирует значение для вывода"""
-        value_str = str(value)
-
-        # Убираем namespace из URI
-        if "http://www.semanticweb.org/ontology/wot#" in value_str:
-            value_str = value_str.split("#")[-1]
+        kind, value = term_value(value)
+        return format_cell(value, kind)
 
-        # Форматируем числа
-        if value_str.replace('.', '').replace('-', '').isdigit():
-            try:
-                num = float(value_str)
-                if num.is_integer():
-                    return str(int(num))
-                else:
-                    return f"{num:.2f}"
-            except:
-                pass
-
-        # Ограничиваем длину строки
-        if len(value_str) > 50:
-            return value_str[:47] + "..."
-
-        return value_str
+    def export_results(self, results, path):
+        """Выгружает результат запроса в CSV или Parquet (по расширению файла)"""
+        table = ResultTable.from_result(results)
+        try:
+            table.export(path)
+        except (RuntimeError, ValueError) as e:
+            print(f"\n❌ Export failed: {e}")
+            return None
+        print(f"\n💾 {len(table)} rows exported: {path}")
+        return table
 
     def get_statistics(self):
         """Получает статистику по онтологии"""
@@ -163,8 +422,12 @@ class OntologyQueryEngine:
 
     # ==================== ПРЕДОПРЕДЕЛЕННЫЕ ЗАПРОСЫ ====================
 
-    def query_top_tanks_by_winrate(self, min_battles=50, limit=10):
-        """Топ танков по проценту побед"""
+    def query_top_tanks_by_winrate(self, min_battles=50, limit=10, approx=False):
+        """Топ танков по проценту побед (approx=True - оценка по выборке с доверительными интервалами)"""
+        if approx:
+            return self.approximate_top_tanks_by_winrate(min_battles, limit)
+        if self.aggregates is not None:
+            return self.aggregated_top_tanks_by_winrate(min_battles, limit)
         query = f"""
         PREFIX wot: <http://www.semanticweb.org/ontology/wot#>
         
@@ -185,6 +448,7 @@ class OntologyQueryEngine:
 
         results = self.execute_query(query, f"Top {limit} Tanks by Win Rate (min {min_battles} battles)")
         self.print_results(results)
+        return results
 
     def query_average_damage_by_class(self):
         """Средний урон по классам танков"""
@@ -208,6 +472,7 @@ class OntologyQueryEngine:
 
         results = self.execute_query(query, "Average Damage by Tank Class")
         self.print_results(results)
+        return results
 
     def query_best_players(self, limit=10):
         """Лучшие игроки по среднему урону"""
@@ -231,6 +496,7 @@ class OntologyQueryEngine:
 
         results = self.execute_query(query, f"Top {limit} Players by Average Damage")
         self.print_results(results)
+        return results
 
     def query_tanks_by_nation(self, nation):
         """Танки определенной нации"""
@@ -252,6 +518,7 @@ class OntologyQueryEngine:
 
         results = self.execute_query(query, f"Tanks of Nation: {nation}")
         self.print_results(results, limit=30)
+        return results
 
     def query_spotting_masters(self, limit=10):
         """Танки лучшие для засвета"""
@@ -276,6 +543,7 @@ class OntologyQueryEngine:
 
         results = self.execute_query(query, f"Top {limit} Tanks for Spotting")
         self.print_results(results)
+        return results
 
     def query_guns_with_highest_dpm(self, limit=10):
         """Орудия с максимальным DPM"""
@@ -296,6 +564,7 @@ class OntologyQueryEngine:
 
         results = self.execute_query(query, f"Top {limit} Guns by DPM")
         self.print_results(results)
+        return results
 
     def query_engines_by_power(self, limit=10):
         """Двигатели по мощности"""
@@ -314,9 +583,14 @@ class OntologyQueryEngine:
 
         results = self.execute_query(query, f"Top {limit} Engines by Power")
         self.print_results(results)
+        return results
 
-    def query_nation_statistics(self):
-        """Статистика по нациям"""
+    def query_nation_statistics(self, approx=False):
+        """Статистика по нациям (approx=True - оценка по выборке с доверительными интервалами)"""
+        if approx:
+            return self.approximate_nation_statistics()
+        if self.aggregates is not None:
+            return self.aggregated_nation_statistics()
         query = """
         PREFIX wot: <http://www.semanticweb.org/ontology/wot#>
         
@@ -338,6 +612,7 @@ class OntologyQueryEngine:
 
         results = self.execute_query(query, "Statistics by Nation")
         self.print_results(results)
+        return results
 
     def query_best_tanks_by_composite(self, limit=10, tier=None, exclude_premium=False, exclude_gift=False):
         """Лучшие танки по совокупному скору (без нормировки, взвешенная сумма метрик)"""
@@ -562,6 +837,8 @@ class OntologyQueryEngine:
 
     def query_tank_with_highest_avg_damage(self, min_battles=50, top_n=1):
         """Танк(и) с наибольшим средним уроном, рассчитанным по данным боёв"""
+        if self.aggregates is not None:
+            return self.aggregated_tank_with_highest_avg_damage(min_battles, top_n)
 
         query = f""" 
         PREFIX rdf:  <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
@@ -590,11 +867,16 @@ class OntologyQueryEngine:
         self.print_results(results, limit=top_n)
         return results
 
-    def query_worst_maps_for_tank(self, tank_name, min_battles=10, limit=2):
+    def query_worst_maps_for_tank(self, tank_name, min_battles=10, limit=2, approx=False):
         """Топ худших карт для конкретного танка по win rate (при равенстве — по числу боёв, затем по урону)"""
+        if approx:
+            return self.approximate_worst_maps_for_tank(tank_name, min_battles, limit)
+        if self.aggregates is not None:
+            return self.aggregated_worst_maps_for_tank(tank_name, min_battles, limit)
 
-        safe_name = str(tank_name).replace('"', '\\"')
-        safe_name_lc = safe_name.lower()
+        description = f"Worst {limit} Maps for Tank '{tank_name}' (min {min_battles} battles per map)"
+        tanks = self.resolve_tanks(tank_name)
+        tank_values = ' '.join(f"<{tank}>" for tank in sorted(tanks))
 
         query = f"""
         PREFIX wot:  <http://www.semanticweb.org/ontology/wot#>
@@ -611,10 +893,8 @@ class OntologyQueryEngine:
                    ((SUM(IF(?won = true, 1, 0)) * 100.0 / COUNT(?battle)) AS ?winRate)
                    (AVG(COALESCE(xsd:decimal(?damage), xsd:decimal("0"))) AS ?avgDamage)
             WHERE {{
-              # Находим нужный танк по имени/короткому имени (регистронезависимо)
-              ?tank wot:tankName ?tName .
-              OPTIONAL {{ ?tank wot:shortName ?sName . }}
-              FILTER(LCASE(STR(?tName)) = "{safe_name_lc}" || LCASE(STR(?sName)) = "{safe_name_lc}")
+              # Танки, найденные по имени/короткому имени индексом имен
+              VALUES ?tank {{ {tank_values} }}
 
               # Performance этого танка и связанные бои
               ?perf   wot:withTank ?tank .
@@ -633,16 +913,17 @@ class OntologyQueryEngine:
         ORDER BY ASC(?winRate) DESC(?battles) DESC(?avgDamage)
         LIMIT {int(limit)}
         """
-        results = self.execute_query(
-            query,
-            f"Worst {limit} Maps for Tank '{tank_name}' (min {min_battles} battles per map)"
-        )
+        results = self.execute_query(query, description)
         self.print_results(results, limit=limit)
         return results
 
     def query_maps_with_side_imbalance(self, threshold_pct=10.0, min_battles_per_side=20, limit=50):
         """Карты с перекосом по сторонам: одна сторона выигрывает на threshold_pct п.п. чаще другой.
            Счёт ведётся по боям (won/spawn — свойства Battle), onMap — строковое свойство."""
+        if self.consolidated:
+            return self.query_match_side_imbalance(threshold_pct, min_battles_per_side, limit)
+        if self.aggregates is not None:
+            return self.aggregated_maps_with_side_imbalance(threshold_pct, min_battles_per_side, limit)
         query = f"""
         PREFIX wot:  <http://www.semanticweb.org/ontology/wot#>
         PREFIX xsd:  <http://www.w3.org/2001/XMLSchema#>
@@ -671,10 +952,11 @@ class OntologyQueryEngine:
             HAVING (COUNT(?battle) >= {int(min_battles_per_side)})
           }}
 
-          # Агрегаты по карте и стороне (вторая выборка — B), связываем по той же карте
+          # Агрегаты по карте и стороне (вторая выборка — B); карта связывается явным FILTER:
+          # rdflib не видит общих переменных у двух подзапросов с GROUP BY и перемножает карты
           {{
             SELECT
-              ?mapKey
+              (?mapKeyRaw AS ?mapKeyB)
               ?sideB
               (COUNT(?battle) AS ?battlesB)
               ((SUM(IF(?won, 1, 0)) * 100.0 / COUNT(?battle)) AS ?winRateB)
@@ -682,13 +964,14 @@ class OntologyQueryEngine:
               ?battle wot:onMap ?mapRaw ;
                       wot:spawn ?sideB ;
                       wot:won   ?won .
-              BIND(LCASE(STR(?mapRaw)) AS ?mapKey)
+              BIND(LCASE(STR(?mapRaw)) AS ?mapKeyRaw)
             }}
-            GROUP BY ?mapKey ?sideB
+            GROUP BY ?mapKeyRaw ?sideB
             HAVING (COUNT(?battle) >= {int(min_battles_per_side)})
           }}
 
           # Сравниваем разные стороны одной карты; < — чтобы не дублировать пары
+          FILTER(?mapKey = ?mapKeyB)
           FILTER(?sideA != ?sideB)
           FILTER(?sideA <  ?sideB)
 
@@ -715,38 +998,518 @@ class OntologyQueryEngine:
         self.print_results(results, limit=limit)
         return results
 
-    def interactive_mode(self):
+    def query_match_side_imbalance(self, threshold_pct=10.0, min_battles_per_side=20, limit=50):
+        """Перекос сторон по матчам консолидированного графа: каждый Battle - один матч,
+           в котором играют обе стороны, победитель - winnerSpawn"""
+        query = f"""
+        PREFIX wot:  <http://www.semanticweb.org/ontology/wot#>
+
+        SELECT
+          ?mapName
+          ?sideAdv ?winRateAdv (?battles AS ?battlesAdv)
+          ?sideOther ?winRateOther (?battles AS ?battlesOther)
+          (?winRateAdv - ?winRateOther AS ?winRateDiff)
+        WHERE {{
+          {{
+            SELECT
+              ?mapKey
+              (SAMPLE(?mapRaw) AS ?mapName)
+              (COUNT(?battle) AS ?battles)
+              ((SUM(IF(?winner = 1, 1, 0)) * 100.0 / COUNT(?battle)) AS ?winRate1)
+              ((SUM(IF(?winner = 2, 1, 0)) * 100.0 / COUNT(?battle)) AS ?winRate2)
+            WHERE {{
+              ?battle wot:onMap ?mapRaw ;
+                      wot:winnerSpawn ?winner .
+              BIND(LCASE(STR(?mapRaw)) AS ?mapKey)
+            }}
+            GROUP BY ?mapKey
+            HAVING (COUNT(?battle) >= {int(min_battles_per_side)})
+          }}
+
+          BIND(IF(?winRate1 >= ?winRate2, 1, 2) AS ?sideAdv)
+          BIND(IF(?winRate1 >= ?winRate2, ?winRate1, ?winRate2) AS ?winRateAdv)
+          BIND(IF(?winRate1 >= ?winRate2, 2, 1) AS ?sideOther)
+          BIND(IF(?winRate1 >= ?winRate2, ?winRate2, ?winRate1) AS ?winRateOther)
+
+          FILTER((?winRateAdv - ?winRateOther) >= {float(threshold_pct)})
+        }}
+        ORDER BY DESC(?winRateDiff) DESC(?battlesAdv) ?mapName
+        LIMIT {int(limit)}
+        """
+        results = self.execute_query(
+            query,
+            f"Maps with Side Imbalance by matches (ΔWR ≥ {threshold_pct} pp; ≥ {min_battles_per_side} matches)"
+        )
+        self.print_results(results, limit=limit)
+        return results
+
+    def query_win_rates(self, group_by='tank', since=None, until=None, min_battles=1, limit=20, workers=None):
+        """Процент побед и средний урон за период [since, until) по танкам, картам, нациям, уровням или классам
+
+        На партиционированном графе шарды боев вне окна отсекаются по индексу
+        времени, остальные агрегируются параллельно в процессах и сливаются
+        """
+        if group_by not in WIN_RATE_GROUPS:
+            raise ValueError(f"group_by must be one of: {', '.join(WIN_RATE_GROUPS)}")
+        window = f"{since or '...'} - {until or '...'}" if since or until else 'all time'
+        description = f"Win Rates by {group_by} ({window}; min {min_battles} battles)"
+        print(f"\n{'=' * 60}")
+        print(f"🔍 {description}")
+        print(f"{'=' * 60}")
+
+        start_time = time.time()
+        if self.manifest is not None:
+            shards = select_shards(self.manifest, since, until)
+            battle_shards = sum(1 for partition in self.manifest['partitions'] if partition['kind'] == 'battles')
+            tasks = [(partition['name'], str(self.partition_dir / partition['file']),
+                      None if covered else since, None if covered else until)
+                     for partition, covered in shards]
+            # Частичные агрегаты шардов кешируются: шард с тем же окном не пересчитывается
+            missing = [task for task in tasks if (task[0], task[2], task[3]) not in self.shard_partials]
+            shard_results, used_workers = scatter_gather(missing, workers) if missing else ([], 0)
+            for result, task in zip(shard_results, missing):
+                self.shard_partials[(task[0], task[2], task[3])] = result['partial']
+            merged = merge_partials(self.shard_partials[(task[0], task[2], task[3])] for task in tasks)
+            print(f"\n🧩 Shards: {len(shards)} of {battle_shards} in window ({len(tasks) - len(missing)} cached), "
+                  f"{used_workers} worker(s), {sum(result['triples'] for result in shard_results):,} triples scanned")
+        else:
+            merged = aggregate_graph(self.g, since, until)
+
+        if group_by == 'map':
+            groups = rollup(merged, lambda tank, map_name: map_name)
+        else:
+            tanks = self.tank_attributes()
+            groups = rollup(merged, lambda tank, map_name: tanks.get(tank, {}).get(group_by))
+        query_time = time.time() - start_time
+
+        records = [{
+            WIN_RATE_GROUPS[group_by]: group,
+            'battles': battles,
+            'winRate': wins * 100.0 / battles,
+            'avgDamage': damage_sum / damage_count if damage_count else None,
+        } for group, (battles, wins, damage_count, damage_sum) in groups.items() if battles >= min_battles]
+        records.sort(key=lambda record: -record['winRate'])
+        columns = [WIN_RATE_GROUPS[group_by], 'battles', 'winRate', 'avgDamage']
+        results = make_result_rows(columns, records[:limit] if limit else records)
+
+        print(f"\n⏱️  Query executed in {query_time:.3f} seconds")
+        print(f"📋 Results: {len(results)} rows\n")
+        self.print_results(results, limit=limit)
+        return results
+
+    def tank_attributes(self):
+        """Имя, нация, уровень и класс каждого танка (по URI)"""
+        query = """
+        PREFIX wot: <http://www.semanticweb.org/ontology/wot#>
+        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+
+        SELECT ?tank ?tankName ?shortName ?nationName ?tier ?type
+        WHERE {
+          ?tank wot:tankName ?tankName .
+          OPTIONAL { ?tank wot:shortName ?shortName }
+          OPTIONAL { ?tank wot:belongsToNation ?nation . ?nation wot:nationName ?nationName }
+          OPTIONAL { ?tank wot:tier ?tier }
+          OPTIONAL {
+            ?tank rdf:type ?type .
+            FILTER(?type IN (wot:HeavyTank, wot:MediumTank, wot:LightTank,
+                             wot:TankDestroyer, wot:SelfPropelledGun))
+          }
+        }
+        """
+        if self.tanks is not None:
+            return self.tanks
+        tanks = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = self.execute_query(query)
+        for row in results:
+            tanks[str(row.tank)] = {
+                'tank': str(row.tankName),
+                'short': str(row.shortName) if row.shortName is not None else None,
+                'nation': str(row.nationName) if row.nationName is not None else None,
+                'tier': int(row.tier.toPython()) if row.tier is not None else None,
+                'class': row.type.split('#')[-1] if row.type is not None else None,
+            }
+        self.tanks = tanks
+        return tanks
+
+    def tank_name_resolver(self):
+        """Триграммный индекс имен танков (по хранилищу агрегатов или каталогу танков графа)"""
+        if self.tank_resolver is None:
+            if self.aggregates is not None:
+                names = [(tank, name) for tank, names in self.aggregates.names['tank'].items()
+                         for name in names]
+            else:
+                names = [(tank, attributes[key]) for tank, attributes in self.tank_attributes().items()
+                         for key in ('tank', 'short')]
+            self.tank_resolver = TankNameResolver(names)
+            print(f"🔤 Tank name index: {len(self.tank_resolver):,} names, "
+                  f"{len(self.tank_resolver.postings):,} trigrams in {self.tank_resolver.build_time * 1000:.1f} ms")
+        return self.tank_resolver
+
+    def resolve_tanks(self, tank_name, resolver=None):
+        """URI танков по имени или короткому имени с опечатками и в другой транслитерации
+
+        resolver - индекс имен (по умолчанию танков с боями или каталога). Неоднозначное или
+        слишком непохожее имя не подменяется: QueryParameterError с кандидатами
+        """
+        if resolver is None:
+            resolver = self.tank_name_resolver()
+        tanks, spelling, score = resolver.resolve(tank_name)
+        if spelling is None:
+            candidates = resolver.candidates(tank_name, limit=3)
+            if not candidates:
+                raise QueryParameterError(f"no tank named '{tank_name}'")
+            suggestions = ', '.join(f"'{name}' ({candidate_score:.2f})" for name, _, candidate_score in candidates)
+            raise QueryParameterError(f"tank name '{tank_name}' is ambiguous or not close enough; "
+                                      f"candidates: {suggestions}")
+        if score < 1.0:
+            print(f"🔤 '{tank_name}' → '{spelling}' (similarity {score:.2f})")
+        return tanks
+
+    def resolve_tank_name(self, name, limit=5):
+        """Печатает кандидатов для имени танка (команда resolve интерактивного режима)"""
+        start_time = time.perf_counter()
+        candidates = self.tank_name_resolver().candidates(name, limit=limit)
+        elapsed = time.perf_counter() - start_time
+        print(f"\n🔤 Candidates for '{name}' ({elapsed * 1e6:.0f} µs):")
+        for spelling, tanks, score in candidates:
+            print(f"   {score:5.2f}  {spelling:<30} {', '.join(sorted(tank.split('#')[-1] for tank in tanks))}")
+        if not candidates:
+            print("   (none)")
+        return candidates
+
+    def tank_feature_index(self):
+        """Матрица признаков танков для поиска похожих (строится при первом обращении)"""
+        if self.features is None:
+            if self.manifest is not None and self.load_partitions(
+                    [partition for partition in self.manifest['partitions'] if partition['kind'] == 'catalog']):
+                self.refresh_statistics()
+            self.features = TankFeatureIndex().build(self.g, self.WOT)
+            print(f"🧭 Tank feature index: {len(self.features):,} tanks × {self.features.matrix.shape[1]} features "
+                  f"in {self.features.build_time:.2f} seconds")
+        return self.features
+
+    def similar_tanks(self, tank, k=10, filters=None):
+        """k танков, ближайших к tank (URI или имя) по характеристикам; filters - см. tank_similarity.FILTERS"""
+        index = self.tank_feature_index()
+        if str(tank) not in index.tank_index:
+            # Из танков индекса с этим именем берется первый
+            tank = min(self.resolve_tanks(tank, index.resolver))
+        return [{'tank': uri, **index.attributes(uri), 'distance': distance}
+                for uri, distance in index.similar(tank, k, filters)]
+
+    def battle_time_index(self):
+        """Индекс времени боев (строится при первом оконном запросе)"""
+        if self.time_index is None:
+            if self.manifest is not None and self.load_partitions(self.manifest['partitions']):
+                self.refresh_statistics()
+            self.time_index = BattleTimeIndex().build(self.g, self.WOT)
+            print(f"🕒 Battle time index: {len(self.time_index):,} performances "
+                  f"in {self.time_index.build_time:.2f} seconds")
+        return self.time_index
+
+    def query_tank_trend(self, tank_name=None, bucket='week', since=None, until=None, min_battles=1, limit=50):
+        """Win rate и средний урон танка по корзинам времени (tank_name=None - все танки)"""
+        if self.aggregates is not None and bucket == 'week' and week_aligned(since) and week_aligned(until):
+            return self.aggregated_tank_trend(tank_name, since, until, min_battles, limit)
+        index = self.battle_time_index()
+        start_time = time.time()
+        tanks = self.tank_attributes()
+        selected = None if tank_name is None else sorted(self.resolve_tanks(tank_name))
+        trend = index.trend(selected, bucket=bucket, since=since, until=until)
+
+        # Танки с одинаковым именем складываются в одну строку корзины
+        groups = {}
+        for i, tank in enumerate(trend['tank']):
+            key = (tanks.get(tank, {}).get('tank', tank), trend['bucket'][i].astype(object))
+            total = groups.setdefault(key, [0, 0.0, 0.0, 0.0])
+            total[0] += int(trend['battles'][i])
+            total[1] += trend['wins'][i]
+            total[2] += trend['damage_count'][i]
+            total[3] += trend['damage_sum'][i]
+        records = [{
+            'tankName': name,
+            'bucketStart': bucket_start,
+            'battles': battles,
+            'winRate': wins * 100.0 / battles,
+            'avgDamage': damage_sum / damage_count if damage_count else None,
+        } for (name, bucket_start), (battles, wins, damage_count, damage_sum) in sorted(groups.items())
+            if battles >= min_battles]
+        results = make_result_rows(['tankName', 'bucketStart', 'battles', 'winRate', 'avgDamage'], records)
+
+        window = f"{since or '...'} - {until or '...'}" if since or until else 'all time'
+        print(f"\n{'=' * 60}")
+        print(f"🔍 Trend of {tank_name or 'all tanks'} by {bucket} ({window})")
+        print(f"{'=' * 60}")
+        print(f"\n⏱️  Query executed in {time.time() - start_time:.3f} seconds (time index)")
+        print(f"📋 Results: {len(results)} rows\n")
+        self.print_results(results, limit=limit)
+        return results
+
+    def query_similar_tanks(self, tank_name, k=10, nation=None, other_nation=False, tier=None, max_tier_diff=None,
+                            tank_class=None, same_class=False, exclude_premium=False):
+        """Танки, похожие на tank_name по характеристикам (например, той же роли другой нации)"""
+        filters = {'nation': nation, 'other_nation': other_nation, 'tier': tier, 'max_tier_diff': max_tier_diff,
+                   'tank_class': tank_class, 'same_class': same_class, 'exclude_premium': exclude_premium}
+        self.tank_feature_index()
+        start_time = time.time()
+        records = self.similar_tanks(tank_name, k=k, filters=filters)
+        columns = ['tankName', 'nation', 'tier', 'tankClass', 'distance', 'dpm', 'penetration', 'alpha', 'speed', 'hp']
+        results = make_result_rows(columns, records)
+
+        flags = ', '.join(f"{name}={value}" for name, value in filters.items() if value not in (None, False))
+        print(f"\n{'=' * 60}")
+        print(f"🔍 Tanks Similar to '{tank_name}'{f' [{flags}]' if flags else ''}")
+        print(f"{'=' * 60}")
+        print(f"\n⏱️  Query executed in {time.time() - start_time:.3f} seconds (feature index)")
+        print(f"📋 Results: {len(results)} rows\n")
+        self.print_results(results, limit=k)
+        return results
+
+    # ==================== ПРИБЛИЖЕННЫЕ АГРЕГАТЫ ====================
+
+    def battle_sample(self):
+        """Стратифицированная выборка результатов боев (без файла выборки строится при первом приближенном запросе)"""
+        if self.sample is None:
+            if self.manifest is not None and self.load_partitions(self.manifest['partitions']):
+                self.refresh_statistics()
+            self.sample = BattleSample(fraction=self.sample_fraction).build(self.g, self.WOT)
+            print(f"🎲 Stratified sample: {self.sample.size:,} of {self.sample.population:,} performances, "
+                  f"{len(self.sample.strata)} strata (tanks) in {self.sample.build_time:.2f} seconds")
+        return self.sample
+
+    def print_approximate(self, description, columns, records, start_time, limit=None):
+        """Печатает приближенный результат и возвращает строки"""
+        print(f"\n{'=' * 60}")
+        print(f"🔍 {description} [approximate]")
+        print(f"{'=' * 60}")
+        results = make_result_rows(columns, records[:limit] if limit else records)
+        print(f"\n⏱️  Query executed in {time.time() - start_time:.3f} seconds (stratified sample, "
+              f"{self.sample_fraction:.0%} per tank)")
+        print(f"📋 Results: {len(results)} rows; Low/High - 95% confidence interval, "
+              f"smallSample - fewer than {MIN_GROUP_SAMPLE} sampled rows\n")
+        self.print_results(results, limit=limit)
+        return results
+
+    def approximate_records(self, estimates, group_column, battles_column='battles'):
+        """Записи результата из оценок (бои, win rate, урон) по группам"""
+        records = []
+        for group, (battles, win_rate, damage) in estimates.items():
+            if win_rate is None:
+                continue
+            records.append({
+                group_column: group,
+                battles_column: int(round(battles)),
+                **estimate_columns('winRate', win_rate),
+                **estimate_columns('avgDamage', damage),
+                'sampleSize': win_rate.sample_size,
+                'smallSample': win_rate.sample_size < MIN_GROUP_SAMPLE,
+            })
+        return records
+
+    def approximate_top_tanks_by_winrate(self, min_battles=50, limit=10):
+        """Топ танков по проценту побед по стратифицированной выборке"""
+        sample = self.battle_sample()
+        start_time = time.time()
+        groups = {}
+        for tank, attributes in self.tank_attributes().items():
+            groups.setdefault(attributes['tank'], []).append(tank)
+        records = [record for record in self.approximate_records(sample.group_estimates(groups), 'tankName',
+                                                                 'totalBattles')
+                   if record['totalBattles'] > min_battles]
+        records.sort(key=lambda record: -record['winRate'])
+        columns = ['tankName', 'totalBattles', 'winRate', 'winRateLow', 'winRateHigh', 'sampleSize', 'smallSample']
+        return self.print_approximate(f"Top {limit} Tanks by Win Rate (min {min_battles} battles)",
+                                      columns, records, start_time, limit=limit)
+
+    def approximate_nation_statistics(self):
+        """Статистика по нациям по стратифицированной выборке"""
+        sample = self.battle_sample()
+        start_time = time.time()
+        groups = {}
+        for tank, attributes in self.tank_attributes().items():
+            if attributes['nation'] is not None:
+                groups.setdefault(attributes['nation'], []).append(tank)
+        # Точный запрос считает только результаты с уроном: выборка оценивает тот же домен
+        records = self.approximate_records(sample.group_estimates(groups, require_damage=True), 'nationName')
+        records.sort(key=lambda record: -record['winRate'])
+        columns = ['nationName', 'battles', 'winRate', 'winRateLow', 'winRateHigh',
+                   'avgDamage', 'avgDamageLow', 'avgDamageHigh', 'sampleSize', 'smallSample']
+        return self.print_approximate("Statistics by Nation", columns, records, start_time)
+
+    def approximate_worst_maps_for_tank(self, tank_name, min_battles=10, limit=2):
+        """Худшие карты танка по стратифицированной выборке"""
+        sample = self.battle_sample()
+        start_time = time.time()
+        tanks = sorted(self.resolve_tanks(tank_name))
+        estimates = {sample.map_names.get(map_key, map_key): values
+                     for map_key, values in sample.map_estimates(tanks).items()}
+        records = [record for record in self.approximate_records(estimates, 'mapName')
+                   if record['battles'] >= min_battles]
+        records.sort(key=lambda record: (record['winRate'], -record['battles'], -(record['avgDamage'] or 0)))
+        columns = ['mapName', 'battles', 'winRate', 'winRateLow', 'winRateHigh',
+                   'avgDamage', 'avgDamageLow', 'avgDamageHigh', 'sampleSize', 'smallSample']
+        return self.print_approximate(f"Worst {limit} Maps for Tank '{tank_name}' (min {min_battles} battles per map)",
+                                      columns, records, start_time, limit=limit)
+
+    # ==================== ХРАНИЛИЩЕ АГРЕГАТОВ ====================
+
+    def print_aggregated(self, description, columns, records, start_time, limit=None, display_limit=None):
+        """Печатает результат, посчитанный по хранилищу агрегатов, и возвращает строки"""
+        print(f"\n{'=' * 60}")
+        print(f"🔍 {description}")
+        print(f"{'=' * 60}")
+        results = make_result_rows(columns, records[:limit] if limit else records)
+        print(f"\n⏱️  Query executed in {time.time() - start_time:.3f} seconds (aggregate store)")
+        print(f"📋 Results: {len(results)} rows\n")
+        self.print_results(results, limit=display_limit or limit)
+        return results
+
+    def aggregated_top_tanks_by_winrate(self, min_battles=50, limit=10):
+        """Топ танков по проценту побед по хранилищу агрегатов"""
+        start_time = time.time()
+        names = self.aggregates.names['tank']
+        groups = {}
+        for (tank,), (battles, wins, _, _) in self.aggregates.groups('tank').items():
+            if tank in names:
+                total = groups.setdefault(names[tank][0], [0, 0])
+                total[0] += battles
+                total[1] += wins
+        records = [{'tankName': name_literal(name), 'totalBattles': battles, 'winRate': decimal_ratio(wins * 100, battles)}
+                   for name, (battles, wins) in groups.items() if battles > min_battles]
+        records.sort(key=lambda record: -record['winRate'])
+        return self.print_aggregated(f"Top {limit} Tanks by Win Rate (min {min_battles} battles)",
+                                     ['tankName', 'totalBattles', 'winRate'], records, start_time, limit=limit)
+
+    def aggregated_nation_statistics(self):
+        """Статистика по нациям по хранилищу агрегатов"""
+        start_time = time.time()
+        names = self.aggregates.names['nation']
+        groups = {}
+        for (nation,), values in self.aggregates.groups('nation').items():
+            if nation in names:
+                total = groups.setdefault(names[nation], [0, 0, 0.0])
+                for i in range(3):
+                    total[i] += values[i]
+        # nationName в онтологии - литерал без datatype
+        records = [{'nationName': Literal(name), 'battles': battles, 'winRate': decimal_ratio(wins * 100, battles),
+                    'avgDamage': decimal_ratio(damage_sum, battles)}
+                   for name, (battles, wins, damage_sum) in groups.items()]
+        records.sort(key=lambda record: -record['winRate'])
+        return self.print_aggregated("Statistics by Nation", ['nationName', 'battles', 'winRate', 'avgDamage'],
+                                     records, start_time)
+
+    def aggregated_tank_with_highest_avg_damage(self, min_battles=50, top_n=1):
+        """Танк(и) с наибольшим средним уроном по хранилищу агрегатов"""
+        start_time = time.time()
+        names = self.aggregates.names['tank']
+        records = [{'tank': URIRef(tank), 'tankName': name_literal(names[tank][0]),
+                    'avgDamage': decimal_ratio(damage_sum, battles), 'battles': battles}
+                   for (tank,), (battles, _, damage_sum, _) in self.aggregates.groups('tank').items()
+                   if tank in names and battles >= min_battles]
+        records.sort(key=lambda record: (-record['avgDamage'], -record['battles']))
+        return self.print_aggregated(f"Tank(s) with Highest Average Damage (min {min_battles} battles)",
+                                     ['tank', 'tankName', 'avgDamage', 'battles'], records, start_time, limit=top_n)
+
+    def aggregated_worst_maps_for_tank(self, tank_name, min_battles=10, limit=2):
+        """Худшие карты танка по хранилищу агрегатов"""
+        start_time = time.time()
+        tanks = self.resolve_tanks(tank_name)
+        groups = {}
+        for (tank, map_key), values in self.aggregates.groups('tank_map').items():
+            if tank in tanks:
+                total = groups.setdefault(map_key, [0, 0, 0.0])
+                for i in range(3):
+                    total[i] += values[i]
+        map_names = self.aggregates.names['map']
+        records = [{'mapName': name_literal(map_names.get(map_key, map_key)), 'battles': battles,
+                    'winRate': decimal_ratio(wins * 100, battles), 'avgDamage': decimal_ratio(damage_sum, battles)}
+                   for map_key, (battles, wins, damage_sum) in groups.items() if battles >= min_battles]
+        records.sort(key=lambda record: (record['winRate'], -record['battles'], -record['avgDamage']))
+        return self.print_aggregated(f"Worst {limit} Maps for Tank '{tank_name}' (min {min_battles} battles per map)",
+                                     ['mapName', 'battles', 'winRate', 'avgDamage'], records, start_time,
+                                     limit=limit)
+
+    def aggregated_maps_with_side_imbalance(self, threshold_pct=10.0, min_battles_per_side=20, limit=50):
+        """Карты с перекосом по сторонам по хранилищу агрегатов"""
+        start_time = time.time()
+        sides = {}
+        for (map_key, spawn), (battles, wins, _, _) in self.aggregates.groups('map_side').items():
+            if battles >= min_battles_per_side:
+                sides.setdefault(map_key, []).append((spawn, decimal_ratio(wins * 100, battles), battles))
+
+        map_names = self.aggregates.names['map']
+        records = []
+        for map_key, map_sides in sides.items():
+            map_sides.sort()
+            # Пары разных сторон одной карты, как sideA < sideB в SPARQL варианте
+            for i, side_a in enumerate(map_sides):
+                for side_b in map_sides[i + 1:]:
+                    adv, other = (side_a, side_b) if side_a[1] >= side_b[1] else (side_b, side_a)
+                    if adv[1] - other[1] < float(threshold_pct):
+                        continue
+                    records.append({
+                        'mapName': name_literal(map_names.get(map_key, map_key)),
+                        'sideAdv': adv[0], 'winRateAdv': adv[1], 'battlesAdv': adv[2],
+                        'sideOther': other[0], 'winRateOther': other[1], 'battlesOther': other[2],
+                        'winRateDiff': adv[1] - other[1],
+                    })
+        records.sort(key=lambda record: (-record['winRateDiff'], -record['battlesAdv'],
+                                         -record['battlesOther'], record['mapName']))
+        columns = ['mapName', 'sideAdv', 'winRateAdv', 'battlesAdv',
+                   'sideOther', 'winRateOther', 'battlesOther', 'winRateDiff']
+        return self.print_aggregated(f"Maps with Side Imbalance (ΔWR ≥ {threshold_pct} pp; "
+                                     f"≥ {min_battles_per_side} battles per side)",
+                                     columns, records, start_time, limit=limit)
+
+    def aggregated_tank_trend(self, tank_name=None, since=None, until=None, min_battles=1, limit=50):
+        """Недельный тренд танка по хранилищу агрегатов (границы окна - начала недель)"""
+        start_time = time.time()
+        tanks = None if tank_name is None else self.resolve_tanks(tank_name)
+        since = parse_time(since).date() if since is not None else None
+        until = parse_time(until).date() if until is not None else None
+        names = self.aggregates.names['tank']
+        groups = {}
+        for (tank, week), (battles, wins, damage_sum, _) in self.aggregates.groups('tank_week').items():
+            if tanks is not None and tank not in tanks:
+                continue
+            week = date.fromisoformat(week)
+            if (since is not None and week < since) or (until is not None and week >= until):
+                continue
+            total = groups.setdefault((names.get(tank, [tank])[0], week), [0, 0, 0.0])
+            total[0] += battles
+            total[1] += wins
+            total[2] += damage_sum
+        records = [{
+            'tankName': name,
+            'bucketStart': week,
+            'battles': battles,
+            'winRate': wins * 100.0 / battles,
+            'avgDamage': damage_sum / battles,
+        } for (name, week), (battles, wins, damage_sum) in sorted(groups.items()) if battles >= min_battles]
+        window = f"{since or '...'} - {until or '...'}" if since or until else 'all time'
+        return self.print_aggregated(f"Trend of {tank_name or 'all tanks'} by week ({window})",
+                                     ['tankName', 'bucketStart', 'battles', 'winRate', 'avgDamage'],
+                                     records, start_time, display_limit=limit)
+
+    def run_named_query(self, name, params=None):
+        """Выполняет предопределенный запрос по короткому имени (или имени метода query_*)"""
+        method_name = QUERY_REGISTRY.get(name, name)
+        if not method_name.startswith('query_') or not hasattr(self, method_name):
+            raise UnknownQueryError(f"Unknown query: {name}")
+        method = getattr(self, method_name)
+        params = params or {}
+        if not isinstance(params, dict):
+            raise QueryParameterError(f"parameters of {name} must be a JSON object; usage: {query_usage(name, method)}")
+        try:
+            inspect.signature(method).bind(**params)
+        except TypeError as e:
+            raise QueryParameterError(f"{e}; usage: {query_usage(name, method)}") from None
+        return method(**params)
+
+    def interactive_mode(self, history_file=None):
         """Интерактивный режим для выполнения произвольных запросов"""
-        print("\n" + "=" * 60)
-        print("🎮 INTERACTIVE MODE")
-        print("=" * 60)
-        print("\nEnter SPARQL query (type 'exit' to quit, 'help' for examples):\n")
-
-        while True:
-            try:
-                print("\n" + ">" * 60)
-                lines = []
-                while True:
-                    line = input()
-                    if line.strip().lower() == 'exit':
-                        return
-                    if line.strip().lower() == 'help':
-                        self.show_help()
-                        break
-                    lines.append(line)
-                    if line.strip().endswith('}') or line.strip().endswith(';'):
-                        break
-
-                if lines:
-                    query = '\n'.join(lines)
-                    results = self.execute_query(query)
-                    self.print_results(results, limit=50)
-
-            except KeyboardInterrupt:
-                print("\n\nExiting...")
-                break
-            except Exception as e:
-                print(f"Error: {e}")
+        QuerySession(self, history_file=history_file).run()
 
     def show_help(self):
         """Показывает примеры запросов"""
@@ -778,60 +1541,107 @@ SELECT ?name ?hp WHERE {
             print(f"\n### {title}:")
             print(query)
 
+        print("### Commands:")
+        print("  EXPLAIN <query> | \\explain [query]   plan without running (last query by default)")
+        print("  PROFILE <query>                      run with per-node timings")
+        print("  profile on|json|off                  profile every query")
+        print("  resolve <tank name>                  fuzzy tank name lookup")
+        print("  \\timeout N|off                       cancel queries running longer than N seconds")
+        print("  \\cache [clear]                       session plan/result cache")
+        print("  \\export FILE                         save the last result to .csv or .parquet")
+        print("  Ctrl-C cancels a running query; exit, \\q or Ctrl-D leaves the session")
+
 
 def main():
     parser = argparse.ArgumentParser(description='Query World of Tanks Ontology')
     parser.add_argument('--ontology', type=str,
                         default='ontology/wot_with_data.owl',
-                        help='Path to ontology file')
+                        help='Path to ontology file, partitioned graph directory or triple index directory')
     parser.add_argument('--query', type=str,
                         help='Predefined query to run')
     parser.add_argument('--interactive', action='store_true',
                         help='Start interactive mode')
+    parser.add_argument('--history', type=str, default=None,
+                        help='History file of the interactive mode (default: ~/.wot_query_history)')
     parser.add_argument('--stats', action='store_true',
                         help='Show ontology statistics')
+    parser.add_argument('--profile', nargs='?', const='text', choices=['text', 'json'], default=None,
+                        help='Profile every query: per-node rows and time of the rdflib algebra (text or json)')
+    parser.add_argument('--profile-output', type=str, default=None,
+                        help='Save collected query profiles to a JSON file')
+    parser.add_argument('--no-optimize', action='store_true',
+                        help='Disable cardinality-based BGP ordering and FILTER pushdown')
+    parser.add_argument('--no-aggregates', action='store_true',
+                        help='Ignore <ontology>.aggregates.json and compute dashboard queries from the graph')
+    parser.add_argument('--sample-fraction', type=float, default=0.1,
+                        help='Share of each tank\'s battles in the sample used by approx=True queries (default: 0.1)')
+    parser.add_argument('--params', type=str, default=None,
+                        help='JSON object with parameters for --query, e.g. \'{"tank_name": "B-C 25 t"}\'')
+    parser.add_argument('--export', type=str, default=None,
+                        help='Save the --query result to a .csv or .parquet file (Parquet needs pyarrow)')
+    parser.add_argument('--batch', type=str, default=None,
+                        help='JSON file with named queries and parameters to run in a process pool')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--batch-output', type=str, default='query_batch_report.json',
+                        help='Combined report for --batch (default: query_batch_report.json)')
 
     args = parser.parse_args()
 
     # Определяем путь к онтологии
     ontology_path = Path(__file__).parent.parent / args.ontology
 
-    if not ontology_path.exists():
+    if not ontology_path.exists() and not available_graph_files(ontology_path):
         print(f"❌ Ontology file not found: {ontology_path}")
         print("\nAvailable files:")
         ontology_dir = ontology_path.parent
         if ontology_dir.exists():
-            for f in ontology_dir.glob("*.owl"):
-                print(f"  - {f.name}")
+            for f in sorted(ontology_dir.glob("*.*")):
+                if split_graph_path(f)[1] is not None:
+                    print(f"  - {f.name}")
         return
 
     # Создаем движок запросов
-    engine = OntologyQueryEngine(ontology_path)
+    engine = OntologyQueryEngine(ontology_path, profile=args.profile, optimize=not args.no_optimize,
+                                 sample_fraction=args.sample_fraction, aggregates=not args.no_aggregates)
+
+    run_mode(engine, args)
+    if args.profile_output:
+        engine.save_profiles(args.profile_output)
 
+
+def run_mode(engine, args):
+    """Выполняет выбранный режим: статистика, запрос, интерактив или примеры"""
     # Статистика
     if args.stats:
         engine.get_statistics()
         return
 
+    # Пакетный режим: набор запросов из файла в пуле процессов
+    if args.batch:
+        run_batch(engine, args.batch, workers=args.workers, output_file=args.batch_output)
+        return
+
     # Предопределенные запросы
     if args.query:
-        query_map = {
-            'best-tanks': lambda: engine.query_best_tanks_by_composite(limit=10),
-            'best-nation': lambda: engine.query_best_nation_by_weighted_tanks(limit=10)
-        }
-
-        if args.query in query_map:
-            query_map[args.query]()
-        else:
+        try:
+            results = engine.run_named_query(args.query, json.loads(args.params) if args.params else None)
+        except UnknownQueryError:
             print(f"❌ Unknown query: {args.query}")
             print("\nAvailable queries:")
-            for key in query_map.keys():
+            for key in QUERY_REGISTRY:
                 print(f"  - {key}")
+            return
+        except QueryParameterError as e:
+            print(f"❌ Invalid parameters for {args.query}: {e}")
+            return
+        if args.export:
+            engine.export_results(results, args.export)
         return
 
     # Интерактивный режим
     if args.interactive:
-        engine.interactive_mode()
+        engine.interactive_mode(history_file=args.history)
         return
 
     # По умолчанию - показываем несколько запросов
@@ -842,7 +1652,10 @@ def main():
     engine.query_best_tanks_by_composite(limit=10)
     engine.query_best_nation_by_weighted_tanks(limit=1)
     engine.query_tank_with_highest_avg_damage(min_battles=50, top_n=1)
-    engine.query_worst_maps_for_tank("B-C 25 t", min_battles=1, limit=2)
+    try:
+        engine.query_worst_maps_for_tank("B-C 25 t", min_battles=1, limit=2)
+    except QueryParameterError as e:
+        print(f"\n⚠️  Worst maps skipped: {e}")
     engine.query_maps_with_side_imbalance(threshold_pct=5.0, min_battles_per_side=4, limit=5)
 
     print("\n" + "=" * 60)
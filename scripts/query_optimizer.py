@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Оптимизатор SPARQL запросов для движка World of Tanks
+
+При загрузке графа собирается статистика кардинальностей по предикатам и
+парам (предикат, объект). Перед выполнением FILTER опускаются как можно ниже
+в дереве алгебры, а шаблоны BGP упорядочиваются жадно по оценке числа строк
+с учетом уже связанных переменных (в т.ч. связанных во время выполнения)
+"""
+
+import weakref
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+from rdflib import BNode, Variable
+from rdflib.paths import AlternativePath, InvPath, Path, SequencePath
+from rdflib.plugins.sparql import CUSTOM_EVALS
+from rdflib.plugins.sparql import evaluate
+from rdflib.plugins.sparql.parserutils import CompValue
+
+
+# Узлы алгебры, внутрь которых FILTER не переносится (граница подзапроса/агрегации)
+OPAQUE_NODES = {'Project', 'AggregateJoin', 'Group', 'Slice', 'Distinct', 'Reduced', 'OrderBy'}
+
+# Выражения, зависящие от контекста выполнения: такие FILTER не переносим
+CONTEXT_EXPRESSIONS = {'Builtin_EXISTS', 'Builtin_NOTEXISTS'}
+
+# Активные оптимизаторы по store графа (QueryOptimizer.active): хук CUSTOM_EVALS один на процесс
+ACTIVE_OPTIMIZERS = weakref.WeakKeyDictionary()
+
+
+class GraphStatistics:
+    """Кардинальности графа: число триплетов по предикату и по (предикат, объект)"""
+
+    # Для предикатов с большим числом разных объектов храним только число различных
+    max_tracked_objects = 2000
+
+    def __init__(self):
+        self.total = 0
+        self.predicates = Counter()
+        self.object_counts = {}
+        self.distinct_subjects = {}
+        self.distinct_objects = {}
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Собирает статистику за один проход по графу"""
+        stats = cls()
+        subjects = defaultdict(set)
+        objects = defaultdict(set)
+        object_counts = defaultdict(Counter)
+        overflow = set()
+
+        for s, p, o in graph:
+            stats.predicates[p] += 1
+            subjects[p].add(s)
+            objects[p].add(o)
+            if p not in overflow:
+                object_counts[p][o] += 1
+                if len(object_counts[p]) > cls.max_tracked_objects:
+                    overflow.add(p)
+                    del object_counts[p]
+
+        stats.total = sum(stats.predicates.values())
+        stats.object_counts = dict(object_counts)
+        stats.distinct_subjects = {p: len(values) for p, values in subjects.items()}
+        stats.distinct_objects = {p: len(values) for p, values in objects.items()}
+        return stats
+
+    def to_dict(self, encode):
+        """Представление для JSON; encode переводит терм в строку"""
+        return {
+            'total': self.total,
+            'predicates': {encode(p): count for p, count in self.predicates.items()},
+            'object_counts': {encode(p): [[encode(o), count] for o, count in counts.items()]
+                              for p, counts in self.object_counts.items()},
+            'distinct_subjects': {encode(p): count for p, count in self.distinct_subjects.items()},
+            'distinct_objects': {encode(p): count for p, count in self.distinct_objects.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data, decode):
+        """Статистика из to_dict; decode переводит строку обратно в терм"""
+        stats = cls()
+        stats.total = data['total']
+        stats.predicates = Counter({decode(p): count for p, count in data['predicates'].items()})
+        stats.object_counts = {decode(p): Counter({decode(o): count for o, count in counts})
+                               for p, counts in data['object_counts'].items()}
+        stats.distinct_subjects = {decode(p): count for p, count in data['distinct_subjects'].items()}
+        stats.distinct_objects = {decode(p): count for p, count in data['distinct_objects'].items()}
+        return stats
+
+    def estimate(self, triple, bound):
+        """Оценка числа строк шаблона при уже связанных переменных bound"""
+        s, p, o = triple
+        s_bound = is_bound(s, bound)
+        o_bound = is_bound(o, bound)
+
+        if isinstance(p, Path):
+            return self.estimate_path(s, p, o, bound)
+        if not is_bound(p, bound):
+            # Предикат-переменная: грубая оценка по всему графу
+            estimate = float(self.total)
+            if s_bound:
+                estimate /= max(len(self.distinct_subjects), 1) * 10
+            if o_bound:
+                estimate /= max(len(self.distinct_objects), 1) * 10
+            return estimate
+        if isinstance(p, Variable):
+            # Предикат связан во время выполнения, но неизвестен при планировании
+            return float(self.total) / max(len(self.predicates), 1)
+
+        count = self.predicates.get(p, 0)
+        if count == 0:
+            return 0.0
+
+        if o_bound:
+            if not isinstance(o, (Variable, BNode)) and p in self.object_counts:
+                estimate = float(self.object_counts[p].get(o, 0))
+            else:
+                estimate = count / self.distinct_objects[p]
+            if s_bound:
+                estimate = min(estimate / self.distinct_subjects[p], 1.0)
+            return estimate
+        if s_bound:
+            return count / self.distinct_subjects[p]
+        return float(count)
+
+    def estimate_path(self, s, path, o, bound):
+        """Оценка числа строк шаблона с property path"""
+        if isinstance(path, InvPath):
+            return self.estimate((o, path.arg, s), bound)
+        if isinstance(path, AlternativePath):
+            return sum(self.estimate((s, arg, o), bound) for arg in path.args)
+        if isinstance(path, SequencePath):
+            # Первое звено от начала пути, дальше - среднее число объектов на субъект
+            estimate = self.estimate((s, path.args[0], BNode()), bound)
+            for arg in path.args[1:]:
+                estimate *= self.estimate((Variable('_'), arg, BNode()), {Variable('_')})
+            if is_bound(o, bound):
+                estimate = min(estimate, self.estimate((BNode(), path.args[-1], o), bound))
+            return estimate
+        # Пути с повторением (*, +, ?) и отрицанием: грубая оценка по всему графу
+        return float(self.total) / max(len(self.predicates), 1)
+
+    def order_triples(self, triples, bound=()):
+        """Жадный порядок шаблонов: сначала самые селективные среди связанных с уже выбранными"""
+        bound = set(bound)
+        remaining = list(triples)
+        ordered = []
+        while remaining:
+            connected = [t for t in remaining if any(term in bound for term in t if is_variable(term))]
+            candidates = connected if bound and connected else remaining
+            best = min(candidates, key=lambda t: self.estimate(t, bound))
+            ordered.append(best)
+            remaining.remove(best)
+            bound.update(term for term in best if is_variable(term))
+        return ordered
+
+
+def is_variable(term):
+    """Переменная шаблона (blank node в BGP тоже переменная)"""
+    return isinstance(term, (Variable, BNode))
+
+
+def is_bound(term, bound):
+    """Константа или уже связанная переменная"""
+    return not is_variable(term) or term in bound
+
+
+def expression_vars(expr):
+    """Переменные выражения; None, если выражение зависит от контекста (EXISTS)"""
+    if isinstance(expr, Variable):
+        return {expr}
+    if isinstance(expr, CompValue):
+        if expr.name in CONTEXT_EXPRESSIONS:
+            return None
+        values = [value for key, value in expr.items() if not key.startswith('_')]
+    elif isinstance(expr, (list, tuple)):
+        values = expr
+    else:
+        return set()
+
+    result = set()
+    for value in values:
+        value_vars = expression_vars(value)
+        if value_vars is None:
+            return None
+        result |= value_vars
+    return result
+
+
+def node_vars(node):
+    """Переменные, которые может связать узел алгебры"""
+    name = node.name
+    if name == 'BGP':
+        return {term for triple in node.triples for term in triple if is_variable(term)}
+    if name == 'Project':
+        return set(node.PV)
+    if name == 'Extend':
+        return node_vars(node.p) | {node.var}
+    if name == 'ToMultiSet' and node.p.name == 'values':
+        return {var for row in node.p.res for var in row}
+
+    result = set()
+    for attr in ('p', 'p1', 'p2'):
+        child = node.get(attr)
+        if isinstance(child, CompValue):
+            result |= node_vars(child)
+    return result
+
+
+def push_filter(filter_node):
+    """Опускает FILTER под Join/LeftJoin/Extend/Filter, пока его переменные это позволяют"""
+    expr_vars = expression_vars(filter_node.expr)
+    if not expr_vars:
+        # EXISTS или выражение без переменных оставляем на месте
+        return filter_node
+
+    child = filter_node.p
+    name = child.name
+    if name == 'Join':
+        for side, other in (('p1', 'p2'), ('p2', 'p1')):
+            if expr_vars <= node_vars(child[side]) and not expr_vars & node_vars(child[other]):
+                filter_node['p'] = child[side]
+                child[side] = push_filter(filter_node)
+                return child
+    elif name == 'LeftJoin':
+        # Правая часть OPTIONAL не должна связывать переменные фильтра: фильтр по переменной
+        # из OPTIONAL (например, имя ИЛИ необязательное короткое имя) остается над LeftJoin
+        if expr_vars <= node_vars(child.p1) and not expr_vars & node_vars(child.p2):
+            filter_node['p'] = child.p1
+            child['p1'] = push_filter(filter_node)
+            return child
+    elif name == 'Extend':
+        if child.var not in expr_vars:
+            filter_node['p'] = child.p
+            child['p'] = push_filter(filter_node)
+            return child
+    elif name == 'Filter':
+        filter_node['p'] = child.p
+        child['p'] = push_filter(filter_node)
+        return child
+    return filter_node
+
+
+class QueryOptimizer:
+    """Переписывает алгебру запроса и упорядочивает BGP во время выполнения"""
+
+    def __init__(self, statistics):
+        self.statistics = statistics
+        self.order_cache = {}
+
+    def rewrite(self, node):
+        """Оптимизирует дерево алгебры: FILTER вниз, статический порядок BGP"""
+        for attr in ('p', 'p1', 'p2'):
+            child = node.get(attr)
+            if isinstance(child, CompValue) and child.name != 'values':
+                node[attr] = self.rewrite(child)
+
+        if node.name == 'Filter' and node.p.name not in OPAQUE_NODES:
+            return push_filter(node)
+        if node.name == 'BGP' and len(node.triples) > 1:
+            node['triples'] = self.statistics.order_triples(node.triples)
+        return node
+
+    def optimize(self, prepared):
+        """Оптимизирует подготовленный запрос (prepareQuery) на месте"""
+        prepared.algebra = self.rewrite(prepared.algebra)
+        return prepared
+
+    def eval_bgp(self, ctx, part):
+        """Порядок шаблонов BGP по связанным на момент выполнения переменным"""
+        triples = part.triples
+        if len(triples) > 1:
+            bound = frozenset(term for triple in triples for term in triple
+                              if is_variable(term) and ctx[term] is not None)
+            key = (id(part), bound)
+            ordered = self.order_cache.get(key)
+            if ordered is None:
+                ordered = self.statistics.order_triples(triples, bound)
+                self.order_cache[key] = ordered
+            triples = ordered
+        return evaluate.evalBGP(ctx, triples)
+
+    @contextmanager
+    def active(self, graph):
+        """Включает порядок BGP для запросов к graph на время запроса (прежний оптимизатор графа восстанавливается)"""
+        store = graph.store
+        previous = ACTIVE_OPTIMIZERS.get(store)
+        ACTIVE_OPTIMIZERS[store] = self
+        try:
+            yield self
+        finally:
+            if previous is None:
+                ACTIVE_OPTIMIZERS.pop(store, None)
+            else:
+                ACTIVE_OPTIMIZERS[store] = previous
+            self.order_cache.clear()
+
+
+def eval_bgp(ctx, part):
+    """CUSTOM_EVALS: BGP графа с активным оптимизатором упорядочиваются им, остальные вычисляет rdflib"""
+    store = getattr(ctx.graph, 'store', None)
+    optimizer = ACTIVE_OPTIMIZERS.get(store) if part.name == 'BGP' and store is not None else None
+    if optimizer is None:
+        raise NotImplementedError()
+    return optimizer.eval_bgp(ctx, part)
+
+
+CUSTOM_EVALS['wot_bgp_order'] = eval_bgp
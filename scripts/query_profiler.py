@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Профилирование SPARQL запросов rdflib по узлам алгебры
+
+На время выполнения запроса evalPart подменяется оберткой, которая считает
+для каждого узла алгебры число вызовов, выданных строк и затраченное время.
+План выводится деревом (текст) или словарем (JSON)
+"""
+
+import time
+from collections import defaultdict
+
+from rdflib import Variable
+from rdflib.plugins.sparql import evaluate
+from rdflib.plugins.sparql.parserutils import CompValue
+
+
+# Узлы алгебры, которые вычисляются через evalPart (остальные CompValue - выражения)
+PLAN_NODES = {
+    'SelectQuery', 'AskQuery', 'ConstructQuery', 'DescribeQuery',
+    'Project', 'Distinct', 'Reduced', 'Slice', 'OrderBy', 'Group', 'AggregateJoin',
+    'BGP', 'Filter', 'Join', 'LeftJoin', 'Union', 'Minus', 'Extend', 'Graph',
+    'ToMultiSet', 'ServiceGraphPattern',
+}
+
+# Атрибуты узла, в которых лежат дочерние узлы плана
+CHILD_ATTRS = ('p', 'p1', 'p2')
+
+
+class NodeStats:
+    """Показатели одного узла плана"""
+
+    __slots__ = ('calls', 'rows', 'time')
+
+    def __init__(self):
+        self.calls = 0
+        self.rows = 0
+        self.time = 0.0
+
+
+class QueryProfiler:
+    """Контекстный менеджер: замеряет узлы алгебры, пока активен"""
+
+    def __init__(self):
+        self.stats = defaultdict(NodeStats)
+        self.original_eval_part = None
+
+    def __enter__(self):
+        self.original_eval_part = evaluate.evalPart
+        evaluate.evalPart = self.eval_part
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        evaluate.evalPart = self.original_eval_part
+        return False
+
+    def eval_part(self, ctx, part):
+        """Обертка над evalPart: время и строки узла"""
+        stats = self.stats[id(part)]
+        stats.calls += 1
+        start_time = time.perf_counter()
+        result = self.original_eval_part(ctx, part)
+        stats.time += time.perf_counter() - start_time
+
+        # SelectQuery/AskQuery возвращают словарь, строки считаются в дочерних узлах
+        if isinstance(result, dict):
+            return result
+        return self.iterate(result, stats)
+
+    @staticmethod
+    def iterate(result, stats):
+        """Итерирует результат узла, накапливая время внутри next()"""
+        iterator = iter(result)
+        while True:
+            start_time = time.perf_counter()
+            try:
+                row = next(iterator)
+            except StopIteration:
+                stats.time += time.perf_counter() - start_time
+                return
+            stats.time += time.perf_counter() - start_time
+            stats.rows += 1
+            yield row
+
+    def build_plan(self, algebra, namespace_manager=None):
+        """Строит дерево плана с показателями узлов"""
+        return build_plan(algebra, self.stats, namespace_manager)
+
+
+def plan_children(part):
+    """Дочерние узлы плана"""
+    children = []
+    for attr in CHILD_ATTRS:
+        child = part.get(attr)
+        if isinstance(child, CompValue) and child.name in PLAN_NODES:
+            children.append(child)
+    return children
+
+
+def format_term(term, namespace_manager=None):
+    """Короткая запись термина: ?var, prefix:name или литерал с prefix:тип"""
+    if isinstance(term, Variable):
+        return f"?{term}"
+    if hasattr(term, 'n3'):
+        return term.n3(namespace_manager)
+    return str(term)
+
+
+def node_label(part, namespace_manager=None):
+    """Подпись узла: имя оператора и главные детали"""
+    name = part.name
+    if name == 'BGP':
+        patterns = ['(' + ' '.join(format_term(t, namespace_manager) for t in triple) + ')'
+                    for triple in part.triples]
+        return f"BGP {' '.join(patterns)}"
+    if name == 'Extend':
+        return f"Extend ?{part.var}"
+    if name == 'Project':
+        return f"Project {' '.join(f'?{v}' for v in part.PV)}"
+    if name == 'Slice':
+        return f"Slice start={part.start} length={part.length}"
+    if name == 'Join' and part.get('lazy'):
+        return "Join (lazy)"
+    if name == 'Group' and part.get('expr'):
+        return f"Group by {len(part.expr)} expression(s)"
+    if name == 'AggregateJoin':
+        return f"AggregateJoin {len(part.A)} aggregate(s)"
+    if name == 'Filter':
+        variables = sorted(getattr(part, '_vars', None) or [])
+        return f"Filter {' '.join(f'?{v}' for v in variables)}".rstrip()
+    return name
+
+
+def build_plan(part, stats=None, namespace_manager=None):
+    """Дерево плана в виде словаря; stats - показатели узлов (None для EXPLAIN без выполнения)"""
+    node_stats = stats.get(id(part)) if stats is not None else None
+    children = [build_plan(child, stats, namespace_manager) for child in plan_children(part)]
+    node = {
+        'name': part.name,
+        'label': node_label(part, namespace_manager),
+        'children': children,
+    }
+    if stats is not None:
+        node['calls'] = node_stats.calls if node_stats else 0
+        node['rows'] = node_stats.rows if node_stats else 0
+        node['time'] = round(node_stats.time, 6) if node_stats else 0.0
+        # Собственное время узла: без времени, проведенного в дочерних узлах
+        node['self_time'] = round(max(node['time'] - sum(c['time'] for c in children), 0.0), 6)
+    return node
+
+
+def iter_plan(node, depth=0):
+    """Обходит дерево плана в глубину"""
+    yield node, depth
+    for child in node['children']:
+        yield from iter_plan(child, depth + 1)
+
+
+def dominant_node(plan):
+    """Узел с наибольшим собственным временем"""
+    nodes = [node for node, _ in iter_plan(plan) if 'self_time' in node]
+    return max(nodes, key=lambda node: node['self_time']) if nodes else None
+
+
+def profile_report(plan, query_time, rows, query=None):
+    """Отчет профилирования для JSON"""
+    dominant = dominant_node(plan)
+    return {
+        'query': query,
+        'time': round(query_time, 6),
+        'rows': rows,
+        'dominant': {
+            'label': dominant['label'],
+            'self_time': dominant['self_time'],
+            'share': round(dominant['self_time'] / query_time, 4) if query_time > 0 else 0.0,
+        } if dominant else None,
+        'plan': plan,
+    }
+
+
+def format_plan(plan, total_time=None, label_width=100):
+    """Текстовое дерево плана; доминирующий узел помечается"""
+    dominant = dominant_node(plan)
+    profiled = 'time' in plan
+    lines = []
+    if profiled:
+        lines.append(f"{'rows':>10} {'calls':>8} {'time, s':>9} {'self, s':>9} {'self %':>7}  node")
+    for node, depth in iter_plan(plan):
+        label = '  ' * depth + ('└─ ' if depth else '') + node['label']
+        if len(label) > label_width:
+            label = label[:label_width - 3] + '...'
+        if not profiled:
+            lines.append(label)
+            continue
+        share = node['self_time'] / total_time * 100 if total_time else 0.0
+        line = (f"{node['rows']:>10,} {node['calls']:>8,} {node['time']:>9.3f} "
+                f"{node['self_time']:>9.3f} {share:>6.1f}%  {label}")
+        if node is dominant:
+            line += "  ◀ dominant"
+        lines.append(line)
+    return '\n'.join(lines)
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Типизированные колонки результатов SPARQL запросов World of Tanks
+
+Результат (rdflib ResultRow с Literal) за один проход раскладывается по колонкам:
+тип колонки выводится из XSD datatype литералов (integer -> int64, decimal/float/double ->
+float64, boolean -> bool, dateTime/date -> datetime64, остальное и URI - строки).
+Из колонок строятся массивы NumPy, DataFrame pandas, таблица Arrow, легкие строки
+со __slots__, выгрузка в CSV и Parquet; печать результата берет значения отсюда же
+"""
+
+import csv
+import functools
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+from rdflib import BNode, Literal, URIRef
+from rdflib.namespace import XSD
+
+try:
+    import pandas as pd
+except ImportError:  # pandas нужен только для to_pandas()
+    pd = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pyarrow - необязательная зависимость (Arrow и Parquet)
+    pyarrow = None
+
+
+# XSD datatype -> вид колонки
+XSD_KINDS = {
+    **{datatype: 'int' for datatype in (
+        XSD.integer, XSD.int, XSD.long, XSD.short, XSD.byte, XSD.nonNegativeInteger, XSD.positiveInteger,
+        XSD.negativeInteger, XSD.nonPositiveInteger, XSD.unsignedLong, XSD.unsignedInt, XSD.unsignedShort,
+        XSD.unsignedByte)},
+    XSD.decimal: 'float',
+    XSD.float: 'float',
+    XSD.double: 'float',
+    XSD.boolean: 'bool',
+    XSD.dateTime: 'datetime',
+    XSD.date: 'datetime',
+}
+
+# Вид колонки -> dtype NumPy (колонки без пропусков) и pandas (с пропусками)
+NUMPY_DTYPES = {'int': np.int64, 'float': np.float64, 'bool': np.bool_, 'datetime': 'datetime64[us]', 'str': object}
+PANDAS_NULLABLE = {'int': 'Int64', 'bool': 'boolean'}
+
+# Namespace онтологии, который убирается из URI при печати
+WOT_NAMESPACE = "http://www.semanticweb.org/ontology/wot#"
+
+MAX_CELL_WIDTH = 50
+
+INT64_MIN, INT64_MAX = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+
+
+def term_value(term):
+    """(вид, Python значение) терма rdflib; (None, None) для пропуска"""
+    if term is None:
+        return None, None
+    if isinstance(term, Literal):
+        kind = XSD_KINDS.get(term.datatype, 'str')
+        value = term.value
+        if value is None or kind == 'str':
+            # Некорректный литерал типа или строка: остается текстом
+            return 'str', str(term)
+        if kind == 'int':
+            value = int(value)
+            return ('int', value) if INT64_MIN <= value <= INT64_MAX else ('str', str(term))
+        if kind == 'float':
+            return 'float', float(value)
+        if kind == 'datetime':
+            if not isinstance(value, datetime):
+                value = datetime(value.year, value.month, value.day)
+            elif value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            return 'datetime', value
+        return kind, value
+    if isinstance(term, (URIRef, BNode)):
+        return 'str', str(term)
+    # Значения не из rdflib (например, собранные вручную записи)
+    if isinstance(term, bool):
+        return 'bool', term
+    if isinstance(term, int):
+        return ('int', term) if INT64_MIN <= term <= INT64_MAX else ('str', str(term))
+    if isinstance(term, (float, Decimal)):
+        return 'float', float(term)
+    if isinstance(term, date):
+        return term_value(Literal(term))
+    return 'str', str(term)
+
+
+def column_kind(kinds):
+    """Общий вид колонки по видам ее значений: int и float дают float, смесь - строки"""
+    kinds = kinds - {None}
+    if not kinds:
+        return 'str'
+    if len(kinds) == 1:
+        return next(iter(kinds))
+    return 'float' if kinds == {'int', 'float'} else 'str'
+
+
+def format_cell(value, kind, width=MAX_CELL_WIDTH):
+    """Значение колонки для печати: целые без дробной части, дроби - 2 знака, URI - локальное имя"""
+    if value is None:
+        return ""
+    if kind == 'float':
+        return str(int(value)) if value.is_integer() else f"{value:.2f}"
+    if kind == 'bool':
+        return 'true' if value else 'false'
+    if kind == 'datetime':
+        return value.isoformat(sep=' ') if value.time() != datetime.min.time() else value.date().isoformat()
+    text = str(value)
+    if text.startswith(WOT_NAMESPACE):
+        text = text[len(WOT_NAMESPACE):]
+    if len(text) > width:
+        return text[:width - 3] + "..."
+    return text
+
+
+class QueryRow:
+    """Строка результата: значения в слотах, доступ по имени, индексу и распаковкой"""
+    __slots__ = ()
+
+    def __iter__(self):
+        return (getattr(self, column) for column in self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __getitem__(self, key):
+        return getattr(self, self.__slots__[key] if isinstance(key, int) else key)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and tuple(self) == tuple(other)
+
+    def __repr__(self):
+        values = ', '.join(f"{column}={value!r}" for column, value in zip(self.__slots__, self))
+        return f"{type(self).__name__}({values})"
+
+    def as_dict(self):
+        return dict(zip(self.__slots__, self))
+
+
+@functools.lru_cache(maxsize=256)
+def row_type(columns):
+    """Класс строки со __slots__ под набор колонок (кешируется по колонкам)"""
+
+    def __init__(self, *values):
+        for column, value in zip(columns, values):
+            setattr(self, column, value)
+
+    return type('Row', (QueryRow,), {'__slots__': columns, '__init__': __init__})
+
+
+class ResultTable:
+    """Результат запроса по колонкам: вид колонки и список Python значений (None - пропуск)"""
+
+    def __init__(self, columns, kinds, values):
+        self.columns = list(columns)
+        self.kinds = kinds
+        self.values = values
+
+    def __len__(self):
+        return len(self.values[self.columns[0]]) if self.columns else 0
+
+    @classmethod
+    def from_result(cls, results):
+        """Таблица из SPARQLResult или списка ResultRow за один проход по строкам"""
+        if isinstance(results, ResultTable):
+            return results
+        if results is None:
+            return cls([], {}, {})
+        result_type = getattr(results, 'type', 'SELECT')
+        if result_type == 'ASK':
+            return cls(['ask'], {'ask': 'bool'}, {'ask': [bool(results.askAnswer)]})
+        if result_type in ('CONSTRUCT', 'DESCRIBE'):
+            columns, rows = ['subject', 'predicate', 'object'], list(results.graph)
+        else:
+            rows = results if isinstance(results, list) else list(results)
+            labels = getattr(results, 'vars', None) or (rows[0].labels if rows else [])
+            columns = [str(label) for label in labels]
+
+        cells = [[] for _ in columns]
+        seen = [set() for _ in columns]
+        for row in rows:
+            for position, term in enumerate(row):
+                kind, value = term_value(term)
+                seen[position].add(kind)
+                cells[position].append(value)
+
+        kinds, values = {}, {}
+        for column, column_cells, column_kinds in zip(columns, cells, seen):
+            kind = column_kind(column_kinds)
+            kinds[column] = kind
+            if kind == 'float':
+                values[column] = [None if value is None else float(value) for value in column_cells]
+            elif kind == 'str' and column_kinds - {'str', None}:
+                # Смешанная колонка печатается и выгружается как текст
+                values[column] = [None if value is None else str(value) for value in column_cells]
+            else:
+                values[column] = column_cells
+        return cls(columns, kinds, values)
+
+    def rows(self):
+        """Строки со __slots__ (имена колонок - атрибуты)"""
+        row_class = row_type(tuple(self.columns))
+        return [row_class(*values) for values in zip(*(self.values[column] for column in self.columns))]
+
+    def records(self):
+        """Строки в виде словарей колонка -> значение"""
+        return [dict(zip(self.columns, values)) for values in zip(*(self.values[column] for column in self.columns))]
+
+    def column_array(self, column):
+        """Колонка массивом NumPy: пропуски целых дают float64 с NaN, булевых - object"""
+        kind, values = self.kinds[column], self.values[column]
+        missing = any(value is None for value in values)
+        if kind == 'int' and missing:
+            return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        if kind == 'float':
+            return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+        if kind == 'datetime':
+            return np.array([np.datetime64('NaT') if value is None else value for value in values],
+                            dtype='datetime64[us]')
+        if kind == 'bool' and missing or kind == 'str':
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            return array
+        return np.array(values, dtype=NUMPY_DTYPES[kind])
+
+    def to_numpy(self):
+        """Словарь колонка -> массив NumPy"""
+        return {column: self.column_array(column) for column in self.columns}
+
+    def to_pandas(self):
+        """DataFrame с нативными dtype (целые и булевы с пропусками - nullable Int64/boolean)"""
+        if pd is None:
+            raise RuntimeError("pandas is required for DataFrame export: pip install pandas")
+        data = {}
+        for column in self.columns:
+            kind = self.kinds[column]
+            if kind in PANDAS_NULLABLE and any(value is None for value in self.values[column]):
+                data[column] = pd.array(self.values[column], dtype=PANDAS_NULLABLE[kind])
+            else:
+                data[column] = self.column_array(column)
+        return pd.DataFrame(data, columns=self.columns)
+
+    def to_arrow(self):
+        """Таблица Arrow (int64, double, bool, timestamp[us], string)"""
+        if pyarrow is None:
+            raise RuntimeError("pyarrow is required for Arrow/Parquet export: pip install pyarrow")
+        types = {'int': pyarrow.int64(), 'float': pyarrow.float64(), 'bool': pyarrow.bool_(),
+                 'datetime': pyarrow.timestamp('us'), 'str': pyarrow.string()}
+        return pyarrow.table({column: pyarrow.array(self.values[column], type=types[self.kinds[column]])
+                              for column in self.columns})
+
+    def to_csv(self, path):
+        """Выгрузка в CSV (пропуск - пустая ячейка, даты в ISO 8601)"""
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            for values in zip(*(self.values[column] for column in self.columns)):
+                writer.writerow(['' if value is None else
+                                 value.isoformat() if isinstance(value, datetime) else
+                                 str(value).lower() if isinstance(value, bool) else value
+                                 for value in values])
+
+    def to_parquet(self, path):
+        """Выгрузка в Parquet через pyarrow"""
+        if pyarrow is None:
+            raise RuntimeError("pyarrow is required for Arrow/Parquet export: pip install pyarrow")
+        pyarrow.parquet.write_table(self.to_arrow(), path)
+
+    def export(self, path):
+        """Выгрузка по расширению файла: .csv или .parquet"""
+        suffix = Path(path).suffix.lower()
+        if suffix == '.csv':
+            self.to_csv(path)
+        elif suffix in ('.parquet', '.pq'):
+            self.to_parquet(path)
+        else:
+            raise ValueError(f"Unsupported export format: {suffix or path} (use .csv or .parquet)")
+
+    def formatted(self, column, limit=None):
+        """Значения колонки для печати"""
+        kind = self.kinds[column]
+        values = self.values[column][:limit] if limit else self.values[column]
+        return [format_cell(value, kind) for value in values]
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Интерактивная сессия SPARQL запросов World of Tanks
+
+Сессия помнит разобранные и оптимизированные планы и результаты запросов (LRU):
+повтор запроса из истории, в том числе с другими пробелами и комментариями, не разбирает его заново,
+а при неизменном графе сразу печатает результат. Кеш сбрасывается, когда в граф
+догружаются партиции (меняются данные и статистика оптимизатора). История строк
+сохраняется между запусками (readline), для каждого запуска печатаются время и число
+строк. \\timeout N ограничивает время запроса (SIGALRM), Ctrl-C отменяет выполняемый
+запрос, не закрывая сессию
+"""
+
+import contextlib
+import re
+import signal
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from query_results import ResultTable
+
+try:
+    import readline
+except ImportError:  # readline есть не на всех платформах: без него нет истории
+    readline = None
+
+
+# Файл истории интерактивного режима и ее длина
+HISTORY_FILE = Path.home() / '.wot_query_history'
+HISTORY_LENGTH = 1000
+
+# Размер кешей сессии и наибольший кешируемый результат
+PLAN_CACHE_SIZE = 128
+RESULT_CACHE_SIZE = 32
+MAX_CACHED_ROWS = 100_000
+
+# Сколько строк результата печатать
+DISPLAY_LIMIT = 50
+
+PROMPT_COMMANDS = {'help', '\\help', '\\?'}
+
+
+class QueryTimeout(Exception):
+    """Запрос не уложился в \\timeout"""
+
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """Прерывает блок исключением QueryTimeout через seconds секунд (SIGALRM)"""
+    if not seconds:
+        yield
+        return
+
+    def expire(signum, frame):
+        raise QueryTimeout(f"query exceeded {seconds:g} s timeout")
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+# Лексемы запроса для ключа кеша: IRI и строковые литералы (пробелы в них значимы),
+# комментарии и пробелы
+QUERY_TOKENS = re.compile(
+    r'(?P<keep><[^<>"{}|^`\\\s]*>'
+    r"|'''(?:[^'\\]|\\.|'(?!''))*'''"
+    r'|"""(?:[^"\\]|\\.|"(?!""))*"""'
+    r"|'(?:[^'\\\n]|\\.)*'"
+    r'|"(?:[^"\\\n]|\\.)*")'
+    r'|(?P<comment>#[^\n]*)'
+    r'|(?P<space>\s+)'
+)
+
+
+def query_key(query):
+    """Ключ кеша: запрос без комментариев, пробелы вне IRI и литералов сведены к одному"""
+    parts = []
+    position = 0
+    for match in QUERY_TOKENS.finditer(query):
+        if match.start() > position:
+            parts.append(query[position:match.start()])
+        if match.lastgroup == 'keep':
+            parts.append(match.group())
+        elif parts and parts[-1] != ' ':
+            parts.append(' ')
+        position = match.end()
+    parts.append(query[position:])
+    return ''.join(parts).strip()
+
+
+class LRUCache:
+    """Словарь ограниченного размера: при переполнении удаляется давно не использованный ключ"""
+
+    def __init__(self, size):
+        self.size = size
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key):
+        if key not in self.items:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.items.move_to_end(key)
+        return self.items[key]
+
+    def put(self, key, value):
+        self.items[key] = value
+        self.items.move_to_end(key)
+        while len(self.items) > self.size:
+            self.items.popitem(last=False)
+
+    def clear(self):
+        self.items.clear()
+
+
+class QuerySession:
+    """Интерактивная сессия движка запросов: кеш планов и результатов, история, тайм-аут"""
+
+    def __init__(self, engine, history_file=None, timeout=None):
+        self.engine = engine
+        self.history_file = Path(history_file) if history_file else HISTORY_FILE
+        self.timeout = timeout
+        self.plans = LRUCache(PLAN_CACHE_SIZE)
+        self.results = LRUCache(RESULT_CACHE_SIZE)
+        self.version = self.graph_version()
+        self.last_query = None
+        self.last_result = None
+
+    def graph_version(self):
+        """Версия графа: меняется, когда догружаются партиции (и пересчитывается статистика)"""
+        return len(self.engine.loaded_partitions)
+
+    def check_version(self):
+        """Сбрасывает кеши, если граф изменился после их заполнения"""
+        version = self.graph_version()
+        if version != self.version:
+            self.plans.clear()
+            self.results.clear()
+            self.version = version
+
+    def load_history(self):
+        if readline is None:
+            return
+        readline.set_history_length(HISTORY_LENGTH)
+        # Строки многострочного запроса добавляются в историю вместе, после ввода
+        readline.set_auto_history(False)
+        with contextlib.suppress(OSError):
+            readline.read_history_file(self.history_file)
+
+    def save_history(self):
+        if readline is None:
+            return
+        try:
+            readline.write_history_file(self.history_file)
+        except OSError as e:
+            print(f"⚠️  History not saved: {e}")
+
+    def remember(self, lines):
+        """Добавляет команду или запрос в историю одной записью (запрос с комментариями # - по строкам)"""
+        if readline is None:
+            return
+        if len(lines) > 1 and any('#' in re.sub(r'<[^>]*>', '', line) for line in lines):
+            for line in lines:
+                readline.add_history(line)
+        else:
+            readline.add_history(' '.join(line.strip() for line in lines))
+
+    def read_statement(self):
+        """Читает команду или запрос (до строки, оканчивающейся на } или ;); None - выход"""
+        print("\n" + ">" * 60)
+        lines = []
+        while True:
+            line = input()
+            command = line.strip()
+            if command.lower() in ('exit', 'quit', '\\q'):
+                return None
+            if lines and command.startswith('\\'):
+                # Команда посреди незаконченного запроса отбрасывает его
+                print(f"(unfinished query discarded: {len(lines)} lines)")
+                lines = []
+            if not lines and (command.lower() in PROMPT_COMMANDS or command.startswith('\\')
+                              or command.lower().startswith(('profile ', 'resolve '))):
+                self.remember([command])
+                return command
+            lines.append(line)
+            if command.endswith('}') or command.endswith(';'):
+                self.remember(lines)
+                return '\n'.join(lines).strip()
+
+    def run(self):
+        """Цикл чтения и выполнения запросов"""
+        print("\n" + "=" * 60)
+        print("🎮 INTERACTIVE MODE")
+        print("=" * 60)
+        print("\nEnter SPARQL query (type 'exit' to quit, 'help' for examples and commands):")
+        print("Prefix a query with EXPLAIN to show its plan or PROFILE to run it with per-node timings;")
+        print("'profile on|json|off' profiles every query; 'resolve <tank name>' finds tanks by a fuzzy name;")
+        print("\\timeout N limits query time, Ctrl-C cancels a running query.\n")
+
+        self.load_history()
+        try:
+            while True:
+                try:
+                    statement = self.read_statement()
+                except KeyboardInterrupt:
+                    print("^C")
+                    continue
+                except EOFError:
+                    print()
+                    break
+                if statement is None:
+                    break
+                self.handle(statement)
+        finally:
+            self.save_history()
+
+    def handle(self, statement):
+        """Выполняет команду или запрос; ошибка, тайм-аут и Ctrl-C не закрывают сессию"""
+        try:
+            self.dispatch(statement)
+        except KeyboardInterrupt:
+            print("\n⛔ Query cancelled")
+        except QueryTimeout as e:
+            print(f"\n⏰ Query cancelled: {e}")
+        except Exception as e:
+            print(f"❌ Query error: {e}")
+
+    def dispatch(self, statement):
+        lowered = statement.lower()
+        if lowered in ('help', '\\help', '\\?'):
+            self.engine.show_help()
+            return
+        if lowered in ('profile on', 'profile json', 'profile off'):
+            self.engine.profile = {'on': 'text', 'json': 'json', 'off': None}[lowered.split()[1]]
+            print(f"Profiling: {self.engine.profile or 'off'}")
+            return
+        if lowered.startswith('resolve '):
+            self.engine.resolve_tank_name(statement[len('resolve '):].strip())
+            return
+        if statement.startswith('\\'):
+            name, _, argument = statement[1:].partition(' ')
+            command = getattr(self, f"command_{name.lower()}", None)
+            if command is None:
+                print(f"❌ Unknown command: \\{name} (type 'help' for the list)")
+                return
+            command(argument.strip())
+            return
+
+        query = statement.rstrip(';').strip()
+        keyword = query.split(None, 1)[0].upper() if query else ''
+        if keyword == 'EXPLAIN':
+            self.explain(query[len(keyword):])
+        elif keyword == 'PROFILE':
+            self.run_profiled(query[len(keyword):].strip())
+        elif query:
+            self.run_query(query)
+
+    def plan(self, query):
+        """Подготовленный запрос из кеша или новый: (prepared, найден ли в кеше)"""
+        self.check_version()
+        key = query_key(query)
+        prepared = self.plans.get(key)
+        if prepared is not None:
+            return prepared, True
+        prepared = self.engine.prepare_query(query)
+        # Подготовка могла догрузить партиции: старые планы и результаты больше не действительны
+        self.check_version()
+        self.plans.put(key, prepared)
+        return prepared, False
+
+    def run_query(self, query):
+        """Выполняет запрос через кеш планов и результатов, печатает время и число строк"""
+        if self.engine.profile:
+            self.run_profiled(query)
+            return
+
+        self.check_version()
+        key = query_key(query)
+        # До успешного выполнения результата нет: \export после ошибки не выгрузит чужой результат
+        self.last_query, self.last_result = query, None
+        start_time = time.perf_counter()
+        table = self.results.get(key)
+        if table is not None:
+            source = "cached result"
+        else:
+            with time_limit(self.timeout):
+                prepared, cached_plan = self.plan(query)
+                plan_time = time.perf_counter() - start_time
+                with self.engine.optimization():
+                    table = ResultTable.from_result(self.engine.g.query(prepared))
+            source = f"{'cached plan' if cached_plan else 'plan'} {plan_time:.3f} s"
+            if len(table) <= MAX_CACHED_ROWS:
+                self.results.put(key, table)
+        query_time = time.perf_counter() - start_time
+        self.last_result = table
+
+        print(f"\n⏱️  Query executed in {query_time:.3f} seconds ({source})")
+        print(f"📋 Results: {len(table)} rows\n")
+        self.engine.print_results(table, limit=DISPLAY_LIMIT)
+
+    def run_profiled(self, query):
+        """Выполняет запрос с профилем узлов (без кеша результатов)"""
+        # Движок печатает ошибку и возвращает пустой результат; здесь она должна дойти до handle
+        raise_errors, self.engine.raise_errors = self.engine.raise_errors, True
+        self.last_query, self.last_result = query, None
+        try:
+            with time_limit(self.timeout):
+                results = self.engine.execute_query(query, profile=self.engine.profile or 'text')
+        finally:
+            self.engine.raise_errors = raise_errors
+        self.last_result = table = ResultTable.from_result(results)
+        self.engine.print_results(table, limit=DISPLAY_LIMIT)
+
+    def explain(self, query):
+        """План запроса (из кеша планов) без выполнения"""
+        query = query.rstrip(';').strip()
+        with time_limit(self.timeout):
+            prepared, _ = self.plan(query)
+        self.engine.print_plan(prepared, output=self.engine.profile or 'text')
+
+    def command_explain(self, argument):
+        """\\explain [запрос] - план запроса, без аргумента - последнего выполненного"""
+        query = argument or self.last_query
+        if not query:
+            print("No query to explain yet.")
+            return
+        self.explain(query)
+
+    def command_timeout(self, argument):
+        """\\timeout [N|off] - ограничение времени запроса в секундах"""
+        if not argument:
+            print(f"Timeout: {f'{self.timeout:g} s' if self.timeout else 'off'}")
+            return
+        if not hasattr(signal, 'SIGALRM'):
+            print("⚠️  Timeouts need SIGALRM, which is not available on this platform")
+            return
+        seconds = 0.0 if argument.lower() == 'off' else float(argument)
+        if seconds < 0:
+            raise ValueError("timeout must be non-negative")
+        self.timeout = seconds or None
+        print(f"Timeout: {f'{seconds:g} s' if seconds else 'off'}")
+
+    def command_cache(self, argument):
+        """\\cache [clear] - состояние кешей сессии или их очистка"""
+        if argument.lower() == 'clear':
+            self.plans.clear()
+            self.results.clear()
+            print("Session cache cleared")
+            return
+        print(f"Plans:   {len(self.plans)}/{self.plans.size} (hits {self.plans.hits}, misses {self.plans.misses})")
+        print(f"Results: {len(self.results)}/{self.results.size} "
+              f"(hits {self.results.hits}, misses {self.results.misses})")
+
+    def command_export(self, argument):
+        """\\export FILE - выгрузка результата последнего запроса в CSV или Parquet"""
+        if self.last_result is None:
+            print("No result to export yet." if self.last_query is None else
+                  "No result to export: the last query failed or was cancelled.")
+            return
+        if not argument:
+            print("Usage: \\export FILE.csv|FILE.parquet")
+            return
+        self.engine.export_results(self.last_result, argument)
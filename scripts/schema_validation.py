@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Проверка значений колонок tomato.csv по схеме онтологии World of Tanks
+
+Перед построением триплетов каждый блок строк сверяется с domain/range свойств
+из wot_schema: одна векторная проверка на колонку (числа, даты, булевы значения,
+переполнение int64, дробная часть у integer, отрицательные счетчики, пропуски).
+По колонкам накапливаются счетчики нарушений и примеры значений; в строгом режиме
+импорт завершается ошибкой, если нарушения есть
+"""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+from rdflib.namespace import XSD
+
+from wot_schema import DATATYPE_PROPERTIES
+
+
+# Свойства-счетчики (очки, время, номера стороны и взвода): отрицательное значение - ошибка данных
+NON_NEGATIVE = {
+    'baseCapturePoints', 'baseDefensePoints', 'baseXP', 'damage', 'damageBlocked', 'damageReceived',
+    'damageReceivedFromInvisible', 'directHits', 'distanceTraveled', 'duration', 'frags', 'hitsReceived',
+    'lifeTime', 'penetrations', 'penetrationsReceived', 'platoon', 'playerPlatoon', 'playerSpawn',
+    'potentialDamageReceived', 'shotsFired', 'sniperDamage', 'spawn', 'splashHitsReceived', 'spots',
+    'spottingAssist', 'trackingAssist', 'winnerSpawn',
+}
+
+# Границы xsd:integer, которые переживают numpy (int64) в индексах и агрегатах
+INT64_MIN, INT64_MAX = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+
+SAMPLE_SIZE = 5
+
+
+class SchemaValidationError(ValueError):
+    """Строгий режим: значения колонок не соответствуют схеме"""
+
+
+class SchemaValidator:
+    """Накопитель нарушений схемы по колонкам (проверка блоками, векторно)"""
+
+    def __init__(self, properties=DATATYPE_PROPERTIES, sample_size=SAMPLE_SIZE):
+        self.properties = properties
+        self.sample_size = sample_size
+        self.columns = {}
+        self.seconds = 0.0
+
+    def column_report(self, domain, mapping):
+        """Отчет колонки (создается при первой проверке)"""
+        key = f"{domain}.{mapping.column}"
+        if key not in self.columns:
+            self.columns[key] = {
+                'domain': domain,
+                'column': mapping.column,
+                'property': mapping.predicate.split('#')[-1],
+                'datatype': mapping.datatype.split('#')[-1],
+                'checked': 0,
+                'violations': {},
+                'samples': [],
+            }
+        return self.columns[key]
+
+    def violation_masks(self, domain, mapping, values):
+        """Маски нарушений колонки: {вид: булев массив}"""
+        name = mapping.predicate.split('#')[-1]
+        present = values.notna().to_numpy()
+        masks = {'missing': ~present}
+        if domain not in self.properties.get(name, ((), ()))[0]:
+            masks['domain'] = present
+
+        datatype = mapping.datatype
+        if datatype == XSD.dateTime:
+            masks['bad_date'] = present & pd.to_datetime(values, errors='coerce').isna().to_numpy()
+            return masks
+        if datatype not in (XSD.integer, XSD.float, XSD.boolean):
+            return masks
+
+        text = not pd.api.types.is_numeric_dtype(values)
+        if text:
+            numeric = pd.to_numeric(values, errors='coerce')
+            masks['not_numeric'] = present & numeric.isna().to_numpy()
+        else:
+            numeric = values
+        array = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        with np.errstate(invalid='ignore'):
+            if datatype == XSD.boolean:
+                masks['not_boolean'] = present & ~np.isin(array, (0.0, 1.0)) & ~np.isnan(array)
+                return masks
+            if name in NON_NEGATIVE:
+                masks['negative'] = array < 0
+            if datatype == XSD.float:
+                masks['infinite'] = np.isinf(array)
+            elif text or values.dtype.kind == 'f':
+                # У целых колонок numpy дробей и переполнения быть не может
+                finite = np.isfinite(array)
+                masks['overflow'] = finite & ((array < INT64_MIN) | (array > INT64_MAX))
+                masks['not_integer'] = finite & (array != np.floor(array))
+                masks['infinite'] = np.isinf(array)
+        return masks
+
+    def check(self, domain, mappings, block):
+        """Проверяет колонки блока, соответствующие маппингам класса domain"""
+        start_time = time.perf_counter()
+        for mapping in mappings:
+            if mapping.column not in block.columns:
+                continue
+            values = block[mapping.column]
+            report = self.column_report(domain, mapping)
+            report['checked'] += len(values)
+            for kind, mask in self.violation_masks(domain, mapping, values).items():
+                count = int(np.count_nonzero(mask))
+                if not count:
+                    continue
+                report['violations'][kind] = report['violations'].get(kind, 0) + count
+                free = self.sample_size - len(report['samples'])
+                if free > 0:
+                    positions = np.flatnonzero(mask)[:free]
+                    report['samples'] += [{'row': int(block.index[position]), 'kind': kind,
+                                           'value': str(values.iloc[position])} for position in positions]
+        self.seconds += time.perf_counter() - start_time
+
+    def merge(self, other):
+        """Добавляет отчет другого валидатора (процесса пайплайна)"""
+        for key, report in other['columns'].items():
+            if key not in self.columns:
+                self.columns[key] = {**report, 'violations': {}, 'samples': [], 'checked': 0}
+            own = self.columns[key]
+            own['checked'] += report['checked']
+            for kind, count in report['violations'].items():
+                own['violations'][kind] = own['violations'].get(kind, 0) + count
+            own['samples'] += report['samples'][:max(0, self.sample_size - len(own['samples']))]
+        self.seconds += other['seconds']
+
+    def violations(self):
+        """Всего нарушений (пропуски не считаются: такие значения просто не пишутся)"""
+        return sum(count for report in self.columns.values()
+                   for kind, count in report['violations'].items() if kind != 'missing')
+
+    def to_dict(self):
+        return {
+            'violations': self.violations(),
+            'checked_values': sum(report['checked'] for report in self.columns.values()),
+            'seconds': round(self.seconds, 6),
+            'columns': self.columns,
+        }
+
+    def summary(self):
+        """Итог для метрик импорта (без примеров)"""
+        return {
+            'violations': self.violations(),
+            'checked_values': sum(report['checked'] for report in self.columns.values()),
+            'seconds': round(self.seconds, 6),
+            'columns_with_violations': sorted(key for key, report in self.columns.items()
+                                              if set(report['violations']) - {'missing'}),
+        }
+
+    def write_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def print_report(self):
+        """Печатает колонки с нарушениями и примеры значений"""
+        print(f"\n🔎 Schema validation: {self.violations():,} violations in "
+              f"{sum(report['checked'] for report in self.columns.values()):,} values ({self.seconds:.2f} s)")
+        for key, report in sorted(self.columns.items()):
+            if not report['violations']:
+                continue
+            counts = ', '.join(f"{kind} {count:,}" for kind, count in sorted(report['violations'].items()))
+            print(f"   {key:<40} {report['property']} ({report['datatype']}): {counts}")
+            for sample in report['samples'][:3]:
+                print(f"      row {sample['row']}: {sample['value']!r} ({sample['kind']})")
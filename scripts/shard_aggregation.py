@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Scatter-gather агрегация боев по временным шардам
+
+Каждый шард (партиция боев за месяц) загружается и агрегируется в отдельном
+процессе: для пар (танк, карта) считаются бои, победы и сумма урона.
+Частичные агрегаты аддитивны, поэтому их сумма дает точный результат,
+а группировка по нации, уровню или классу делается уже после слияния
+"""
+
+import multiprocessing
+import os
+import time
+
+from rdflib import Graph, URIRef
+
+from graph_partitions import load_partition, parse_time
+
+
+# Частичный агрегат шарда по парам (танк, карта); фильтр по времени подставляется при необходимости
+PARTIAL_QUERY = """
+PREFIX wot: <http://www.semanticweb.org/ontology/wot#>
+PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+
+SELECT ?tank ?map
+       (COUNT(?perf) AS ?battles)
+       (SUM(IF(?won, 1, 0)) AS ?wins)
+       (COUNT(?damage) AS ?damageCount)
+       (SUM(?damage) AS ?damageSum)
+WHERE {{
+  ?perf wot:inBattle ?battle .
+  ?perf wot:withTank ?tank .
+  {won_pattern}
+  {time_filter}
+  OPTIONAL {{ ?battle wot:onMap ?map }}
+  OPTIONAL {{ ?perf wot:damage ?damage }}
+}}
+GROUP BY ?tank ?map
+"""
+
+
+# Победа лежит на бою или, в графе с консолидированными боями, на результате игрока
+BATTLE_WON = "?battle wot:won ?won ."
+PLAYER_WON = "?perf wot:playerWon ?won ."
+PLAYER_WON_PREDICATE = URIRef("http://www.semanticweb.org/ontology/wot#playerWon")
+
+
+def time_filter(since=None, until=None):
+    """Шаблон и FILTER по времени боя для окна [since, until)"""
+    conditions = []
+    if since is not None:
+        conditions.append(f'?time >= "{parse_time(since).isoformat()}"^^xsd:dateTime')
+    if until is not None:
+        conditions.append(f'?time < "{parse_time(until).isoformat()}"^^xsd:dateTime')
+    if not conditions:
+        return ''
+    return f"?battle wot:battleTime ?time .\n  FILTER({' && '.join(conditions)})"
+
+
+def aggregate_graph(graph, since=None, until=None):
+    """Частичный агрегат графа: (танк, карта) -> [бои, победы, число значений урона, сумма урона]"""
+    consolidated = next(graph.triples((None, PLAYER_WON_PREDICATE, None)), None) is not None
+    query = PARTIAL_QUERY.format(time_filter=time_filter(since, until),
+                                 won_pattern=PLAYER_WON if consolidated else BATTLE_WON)
+    partial = {}
+    for row in graph.query(query):
+        key = (str(row.tank), str(row.map) if row.map is not None else None)
+        partial[key] = [
+            int(row.battles.toPython()),
+            int(row.wins.toPython()) if row.wins is not None else 0,
+            int(row.damageCount.toPython()),
+            float(row.damageSum.toPython()) if row.damageSum is not None else 0.0,
+        ]
+    return partial
+
+
+def aggregate_shard(task):
+    """Загружает шард и считает его частичный агрегат (выполняется в процессе пула)"""
+    name, path, since, until = task
+    start_time = time.perf_counter()
+    graph = Graph()
+    load_partition(graph, path)
+    load_time = time.perf_counter() - start_time
+    partial = aggregate_graph(graph, since, until)
+    return {
+        'name': name,
+        'pid': os.getpid(),
+        'triples': len(graph),
+        'load_seconds': load_time,
+        'seconds': time.perf_counter() - start_time,
+        'partial': partial,
+    }
+
+
+def scatter_gather(tasks, workers=None):
+    """Агрегирует шарды в пуле процессов (fork) или последовательно"""
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+        with multiprocessing.get_context('fork').Pool(workers) as pool:
+            return pool.map(aggregate_shard, tasks, chunksize=1), workers
+    return [aggregate_shard(task) for task in tasks], 1
+
+
+def merge_partials(partials):
+    """Складывает частичные агрегаты шардов"""
+    merged = {}
+    for partial in partials:
+        for key, values in partial.items():
+            total = merged.get(key)
+            if total is None:
+                merged[key] = list(values)
+            else:
+                for i, value in enumerate(values):
+                    total[i] += value
+    return merged
+
+
+def rollup(merged, group_of):
+    """Перегруппировывает агрегаты (танк, карта) по ключу group_of(tank, map); None - пропустить"""
+    groups = {}
+    for (tank, map_name), values in merged.items():
+        group = group_of(tank, map_name)
+        if group is None:
+            continue
+        total = groups.setdefault(group, [0, 0, 0, 0.0])
+        for i, value in enumerate(values):
+            total[i] += value
+    return groups
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Нечеткий поиск танков World of Tanks по имени
+
+Индекс строится один раз при загрузке графа: имя и короткое имя танка
+нормализуются (регистр, диакритика, кириллица -> латиница, без пробелов и знаков),
+и каждая триграмма ключа ссылается на имена, в которых встречается. Запрос
+разбирается на триграммы того же вида, кандидаты ранжируются по коэффициенту
+Жаккара без обхода графа, так что "B-C 25t", "bc 25 t" и "Б-Ц 25 т" находят B-C 25 t.
+Имена, совпадающие со знаками (T-34 и T34), различаются точным ключом; если запрос
+подходит к нескольким таким именам или похож меньше, чем на MIN_SCORE, танк не выбирается
+"""
+
+import time
+import unicodedata
+
+import numpy as np
+
+
+# Кириллица -> латиница (названия танков в данных записаны латиницей)
+TRANSLIT = str.maketrans({
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'ж': 'zh', 'з': 'z', 'и': 'i',
+    'й': 'i', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't',
+    'у': 'u', 'ф': 'f', 'х': 'h', 'ц': 'c', 'ч': 'ch', 'ш': 'sh', 'щ': 'sch', 'ъ': '', 'ы': 'y', 'ь': '',
+    'э': 'e', 'ю': 'yu', 'я': 'ya',
+})
+
+# Похожесть, начиная с которой движок подставляет кандидата вместо имени с опечаткой;
+# ниже - запрос не выполняется, печатаются кандидаты
+MIN_SCORE = 0.75
+
+
+def fold_name(text):
+    """Нижний регистр, без диакритики, латиницей; знаки сохраняются (T-34 и T34 - разные танки)"""
+    text = unicodedata.normalize('NFKD', str(text).lower().translate(TRANSLIT))
+    return ' '.join(''.join(char for char in text if not unicodedata.combining(char)).split())
+
+
+def normalize_name(text):
+    """Ключ имени для нечеткого поиска: как fold_name, но только буквы и цифры"""
+    return ''.join(char for char in fold_name(text) if char.isalnum())
+
+
+def trigrams(key):
+    """Триграммы ключа (с границами, чтобы короткие имена тоже давали триграммы)"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TankNameResolver:
+    """Инвертированный индекс триграмм по tankName/shortName танков"""
+
+    def __init__(self, names):
+        """names - пары (URI танка, имя); у танка может быть несколько имен"""
+        start_time = time.perf_counter()
+        # Точный ключ имени (со знаками) -> (написание, URI танков); одинаковые имена разных танков
+        # объединяются, а имена, различающиеся только знаками, остаются разными позициями
+        self.keys = []
+        self.spellings = []
+        self.tanks = []
+        self.exact = {}
+        self.positions = {}
+        for tank, name in names:
+            if not name:
+                continue
+            key = normalize_name(name)
+            if not key:
+                continue
+            exact = fold_name(name)
+            if exact not in self.exact:
+                self.exact[exact] = len(self.keys)
+                self.positions.setdefault(key, []).append(len(self.keys))
+                self.keys.append(key)
+                self.spellings.append(str(name))
+                self.tanks.append(set())
+            self.tanks[self.exact[exact]].add(tank)
+
+        sizes = []
+        postings = {}
+        for position, key in enumerate(self.keys):
+            grams = trigrams(key)
+            sizes.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(position)
+        # Списки имен триграмм - массивы: совпадения считаются одним bincount
+        self.sizes = np.array(sizes, dtype=np.float64)
+        self.postings = {gram: np.array(positions_list, dtype=np.int32) for gram, positions_list in postings.items()}
+        self.build_time = time.perf_counter() - start_time
+
+    def __len__(self):
+        return len(self.keys)
+
+    def candidates(self, name, limit=5):
+        """Кандидаты [(написание, URI танков, похожесть)] по убыванию похожести"""
+        key = normalize_name(name)
+        if not key:
+            return []
+        exact = [(self.spellings[position], self.tanks[position], 1.0)
+                 for position in sorted(self.positions.get(key, ()), key=lambda position: self.spellings[position])]
+        if len(exact) >= limit:
+            return exact[:limit]
+
+        grams = trigrams(key)
+        postings = [self.postings[gram] for gram in grams if gram in self.postings]
+        if not postings:
+            return exact
+        # Коэффициент Жаккара: общие триграммы / (триграммы запроса + имени - общие)
+        shared = np.bincount(np.concatenate(postings), minlength=len(self.keys)).astype(np.float64)
+        scores = shared / (len(grams) + self.sizes - shared)
+        scores[self.positions.get(key, [])] = 0.0
+        count = min(limit - len(exact), int(np.count_nonzero(scores)))
+        if count <= 0:
+            return exact
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = sorted(top.tolist(), key=lambda position: (-scores[position], self.spellings[position]))
+        return exact + [(self.spellings[position], self.tanks[position], float(scores[position])) for position in top]
+
+    def resolve(self, name, min_score=MIN_SCORE):
+        """(URI танков, написание, похожесть) танка с этим именем
+
+        (set(), None, похожесть), если лучший кандидат похож меньше min_score или не один
+        (T34 при танках T-34 и T34): вместо подстановки вызывающий показывает кандидатов
+        """
+        position = self.exact.get(fold_name(name))
+        if position is not None:
+            return set(self.tanks[position]), self.spellings[position], 1.0
+        best = self.candidates(name, limit=2)
+        if not best or best[0][2] < min_score or len(best) > 1 and best[1][2] == best[0][2]:
+            return set(), None, best[0][2] if best else 0.0
+        spelling, tanks, score = best[0]
+        return set(tanks), spelling, score
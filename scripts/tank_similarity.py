@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Поиск похожих танков по вектору характеристик
+
+Для каждого танка собирается вектор: DPM, пробитие, альфа-урон, время сведения,
+скорость, HP, удельная мощность, уровень и класс (one-hot); из нескольких модулей
+танка берутся орудие с наибольшим DPM и самый мощный двигатель. Числовые признаки
+нормируются (z-оценка, пропуски - медиана), квадраты норм строк считаются заранее,
+поэтому соседи танка находятся одним умножением матрицы на вектор:
+|x - q|^2 = |x|^2 + |q|^2 - 2 x·q. Фильтры (нация, уровень, класс, премиум)
+применяются масками, k ближайших выбираются через argpartition
+"""
+
+import time
+
+import numpy as np
+from rdflib import RDF
+
+from tank_names import TankNameResolver
+
+
+# Числовые признаки вектора танка
+FEATURES = ('dpm', 'penetration', 'alpha', 'aimTime', 'speed', 'hp', 'powerToWeight', 'tier')
+
+# Классы танков (one-hot часть вектора)
+TANK_CLASSES = ('HeavyTank', 'MediumTank', 'LightTank', 'TankDestroyer', 'SelfPropelledGun')
+
+# Вес класса: другой класс дает вклад 2 * CLASS_WEIGHT^2 в квадрат расстояния
+CLASS_WEIGHT = 1.0
+
+# Параметры фильтра similar()
+FILTERS = ('nation', 'other_nation', 'tier', 'max_tier_diff', 'tank_class', 'same_class', 'exclude_premium')
+
+
+def numeric_values(graph, predicate):
+    """Числовые значения предиката: субъект -> float"""
+    values = {}
+    for subject, value in graph.subject_objects(predicate):
+        value = value.toPython()
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[subject] = float(value)
+    return values
+
+
+def best_modules(graph, predicate, score):
+    """Лучший модуль каждого танка по score (модуль -> число); при равенстве - меньший URI
+
+    У танка несколько орудий и двигателей, а порядок обхода графа не определен: без явного
+    выбора признаки танка зависели бы от store и порядка загрузки
+    """
+    modules = {}
+    for tank, module in graph.subject_objects(predicate):
+        modules.setdefault(tank, []).append(module)
+    return {tank: min(candidates, key=lambda module: (-score.get(module, -np.inf), str(module)))
+            for tank, candidates in modules.items()}
+
+
+class TankFeatureIndex:
+    """Нормированная матрица признаков танков с заранее посчитанными нормами строк"""
+
+    def __init__(self):
+        self.tanks = []
+        self.tank_index = {}
+        self.names = []
+        self.resolver = TankNameResolver([])
+        self.nations = np.empty(0, dtype=object)
+        self.nation_keys = np.empty(0, dtype=object)
+        self.tiers = np.empty(0, dtype=np.float64)
+        self.classes = np.empty(0, dtype=object)
+        self.premium = np.empty(0, dtype=bool)
+        self.raw = np.empty((0, len(FEATURES)), dtype=np.float64)
+        self.matrix = np.empty((0, len(FEATURES) + len(TANK_CLASSES)), dtype=np.float64)
+        self.norms = np.empty(0, dtype=np.float64)
+        self.build_time = 0.0
+
+    def __len__(self):
+        return len(self.tanks)
+
+    def build(self, graph, namespace):
+        """Строит матрицу прямым чтением предикатов танков, модулей и характеристик"""
+        start_time = time.time()
+        classes = {}
+        for class_name in TANK_CLASSES:
+            for tank in graph.subjects(RDF.type, namespace[class_name]):
+                classes[tank] = class_name
+        # Танки из строк боев (без wot_data.csv) типизированы только классом
+        tanks = sorted(set(graph.subjects(RDF.type, namespace.Tank)) | set(classes), key=str)
+
+        names = {tank: str(name) for tank, name in graph.subject_objects(namespace.tankName)}
+        short_names = {tank: str(name) for tank, name in graph.subject_objects(namespace.shortName)}
+        nation_names = {nation: str(name) for nation, name in graph.subject_objects(namespace.nationName)}
+        nations = {tank: nation_names.get(nation, str(nation).split('#')[-1])
+                   for tank, nation in graph.subject_objects(namespace.belongsToNation)}
+        premium = {tank for tank, value in graph.subject_objects(namespace.isPremium) if value.toPython() is True}
+
+        characteristics = dict(graph.subject_objects(namespace.hasCharacteristics))
+        dpm = numeric_values(graph, namespace.dpm)
+        fire_rate = numeric_values(graph, namespace.fireRate)
+        alpha = numeric_values(graph, namespace.avgDamage)
+        penetration = numeric_values(graph, namespace.avgPenetration)
+        aim_time = numeric_values(graph, namespace.aimTime)
+        power = numeric_values(graph, namespace.power)
+        # Танк описывается лучшим орудием (по DPM) и самым мощным двигателем
+        for gun in fire_rate.keys() & alpha.keys() - dpm.keys():
+            dpm[gun] = fire_rate[gun] * alpha[gun]
+        guns = best_modules(graph, namespace.hasGun, dpm)
+        engines = best_modules(graph, namespace.hasEngine, power)
+        weight = numeric_values(graph, namespace.weight)
+        tier = numeric_values(graph, namespace.tier)
+        # В lean графе скорость и HP есть только у TankCharacteristics
+        speed = numeric_values(graph, namespace.speedForward)
+        hp = numeric_values(graph, namespace.hp)
+        max_hp = numeric_values(graph, namespace.maxHP)
+
+        raw = np.full((len(tanks), len(FEATURES)), np.nan)
+        for row, tank in enumerate(tanks):
+            gun, engine, ch = guns.get(tank), engines.get(tank), characteristics.get(tank)
+            tank_weight = weight.get(tank)
+            values = {
+                'dpm': dpm.get(gun),
+                'penetration': penetration.get(gun),
+                'alpha': alpha.get(gun),
+                'aimTime': aim_time.get(gun),
+                'speed': speed.get(ch, speed.get(tank)),
+                'hp': max_hp.get(tank, hp.get(ch)),
+                'powerToWeight': power[engine] / tank_weight if engine in power and tank_weight else None,
+                'tier': tier.get(tank),
+            }
+            for column, feature in enumerate(FEATURES):
+                if values[feature] is not None:
+                    raw[row, column] = values[feature]
+
+        self.tanks = [str(tank) for tank in tanks]
+        self.tank_index = {tank: row for row, tank in enumerate(self.tanks)}
+        self.names = [names.get(tank) or short_names.get(tank) or str(tank).split('#')[-1] for tank in tanks]
+        # Имена ищутся по танкам самого индекса: в нем есть и танки каталога без боев
+        self.resolver = TankNameResolver([(str(tank), name) for tank in tanks
+                                          for name in (names.get(tank), short_names.get(tank))])
+        self.nations = np.array([nations.get(tank) for tank in tanks], dtype=object)
+        self.nation_keys = np.array([str(nations.get(tank)).lower() for tank in tanks], dtype=object)
+        self.tiers = raw[:, FEATURES.index('tier')].copy()
+        self.classes = np.array([classes.get(tank) for tank in tanks], dtype=object)
+        self.premium = np.array([tank in premium for tank in tanks], dtype=bool)
+        self.raw = raw
+        self.normalize()
+        self.build_time = time.time() - start_time
+        return self
+
+    def normalize(self):
+        """z-оценки признаков (пропуск - медиана колонки), one-hot класса и нормы строк"""
+        numeric = self.raw.copy()
+        with np.errstate(invalid='ignore'):
+            medians = np.nanmedian(numeric, axis=0) if len(numeric) else np.zeros(len(FEATURES))
+        medians = np.where(np.isnan(medians), 0.0, medians)
+        numeric = np.where(np.isnan(numeric), medians, numeric)
+        std = numeric.std(axis=0) if len(numeric) else np.ones(len(FEATURES))
+        numeric = (numeric - numeric.mean(axis=0)) / np.where(std > 0, std, 1.0)
+
+        one_hot = np.zeros((len(self.tanks), len(TANK_CLASSES)))
+        for column, class_name in enumerate(TANK_CLASSES):
+            one_hot[self.classes == class_name, column] = CLASS_WEIGHT
+        self.matrix = np.ascontiguousarray(np.hstack([numeric, one_hot]))
+        self.norms = np.einsum('ij,ij->i', self.matrix, self.matrix)
+
+    def filter_mask(self, row, filters):
+        """Маска танков-кандидатов по фильтрам (сам танк исключается)"""
+        unknown = set(filters) - set(FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown similar-tank filters: {', '.join(sorted(unknown))}; "
+                             f"supported: {', '.join(FILTERS)}")
+        mask = np.ones(len(self.tanks), dtype=bool)
+        mask[row] = False
+        if filters.get('nation') is not None:
+            mask &= self.nation_keys == str(filters['nation']).lower()
+        if filters.get('other_nation'):
+            mask &= self.nations != self.nations[row]
+        if filters.get('tier') is not None:
+            mask &= self.tiers == float(filters['tier'])
+        if filters.get('max_tier_diff') is not None:
+            mask &= np.abs(self.tiers - self.tiers[row]) <= float(filters['max_tier_diff'])
+        if filters.get('tank_class') is not None:
+            mask &= self.classes == filters['tank_class']
+        if filters.get('same_class'):
+            mask &= self.classes == self.classes[row]
+        if filters.get('exclude_premium'):
+            mask &= ~self.premium
+        return mask
+
+    def similar(self, tank, k=10, filters=None):
+        """k ближайших танков к tank (URI) по евклидову расстоянию: [(URI, расстояние)]"""
+        row = self.tank_index[str(tank)]
+        query = self.matrix[row]
+        distances = self.norms + self.norms[row] - 2.0 * (self.matrix @ query)
+        mask = self.filter_mask(row, filters or {})
+        candidates = np.flatnonzero(mask)
+        if not len(candidates) or k <= 0:
+            return []
+        candidate_distances = distances[candidates]
+        k = min(k, len(candidates))
+        top = np.argpartition(candidate_distances, k - 1)[:k]
+        top = top[np.argsort(candidate_distances[top], kind='stable')]
+        # Погрешность округления может дать чуть отрицательный квадрат расстояния
+        return [(self.tanks[candidates[i]], float(np.sqrt(max(candidate_distances[i], 0.0)))) for i in top]
+
+    def attributes(self, tank):
+        """Имя, нация, уровень, класс и исходные признаки танка"""
+        row = self.tank_index[str(tank)]
+        record = {
+            'tankName': self.names[row],
+            'nation': self.nations[row],
+            'tankClass': self.classes[row],
+        }
+        for column, feature in enumerate(FEATURES):
+            value = self.raw[row, column]
+            record[feature] = None if np.isnan(value) else float(value)
+        return record
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Индекс троек графа знаний World of Tanks в файлах, открываемых через mmap
+
+Директория индекса: словарь термов (отсортированные записи N-Triples в terms.bin
+и смещения в term_offsets.npy) и три отсортированных массива идентификаторов
+троек spo.npy, pos.npy, osp.npy формы (3, N): каждая колонка непрерывна,
+поэтому бинарный поиск не копирует данные. Движок открывает их через np.memmap:
+при старте ничего не разбирается, страницы подгружаются по мере обращения,
+а несколько процессов на одной машине делят страницы через кеш ОС. Разобранные
+термы процесс держит только в ограниченных LRU кешах (TERM_CACHE_SIZE)
+"""
+
+import argparse
+import functools
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph
+from rdflib.plugins.stores.memory import Memory
+from rdflib.store import Store
+
+from graph_formats import load_graph
+from graph_partitions import is_partitioned, load_manifest, load_partition, nt_term, parse_nt_term
+from query_optimizer import GraphStatistics
+
+
+INDEX_FILE = 'index.json'
+INDEX_FORMAT = 1
+
+# Порядок колонок (строк массива (3, N)): номера позиций тройки (s=0, p=1, o=2)
+ORDERS = {
+    'spo': (0, 1, 2),
+    'pos': (1, 2, 0),
+    'osp': (2, 0, 1),
+}
+
+# Колонка массива для каждой позиции тройки
+POSITIONS = {name: tuple(order.index(position) for position in range(3)) for name, order in ORDERS.items()}
+
+# Строк массива, читаемых за одно обращение при обходе диапазона
+READ_BLOCK = 10000
+
+# Размер LRU кешей термов процесса: словарь остается в общих страницах mmap, в памяти процесса - только горячие термы
+TERM_CACHE_SIZE = 100000
+
+
+def is_triple_index(path):
+    """Путь указывает на индекс троек (директорию или ее index.json)"""
+    path = Path(path)
+    return (path / INDEX_FILE).exists() or path.name == INDEX_FILE
+
+
+def write_index(graph, directory):
+    """Записывает граф в директорию индекса, возвращает описание индекса"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    # Временные номера термов в порядке появления
+    terms = {}
+    triples = [tuple(terms.setdefault(term, len(terms)) for term in triple) for triple in graph]
+
+    # Идентификатор терма - номер его записи N-Triples в отсортированном словаре
+    texts = [nt_term(term).encode('utf-8') for term in terms]
+    order = sorted(range(len(texts)), key=texts.__getitem__)
+    rank = np.empty(len(texts), dtype=np.int64)
+    rank[order] = np.arange(len(texts))
+    dtype = np.int32 if len(texts) < 2 ** 31 else np.int64
+    triples = rank[np.array(triples, dtype=np.int64).reshape(-1, 3)].astype(dtype)
+
+    with open(directory / 'terms.bin', 'wb') as f:
+        for index in order:
+            f.write(texts[index])
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum([len(texts[index]) for index in order], out=offsets[1:])
+    np.save(directory / 'term_offsets.npy', offsets)
+
+    for name, columns in ORDERS.items():
+        array = triples[:, columns].T
+        array = array[:, np.lexsort((array[2], array[1], array[0]))]
+        np.save(directory / f"{name}.npy", np.ascontiguousarray(array))
+
+    index = {
+        'format': INDEX_FORMAT,
+        'triples': len(triples),
+        'terms': len(texts),
+        'namespaces': {prefix: str(uri) for prefix, uri in graph.namespaces()},
+        'statistics': GraphStatistics.from_graph(graph).to_dict(nt_term),
+    }
+    with open(directory / INDEX_FILE, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False)
+    return index
+
+
+class TripleIndexStore(Store):
+    """Store rdflib только для чтения поверх файлов индекса (np.memmap)"""
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, path):
+        super().__init__()
+        path = Path(path)
+        self.directory = path.parent if path.name == INDEX_FILE else path
+        with open(self.directory / INDEX_FILE, encoding='utf-8') as f:
+            self.index = json.load(f)
+        if self.index.get('format') != INDEX_FORMAT:
+            raise ValueError(f"Unsupported triple index format: {self.index.get('format')}")
+
+        # Обычные ndarray поверх отображенных файлов: без накладных расходов подкласса memmap
+        self.offsets = np.asarray(np.load(self.directory / 'term_offsets.npy', mmap_mode='r'))
+        self.term_bytes = np.asarray(np.memmap(self.directory / 'terms.bin', dtype=np.uint8, mode='r'))
+        self.arrays = {name: np.asarray(np.load(self.directory / f"{name}.npy", mmap_mode='r'))
+                       for name in ORDERS}
+
+        # Разобранные термы и найденные идентификаторы кешируются в ограниченных LRU кешах
+        self.term = functools.lru_cache(maxsize=TERM_CACHE_SIZE)(self.decode_term)
+        self.term_id = functools.lru_cache(maxsize=TERM_CACHE_SIZE)(self.find_term_id)
+
+        # Префиксы хранятся отдельно, в маленьком store в памяти
+        self.namespace_store = Memory()
+        for prefix, uri in self.index['namespaces'].items():
+            self.namespace_store.bind(prefix, uri)
+
+    def __len__(self, context=None):
+        return self.index['triples']
+
+    def statistics(self):
+        """Статистика кардинальностей, сохраненная при записи индекса"""
+        parsed = {}
+        return GraphStatistics.from_dict(self.index['statistics'], lambda text: parse_nt_term(text, parsed))
+
+    def term_text(self, term_id):
+        """Запись N-Triples терма по идентификатору"""
+        return self.term_bytes[self.offsets[term_id]:self.offsets[term_id + 1]].tobytes()
+
+    def decode_term(self, term_id):
+        """Терм rdflib по идентификатору (через кеш self.term)"""
+        return parse_nt_term(self.term_text(term_id).decode('utf-8'), {})
+
+    def find_term_id(self, term):
+        """Идентификатор терма бинарным поиском по словарю (через кеш self.term_id); None, если терма нет"""
+        key = nt_term(term).encode('utf-8')
+        low, high = 0, len(self.offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self.term_text(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < len(self.offsets) - 1 and self.term_text(low) == key else None
+
+    @staticmethod
+    def match_range(array, key):
+        """Диапазон позиций отсортированного массива (3, N) с префиксом key"""
+        start, stop = 0, array.shape[1]
+        for column, value in enumerate(key):
+            values = array[column, start:stop]
+            # Значение того же типа, что и массив: иначе searchsorted приводит (копирует) массив
+            value = array.dtype.type(value)
+            start, stop = (start + int(np.searchsorted(values, value, side='left')),
+                           start + int(np.searchsorted(values, value, side='right')))
+            if start == stop:
+                break
+        return start, stop
+
+    def triples(self, triple_pattern, context=None):
+        """Тройки шаблона: выбор массива по связанным позициям и бинарный поиск диапазона"""
+        ids = []
+        for term in triple_pattern:
+            term_id = self.term_id(term) if term is not None else None
+            if term is not None and term_id is None:
+                return
+            ids.append(term_id)
+        s, p, o = ids
+
+        if s is not None and p is None and o is not None:
+            name, key = 'osp', (o, s)
+        elif s is not None:
+            name, key = 'spo', (s,) if p is None else ((s, p) if o is None else (s, p, o))
+        elif p is not None:
+            name, key = 'pos', (p,) if o is None else (p, o)
+        elif o is not None:
+            name, key = 'osp', (o,)
+        else:
+            name, key = 'spo', ()
+
+        array = self.arrays[name]
+        s_column, p_column, o_column = POSITIONS[name]
+        start, stop = self.match_range(array, key)
+        term = self.term
+        for block_start in range(start, stop, READ_BLOCK):
+            block = array[:, block_start:min(block_start + READ_BLOCK, stop)]
+            for s_id, p_id, o_id in zip(block[s_column].tolist(), block[p_column].tolist(), block[o_column].tolist()):
+                yield (term(s_id), term(p_id), term(o_id)), iter(())
+
+    def add(self, triple, context, quoted=False):
+        raise TypeError("Triple index store is read-only")
+
+    def addN(self, quads):
+        raise TypeError("Triple index store is read-only")
+
+    def remove(self, triple, context=None):
+        raise TypeError("Triple index store is read-only")
+
+    def contexts(self, triple=None):
+        return iter(())
+
+    def bind(self, prefix, namespace, override=True):
+        self.namespace_store.bind(prefix, namespace, override=override)
+
+    def prefix(self, namespace):
+        return self.namespace_store.prefix(namespace)
+
+    def namespace(self, prefix):
+        return self.namespace_store.namespace(prefix)
+
+    def namespaces(self):
+        return self.namespace_store.namespaces()
+
+
+def load_source(path):
+    """Загружает граф для индекса: файл любого формата graph_formats или партиционированную директорию"""
+    graph = Graph()
+    path = Path(path)
+    if is_partitioned(path):
+        directory, manifest = load_manifest(path)
+        for prefix, uri in manifest['namespaces'].items():
+            graph.bind(prefix, uri, override=False)
+        for partition in manifest['partitions']:
+            load_partition(graph, directory / partition['file'])
+    else:
+        load_graph(graph, path)
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a memory-mapped triple index from a WoT graph')
+    parser.add_argument('source', type=str,
+                        help='Graph to index: .owl, .nt, .ttl, .nq (optionally .gz/.zst) or partitioned graph directory')
+    parser.add_argument('output', type=str,
+                        help='Index directory (open it with query_ontology.py --ontology)')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BUILDING TRIPLE INDEX")
+    print("=" * 60)
+
+    start_time = time.time()
+    print(f"\n📂 Loading graph: {args.source}")
+    graph = load_source(args.source)
+    load_time = time.time() - start_time
+    print(f"  ✅ Loaded {len(graph):,} triples in {load_time:.2f} seconds")
+
+    start_time = time.time()
+    index = write_index(graph, args.output)
+    output = Path(args.output)
+    size = sum(f.stat().st_size for f in output.iterdir())
+    print(f"  ✅ Index: {output} ({index['triples']:,} triples, {index['terms']:,} terms) "
+          f"in {time.time() - start_time:.2f} seconds")
+    print(f"  📦 Total size: {size / (1024 * 1024):.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
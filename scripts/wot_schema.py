@@ -0,0 +1,782 @@
+#!/usr/bin/env python3
+"""
+Схема онтологии World of Tanks (сгенерировано create_ontology.py, не редактировать)
+
+Константы классов и свойств (WOT - закрытый namespace: опечатка в имени термина
+дает AttributeError), domain/range свойств и триплеты схемы в N-Triples,
+которые импортер добавляет в граф без разбора wot_ontology.owl
+"""
+
+from rdflib import Namespace, URIRef
+from rdflib.namespace import XSD, DefinedNamespace
+
+
+class WOT(DefinedNamespace):
+    _NS = Namespace("http://www.semanticweb.org/ontology/wot#")
+    _fail = True
+
+    Battle: URIRef
+    BattlePerformance: URIRef
+    China: URIRef
+    Czech: URIRef
+    Engine: URIRef
+    France: URIRef
+    Germany: URIRef
+    Gun: URIRef
+    HeavyTank: URIRef
+    Italy: URIRef
+    Japan: URIRef
+    LightTank: URIRef
+    MediumTank: URIRef
+    Module: URIRef
+    Nation: URIRef
+    Player: URIRef
+    Poland: URIRef
+    Radio: URIRef
+    SelfPropelledGun: URIRef
+    Suspension: URIRef
+    Sweden: URIRef
+    Tank: URIRef
+    TankCharacteristics: URIRef
+    TankDestroyer: URIRef
+    TankRole: URIRef
+    Turret: URIRef
+    UK: URIRef
+    USA: URIRef
+    USSR: URIRef
+    achievedBy: URIRef
+    achieves: URIRef
+    aimTime: URIRef
+    avgDamage: URIRef
+    avgPenetration: URIRef
+    avgXP: URIRef
+    baseCapturePoints: URIRef
+    baseDefensePoints: URIRef
+    baseXP: URIRef
+    battleTime: URIRef
+    belongsToNation: URIRef
+    compatibleWith: URIRef
+    damage: URIRef
+    damageBlocked: URIRef
+    damageReceived: URIRef
+    damageReceivedFromInvisible: URIRef
+    directHits: URIRef
+    displayName: URIRef
+    distanceTraveled: URIRef
+    dpm: URIRef
+    duration: URIRef
+    engineName: URIRef
+    equipsWith: URIRef
+    fireRate: URIRef
+    frags: URIRef
+    graphProfile: URIRef
+    gunName: URIRef
+    hasCharacteristics: URIRef
+    hasEngine: URIRef
+    hasGun: URIRef
+    hasPerformance: URIRef
+    hasRadio: URIRef
+    hasRole: URIRef
+    hasSuspension: URIRef
+    hasTurret: URIRef
+    hitsReceived: URIRef
+    hp: URIRef
+    hullHP: URIRef
+    hullWeight: URIRef
+    inBattle: URIRef
+    installedOn: URIRef
+    isGift: URIRef
+    isPremium: URIRef
+    isWheeled: URIRef
+    lifeTime: URIRef
+    maxHP: URIRef
+    nationCode: URIRef
+    nationName: URIRef
+    onMap: URIRef
+    participatesIn: URIRef
+    penetrations: URIRef
+    penetrationsReceived: URIRef
+    platoon: URIRef
+    playerPlatoon: URIRef
+    playerSpawn: URIRef
+    playerWon: URIRef
+    plays: URIRef
+    potentialDamageReceived: URIRef
+    power: URIRef
+    priceCredit: URIRef
+    priceGold: URIRef
+    priceXP: URIRef
+    roleDescription: URIRef
+    roleName: URIRef
+    shortName: URIRef
+    shotsFired: URIRef
+    sniperDamage: URIRef
+    spawn: URIRef
+    speedBackward: URIRef
+    speedForward: URIRef
+    splashHitsReceived: URIRef
+    spots: URIRef
+    spottingAssist: URIRef
+    tankId: URIRef
+    tankName: URIRef
+    tier: URIRef
+    totalBattles: URIRef
+    trackingAssist: URIRef
+    weight: URIRef
+    winRate: URIRef
+    winnerSpawn: URIRef
+    withTank: URIRef
+    won: URIRef
+
+
+CLASSES = ['Battle', 'BattlePerformance', 'Engine', 'Gun', 'HeavyTank', 'LightTank', 'MediumTank', 'Module', 'Nation', 'Player', 'Radio', 'SelfPropelledGun', 'Suspension', 'Tank', 'TankCharacteristics', 'TankDestroyer', 'TankRole', 'Turret']
+
+# Свойство -> (классы domain, range)
+OBJECT_PROPERTIES = {
+    'achievedBy': (('BattlePerformance',), ('Player',)),
+    'achieves': (('Player',), ('BattlePerformance',)),
+    'belongsToNation': (('Tank',), ('Nation',)),
+    'compatibleWith': (('Module',), ('Tank',)),
+    'equipsWith': (('Tank',), ('Module',)),
+    'hasCharacteristics': (('Tank',), ('TankCharacteristics',)),
+    'hasEngine': (('Tank',), ('Engine',)),
+    'hasGun': (('Tank',), ('Gun',)),
+    'hasPerformance': (('Battle',), ('BattlePerformance',)),
+    'hasRadio': (('Tank',), ('Radio',)),
+    'hasRole': (('Tank',), ('TankRole',)),
+    'hasSuspension': (('Tank',), ('Suspension',)),
+    'hasTurret': (('Tank',), ('Turret',)),
+    'inBattle': (('BattlePerformance',), ('Battle',)),
+    'installedOn': (('Module',), ('Tank',)),
+    'participatesIn': (('Player',), ('Battle',)),
+    'plays': (('Player',), ('Tank',)),
+    'withTank': (('BattlePerformance',), ('Tank',)),
+}
+
+DATATYPE_PROPERTIES = {
+    'aimTime': (('Gun',), (XSD.float,)),
+    'avgDamage': (('Gun', 'Player'), (XSD.float, XSD.integer,)),
+    'avgPenetration': (('Gun',), (XSD.integer,)),
+    'avgXP': (('Player',), (XSD.float,)),
+    'baseCapturePoints': (('BattlePerformance',), (XSD.integer,)),
+    'baseDefensePoints': (('BattlePerformance',), (XSD.integer,)),
+    'baseXP': (('BattlePerformance',), (XSD.integer,)),
+    'battleTime': (('Battle',), (XSD.dateTime,)),
+    'damage': (('BattlePerformance',), (XSD.integer,)),
+    'damageBlocked': (('BattlePerformance',), (XSD.integer,)),
+    'damageReceived': (('BattlePerformance',), (XSD.integer,)),
+    'damageReceivedFromInvisible': (('BattlePerformance',), (XSD.integer,)),
+    'directHits': (('BattlePerformance',), (XSD.integer,)),
+    'displayName': (('Player',), (XSD.string,)),
+    'distanceTraveled': (('BattlePerformance',), (XSD.integer,)),
+    'dpm': (('Gun',), (XSD.integer,)),
+    'duration': (('Battle',), (XSD.integer,)),
+    'engineName': (('Engine',), (XSD.string,)),
+    'fireRate': (('Gun',), (XSD.float,)),
+    'frags': (('BattlePerformance',), (XSD.integer,)),
+    'gunName': (('Gun',), (XSD.string,)),
+    'hitsReceived': (('BattlePerformance',), (XSD.integer,)),
+    'hp': (('TankCharacteristics',), (XSD.integer,)),
+    'hullHP': (('TankCharacteristics',), (XSD.integer,)),
+    'hullWeight': (('TankCharacteristics',), (XSD.integer,)),
+    'isGift': (('Tank',), (XSD.boolean,)),
+    'isPremium': (('Tank',), (XSD.boolean,)),
+    'isWheeled': (('Tank',), (XSD.boolean,)),
+    'lifeTime': (('BattlePerformance',), (XSD.integer,)),
+    'maxHP': (('Tank',), (XSD.integer,)),
+    'nationCode': (('Nation',), (XSD.string,)),
+    'nationName': (('Nation',), (XSD.string,)),
+    'onMap': (('Battle',), (XSD.string,)),
+    'penetrations': (('BattlePerformance',), (XSD.integer,)),
+    'penetrationsReceived': (('BattlePerformance',), (XSD.integer,)),
+    'platoon': (('Battle',), (XSD.integer,)),
+    'playerPlatoon': (('BattlePerformance',), (XSD.integer,)),
+    'playerSpawn': (('BattlePerformance',), (XSD.integer,)),
+    'playerWon': (('BattlePerformance',), (XSD.boolean,)),
+    'potentialDamageReceived': (('BattlePerformance',), (XSD.integer,)),
+    'power': (('Engine',), (XSD.integer,)),
+    'priceCredit': (('Tank',), (XSD.integer,)),
+    'priceGold': (('Tank',), (XSD.integer,)),
+    'priceXP': (('Tank',), (XSD.integer,)),
+    'roleDescription': (('TankRole',), (XSD.string,)),
+    'roleName': (('TankRole',), (XSD.string,)),
+    'shortName': (('Tank',), (XSD.string,)),
+    'shotsFired': (('BattlePerformance',), (XSD.integer,)),
+    'sniperDamage': (('BattlePerformance',), (XSD.integer,)),
+    'spawn': (('Battle',), (XSD.integer,)),
+    'speedBackward': (('TankCharacteristics',), (XSD.integer,)),
+    'speedForward': (('TankCharacteristics',), (XSD.integer,)),
+    'splashHitsReceived': (('BattlePerformance',), (XSD.integer,)),
+    'spots': (('BattlePerformance',), (XSD.integer,)),
+    'spottingAssist': (('BattlePerformance',), (XSD.integer,)),
+    'tankId': (('Tank',), (XSD.integer,)),
+    'tankName': (('Tank',), (XSD.string,)),
+    'tier': (('Tank',), (XSD.integer,)),
+    'totalBattles': (('Player',), (XSD.integer,)),
+    'trackingAssist': (('BattlePerformance',), (XSD.integer,)),
+    'weight': (('Tank',), (XSD.integer,)),
+    'winRate': (('Player',), (XSD.float,)),
+    'winnerSpawn': (('Battle',), (XSD.integer,)),
+    'won': (('Battle',), (XSD.boolean,)),
+}
+
+NAMESPACES = {'owl': 'http://www.w3.org/2002/07/owl#', 'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#', 'rdfs': 'http://www.w3.org/2000/01/rdf-schema#', 'xsd': 'http://www.w3.org/2001/XMLSchema#', 'wot': 'http://www.semanticweb.org/ontology/wot#'}
+
+# Триплеты схемы (строки N-Triples)
+SCHEMA_TRIPLES = (
+    '<http://www.semanticweb.org/ontology/wot#Battle> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Battle> <http://www.w3.org/2000/01/rdf-schema#comment> "Single battle/match"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Battle> <http://www.w3.org/2000/01/rdf-schema#comment> "Отдельный бой"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Battle> <http://www.w3.org/2000/01/rdf-schema#label> "Battle"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Battle> <http://www.w3.org/2000/01/rdf-schema#label> "Бой"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#BattlePerformance> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#BattlePerformance> <http://www.w3.org/2000/01/rdf-schema#comment> "Player performance in a specific battle"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#BattlePerformance> <http://www.w3.org/2000/01/rdf-schema#comment> "Результативность игрока в конкретном бою"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#BattlePerformance> <http://www.w3.org/2000/01/rdf-schema#label> "Battle Performance"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#BattlePerformance> <http://www.w3.org/2000/01/rdf-schema#label> "Результат боя"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#China> <http://www.semanticweb.org/ontology/wot#nationCode> "china" .\n',
+    '<http://www.semanticweb.org/ontology/wot#China> <http://www.semanticweb.org/ontology/wot#nationName> "China" .\n',
+    '<http://www.semanticweb.org/ontology/wot#China> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#China> <http://www.w3.org/2000/01/rdf-schema#label> "China"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#China> <http://www.w3.org/2000/01/rdf-schema#label> "Китай"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Czech> <http://www.semanticweb.org/ontology/wot#nationCode> "czech" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Czech> <http://www.semanticweb.org/ontology/wot#nationName> "Czech" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Czech> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Czech> <http://www.w3.org/2000/01/rdf-schema#label> "Czech"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Czech> <http://www.w3.org/2000/01/rdf-schema#label> "Чехословакия"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Engine> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Engine> <http://www.w3.org/2000/01/rdf-schema#label> "Engine"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Engine> <http://www.w3.org/2000/01/rdf-schema#label> "Двигатель"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Engine> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Module> .\n',
+    '<http://www.semanticweb.org/ontology/wot#France> <http://www.semanticweb.org/ontology/wot#nationCode> "france" .\n',
+    '<http://www.semanticweb.org/ontology/wot#France> <http://www.semanticweb.org/ontology/wot#nationName> "France" .\n',
+    '<http://www.semanticweb.org/ontology/wot#France> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#France> <http://www.w3.org/2000/01/rdf-schema#label> "France"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#France> <http://www.w3.org/2000/01/rdf-schema#label> "Франция"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Germany> <http://www.semanticweb.org/ontology/wot#nationCode> "germany" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Germany> <http://www.semanticweb.org/ontology/wot#nationName> "Germany" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Germany> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Germany> <http://www.w3.org/2000/01/rdf-schema#label> "Germany"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Germany> <http://www.w3.org/2000/01/rdf-schema#label> "Германия"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Gun> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Gun> <http://www.w3.org/2000/01/rdf-schema#label> "Gun"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Gun> <http://www.w3.org/2000/01/rdf-schema#label> "Орудие"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Gun> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Module> .\n',
+    '<http://www.semanticweb.org/ontology/wot#HeavyTank> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#HeavyTank> <http://www.w3.org/2000/01/rdf-schema#label> "Heavy Tank"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#HeavyTank> <http://www.w3.org/2000/01/rdf-schema#label> "Тяжелый танк"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#HeavyTank> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Italy> <http://www.semanticweb.org/ontology/wot#nationCode> "italy" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Italy> <http://www.semanticweb.org/ontology/wot#nationName> "Italy" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Italy> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Italy> <http://www.w3.org/2000/01/rdf-schema#label> "Italy"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Italy> <http://www.w3.org/2000/01/rdf-schema#label> "Италия"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Japan> <http://www.semanticweb.org/ontology/wot#nationCode> "japan" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Japan> <http://www.semanticweb.org/ontology/wot#nationName> "Japan" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Japan> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Japan> <http://www.w3.org/2000/01/rdf-schema#label> "Japan"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Japan> <http://www.w3.org/2000/01/rdf-schema#label> "Япония"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#LightTank> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#LightTank> <http://www.w3.org/2000/01/rdf-schema#label> "Light Tank"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#LightTank> <http://www.w3.org/2000/01/rdf-schema#label> "Легкий танк"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#LightTank> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#MediumTank> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#MediumTank> <http://www.w3.org/2000/01/rdf-schema#label> "Medium Tank"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#MediumTank> <http://www.w3.org/2000/01/rdf-schema#label> "Средний танк"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#MediumTank> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Module> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Module> <http://www.w3.org/2000/01/rdf-schema#comment> "Tank equipment module"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Module> <http://www.w3.org/2000/01/rdf-schema#comment> "Модуль оборудования танка"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Module> <http://www.w3.org/2000/01/rdf-schema#label> "Module"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Module> <http://www.w3.org/2000/01/rdf-schema#label> "Модуль"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Nation> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Nation> <http://www.w3.org/2000/01/rdf-schema#comment> "Country that produced the tank"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Nation> <http://www.w3.org/2000/01/rdf-schema#comment> "Страна-производитель танка"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Nation> <http://www.w3.org/2000/01/rdf-schema#label> "Nation"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Nation> <http://www.w3.org/2000/01/rdf-schema#label> "Нация"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Player> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Player> <http://www.w3.org/2000/01/rdf-schema#comment> "Game player"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Player> <http://www.w3.org/2000/01/rdf-schema#comment> "Игрок"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Player> <http://www.w3.org/2000/01/rdf-schema#label> "Player"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Player> <http://www.w3.org/2000/01/rdf-schema#label> "Игрок"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Poland> <http://www.semanticweb.org/ontology/wot#nationCode> "poland" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Poland> <http://www.semanticweb.org/ontology/wot#nationName> "Poland" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Poland> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Poland> <http://www.w3.org/2000/01/rdf-schema#label> "Poland"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Poland> <http://www.w3.org/2000/01/rdf-schema#label> "Польша"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Radio> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Radio> <http://www.w3.org/2000/01/rdf-schema#label> "Radio"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Radio> <http://www.w3.org/2000/01/rdf-schema#label> "Радиостанция"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Radio> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Module> .\n',
+    '<http://www.semanticweb.org/ontology/wot#SelfPropelledGun> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#SelfPropelledGun> <http://www.w3.org/2000/01/rdf-schema#label> "Self-Propelled Gun"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#SelfPropelledGun> <http://www.w3.org/2000/01/rdf-schema#label> "САУ"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#SelfPropelledGun> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Suspension> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Suspension> <http://www.w3.org/2000/01/rdf-schema#label> "Suspension"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Suspension> <http://www.w3.org/2000/01/rdf-schema#label> "Подвеска"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Suspension> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Module> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Sweden> <http://www.semanticweb.org/ontology/wot#nationCode> "sweden" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Sweden> <http://www.semanticweb.org/ontology/wot#nationName> "Sweden" .\n',
+    '<http://www.semanticweb.org/ontology/wot#Sweden> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Sweden> <http://www.w3.org/2000/01/rdf-schema#label> "Sweden"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Sweden> <http://www.w3.org/2000/01/rdf-schema#label> "Швеция"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Tank> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Tank> <http://www.w3.org/2000/01/rdf-schema#comment> "Main vehicle in the game"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Tank> <http://www.w3.org/2000/01/rdf-schema#comment> "Основное боевое средство в игре"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Tank> <http://www.w3.org/2000/01/rdf-schema#label> "Tank"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Tank> <http://www.w3.org/2000/01/rdf-schema#label> "Танк"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankCharacteristics> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankCharacteristics> <http://www.w3.org/2000/01/rdf-schema#comment> "Technical characteristics of a tank"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankCharacteristics> <http://www.w3.org/2000/01/rdf-schema#comment> "Технические характеристики танка"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankCharacteristics> <http://www.w3.org/2000/01/rdf-schema#label> "Tank Characteristics"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankCharacteristics> <http://www.w3.org/2000/01/rdf-schema#label> "Характеристики танка"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankDestroyer> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankDestroyer> <http://www.w3.org/2000/01/rdf-schema#label> "Tank Destroyer"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankDestroyer> <http://www.w3.org/2000/01/rdf-schema#label> "ПТ-САУ"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankDestroyer> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankRole> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankRole> <http://www.w3.org/2000/01/rdf-schema#comment> "Role of tank in battle"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankRole> <http://www.w3.org/2000/01/rdf-schema#comment> "Роль танка в бою"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankRole> <http://www.w3.org/2000/01/rdf-schema#label> "Tank Role"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#TankRole> <http://www.w3.org/2000/01/rdf-schema#label> "Роль танка"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Turret> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Class> .\n',
+    '<http://www.semanticweb.org/ontology/wot#Turret> <http://www.w3.org/2000/01/rdf-schema#label> "Turret"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#Turret> <http://www.w3.org/2000/01/rdf-schema#label> "Башня"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#Turret> <http://www.w3.org/2000/01/rdf-schema#subClassOf> <http://www.semanticweb.org/ontology/wot#Module> .\n',
+    '<http://www.semanticweb.org/ontology/wot#UK> <http://www.semanticweb.org/ontology/wot#nationCode> "uk" .\n',
+    '<http://www.semanticweb.org/ontology/wot#UK> <http://www.semanticweb.org/ontology/wot#nationName> "UK" .\n',
+    '<http://www.semanticweb.org/ontology/wot#UK> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#UK> <http://www.w3.org/2000/01/rdf-schema#label> "UK"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#UK> <http://www.w3.org/2000/01/rdf-schema#label> "Великобритания"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#USA> <http://www.semanticweb.org/ontology/wot#nationCode> "usa" .\n',
+    '<http://www.semanticweb.org/ontology/wot#USA> <http://www.semanticweb.org/ontology/wot#nationName> "USA" .\n',
+    '<http://www.semanticweb.org/ontology/wot#USA> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#USA> <http://www.w3.org/2000/01/rdf-schema#label> "USA"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#USA> <http://www.w3.org/2000/01/rdf-schema#label> "США"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#USSR> <http://www.semanticweb.org/ontology/wot#nationCode> "ussr" .\n',
+    '<http://www.semanticweb.org/ontology/wot#USSR> <http://www.semanticweb.org/ontology/wot#nationName> "USSR" .\n',
+    '<http://www.semanticweb.org/ontology/wot#USSR> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#USSR> <http://www.w3.org/2000/01/rdf-schema#label> "USSR"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#USSR> <http://www.w3.org/2000/01/rdf-schema#label> "СССР"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#achievedBy> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#achievedBy> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#achievedBy> <http://www.w3.org/2000/01/rdf-schema#label> "achieved by"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#achievedBy> <http://www.w3.org/2000/01/rdf-schema#label> "достигнут игроком"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#achievedBy> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#achieves> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#achieves> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#achieves> <http://www.w3.org/2000/01/rdf-schema#label> "achieves"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#achieves> <http://www.w3.org/2000/01/rdf-schema#label> "достигает"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#achieves> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#aimTime> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#aimTime> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Gun> .\n',
+    '<http://www.semanticweb.org/ontology/wot#aimTime> <http://www.w3.org/2000/01/rdf-schema#label> "aim time"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#aimTime> <http://www.w3.org/2000/01/rdf-schema#label> "время сведения"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#aimTime> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#float> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgDamage> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgDamage> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Gun> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgDamage> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgDamage> <http://www.w3.org/2000/01/rdf-schema#label> "average damage"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgDamage> <http://www.w3.org/2000/01/rdf-schema#label> "средний урон"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgDamage> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#float> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgDamage> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgPenetration> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgPenetration> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Gun> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgPenetration> <http://www.w3.org/2000/01/rdf-schema#label> "average penetration"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgPenetration> <http://www.w3.org/2000/01/rdf-schema#label> "среднее пробитие"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgPenetration> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgXP> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgXP> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgXP> <http://www.w3.org/2000/01/rdf-schema#label> "average XP"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgXP> <http://www.w3.org/2000/01/rdf-schema#label> "средний опыт"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#avgXP> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#float> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseCapturePoints> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseCapturePoints> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseCapturePoints> <http://www.w3.org/2000/01/rdf-schema#label> "base capture points"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseCapturePoints> <http://www.w3.org/2000/01/rdf-schema#label> "очки захвата базы"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseCapturePoints> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseDefensePoints> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseDefensePoints> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseDefensePoints> <http://www.w3.org/2000/01/rdf-schema#label> "base defense points"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseDefensePoints> <http://www.w3.org/2000/01/rdf-schema#label> "очки защиты базы"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseDefensePoints> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseXP> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseXP> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseXP> <http://www.w3.org/2000/01/rdf-schema#label> "base XP"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseXP> <http://www.w3.org/2000/01/rdf-schema#label> "базовый опыт"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#baseXP> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#battleTime> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#battleTime> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#battleTime> <http://www.w3.org/2000/01/rdf-schema#label> "battle time"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#battleTime> <http://www.w3.org/2000/01/rdf-schema#label> "время боя"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#battleTime> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#dateTime> .\n',
+    '<http://www.semanticweb.org/ontology/wot#belongsToNation> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#belongsToNation> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#belongsToNation> <http://www.w3.org/2000/01/rdf-schema#label> "belongs to nation"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#belongsToNation> <http://www.w3.org/2000/01/rdf-schema#label> "принадлежит нации"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#belongsToNation> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#compatibleWith> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#compatibleWith> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Module> .\n',
+    '<http://www.semanticweb.org/ontology/wot#compatibleWith> <http://www.w3.org/2000/01/rdf-schema#label> "compatible with"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#compatibleWith> <http://www.w3.org/2000/01/rdf-schema#label> "совместим с"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#compatibleWith> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damage> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damage> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damage> <http://www.w3.org/2000/01/rdf-schema#label> "damage"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#damage> <http://www.w3.org/2000/01/rdf-schema#label> "нанесенный урон"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#damage> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageBlocked> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageBlocked> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageBlocked> <http://www.w3.org/2000/01/rdf-schema#label> "damage blocked"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageBlocked> <http://www.w3.org/2000/01/rdf-schema#label> "заблокированный урон"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageBlocked> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceived> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceived> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceived> <http://www.w3.org/2000/01/rdf-schema#label> "damage received"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceived> <http://www.w3.org/2000/01/rdf-schema#label> "полученный урон"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceived> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceivedFromInvisible> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceivedFromInvisible> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceivedFromInvisible> <http://www.w3.org/2000/01/rdf-schema#label> "damage from invisible"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceivedFromInvisible> <http://www.w3.org/2000/01/rdf-schema#label> "урон от невидимых"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#damageReceivedFromInvisible> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#directHits> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#directHits> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#directHits> <http://www.w3.org/2000/01/rdf-schema#label> "direct hits"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#directHits> <http://www.w3.org/2000/01/rdf-schema#label> "попаданий"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#directHits> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#displayName> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#displayName> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#displayName> <http://www.w3.org/2000/01/rdf-schema#label> "display name"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#displayName> <http://www.w3.org/2000/01/rdf-schema#label> "никнейм"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#displayName> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#distanceTraveled> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#distanceTraveled> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#distanceTraveled> <http://www.w3.org/2000/01/rdf-schema#label> "distance traveled"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#distanceTraveled> <http://www.w3.org/2000/01/rdf-schema#label> "пройденное расстояние"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#distanceTraveled> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#dpm> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#dpm> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Gun> .\n',
+    '<http://www.semanticweb.org/ontology/wot#dpm> <http://www.w3.org/2000/01/rdf-schema#label> "DPM"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#dpm> <http://www.w3.org/2000/01/rdf-schema#label> "урон в минуту"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#dpm> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#duration> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#duration> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#duration> <http://www.w3.org/2000/01/rdf-schema#label> "duration"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#duration> <http://www.w3.org/2000/01/rdf-schema#label> "продолжительность"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#duration> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#engineName> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#engineName> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Engine> .\n',
+    '<http://www.semanticweb.org/ontology/wot#engineName> <http://www.w3.org/2000/01/rdf-schema#label> "engine name"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#engineName> <http://www.w3.org/2000/01/rdf-schema#label> "название двигателя"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#engineName> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#equipsWith> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#equipsWith> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#equipsWith> <http://www.w3.org/2000/01/rdf-schema#label> "equips with"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#equipsWith> <http://www.w3.org/2000/01/rdf-schema#label> "оснащен"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#equipsWith> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Module> .\n',
+    '<http://www.semanticweb.org/ontology/wot#fireRate> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#fireRate> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Gun> .\n',
+    '<http://www.semanticweb.org/ontology/wot#fireRate> <http://www.w3.org/2000/01/rdf-schema#label> "fire rate"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#fireRate> <http://www.w3.org/2000/01/rdf-schema#label> "скорострельность"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#fireRate> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#float> .\n',
+    '<http://www.semanticweb.org/ontology/wot#frags> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#frags> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#frags> <http://www.w3.org/2000/01/rdf-schema#label> "frags"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#frags> <http://www.w3.org/2000/01/rdf-schema#label> "уничтожено"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#frags> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#graphProfile> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#AnnotationProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#graphProfile> <http://www.w3.org/2000/01/rdf-schema#label> "graph profile"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#graphProfile> <http://www.w3.org/2000/01/rdf-schema#label> "профиль графа"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#gunName> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#gunName> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Gun> .\n',
+    '<http://www.semanticweb.org/ontology/wot#gunName> <http://www.w3.org/2000/01/rdf-schema#label> "gun name"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#gunName> <http://www.w3.org/2000/01/rdf-schema#label> "название орудия"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#gunName> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasCharacteristics> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasCharacteristics> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasCharacteristics> <http://www.w3.org/2000/01/rdf-schema#label> "has characteristics"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasCharacteristics> <http://www.w3.org/2000/01/rdf-schema#label> "имеет характеристики"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasCharacteristics> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#TankCharacteristics> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasEngine> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasEngine> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasEngine> <http://www.w3.org/2000/01/rdf-schema#label> "has engine"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasEngine> <http://www.w3.org/2000/01/rdf-schema#label> "имеет двигатель"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasEngine> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Engine> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasGun> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasGun> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasGun> <http://www.w3.org/2000/01/rdf-schema#label> "has gun"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasGun> <http://www.w3.org/2000/01/rdf-schema#label> "имеет орудие"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasGun> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Gun> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasPerformance> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasPerformance> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasPerformance> <http://www.w3.org/2000/01/rdf-schema#label> "has performance"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasPerformance> <http://www.w3.org/2000/01/rdf-schema#label> "имеет результат"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasPerformance> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRadio> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRadio> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRadio> <http://www.w3.org/2000/01/rdf-schema#label> "has radio"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRadio> <http://www.w3.org/2000/01/rdf-schema#label> "имеет радиостанцию"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRadio> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Radio> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRole> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRole> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRole> <http://www.w3.org/2000/01/rdf-schema#label> "has role"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRole> <http://www.w3.org/2000/01/rdf-schema#label> "имеет роль"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasRole> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#TankRole> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasSuspension> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasSuspension> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasSuspension> <http://www.w3.org/2000/01/rdf-schema#label> "has suspension"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasSuspension> <http://www.w3.org/2000/01/rdf-schema#label> "имеет подвеску"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasSuspension> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Suspension> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasTurret> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasTurret> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasTurret> <http://www.w3.org/2000/01/rdf-schema#label> "has turret"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasTurret> <http://www.w3.org/2000/01/rdf-schema#label> "имеет башню"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hasTurret> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Turret> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hitsReceived> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hitsReceived> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hitsReceived> <http://www.w3.org/2000/01/rdf-schema#label> "hits received"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hitsReceived> <http://www.w3.org/2000/01/rdf-schema#label> "попаданий получено"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hitsReceived> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hp> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hp> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#TankCharacteristics> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hp> <http://www.w3.org/2000/01/rdf-schema#label> "HP"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hp> <http://www.w3.org/2000/01/rdf-schema#label> "прочность"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hp> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullHP> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullHP> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#TankCharacteristics> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullHP> <http://www.w3.org/2000/01/rdf-schema#label> "hull HP"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullHP> <http://www.w3.org/2000/01/rdf-schema#label> "прочность корпуса"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullHP> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullWeight> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullWeight> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#TankCharacteristics> .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullWeight> <http://www.w3.org/2000/01/rdf-schema#label> "hull weight"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullWeight> <http://www.w3.org/2000/01/rdf-schema#label> "вес корпуса"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#hullWeight> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#inBattle> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#inBattle> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#inBattle> <http://www.w3.org/2000/01/rdf-schema#label> "in battle"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#inBattle> <http://www.w3.org/2000/01/rdf-schema#label> "в бою"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#inBattle> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#installedOn> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#installedOn> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Module> .\n',
+    '<http://www.semanticweb.org/ontology/wot#installedOn> <http://www.w3.org/2000/01/rdf-schema#label> "installed on"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#installedOn> <http://www.w3.org/2000/01/rdf-schema#label> "установлен на"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#installedOn> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isGift> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isGift> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isGift> <http://www.w3.org/2000/01/rdf-schema#label> "is gift"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#isGift> <http://www.w3.org/2000/01/rdf-schema#label> "подарочный"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#isGift> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#boolean> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isPremium> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isPremium> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isPremium> <http://www.w3.org/2000/01/rdf-schema#label> "is premium"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#isPremium> <http://www.w3.org/2000/01/rdf-schema#label> "премиум танк"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#isPremium> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#boolean> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isWheeled> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isWheeled> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#isWheeled> <http://www.w3.org/2000/01/rdf-schema#label> "is wheeled"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#isWheeled> <http://www.w3.org/2000/01/rdf-schema#label> "колесный"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#isWheeled> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#boolean> .\n',
+    '<http://www.semanticweb.org/ontology/wot#lifeTime> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#lifeTime> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#lifeTime> <http://www.w3.org/2000/01/rdf-schema#label> "life time"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#lifeTime> <http://www.w3.org/2000/01/rdf-schema#label> "время жизни"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#lifeTime> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#maxHP> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#maxHP> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#maxHP> <http://www.w3.org/2000/01/rdf-schema#label> "max HP"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#maxHP> <http://www.w3.org/2000/01/rdf-schema#label> "максимальное HP"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#maxHP> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationCode> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationCode> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationCode> <http://www.w3.org/2000/01/rdf-schema#label> "nation code"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationCode> <http://www.w3.org/2000/01/rdf-schema#label> "код нации"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationCode> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationName> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationName> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Nation> .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationName> <http://www.w3.org/2000/01/rdf-schema#label> "nation name"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationName> <http://www.w3.org/2000/01/rdf-schema#label> "название нации"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#nationName> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#onMap> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#onMap> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#onMap> <http://www.w3.org/2000/01/rdf-schema#label> "on map"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#onMap> <http://www.w3.org/2000/01/rdf-schema#label> "на карте"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#onMap> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#participatesIn> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#participatesIn> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#participatesIn> <http://www.w3.org/2000/01/rdf-schema#label> "participates in"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#participatesIn> <http://www.w3.org/2000/01/rdf-schema#label> "участвует в"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#participatesIn> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrations> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrations> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrations> <http://www.w3.org/2000/01/rdf-schema#label> "penetrations"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrations> <http://www.w3.org/2000/01/rdf-schema#label> "пробитий"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrations> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrationsReceived> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrationsReceived> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrationsReceived> <http://www.w3.org/2000/01/rdf-schema#label> "penetrations received"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrationsReceived> <http://www.w3.org/2000/01/rdf-schema#label> "пробитий получено"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#penetrationsReceived> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#platoon> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#platoon> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#platoon> <http://www.w3.org/2000/01/rdf-schema#label> "platoon"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#platoon> <http://www.w3.org/2000/01/rdf-schema#label> "взвод"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#platoon> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerPlatoon> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerPlatoon> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerPlatoon> <http://www.w3.org/2000/01/rdf-schema#label> "player platoon"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerPlatoon> <http://www.w3.org/2000/01/rdf-schema#label> "взвод игрока"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerPlatoon> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerSpawn> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerSpawn> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerSpawn> <http://www.w3.org/2000/01/rdf-schema#label> "player spawn"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerSpawn> <http://www.w3.org/2000/01/rdf-schema#label> "сторона игрока"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerSpawn> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerWon> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerWon> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerWon> <http://www.w3.org/2000/01/rdf-schema#label> "player won"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerWon> <http://www.w3.org/2000/01/rdf-schema#label> "победа игрока"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#playerWon> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#boolean> .\n',
+    '<http://www.semanticweb.org/ontology/wot#plays> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#plays> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#plays> <http://www.w3.org/2000/01/rdf-schema#label> "plays"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#plays> <http://www.w3.org/2000/01/rdf-schema#label> "играет на"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#plays> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#potentialDamageReceived> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#potentialDamageReceived> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#potentialDamageReceived> <http://www.w3.org/2000/01/rdf-schema#label> "potential damage"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#potentialDamageReceived> <http://www.w3.org/2000/01/rdf-schema#label> "потенциальный урон"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#potentialDamageReceived> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#power> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#power> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Engine> .\n',
+    '<http://www.semanticweb.org/ontology/wot#power> <http://www.w3.org/2000/01/rdf-schema#label> "power"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#power> <http://www.w3.org/2000/01/rdf-schema#label> "мощность"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#power> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceCredit> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceCredit> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceCredit> <http://www.w3.org/2000/01/rdf-schema#label> "price in credits"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceCredit> <http://www.w3.org/2000/01/rdf-schema#label> "цена в кредитах"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceCredit> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceGold> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceGold> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceGold> <http://www.w3.org/2000/01/rdf-schema#label> "price in gold"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceGold> <http://www.w3.org/2000/01/rdf-schema#label> "цена в золоте"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceGold> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceXP> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceXP> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceXP> <http://www.w3.org/2000/01/rdf-schema#label> "price in XP"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceXP> <http://www.w3.org/2000/01/rdf-schema#label> "цена в опыте"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#priceXP> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleDescription> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleDescription> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#TankRole> .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleDescription> <http://www.w3.org/2000/01/rdf-schema#label> "role description"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleDescription> <http://www.w3.org/2000/01/rdf-schema#label> "описание роли"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleDescription> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleName> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleName> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#TankRole> .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleName> <http://www.w3.org/2000/01/rdf-schema#label> "role name"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleName> <http://www.w3.org/2000/01/rdf-schema#label> "название роли"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#roleName> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#shortName> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#shortName> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#shortName> <http://www.w3.org/2000/01/rdf-schema#label> "short name"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#shortName> <http://www.w3.org/2000/01/rdf-schema#label> "короткое название"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#shortName> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#shotsFired> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#shotsFired> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#shotsFired> <http://www.w3.org/2000/01/rdf-schema#label> "shots fired"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#shotsFired> <http://www.w3.org/2000/01/rdf-schema#label> "выстрелов"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#shotsFired> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#sniperDamage> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#sniperDamage> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#sniperDamage> <http://www.w3.org/2000/01/rdf-schema#label> "sniper damage"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#sniperDamage> <http://www.w3.org/2000/01/rdf-schema#label> "снайперский урон"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#sniperDamage> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spawn> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spawn> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spawn> <http://www.w3.org/2000/01/rdf-schema#label> "spawn"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#spawn> <http://www.w3.org/2000/01/rdf-schema#label> "сторона"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#spawn> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedBackward> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedBackward> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#TankCharacteristics> .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedBackward> <http://www.w3.org/2000/01/rdf-schema#label> "speed backward"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedBackward> <http://www.w3.org/2000/01/rdf-schema#label> "скорость назад"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedBackward> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedForward> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedForward> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#TankCharacteristics> .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedForward> <http://www.w3.org/2000/01/rdf-schema#label> "speed forward"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedForward> <http://www.w3.org/2000/01/rdf-schema#label> "скорость вперед"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#speedForward> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#splashHitsReceived> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#splashHitsReceived> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#splashHitsReceived> <http://www.w3.org/2000/01/rdf-schema#label> "splash hits received"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#splashHitsReceived> <http://www.w3.org/2000/01/rdf-schema#label> "фугасных попаданий"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#splashHitsReceived> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spots> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spots> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spots> <http://www.w3.org/2000/01/rdf-schema#label> "spots"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#spots> <http://www.w3.org/2000/01/rdf-schema#label> "обнаружено"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#spots> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spottingAssist> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spottingAssist> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#spottingAssist> <http://www.w3.org/2000/01/rdf-schema#label> "spotting assist"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#spottingAssist> <http://www.w3.org/2000/01/rdf-schema#label> "помощь засветом"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#spottingAssist> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankId> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankId> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankId> <http://www.w3.org/2000/01/rdf-schema#label> "ID танка"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankId> <http://www.w3.org/2000/01/rdf-schema#label> "tank ID"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankId> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankName> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankName> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankName> <http://www.w3.org/2000/01/rdf-schema#label> "tank name"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankName> <http://www.w3.org/2000/01/rdf-schema#label> "название танка"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#tankName> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#string> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tier> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tier> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#tier> <http://www.w3.org/2000/01/rdf-schema#label> "tier"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#tier> <http://www.w3.org/2000/01/rdf-schema#label> "уровень"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#tier> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#totalBattles> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#totalBattles> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#totalBattles> <http://www.w3.org/2000/01/rdf-schema#label> "total battles"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#totalBattles> <http://www.w3.org/2000/01/rdf-schema#label> "всего боев"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#totalBattles> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#trackingAssist> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#trackingAssist> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#trackingAssist> <http://www.w3.org/2000/01/rdf-schema#label> "tracking assist"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#trackingAssist> <http://www.w3.org/2000/01/rdf-schema#label> "помощь гусеницами"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#trackingAssist> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#weight> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#weight> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#weight> <http://www.w3.org/2000/01/rdf-schema#label> "weight"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#weight> <http://www.w3.org/2000/01/rdf-schema#label> "вес"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#weight> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#winRate> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#winRate> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Player> .\n',
+    '<http://www.semanticweb.org/ontology/wot#winRate> <http://www.w3.org/2000/01/rdf-schema#label> "win rate"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#winRate> <http://www.w3.org/2000/01/rdf-schema#label> "процент побед"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#winRate> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#float> .\n',
+    '<http://www.semanticweb.org/ontology/wot#winnerSpawn> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#winnerSpawn> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#winnerSpawn> <http://www.w3.org/2000/01/rdf-schema#label> "winner spawn"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#winnerSpawn> <http://www.w3.org/2000/01/rdf-schema#label> "сторона победителя"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#winnerSpawn> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#integer> .\n',
+    '<http://www.semanticweb.org/ontology/wot#withTank> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#ObjectProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#withTank> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#BattlePerformance> .\n',
+    '<http://www.semanticweb.org/ontology/wot#withTank> <http://www.w3.org/2000/01/rdf-schema#label> "with tank"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#withTank> <http://www.w3.org/2000/01/rdf-schema#label> "на танке"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#withTank> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.semanticweb.org/ontology/wot#Tank> .\n',
+    '<http://www.semanticweb.org/ontology/wot#won> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#DatatypeProperty> .\n',
+    '<http://www.semanticweb.org/ontology/wot#won> <http://www.w3.org/2000/01/rdf-schema#domain> <http://www.semanticweb.org/ontology/wot#Battle> .\n',
+    '<http://www.semanticweb.org/ontology/wot#won> <http://www.w3.org/2000/01/rdf-schema#label> "won"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot#won> <http://www.w3.org/2000/01/rdf-schema#label> "победа"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot#won> <http://www.w3.org/2000/01/rdf-schema#range> <http://www.w3.org/2001/XMLSchema#boolean> .\n',
+    '<http://www.semanticweb.org/ontology/wot> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://www.w3.org/2002/07/owl#Ontology> .\n',
+    '<http://www.semanticweb.org/ontology/wot> <http://www.w3.org/2000/01/rdf-schema#comment> "Ontology for World of Tanks game representing tanks, battles, players, and their relationships"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot> <http://www.w3.org/2000/01/rdf-schema#comment> "Онтология для игры Мир Танков, представляющая танки, бои, игроков и их взаимосвязи"@ru .\n',
+    '<http://www.semanticweb.org/ontology/wot> <http://www.w3.org/2000/01/rdf-schema#label> "World of Tanks Ontology"@en .\n',
+    '<http://www.semanticweb.org/ontology/wot> <http://www.w3.org/2000/01/rdf-schema#label> "Онтология Мир Танков"@ru .\n',
+)
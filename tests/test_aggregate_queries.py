@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Дашбордные запросы по хранилищу агрегатов возвращают те же строки и те же типы термов,
+что и SPARQL варианты по графу
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from rdflib import Literal
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from generate_synthetic_data import SyntheticDataGenerator  # noqa: E402
+from import_data_to_rdf import DataImporter  # noqa: E402
+from query_ontology import OntologyQueryEngine  # noqa: E402
+
+
+def run_both(engine, method, *args, **kwargs):
+    """Результат запроса по агрегатам и по SPARQL"""
+    aggregates = engine.aggregates
+    try:
+        aggregated = list(getattr(engine, method)(*args, **kwargs))
+        engine.aggregates = None
+        queried = list(getattr(engine, method)(*args, **kwargs))
+    finally:
+        engine.aggregates = aggregates
+    return aggregated, queried
+
+
+class AggregateQueriesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        root = Path(cls.directory.name)
+        generator = SyntheticDataGenerator(seed=3, tanks=15, configs_per_tank=2)
+        generator.write_wot_data(root / 'wot_data.csv')
+        generator.write_battles(root / 'tomato.csv', 1500)
+
+        importer = DataImporter()
+        importer.data_dir = root
+        importer.ontology_dir = root
+        importer.import_tanks_from_wot_data()
+        importer.import_battles_from_tomato(limit=1500, random_sample=False)
+        output_file = importer.save_graph('aggregates', formats=('nt',))
+        importer.save_aggregates(output_file)
+
+        cls.engine = OntologyQueryEngine(output_file)
+        cls.engine.raise_errors = True
+        assert cls.engine.aggregates is not None
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def assertSameRows(self, aggregated, queried):
+        self.assertTrue(queried, "query returned no rows, the comparison would be vacuous")
+        self.assertEqual(len(aggregated), len(queried))
+        for aggregated_row, queried_row in zip(aggregated, queried):
+            self.assertEqual(aggregated_row.labels, queried_row.labels)
+            for aggregated_term, queried_term in zip(aggregated_row, queried_row):
+                self.assertIs(type(aggregated_term), type(queried_term))
+                if isinstance(queried_term, Literal):
+                    self.assertEqual(aggregated_term.datatype, queried_term.datatype)
+                    if isinstance(queried_term.toPython(), (int, str)):
+                        self.assertEqual(aggregated_term.toPython(), queried_term.toPython())
+                    else:
+                        self.assertAlmostEqual(float(aggregated_term), float(queried_term), places=9)
+                else:
+                    self.assertEqual(aggregated_term, queried_term)
+
+    def test_top_tanks_by_winrate(self):
+        self.assertSameRows(*run_both(self.engine, 'query_top_tanks_by_winrate', min_battles=5, limit=50))
+
+    def test_nation_statistics(self):
+        self.assertSameRows(*run_both(self.engine, 'query_nation_statistics'))
+
+    def test_tank_with_highest_avg_damage(self):
+        self.assertSameRows(*run_both(self.engine, 'query_tank_with_highest_avg_damage', min_battles=5, top_n=5))
+
+    def test_worst_maps_for_tank(self):
+        tank_name = next(name for name, _ in self.engine.aggregates.names['tank'].values())
+        self.assertSameRows(*run_both(self.engine, 'query_worst_maps_for_tank', tank_name, min_battles=1, limit=50))
+
+    def test_maps_with_side_imbalance(self):
+        self.assertSameRows(*run_both(self.engine, 'query_maps_with_side_imbalance',
+                                      threshold_pct=1.0, min_battles_per_side=5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Выборка боев строится импортером рядом с агрегатами: движок загружает ее из файла,
+а страты совпадают по размерам совокупностей с выборкой, построенной обходом графа
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from rdflib import Graph, Literal, Namespace
+from rdflib.namespace import XSD
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from battle_sample import BattleSample, sample_path  # noqa: E402
+from generate_synthetic_data import SyntheticDataGenerator  # noqa: E402
+from import_data_to_rdf import DataImporter  # noqa: E402
+from query_ontology import OntologyQueryEngine  # noqa: E402
+
+
+WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
+
+
+def populations(sample):
+    return {tank: (stratum.population, stratum.damage_population) for tank, stratum in sample.strata.items()}
+
+
+class ImportedSampleTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.root = Path(cls.directory.name)
+        generator = SyntheticDataGenerator(seed=5, tanks=15, configs_per_tank=2)
+        generator.write_wot_data(cls.root / 'wot_data.csv')
+        generator.write_battles(cls.root / 'tomato.csv', 1200)
+        cls.output_file = cls.import_battles('sample')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    @classmethod
+    def import_battles(cls, output_name, pipeline=False):
+        importer = DataImporter()
+        importer.data_dir = cls.root
+        importer.ontology_dir = cls.root
+        importer.import_tanks_from_wot_data()
+        if pipeline:
+            output_file = importer.import_battles_pipeline(output_name, limit=1200, random_sample=False,
+                                                           workers=1, chunk_size=300)
+        else:
+            importer.import_battles_from_tomato(limit=1200, random_sample=False)
+            output_file = importer.save_graph(output_name, formats=('nt',))
+        importer.save_aggregates(output_file)
+        return output_file
+
+    def test_engine_loads_imported_sample(self):
+        self.assertTrue(sample_path(self.output_file).exists())
+        engine = OntologyQueryEngine(self.output_file)
+        self.assertIsNotNone(engine.sample)
+
+        built = BattleSample().build(engine.g, WOT)
+        self.assertEqual(populations(engine.sample), populations(built))
+        self.assertEqual(engine.sample.map_names, built.map_names)
+        self.assertEqual(engine.sample.population, built.population)
+        self.assertTrue(engine.query_top_tanks_by_winrate(min_battles=5, approx=True))
+
+    def test_other_fraction_is_built_from_graph(self):
+        engine = OntologyQueryEngine(self.output_file, sample_fraction=0.5)
+        self.assertIsNone(engine.sample)
+        self.assertEqual(engine.battle_sample().fraction, 0.5)
+
+    def test_pipeline_sample_matches(self):
+        pipeline_file = self.import_battles('sample_pipeline', pipeline=True)
+        self.assertEqual(populations(BattleSample.load(sample_path(pipeline_file))),
+                         populations(BattleSample.load(sample_path(self.output_file))))
+
+    def test_save_load_round_trip(self):
+        sample = BattleSample.load(sample_path(self.output_file))
+        copy = BattleSample.load(sample.save(self.root / 'copy.sample.npz'))
+        self.assertEqual(populations(copy), populations(sample))
+        for tank, stratum in sample.strata.items():
+            np.testing.assert_array_equal(copy.strata[tank].won, stratum.won)
+            np.testing.assert_array_equal(copy.strata[tank].damage, stratum.damage)
+            np.testing.assert_array_equal(copy.strata[tank].maps, stratum.maps)
+
+
+class GraphSampleTest(unittest.TestCase):
+    def test_won_must_be_boolean(self):
+        g = Graph()
+        for i, won in enumerate([Literal(True), Literal(False), Literal('true'), Literal(1, datatype=XSD.integer)]):
+            battle, perf = WOT[f"Battle_{i}"], WOT[f"Perf_{i}"]
+            g.add((battle, WOT.won, won))
+            g.add((battle, WOT.onMap, Literal('Himmelsdorf')))
+            g.add((perf, WOT.inBattle, battle))
+            g.add((perf, WOT.withTank, WOT.Tank_1))
+            g.add((perf, WOT.damage, Literal(1000 + i)))
+
+        stratum = BattleSample().build(g, WOT).strata[str(WOT.Tank_1)]
+        self.assertEqual(stratum.population, 2)
+        self.assertEqual(sorted(stratum.won.tolist()), [0.0, 1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Консолидация боев: строки одного матча синтетических данных сливаются в один Battle
+и граф становится меньше; без общих матчей сводка не печатает отрицательную экономию
+"""
+
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from generate_synthetic_data import SyntheticDataGenerator  # noqa: E402
+from import_data_to_rdf import DataImporter  # noqa: E402
+
+
+class ConsolidationTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        generator = SyntheticDataGenerator(seed=2, tanks=15, configs_per_tank=2)
+        generator.write_wot_data(self.root / 'wot_data.csv')
+        generator.write_battles(self.root / 'tomato.csv', 800)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def import_battles(self, consolidate):
+        importer = DataImporter(consolidate_battles=consolidate)
+        importer.data_dir = self.root
+        importer.ontology_dir = self.root
+        importer.import_tanks_from_wot_data()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            importer.import_battles_from_tomato(limit=800, random_sample=False)
+        importer.writer.flush()
+        return importer, output.getvalue()
+
+    def test_generated_matches_are_merged(self):
+        plain, _ = self.import_battles(consolidate=False)
+        consolidated, _ = self.import_battles(consolidate=True)
+        self.assertGreater(consolidated.consolidation['merged_rows'], 0)
+        self.assertGreater(consolidated.consolidation['saved_triples'], 0)
+        self.assertLess(len(consolidated.g), len(plain.g))
+
+    def test_no_shared_matches_reported_plainly(self):
+        tomato = pd.read_csv(self.root / 'tomato.csv')
+        tomato['duration'] = range(100, 100 + len(tomato))
+        tomato.to_csv(self.root / 'tomato.csv', index=False)
+
+        importer, output = self.import_battles(consolidate=True)
+        self.assertEqual(importer.consolidation['merged_rows'], 0)
+        self.assertIn('no rows share a match', output)
+        self.assertNotIn('triples saved', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Пайплайн импорта боев: ошибка трансформера одного чанка завершает импорт исключением,
+а не зависанием читателя на полной очереди
+"""
+
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from generate_synthetic_data import SyntheticDataGenerator  # noqa: E402
+from import_data_to_rdf import DataImporter  # noqa: E402
+
+
+class FailingChunkTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        root = Path(self.directory.name)
+        SyntheticDataGenerator(seed=1, tanks=20).write_battles(root / 'tomato.csv', 400)
+        self.importer = DataImporter()
+        self.importer.data_dir = root
+        self.importer.ontology_dir = root
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_failing_chunk_raises_without_deadlock(self):
+        read_chunks = self.importer.iter_raw_battle_chunks
+
+        def chunks_with_broken_first(*args):
+            # Чанк без колонки tank_id падает в процессе-трансформере; за ним идут обычные чанки,
+            # которых больше, чем помещается в очереди
+            yield 0, 'bogus\n', ['1\n']
+            yield from read_chunks(*args)
+
+        self.importer.iter_raw_battle_chunks = chunks_with_broken_first
+        outcome = {}
+
+        def run():
+            try:
+                self.importer.import_battles_pipeline('failing', limit=400, random_sample=False,
+                                                      workers=1, chunk_size=20, queue_size=1)
+            except Exception as e:
+                outcome['error'] = e
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=120)
+
+        self.assertFalse(thread.is_alive(), "pipeline deadlocked after a failing chunk")
+        self.assertIsInstance(outcome.get('error'), KeyError)
+        self.assertFalse((Path(self.directory.name) / 'failing.nt').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
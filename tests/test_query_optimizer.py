@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Оптимизатор запросов: предопределенные запросы дают те же строки, что и без оптимизатора,
+FILTER опускается под Join/LeftJoin только когда это не меняет смысл, а хук rdflib
+регистрируется один раз и не действует на чужие графы
+"""
+
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+
+from rdflib import Graph, Literal, Namespace
+from rdflib.plugins.sparql import CUSTOM_EVALS, prepareQuery
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from generate_synthetic_data import SyntheticDataGenerator  # noqa: E402
+from import_data_to_rdf import DataImporter  # noqa: E402
+from query_ontology import OntologyQueryEngine  # noqa: E402
+from query_optimizer import ACTIVE_OPTIMIZERS, GraphStatistics, QueryOptimizer, eval_bgp  # noqa: E402
+
+
+WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
+PREFIX = "PREFIX wot: <http://www.semanticweb.org/ontology/wot#>\n"
+
+# Предопределенные SPARQL запросы и параметры без усечения по LIMIT (равные строки при разном порядке)
+PREDEFINED = [
+    ('top-winrate', {'min_battles': 5, 'limit': 1000}),
+    ('damage-by-class', {}),
+    ('best-players', {'limit': 1000}),
+    ('tanks-by-nation', {'nation': 'USSR'}),
+    ('spotting-masters', {'limit': 1000}),
+    ('guns-dpm', {'limit': 1000}),
+    ('engines-power', {'limit': 1000}),
+    ('nation-stats', {}),
+    ('best-tanks', {'limit': 1000}),
+    ('best-nation', {'limit': 1000}),
+    ('highest-avg-damage', {'min_battles': 5, 'top_n': 1000}),
+    ('worst-maps', {'tank_name': None, 'min_battles': 1, 'limit': 1000}),
+    ('side-imbalance', {'threshold_pct': 1.0, 'min_battles_per_side': 5}),
+]
+
+# Импорт не пишет игроков (achievedBy): эти запросы пусты и на синтетических данных
+EMPTY_ON_SYNTHETIC = {'best-players'}
+
+
+def algebra(query):
+    """Алгебра запроса после переписывания оптимизатором (без статистики порядок BGP не важен)"""
+    return QueryOptimizer(GraphStatistics()).optimize(prepareQuery(PREFIX + query)).algebra
+
+
+def find(node, name):
+    """Первый узел алгебры с именем name (обход в глубину)"""
+    if node.name == name:
+        return node
+    for attr in ('p', 'p1', 'p2'):
+        child = node.get(attr)
+        if hasattr(child, 'name'):
+            found = find(child, name)
+            if found is not None:
+                return found
+    return None
+
+
+class PredefinedQueriesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        root = Path(cls.directory.name)
+        generator = SyntheticDataGenerator(seed=4, tanks=15, configs_per_tank=2)
+        generator.write_wot_data(root / 'wot_data.csv')
+        generator.write_battles(root / 'tomato.csv', 1200)
+
+        importer = DataImporter()
+        importer.data_dir = root
+        importer.ontology_dir = root
+        importer.import_tanks_from_wot_data()
+        importer.import_battles_from_tomato(limit=1200, random_sample=False)
+        output_file = importer.save_graph('optimizer', formats=('nt',))
+
+        cls.optimized = OntologyQueryEngine(output_file, aggregates=False)
+        cls.plain = OntologyQueryEngine(output_file, optimize=False, aggregates=False)
+        for engine in (cls.optimized, cls.plain):
+            engine.raise_errors = True
+        cls.tank_name = str(next(cls.plain.g.objects(None, WOT.tankName)))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_optimized_results_match(self):
+        self.assertIsNotNone(self.optimized.optimizer)
+        self.assertIsNone(self.plain.optimizer)
+        for name, params in PREDEFINED:
+            if 'tank_name' in params:
+                params = dict(params, tank_name=self.tank_name)
+            with self.subTest(query=name):
+                optimized = Counter(tuple(row) for row in self.optimized.run_named_query(name, params))
+                plain = Counter(tuple(row) for row in self.plain.run_named_query(name, params))
+                if name not in EMPTY_ON_SYNTHETIC:
+                    self.assertTrue(plain, "query returned no rows, the comparison would be vacuous")
+                self.assertEqual(optimized, plain)
+        self.assertFalse(ACTIVE_OPTIMIZERS)
+
+
+class FilterPushdownTest(unittest.TestCase):
+    def test_filter_moves_into_join_side(self):
+        plan = algebra("SELECT * WHERE { { ?tank wot:tier ?tier } { ?battle wot:damage ?damage } "
+                       "FILTER(?tier > 5) }")
+        join = find(plan, 'Join')
+        self.assertEqual(join.p1.name, 'Filter')
+        self.assertEqual(join.p1.p.name, 'BGP')
+        self.assertNotEqual(join.p2.name, 'Filter')
+
+    def test_filter_over_both_join_sides_stays(self):
+        plan = algebra("SELECT * WHERE { { ?tank wot:tier ?tier } { ?battle wot:damage ?damage } "
+                       "FILTER(?tier < ?damage) }")
+        self.assertEqual(find(plan, 'Filter').p.name, 'Join')
+
+    def test_filter_moves_into_left_join_required_side(self):
+        plan = algebra("SELECT * WHERE { ?tank wot:tier ?tier . OPTIONAL { ?tank wot:shortName ?short } "
+                       "FILTER(?tier > 5) }")
+        left_join = find(plan, 'LeftJoin')
+        self.assertEqual(left_join.p1.name, 'Filter')
+        self.assertEqual(left_join.p1.p.name, 'BGP')
+
+    def test_filter_on_optional_variable_stays_above_left_join(self):
+        plan = algebra("SELECT * WHERE { ?tank wot:tankName ?name . OPTIONAL { ?tank wot:shortName ?short } "
+                       "FILTER(?name = 'T-34' || ?short = 'T-34') }")
+        self.assertEqual(find(plan, 'Filter').p.name, 'LeftJoin')
+
+    def test_pushed_filter_keeps_results(self):
+        g = Graph()
+        for i in range(1, 9):
+            g.add((WOT[f"Tank_{i}"], WOT.tier, Literal(i)))
+            if i % 2:
+                g.add((WOT[f"Tank_{i}"], WOT.shortName, Literal(f"T{i}")))
+        query = PREFIX + "SELECT ?tank ?short WHERE { ?tank wot:tier ?tier . " \
+                         "OPTIONAL { ?tank wot:shortName ?short } FILTER(?tier > 5) }"
+        optimizer = QueryOptimizer(GraphStatistics.from_graph(g))
+        with optimizer.active(g):
+            optimized = set(g.query(optimizer.optimize(prepareQuery(query))))
+        self.assertEqual(optimized, set(g.query(query)))
+        self.assertEqual(len(optimized), 3)
+
+
+class EvalHookTest(unittest.TestCase):
+    def test_hook_registered_once_and_scoped_to_graph(self):
+        self.assertIs(CUSTOM_EVALS.get('wot_bgp_order'), eval_bgp)
+        g, other = Graph(), Graph()
+        first = QueryOptimizer(GraphStatistics())
+        second = QueryOptimizer(GraphStatistics())
+        with first.active(g):
+            self.assertIs(ACTIVE_OPTIMIZERS.get(g.store), first)
+            self.assertIsNone(ACTIVE_OPTIMIZERS.get(other.store))
+            with second.active(g):
+                self.assertIs(ACTIVE_OPTIMIZERS.get(g.store), second)
+            self.assertIs(ACTIVE_OPTIMIZERS.get(g.store), first)
+        self.assertIsNone(ACTIVE_OPTIMIZERS.get(g.store))
+        self.assertIs(CUSTOM_EVALS.get('wot_bgp_order'), eval_bgp)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Типизированные колонки результатов: вид колонки по XSD datatype, пропуски, строки и словари,
+DataFrame/Arrow и выгрузка в CSV/Parquet с обратным чтением
+"""
+
+import csv
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from rdflib import Graph, Literal, Namespace, Variable
+from rdflib.namespace import XSD
+from rdflib.query import ResultRow
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import query_results  # noqa: E402
+from query_results import ResultTable, column_kind, format_cell, term_value  # noqa: E402
+
+
+WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
+
+QUERY = """
+PREFIX wot: <http://www.semanticweb.org/ontology/wot#>
+SELECT ?tank ?battles ?winRate ?premium ?lastBattle ?short
+WHERE {
+  ?tank wot:battles ?battles ; wot:winRate ?winRate ; wot:isPremium ?premium ; wot:lastBattle ?lastBattle .
+  OPTIONAL { ?tank wot:shortName ?short }
+}
+ORDER BY ?tank
+"""
+
+
+def result_graph():
+    """Два танка с колонками всех видов; у второго нет shortName"""
+    g = Graph()
+    g.add((WOT.Tank_1, WOT.battles, Literal(120)))
+    g.add((WOT.Tank_1, WOT.winRate, Literal(Decimal('51.25'))))
+    g.add((WOT.Tank_1, WOT.isPremium, Literal(True)))
+    g.add((WOT.Tank_1, WOT.lastBattle, Literal(datetime(2023, 3, 1, 12, 30))))
+    g.add((WOT.Tank_1, WOT.shortName, Literal('T-34')))
+    g.add((WOT.Tank_2, WOT.battles, Literal(7)))
+    g.add((WOT.Tank_2, WOT.winRate, Literal(Decimal('42.5'))))
+    g.add((WOT.Tank_2, WOT.isPremium, Literal(False)))
+    g.add((WOT.Tank_2, WOT.lastBattle, Literal(datetime(2023, 4, 2))))
+    return g
+
+
+class TermValueTest(unittest.TestCase):
+    def test_datatypes(self):
+        self.assertEqual(term_value(Literal(5)), ('int', 5))
+        self.assertEqual(term_value(Literal('5', datatype=XSD.unsignedShort)), ('int', 5))
+        self.assertEqual(term_value(Literal(Decimal('1.5'))), ('float', 1.5))
+        self.assertEqual(term_value(Literal(2.25)), ('float', 2.25))
+        self.assertEqual(term_value(Literal(True)), ('bool', True))
+        self.assertEqual(term_value(Literal('2023-01-02', datatype=XSD.date)), ('datetime', datetime(2023, 1, 2)))
+        self.assertEqual(term_value(Literal('2023-01-02T10:00:00+03:00', datatype=XSD.dateTime)),
+                         ('datetime', datetime(2023, 1, 2, 7, 0)))
+        self.assertEqual(term_value(WOT.Tank_1), ('str', str(WOT.Tank_1)))
+        self.assertEqual(term_value(Literal('T-34', datatype=XSD.string)), ('str', 'T-34'))
+        self.assertEqual(term_value(None), (None, None))
+
+    def test_ill_typed_and_out_of_range(self):
+        self.assertEqual(term_value(Literal('abc', datatype=XSD.integer)), ('str', 'abc'))
+        self.assertEqual(term_value(Literal(2 ** 70)), ('str', str(2 ** 70)))
+
+    def test_plain_python_values(self):
+        self.assertEqual(term_value(3), ('int', 3))
+        self.assertEqual(term_value(False), ('bool', False))
+        self.assertEqual(term_value(Decimal('0.5')), ('float', 0.5))
+
+    def test_column_kind(self):
+        self.assertEqual(column_kind({'int', None}), 'int')
+        self.assertEqual(column_kind({'int', 'float'}), 'float')
+        self.assertEqual(column_kind({'int', 'str'}), 'str')
+        self.assertEqual(column_kind({None}), 'str')
+
+    def test_format_cell(self):
+        self.assertEqual(format_cell(3.0, 'float'), '3')
+        self.assertEqual(format_cell(51.256, 'float'), '51.26')
+        self.assertEqual(format_cell(str(WOT.Tank_1), 'str'), 'Tank_1')
+        self.assertEqual(format_cell(datetime(2023, 4, 2), 'datetime'), '2023-04-02')
+        self.assertEqual(format_cell(None, 'int'), '')
+
+
+class ResultTableTest(unittest.TestCase):
+    def setUp(self):
+        self.table = ResultTable.from_result(result_graph().query(QUERY))
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_kinds_and_values(self):
+        self.assertEqual(self.table.columns, ['tank', 'battles', 'winRate', 'premium', 'lastBattle', 'short'])
+        self.assertEqual(self.table.kinds, {'tank': 'str', 'battles': 'int', 'winRate': 'float', 'premium': 'bool',
+                                            'lastBattle': 'datetime', 'short': 'str'})
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(self.table.values['short'], ['T-34', None])
+
+    def test_records_and_rows(self):
+        first = {'tank': str(WOT.Tank_1), 'battles': 120, 'winRate': 51.25, 'premium': True,
+                 'lastBattle': datetime(2023, 3, 1, 12, 30), 'short': 'T-34'}
+        self.assertEqual(self.table.records()[0], first)
+        self.assertIsNone(self.table.records()[1]['short'])
+        row = self.table.rows()[0]
+        self.assertEqual(row.battles, 120)
+        self.assertEqual(row['winRate'], 51.25)
+        self.assertEqual(row[0], str(WOT.Tank_1))
+        self.assertEqual(row.as_dict(), first)
+
+    def test_mixed_columns(self):
+        rows = [ResultRow({Variable('v'): term}, [Variable('v')]) for term in (Literal(1), Literal(2.5))]
+        self.assertEqual(ResultTable.from_result(rows).values['v'], [1.0, 2.5])
+        rows = [ResultRow({Variable('v'): term}, [Variable('v')]) for term in (Literal(1), Literal('x'), None)]
+        table = ResultTable.from_result(rows)
+        self.assertEqual((table.kinds['v'], table.values['v']), ('str', ['1', 'x', None]))
+
+    def test_ask_and_empty_results(self):
+        ask = ResultTable.from_result(result_graph().query("ASK { ?s ?p ?o }"))
+        self.assertEqual(ask.records(), [{'ask': True}])
+        self.assertEqual(len(ResultTable.from_result(None)), 0)
+        empty = ResultTable.from_result(result_graph().query("SELECT ?s WHERE { ?s <urn:none> ?o }"))
+        self.assertEqual((empty.columns, len(empty)), (['s'], 0))
+
+    def test_numpy_columns(self):
+        arrays = self.table.to_numpy()
+        self.assertEqual(arrays['battles'].dtype, np.int64)
+        self.assertEqual(arrays['winRate'].dtype, np.float64)
+        self.assertEqual(arrays['premium'].dtype, np.bool_)
+        self.assertEqual(arrays['lastBattle'].dtype, np.dtype('datetime64[us]'))
+        self.assertEqual(arrays['short'].dtype, object)
+
+        missing = ResultTable(['n', 'b'], {'n': 'int', 'b': 'bool'}, {'n': [1, None], 'b': [True, None]})
+        self.assertTrue(np.isnan(missing.column_array('n')[1]))
+        self.assertEqual(missing.column_array('b').dtype, object)
+
+    def test_dataframe(self):
+        df = self.table.to_pandas()
+        self.assertEqual(list(df.columns), self.table.columns)
+        self.assertEqual(str(df['battles'].dtype), 'int64')
+        self.assertEqual(str(df['winRate'].dtype), 'float64')
+        self.assertEqual(str(df['premium'].dtype), 'bool')
+        self.assertEqual(str(df['lastBattle'].dtype), 'datetime64[us]')
+        self.assertEqual(df['short'].iloc[0], 'T-34')
+        self.assertTrue(query_results.pd.isna(df['short'].iloc[1]))
+
+        missing = ResultTable(['n', 'b'], {'n': 'int', 'b': 'bool'}, {'n': [1, None], 'b': [True, None]}).to_pandas()
+        self.assertEqual((str(missing['n'].dtype), str(missing['b'].dtype)), ('Int64', 'boolean'))
+
+    def test_csv_round_trip(self):
+        path = self.root / 'result.csv'
+        self.table.export(path)
+        with open(path, encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], self.table.columns)
+        self.assertEqual(rows[1], [str(WOT.Tank_1), '120', '51.25', 'true', '2023-03-01T12:30:00', 'T-34'])
+        self.assertEqual(rows[2], [str(WOT.Tank_2), '7', '42.5', 'false', '2023-04-02T00:00:00', ''])
+
+        df = query_results.pd.read_csv(path, parse_dates=['lastBattle'])
+        expected = self.table.to_pandas()
+        self.assertEqual(df['battles'].tolist(), expected['battles'].tolist())
+        self.assertEqual(df['winRate'].tolist(), expected['winRate'].tolist())
+        self.assertEqual(df['premium'].tolist(), expected['premium'].tolist())
+        self.assertEqual(df['lastBattle'].tolist(), expected['lastBattle'].tolist())
+
+    def test_unsupported_export(self):
+        with self.assertRaises(ValueError):
+            self.table.export(self.root / 'result.xlsx')
+
+    def test_arrow_requires_pyarrow(self):
+        with mock.patch.object(query_results, 'pyarrow', None):
+            with self.assertRaises(RuntimeError):
+                self.table.to_arrow()
+            with self.assertRaises(RuntimeError):
+                self.table.export(self.root / 'result.parquet')
+
+    @unittest.skipIf(query_results.pyarrow is None, "pyarrow is not installed")
+    def test_arrow_and_parquet_round_trip(self):
+        arrow = self.table.to_arrow()
+        self.assertEqual([str(field.type) for field in arrow.schema],
+                         ['string', 'int64', 'double', 'bool', 'timestamp[us]', 'string'])
+        path = self.root / 'result.parquet'
+        self.table.export(path)
+        loaded = query_results.pyarrow.parquet.read_table(path)
+        self.assertTrue(loaded.equals(arrow))
+        self.assertEqual(loaded.to_pylist(), self.table.records())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Интерактивная сессия: ключ кеша не зависит от пробелов и комментариев вне IRI и литералов,
+повтор запроса берется из кеша, \\timeout прерывает запрос, а \\export после ошибки
+не выгружает результат предыдущего запроса
+"""
+
+import contextlib
+import io
+import signal
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rdflib import Graph, Literal, Namespace, RDF
+from rdflib.namespace import XSD
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from query_ontology import OntologyQueryEngine  # noqa: E402
+from query_session import QuerySession, QueryTimeout, query_key, time_limit  # noqa: E402
+
+
+WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
+
+QUERY = """
+PREFIX wot: <http://www.semanticweb.org/ontology/wot#>
+SELECT ?name ?tier
+WHERE { ?tank wot:tankName ?name ; wot:tier ?tier }
+ORDER BY ?name
+"""
+
+# Тот же запрос с другими отступами, переносами и комментарием
+REFORMATTED_QUERY = """PREFIX wot:   <http://www.semanticweb.org/ontology/wot#>
+    SELECT ?name  ?tier   # имя и уровень
+    WHERE {
+        ?tank wot:tankName ?name ;
+              wot:tier ?tier
+    } ORDER BY ?name"""
+
+
+def run(action, *args):
+    """Вызывает action, возвращает напечатанный текст"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        action(*args)
+    return output.getvalue()
+
+
+class QueryKeyTest(unittest.TestCase):
+    def test_whitespace_and_comments_ignored(self):
+        self.assertEqual(query_key(QUERY), query_key(REFORMATTED_QUERY))
+        self.assertEqual(query_key("SELECT *\n\tWHERE  {  ?s ?p ?o }  # все тройки\n"), "SELECT * WHERE { ?s ?p ?o }")
+
+    def test_literals_kept_verbatim(self):
+        self.assertNotEqual(query_key('SELECT * WHERE { ?s ?p "T  34" }'), query_key('SELECT * WHERE { ?s ?p "T 34" }'))
+        self.assertEqual(query_key("ASK { ?s ?p '''a\n   b''' }"), "ASK { ?s ?p '''a\n   b''' }")
+        # Кавычка и # внутри литерала не начинают комментарий и не заканчивают литерал
+        self.assertEqual(query_key("ASK { ?s ?p 'it\\'s  # 1' }"), "ASK { ?s ?p 'it\\'s  # 1' }")
+
+    def test_iri_fragment_is_not_a_comment(self):
+        self.assertEqual(query_key("ASK { <http://x.org/o#Tank_1>   ?p ?o }"), "ASK { <http://x.org/o#Tank_1> ?p ?o }")
+        self.assertEqual(query_key("ASK { ?s ?p ?o FILTER(?o < 5) }"), "ASK { ?s ?p ?o FILTER(?o < 5) }")
+
+
+class TimeLimitTest(unittest.TestCase):
+    @unittest.skipUnless(hasattr(signal, 'SIGALRM'), "SIGALRM is not available")
+    def test_expires_and_restores_handler(self):
+        previous = signal.getsignal(signal.SIGALRM)
+        with self.assertRaises(QueryTimeout):
+            with time_limit(0.05):
+                time.sleep(2)
+        self.assertIs(signal.getsignal(signal.SIGALRM), previous)
+        self.assertEqual(signal.getitimer(signal.ITIMER_REAL), (0.0, 0.0))
+
+    def test_no_limit(self):
+        with time_limit(None):
+            pass
+
+
+class QuerySessionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.root = Path(cls.directory.name)
+        g = Graph()
+        for i, (name, tier) in enumerate([('T-34', 5), ('IS-7', 10), ('Tiger I', 7)], 1):
+            tank = WOT[f"Tank_{i}"]
+            g.add((tank, RDF.type, WOT.Tank))
+            g.add((tank, WOT.tankName, Literal(name, datatype=XSD.string)))
+            g.add((tank, WOT.tier, Literal(tier)))
+        g.serialize(cls.root / 'session.nt', format='nt')
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.engine = OntologyQueryEngine(cls.root / 'session.nt', aggregates=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.session = QuerySession(self.engine, history_file=self.root / 'history')
+
+    def test_repeated_query_served_from_cache(self):
+        first = run(self.session.handle, QUERY)
+        self.assertIn("Results: 3 rows", first)
+        self.assertIn("(plan ", first)
+        second = run(self.session.handle, REFORMATTED_QUERY)
+        self.assertIn("(cached result)", second)
+        self.assertEqual((self.session.results.hits, len(self.session.results)), (1, 1))
+        self.assertEqual(len(self.session.plans), 1)
+
+    def test_cached_plan_after_results_cleared(self):
+        run(self.session.handle, QUERY)
+        self.session.results.clear()
+        self.assertIn("(cached plan ", run(self.session.handle, REFORMATTED_QUERY))
+
+    def test_cache_cleared_when_graph_changes(self):
+        run(self.session.handle, QUERY)
+        with mock.patch.object(self.engine, 'loaded_partitions', {'battles-2023'}):
+            output = run(self.session.handle, QUERY)
+        self.assertIn("(plan ", output)
+        self.assertEqual(len(self.session.results), 1)
+
+    def test_cache_command(self):
+        run(self.session.handle, QUERY)
+        self.assertIn("Results: 1/", run(self.session.handle, '\\cache'))
+        run(self.session.handle, '\\cache clear')
+        self.assertEqual((len(self.session.plans), len(self.session.results)), (0, 0))
+
+    def test_timeout_command(self):
+        self.assertIn("Timeout: off", run(self.session.handle, '\\timeout'))
+        self.assertIn("Timeout: 2.5 s", run(self.session.handle, '\\timeout 2.5'))
+        self.assertEqual(self.session.timeout, 2.5)
+        self.assertIn("Query error", run(self.session.handle, '\\timeout -1'))
+        self.assertIn("Query error", run(self.session.handle, '\\timeout soon'))
+        self.assertEqual(self.session.timeout, 2.5)
+        run(self.session.handle, '\\timeout off')
+        self.assertIsNone(self.session.timeout)
+
+    @unittest.skipUnless(hasattr(signal, 'SIGALRM'), "SIGALRM is not available")
+    def test_timeout_cancels_query(self):
+        run(self.session.handle, '\\timeout 0.05')
+        with mock.patch.object(self.engine.g, 'query', side_effect=lambda *args, **kwargs: time.sleep(2)):
+            output = run(self.session.handle, QUERY)
+        self.assertIn("Query cancelled", output)
+        self.assertIsNone(self.session.last_result)
+        self.assertEqual(len(self.session.results), 0)
+        # Сессия продолжает работать
+        self.assertIn("Results: 3 rows", run(self.session.handle, QUERY))
+
+    def test_export_after_successful_query(self):
+        path = self.root / 'tanks.csv'
+        run(self.session.handle, QUERY)
+        self.assertIn("3 rows exported", run(self.session.handle, f"\\export {path}"))
+        self.assertEqual(path.read_text(encoding='utf-8').splitlines()[1], 'IS-7,10')
+
+    def test_export_after_failed_query(self):
+        path = self.root / 'stale.csv'
+        self.assertIn("No result to export yet", run(self.session.handle, f"\\export {path}"))
+        run(self.session.handle, QUERY)
+        self.assertIn("Query error", run(self.session.handle, "SELECT ?x WHERE { ?x ?p }"))
+        self.assertIn("the last query failed", run(self.session.handle, f"\\export {path}"))
+        self.assertFalse(path.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Проверка значений по схеме: каждая маска нарушений срабатывает на своем виде ошибки,
+отчеты блоков и процессов складываются, а строгий импорт завершается SchemaValidationError
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from rdflib import Namespace
+from rdflib.namespace import XSD
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from column_mapping import ColumnMapping, schema_column_mappings  # noqa: E402
+from generate_synthetic_data import SyntheticDataGenerator  # noqa: E402
+from import_data_to_rdf import DataImporter  # noqa: E402
+from schema_validation import SchemaValidationError, SchemaValidator  # noqa: E402
+from wot_schema import DATATYPE_PROPERTIES  # noqa: E402
+
+
+WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
+
+MAPPINGS = schema_column_mappings(DATATYPE_PROPERTIES, WOT, ['Battle', 'BattlePerformance'])
+
+
+def mapping(domain, column):
+    return next(mapping for mapping in MAPPINGS[domain] if mapping.column == column)
+
+
+class ViolationMasksTest(unittest.TestCase):
+    def setUp(self):
+        self.validator = SchemaValidator()
+
+    def masks(self, domain, column_mapping, values):
+        return {kind: mask.tolist() for kind, mask in
+                self.validator.violation_masks(domain, column_mapping, pd.Series(values)).items()}
+
+    def test_int64_overflow(self):
+        damage = mapping('BattlePerformance', 'damage')
+        masks = self.masks('BattlePerformance', damage, [1.0, 1e20, -1e20])
+        self.assertEqual(masks['overflow'], [False, True, True])
+        # Текст с числом вне int64 тоже переполнение
+        masks = self.masks('BattlePerformance', damage, ['12', '99999999999999999999'])
+        self.assertEqual(masks['overflow'], [False, True])
+
+    def test_fractional_part_on_integer_column(self):
+        masks = self.masks('BattlePerformance', mapping('BattlePerformance', 'damage'), [100.0, 100.5, np.nan])
+        self.assertEqual(masks['not_integer'], [False, True, False])
+        self.assertEqual(masks['missing'], [False, False, True])
+
+    def test_integer_dtype_skips_fraction_checks(self):
+        masks = self.masks('BattlePerformance', mapping('BattlePerformance', 'damage'), [1, 2, 3])
+        self.assertNotIn('not_integer', masks)
+        self.assertNotIn('overflow', masks)
+
+    def test_negative_counters(self):
+        masks = self.masks('BattlePerformance', mapping('BattlePerformance', 'frags'), [0, 2, -1])
+        self.assertEqual(masks['negative'], [False, False, True])
+
+    def test_bad_dates(self):
+        masks = self.masks('Battle', mapping('Battle', 'battle_time'), ['2023-01-01 10:00:00', 'yesterday', None])
+        self.assertEqual(masks['bad_date'], [False, True, False])
+
+    def test_domain_mismatch(self):
+        masks = self.masks('Tank', mapping('BattlePerformance', 'damage'), [100, None])
+        self.assertEqual(masks['domain'], [True, False])
+        self.assertNotIn('domain', self.masks('BattlePerformance', mapping('BattlePerformance', 'damage'), [100]))
+
+    def test_not_numeric_and_not_boolean(self):
+        masks = self.masks('BattlePerformance', mapping('BattlePerformance', 'damage'), ['10', 'abc'])
+        self.assertEqual(masks['not_numeric'], [False, True])
+        masks = self.masks('Battle', mapping('Battle', 'won'), [True, False, 2])
+        self.assertEqual(masks['not_boolean'], [False, False, True])
+
+    def test_infinite_float(self):
+        fire_rate = ColumnMapping('fire_rate', WOT.fireRate, XSD.float, float)
+        masks = self.masks('Gun', fire_rate, [1.5, np.inf])
+        self.assertEqual(masks['infinite'], [False, True])
+
+
+class ValidatorReportTest(unittest.TestCase):
+    def block(self, start, damage):
+        return pd.DataFrame({'damage': damage, 'frags': [0] * len(damage)},
+                            index=range(start, start + len(damage)))
+
+    def test_check_accumulates_and_samples(self):
+        validator = SchemaValidator(sample_size=2)
+        validator.check('BattlePerformance', MAPPINGS['BattlePerformance'], self.block(0, [1.5, 2.5, 10.0]))
+        validator.check('BattlePerformance', MAPPINGS['BattlePerformance'], self.block(3, [np.nan, -4.0]))
+
+        report = validator.columns['BattlePerformance.damage']
+        self.assertEqual(report['checked'], 5)
+        self.assertEqual(report['violations'], {'not_integer': 2, 'missing': 1, 'negative': 1})
+        self.assertEqual([sample['row'] for sample in report['samples']], [0, 1])
+        # Пропуски не считаются нарушениями
+        self.assertEqual(validator.violations(), 3)
+        self.assertEqual(validator.summary()['columns_with_violations'], ['BattlePerformance.damage'])
+
+    def test_merge_worker_reports(self):
+        first, second = SchemaValidator(), SchemaValidator()
+        first.check('BattlePerformance', MAPPINGS['BattlePerformance'], self.block(0, [1.5]))
+        second.check('BattlePerformance', MAPPINGS['BattlePerformance'], self.block(1, [-2.0, 3.0]))
+        first.merge(second.to_dict())
+        report = first.columns['BattlePerformance.damage']
+        self.assertEqual(report['checked'], 3)
+        self.assertEqual(report['violations'], {'not_integer': 1, 'negative': 1})
+        self.assertEqual(first.violations(), 2)
+
+
+class StrictImportTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        generator = SyntheticDataGenerator(seed=7, tanks=10, configs_per_tank=2)
+        generator.write_wot_data(self.root / 'wot_data.csv')
+        generator.write_battles(self.root / 'tomato.csv', 300)
+        tomato = pd.read_csv(self.root / 'tomato.csv')
+        tomato.loc[:4, 'frags'] = -1
+        tomato.to_csv(self.root / 'tomato.csv', index=False)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def import_battles(self, strict):
+        importer = DataImporter(strict=strict)
+        importer.data_dir = self.root
+        importer.ontology_dir = self.root
+        importer.import_battles_from_tomato(limit=300, random_sample=False)
+        return importer
+
+    def test_strict_import_raises(self):
+        with self.assertRaises(SchemaValidationError):
+            self.import_battles(strict=True)
+
+    def test_lenient_import_reports(self):
+        importer = self.import_battles(strict=False)
+        report = importer.validator.columns['BattlePerformance.frags']
+        self.assertEqual(report['violations'].get('negative'), 5)
+        self.assertGreater(len(importer.g), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Поиск танков по имени: имена, различающиеся только знаками, не сливаются, кириллица
+транслитерируется, неоднозначные и слишком непохожие имена не подставляются
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from tank_names import MIN_SCORE, TankNameResolver, fold_name, normalize_name, trigrams  # noqa: E402
+
+
+NAMES = [
+    ('Tank_1', 'T-34'), ('Tank_2', 'T34'), ('Tank_3', 'Leopard 1'), ('Tank_4', 'B-C 25 t'),
+    ('Tank_5', 'IS-7'), ('Tank_6', 'IS-7'), ('Tank_7', 'Škoda T 27'), ('Tank_8', 'Conqueror Gun Carriage'),
+    ('Tank_9', None), ('Tank_10', '--'),
+]
+
+
+class NameKeysTest(unittest.TestCase):
+    def test_fold_name_keeps_punctuation(self):
+        self.assertEqual(fold_name('  T-34 '), 't-34')
+        self.assertNotEqual(fold_name('T-34'), fold_name('T34'))
+        self.assertEqual(fold_name('B-C  25\tt'), 'b-c 25 t')
+
+    def test_cyrillic_and_diacritics(self):
+        self.assertEqual(fold_name('Т-34'), 't-34')
+        self.assertEqual(fold_name('Б-Ц 25 т'), 'b-c 25 t')
+        self.assertEqual(fold_name('ИС-7'), 'is-7')
+        self.assertEqual(fold_name('Škoda'), 'skoda')
+        self.assertEqual(fold_name('Объект 140'), 'obekt 140')
+
+    def test_normalize_name_drops_punctuation(self):
+        self.assertEqual(normalize_name('B-C 25 t'), 'bc25t')
+        self.assertEqual(normalize_name('T-34'), normalize_name('T34'))
+        self.assertEqual(normalize_name('--'), '')
+
+    def test_trigrams_of_short_key(self):
+        self.assertEqual(trigrams('t'), {'  t', ' t '})
+
+
+class TankNameResolverTest(unittest.TestCase):
+    def setUp(self):
+        self.resolver = TankNameResolver(NAMES)
+
+    def test_empty_names_skipped_and_same_names_merged(self):
+        self.assertEqual(len(self.resolver), 7)
+        self.assertEqual(self.resolver.resolve('IS-7'), ({'Tank_5', 'Tank_6'}, 'IS-7', 1.0))
+
+    def test_t34_and_t34_without_dash_kept_apart(self):
+        self.assertEqual(self.resolver.resolve('T-34'), ({'Tank_1'}, 'T-34', 1.0))
+        self.assertEqual(self.resolver.resolve('t34'), ({'Tank_2'}, 'T34', 1.0))
+        candidates = self.resolver.candidates('T34')
+        self.assertEqual([(spelling, tanks) for spelling, tanks, _ in candidates[:2]],
+                         [('T-34', {'Tank_1'}), ('T34', {'Tank_2'})])
+
+    def test_cyrillic_query_resolves(self):
+        self.assertEqual(self.resolver.resolve('Т-34'), ({'Tank_1'}, 'T-34', 1.0))
+        self.assertEqual(self.resolver.resolve('Б-Ц 25 т'), ({'Tank_4'}, 'B-C 25 t', 1.0))
+        self.assertEqual(self.resolver.resolve('ИС-7')[0], {'Tank_5', 'Tank_6'})
+
+    def test_punctuation_variants_resolve_when_unique(self):
+        self.assertEqual(self.resolver.resolve('bc 25 t'), ({'Tank_4'}, 'B-C 25 t', 1.0))
+        self.assertEqual(self.resolver.resolve('skoda t27'), ({'Tank_7'}, 'Škoda T 27', 1.0))
+
+    def test_ambiguous_name_is_refused(self):
+        # "T 34" без точного совпадения одинаково близок к T-34 и T34
+        self.assertEqual(self.resolver.resolve('T 34'), (set(), None, 1.0))
+
+    def test_min_score_cutoff(self):
+        tanks, spelling, score = self.resolver.resolve('Conquerer Gun Carriage')
+        self.assertEqual(score, MIN_SCORE)
+        self.assertEqual((tanks, spelling), ({'Tank_8'}, 'Conqueror Gun Carriage'))
+
+        tanks, spelling, score = self.resolver.resolve('leopard')
+        self.assertLess(score, MIN_SCORE)
+        self.assertEqual((tanks, spelling), (set(), None))
+        self.assertEqual(self.resolver.resolve('leopard', min_score=0.5)[:2], ({'Tank_3'}, 'Leopard 1'))
+
+        tanks, spelling, score = self.resolver.resolve('Conqueror Gun Carriag', min_score=0.99)
+        self.assertEqual((tanks, spelling), (set(), None))
+        self.assertGreater(score, MIN_SCORE)
+
+    def test_no_match(self):
+        self.assertEqual(self.resolver.resolve('xyz'), (set(), None, 0.0))
+        self.assertEqual(self.resolver.resolve('--'), (set(), None, 0.0))
+        self.assertEqual(self.resolver.candidates(''), [])
+
+    def test_candidates_ranked_and_limited(self):
+        candidates = self.resolver.candidates('Leopard', limit=3)
+        self.assertLessEqual(len(candidates), 3)
+        self.assertEqual(candidates[0][0], 'Leopard 1')
+        scores = [score for _, _, score in candidates]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Похожие танки: признаки танка берутся по детерминированно выбранным орудию и двигателю,
+фильтры similar() сужают кандидатов масками, неизвестный фильтр - ошибка
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from rdflib import Graph, Literal, Namespace, RDF
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from tank_similarity import FEATURES, TankFeatureIndex, best_modules  # noqa: E402
+
+
+WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
+
+# Танк: имя, нация, класс, уровень, премиум, вес, [(орудие, dpm или (fireRate, alpha), пробитие)], [(двигатель, мощность)]
+TANKS = {
+    'Tank_1': ('T-34', 'USSR', 'MediumTank', 5, False, 30.0,
+               [('Gun_a', 1500.0, 100.0), ('Gun_b', 1800.0, 120.0)], [('Engine_a', 500.0), ('Engine_b', 600.0)]),
+    'Tank_2': ('T-34-85', 'USSR', 'MediumTank', 6, False, 32.0,
+               [('Gun_c', 1800.0, 140.0), ('Gun_d', 1800.0, 150.0)], [('Engine_c', 600.0)]),
+    'Tank_3': ('Pz. IV H', 'Germany', 'MediumTank', 5, False, 25.0,
+               [('Gun_e', (10.0, 110.0), 130.0)], [('Engine_d', 300.0)]),
+    'Tank_4': ('Tiger I', 'Germany', 'HeavyTank', 7, False, 55.0,
+               [('Gun_f', 2000.0, 200.0)], [('Engine_e', 700.0)]),
+    'Tank_5': ('T-34-3', 'China', 'MediumTank', 8, True, 35.0,
+               [('Gun_g', 1900.0, 175.0)], [('Engine_f', 520.0)]),
+    'Tank_6': ('SU-85', 'USSR', 'TankDestroyer', 5, False, 29.0,
+               [('Gun_h', 1600.0, 120.0)], [('Engine_g', 500.0)]),
+}
+
+
+def hand_built_graph(reverse=False):
+    """Граф каталога танков; reverse - модули добавляются в обратном порядке"""
+    g = Graph()
+    for tank_id, (name, nation, tank_class, tier, premium, weight, guns, engines) in TANKS.items():
+        tank = WOT[tank_id]
+        g.add((tank, RDF.type, WOT[tank_class]))
+        g.add((tank, WOT.tankName, Literal(name)))
+        g.add((tank, WOT.belongsToNation, WOT[nation]))
+        g.add((WOT[nation], WOT.nationName, Literal(nation)))
+        g.add((tank, WOT.tier, Literal(tier)))
+        g.add((tank, WOT.isPremium, Literal(premium)))
+        g.add((tank, WOT.weight, Literal(weight)))
+        for gun_id, dpm, penetration in (reversed(guns) if reverse else guns):
+            gun = WOT[gun_id]
+            g.add((tank, WOT.hasGun, gun))
+            g.add((gun, WOT.avgPenetration, Literal(penetration)))
+            if isinstance(dpm, tuple):
+                g.add((gun, WOT.fireRate, Literal(dpm[0])))
+                g.add((gun, WOT.avgDamage, Literal(dpm[1])))
+            else:
+                g.add((gun, WOT.dpm, Literal(dpm)))
+        for engine_id, power in (reversed(engines) if reverse else engines):
+            g.add((tank, WOT.hasEngine, WOT[engine_id]))
+            g.add((WOT[engine_id], WOT.power, Literal(power)))
+    return g
+
+
+class BestModulesTest(unittest.TestCase):
+    def test_highest_score_then_smallest_uri(self):
+        g = hand_built_graph()
+        dpm = {WOT.Gun_a: 1500.0, WOT.Gun_b: 1800.0, WOT.Gun_c: 1800.0, WOT.Gun_d: 1800.0}
+        guns = best_modules(g, WOT.hasGun, dpm)
+        self.assertEqual(guns[WOT.Tank_1], WOT.Gun_b)
+        # Равный DPM: меньший URI
+        self.assertEqual(guns[WOT.Tank_2], WOT.Gun_c)
+        # Единственный модуль выбирается и без оценки
+        self.assertEqual(guns[WOT.Tank_4], WOT.Gun_f)
+
+    def test_independent_of_insertion_order(self):
+        power = {WOT[engine]: value for *_, engines in TANKS.values() for engine, value in engines}
+        self.assertEqual(best_modules(hand_built_graph(), WOT.hasEngine, power),
+                         best_modules(hand_built_graph(reverse=True), WOT.hasEngine, power))
+
+
+class TankFeatureIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = TankFeatureIndex().build(hand_built_graph(), WOT)
+
+    def feature(self, tank_id, name):
+        return self.index.attributes(WOT[tank_id])[name]
+
+    def neighbours(self, tank_id, k=10, **filters):
+        return [tank.split('#')[-1] for tank, _ in self.index.similar(WOT[tank_id], k=k, filters=filters)]
+
+    def test_features_from_chosen_modules(self):
+        self.assertEqual(len(self.index), len(TANKS))
+        self.assertEqual(self.feature('Tank_1', 'dpm'), 1800.0)
+        self.assertEqual(self.feature('Tank_1', 'penetration'), 120.0)
+        self.assertEqual(self.feature('Tank_1', 'powerToWeight'), 600.0 / 30.0)
+        self.assertEqual(self.feature('Tank_2', 'penetration'), 140.0)
+        # DPM без wot:dpm - скорострельность на альфу
+        self.assertEqual(self.feature('Tank_3', 'dpm'), 1100.0)
+        self.assertEqual(self.index.attributes(WOT.Tank_3)['nation'], 'Germany')
+
+    def test_same_features_for_any_insertion_order(self):
+        reversed_index = TankFeatureIndex().build(hand_built_graph(reverse=True), WOT)
+        self.assertEqual(reversed_index.tanks, self.index.tanks)
+        self.assertTrue((reversed_index.matrix == self.index.matrix).all())
+
+    def test_nation_filters(self):
+        self.assertEqual(set(self.neighbours('Tank_1', nation='ussr')), {'Tank_2', 'Tank_6'})
+        self.assertEqual(set(self.neighbours('Tank_1', other_nation=True)), {'Tank_3', 'Tank_4', 'Tank_5'})
+
+    def test_tier_and_class_filters(self):
+        self.assertEqual(set(self.neighbours('Tank_1', max_tier_diff=1)), {'Tank_2', 'Tank_3', 'Tank_6'})
+        self.assertEqual(set(self.neighbours('Tank_1', tier=5)), {'Tank_3', 'Tank_6'})
+        self.assertEqual(set(self.neighbours('Tank_1', same_class=True)), {'Tank_2', 'Tank_3', 'Tank_5'})
+        self.assertEqual(self.neighbours('Tank_1', tank_class='HeavyTank'), ['Tank_4'])
+
+    def test_exclude_premium(self):
+        self.assertIn('Tank_5', self.neighbours('Tank_1'))
+        self.assertNotIn('Tank_5', self.neighbours('Tank_1', exclude_premium=True))
+
+    def test_combined_filters_may_leave_nothing(self):
+        self.assertEqual(self.neighbours('Tank_1', nation='Germany', tank_class='TankDestroyer'), [])
+
+    def test_unknown_filter(self):
+        with self.assertRaises(ValueError) as error:
+            self.index.similar(WOT.Tank_1, filters={'nation': 'USSR', 'colour': 'green'})
+        self.assertIn('colour', str(error.exception))
+
+    def test_k_larger_than_candidates(self):
+        results = self.index.similar(WOT.Tank_1, k=50)
+        self.assertEqual(len(results), len(TANKS) - 1)
+        self.assertNotIn(str(WOT.Tank_1), [tank for tank, _ in results])
+        distances = [distance for _, distance in results]
+        self.assertEqual(distances, sorted(distances))
+        self.assertEqual(self.index.similar(WOT.Tank_1, k=0), [])
+
+    def test_distances_match_direct_computation(self):
+        row = self.index.tank_index[str(WOT.Tank_1)]
+        for tank, distance in self.index.similar(WOT.Tank_1, k=3):
+            other = self.index.tank_index[tank]
+            expected = ((self.index.matrix[row] - self.index.matrix[other]) ** 2).sum() ** 0.5
+            self.assertAlmostEqual(distance, expected, places=9)
+
+    def test_name_resolver_covers_index(self):
+        self.assertEqual(self.index.resolver.resolve('T-34')[0], {str(WOT.Tank_1)})
+        self.assertEqual(len(FEATURES), self.index.raw.shape[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
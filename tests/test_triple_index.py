@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Индекс троек: граф, записанный write_index и открытый через TripleIndexStore, отвечает
+на шаблоны triples() и на предопределенные запросы так же, как граф в памяти
+"""
+
+import itertools
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+from unittest import mock
+
+from rdflib import BNode, Graph, Literal, Namespace, RDF, URIRef
+from rdflib.namespace import XSD
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import triple_index  # noqa: E402
+from generate_synthetic_data import SyntheticDataGenerator  # noqa: E402
+from import_data_to_rdf import DataImporter  # noqa: E402
+from query_ontology import OntologyQueryEngine  # noqa: E402
+from triple_index import TripleIndexStore, is_triple_index, write_index  # noqa: E402
+
+
+WOT = Namespace("http://www.semanticweb.org/ontology/wot#")
+
+
+def small_graph():
+    """Граф с термами разных видов: URI, типизированные и языковые литералы, экранирование, blank node"""
+    g = Graph()
+    g.bind('wot', WOT)
+    crew = BNode('crew1')
+    for i, (name, tier) in enumerate([('T-34', 5), ('IS-7', 10), ('Т-34-85', 6), ('"Quoted"\ntank', 8)], 1):
+        tank = WOT[f"Tank_{i}"]
+        g.add((tank, RDF.type, WOT.MediumTank if tier < 10 else WOT.HeavyTank))
+        g.add((tank, WOT.tankName, Literal(name, datatype=XSD.string)))
+        g.add((tank, WOT.tier, Literal(tier)))
+        g.add((tank, WOT.belongsToNation, WOT.USSR))
+    g.add((WOT.Tank_1, WOT.avgDamage, Literal('1234.5', datatype=XSD.decimal)))
+    g.add((WOT.Tank_1, WOT.isPremium, Literal(False)))
+    g.add((WOT.Tank_2, WOT.description, Literal('тяжелый танк', lang='ru')))
+    g.add((WOT.Tank_2, WOT.hasCrew, crew))
+    g.add((crew, WOT.size, Literal(6)))
+    return g
+
+
+class TripleIndexRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.graph = small_graph()
+        self.index = write_index(self.graph, Path(self.directory.name) / 'index')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def open_index(self):
+        return Graph(store=TripleIndexStore(Path(self.directory.name) / 'index'))
+
+    def assertSamePatterns(self, indexed):
+        for triple in self.graph:
+            for mask in itertools.product((False, True), repeat=3):
+                pattern = tuple(term if bound else None for term, bound in zip(triple, mask))
+                with self.subTest(pattern=pattern):
+                    self.assertEqual(set(indexed.triples(pattern)), set(self.graph.triples(pattern)))
+
+    def test_index_description(self):
+        self.assertTrue(is_triple_index(Path(self.directory.name) / 'index'))
+        self.assertEqual(self.index['triples'], len(self.graph))
+        self.assertEqual(len(self.open_index()), len(self.graph))
+
+    def test_all_triples_round_trip(self):
+        indexed = set(self.open_index())
+        self.assertEqual(indexed, set(self.graph))
+        # Типы литералов (datatype, язык) сохраняются, а не только лексическая форма
+        literals = {(o, o.datatype, o.language) for _, _, o in indexed if isinstance(o, Literal)}
+        self.assertEqual(literals, {(o, o.datatype, o.language) for _, _, o in self.graph if isinstance(o, Literal)})
+
+    def test_pattern_lookups_match_memory_graph(self):
+        self.assertSamePatterns(self.open_index())
+
+    def test_pattern_lookups_with_tiny_term_caches(self):
+        # Кеши меньше числа термов: термы вытесняются и читаются из словаря заново
+        with mock.patch.object(triple_index, 'TERM_CACHE_SIZE', 2):
+            indexed = self.open_index()
+        self.assertSamePatterns(indexed)
+        self.assertEqual(set(indexed), set(self.graph))
+
+    def test_missing_terms_match_nothing(self):
+        indexed = self.open_index()
+        self.assertEqual(list(indexed.triples((WOT.Tank_99, None, None))), [])
+        self.assertEqual(list(indexed.triples((None, WOT.tier, Literal(11)))), [])
+        self.assertEqual(list(indexed.triples((None, URIRef('http://example.org/p'), None))), [])
+        # Тот же текст с другим datatype - другой терм
+        self.assertEqual(list(indexed.triples((None, WOT.tankName, Literal('T-34')))), [])
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.open_index().add((WOT.Tank_1, WOT.tier, Literal(6)))
+
+    def test_namespaces_and_sparql(self):
+        indexed = self.open_index()
+        self.assertEqual(dict(indexed.namespaces())['wot'], URIRef(str(WOT)))
+        query = "SELECT ?name WHERE { ?tank wot:tier ?tier ; wot:tankName ?name FILTER(?tier >= 6) }"
+        self.assertEqual(set(indexed.query(query, initNs={'wot': WOT})),
+                         set(self.graph.query(query, initNs={'wot': WOT})))
+
+
+class IndexedPredefinedQueriesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        root = Path(cls.directory.name)
+        generator = SyntheticDataGenerator(seed=6, tanks=12, configs_per_tank=2)
+        generator.write_wot_data(root / 'wot_data.csv')
+        generator.write_battles(root / 'tomato.csv', 600)
+
+        importer = DataImporter()
+        importer.data_dir = root
+        importer.ontology_dir = root
+        importer.import_tanks_from_wot_data()
+        importer.import_battles_from_tomato(limit=600, random_sample=False)
+        output_file = importer.save_graph('indexed', formats=('nt',))
+        write_index(importer.g, root / 'indexed_index')
+
+        cls.memory = OntologyQueryEngine(output_file, aggregates=False)
+        cls.indexed = OntologyQueryEngine(root / 'indexed_index', aggregates=False)
+        for engine in (cls.memory, cls.indexed):
+            engine.raise_errors = True
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_predefined_queries_match(self):
+        self.assertIsNotNone(self.indexed.index_store)
+        tank_name = str(next(self.memory.g.objects(None, WOT.tankName)))
+        for name, params in [
+            ('top-winrate', {'min_battles': 3, 'limit': 1000}),
+            ('damage-by-class', {}),
+            ('tanks-by-nation', {'nation': 'USSR'}),
+            ('guns-dpm', {'limit': 1000}),
+            ('engines-power', {'limit': 1000}),
+            ('nation-stats', {}),
+            ('best-tanks', {'limit': 1000}),
+            ('highest-avg-damage', {'min_battles': 3, 'top_n': 1000}),
+            ('worst-maps', {'tank_name': tank_name, 'min_battles': 1, 'limit': 1000}),
+            ('side-imbalance', {'threshold_pct': 1.0, 'min_battles_per_side': 3}),
+        ]:
+            with self.subTest(query=name):
+                memory = Counter(tuple(row) for row in self.memory.run_named_query(name, params))
+                indexed = Counter(tuple(row) for row in self.indexed.run_named_query(name, params))
+                self.assertTrue(memory, "query returned no rows, the comparison would be vacuous")
+                self.assertEqual(indexed, memory)
+
+
+if __name__ == '__main__':
+    unittest.main()